@@ -0,0 +1,48 @@
+"""Add keyset pagination index for recommendation history.
+
+Revision ID: 20260105100000
+Revises: 20251231100000
+Create Date: 2026-01-05 10:00:00.000000
+
+Replaces ix_recommendations_user_created with an index that also covers the id
+tie-breaker, so cursor pages are a single index range scan:
+- recommendations: user_id + created_at DESC + id DESC
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260105100000"
+down_revision: Union[str, None] = "20251231100000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the (user_id, created_at, id) keyset index."""
+    # Supports: SELECT * FROM recommendations WHERE user_id = ? AND (created_at, id) < (?, ?)
+    #           ORDER BY created_at DESC, id DESC LIMIT ?
+    op.create_index(
+        "ix_recommendations_user_created_id",
+        "recommendations",
+        ["user_id", "created_at", "id"],
+        postgresql_using="btree",
+        postgresql_ops={"created_at": "DESC", "id": "DESC"},
+    )
+
+    # Covered by the new index's (user_id, created_at) prefix
+    op.drop_index("ix_recommendations_user_created", table_name="recommendations")
+
+
+def downgrade() -> None:
+    """Restore the (user_id, created_at) index."""
+    op.create_index(
+        "ix_recommendations_user_created",
+        "recommendations",
+        ["user_id", "created_at"],
+        postgresql_using="btree",
+        postgresql_ops={"created_at": "DESC"},
+    )
+    op.drop_index("ix_recommendations_user_created_id", table_name="recommendations")
@@ -0,0 +1,44 @@
+"""Convert large JSON columns to JSONB.
+
+Revision ID: 20260105100001
+Revises: 20260105100000
+Create Date: 2026-01-05 10:00:01.000000
+
+JSONB is stored pre-parsed and is TOASTed out of line like JSON, but can be read and
+indexed without reparsing the text. ``generation_parameters`` is converted but stays
+loaded, since every recommendation response includes it. The models defer these columns,
+so listing and profile lookups no longer fetch them:
+- recommendations: generated_options, generation_prompt (Text, not converted here)
+- github_profiles: repositories_data, languages_data, contribution_data, skills_analysis
+"""
+
+from typing import Sequence, Union
+
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260105100001"
+down_revision: Union[str, None] = "20260105100000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSONB_COLUMNS = {
+    "recommendations": ["generated_options", "generation_parameters"],
+    "github_profiles": ["repositories_data", "languages_data", "contribution_data", "skills_analysis"],
+}
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=postgresql.JSONB(), existing_nullable=True, postgresql_using=f"{column}::jsonb")
+
+
+def downgrade() -> None:
+    """Convert JSONB columns back to JSON."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=postgresql.JSON(), existing_nullable=True, postgresql_using=f"{column}::json")
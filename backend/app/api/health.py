@@ -8,7 +8,7 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.database import check_database_health, test_database_connection
-from app.core.redis_client import check_redis_health
+from app.core.redis_client import check_redis_health, get_cache_stats
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +109,12 @@ async def health_check() -> Union[Dict[str, Any], JSONResponse]:
     return response_data
 
 
+@router.get("/cache-stats", response_model=None)
+async def cache_stats() -> Dict[str, Any]:
+    """Cache hit/miss counters per key prefix and in-process cache usage for this worker."""
+    return get_cache_stats()
+
+
 @router.get("/db-test", response_model=None)
 async def database_connection_test():
     """Test database connection with detailed diagnostics."""
@@ -1,5 +1,6 @@
 """GitHub API endpoints."""
 
+import json
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -9,7 +10,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.core.dependencies import get_github_service, get_repository_service, validate_github_username
-from app.core.redis_client import get_cache, set_cache
+from app.core.redis_client import MAX_STREAM_BLOCK_MS, append_to_stream, get_cache, read_stream, set_cache
 from app.schemas.github import GitHubAnalysisRequest, ProfileAnalysisResponse, RepositoryAnalysisRequest, RepositoryAnalysisResponse, RepositoryContributorsRequest
 from app.schemas.repository import RepositoryContributorsResponse
 from app.services.github.github_repository_service import GitHubRepositoryService
@@ -19,6 +20,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Background task statuses, results and progress streams expire after an hour
+TASK_TTL = 3600
+
+# How long an SSE client waits on the progress stream before sending a keepalive: the
+# longest blocking read Redis allows, just under its socket timeout
+TASK_PROGRESS_BLOCK_MS = MAX_STREAM_BLOCK_MS
+
 
 def _handle_api_error(error: Exception, operation: str, status_code: int = 500) -> None:
     """Handle API errors consistently with logging and HTTP exceptions."""
@@ -28,6 +36,12 @@ def _handle_api_error(error: Exception, operation: str, status_code: int = 500)
     raise HTTPException(status_code=status_code, detail="Internal server error")
 
 
+async def _publish_task_status(task_id: str, status: dict) -> None:
+    """Store a task's latest status and push it to the task's progress stream."""
+    await set_cache(f"task_status:{task_id}", status, ttl=TASK_TTL)
+    await append_to_stream(f"task_progress:{task_id}", status, ttl=TASK_TTL)
+
+
 async def _process_github_analysis_background(task_id: str, username: str, force_refresh: bool = False, max_repositories: int = 10) -> None:
     """Background task to process GitHub analysis with progress updates."""
     try:
@@ -38,41 +52,38 @@ async def _process_github_analysis_background(task_id: str, username: str, force
 
         commit_service = GitHubCommitService()
         github_service = GitHubUserService(commit_service)
+        started_at = datetime.now(timezone.utc).isoformat()
+
+        async def report_progress(stage: str, progress: int) -> None:
+            await _publish_task_status(task_id, {"status": "processing", "username": username, "started_at": started_at, "message": stage, "progress": progress})
 
         # Update task status to processing
-        await set_cache(
-            f"task_status:{task_id}",
-            {"status": "processing", "username": username, "started_at": datetime.now(timezone.utc).isoformat(), "message": "Initializing GitHub analysis...", "progress": 5},
-            ttl=3600,
-        )
+        await report_progress("Initializing GitHub analysis...", 5)
 
-        # Perform the analysis
-        analysis = await github_service.analyze_github_profile(username=username, force_refresh=force_refresh, max_repositories=max_repositories)
+        # Perform the analysis, publishing each step
+        analysis = await github_service.analyze_github_profile(username=username, force_refresh=force_refresh, max_repositories=max_repositories, progress=report_progress)
 
         if analysis:
             # Store successful result
-            await set_cache(f"task_result:{task_id}", analysis, ttl=3600)
-            await set_cache(
-                f"task_status:{task_id}",
+            await set_cache(f"task_result:{task_id}", analysis, ttl=TASK_TTL)
+            await _publish_task_status(
+                task_id,
                 {"status": "completed", "username": username, "completed_at": datetime.now(timezone.utc).isoformat(), "message": "Analysis completed successfully", "progress": 100},
-                ttl=3600,
             )
             logger.info(f"✅ Background analysis completed for {username}")
         else:
             # Store error result
-            await set_cache(
-                f"task_status:{task_id}",
+            await _publish_task_status(
+                task_id,
                 {"status": "failed", "username": username, "completed_at": datetime.now(timezone.utc).isoformat(), "message": "Analysis failed - user not found or analysis error", "progress": 0},
-                ttl=3600,
             )
             logger.error(f"❌ Background analysis failed for {username}")
 
     except Exception as e:
         logger.error(f"💥 Background analysis error for {username}: {e}")
-        await set_cache(
-            f"task_status:{task_id}",
+        await _publish_task_status(
+            task_id,
             {"status": "failed", "username": username, "completed_at": datetime.now(timezone.utc).isoformat(), "message": f"Analysis failed: {str(e)}", "progress": 0},
-            ttl=3600,
         )
 
 
@@ -91,15 +102,14 @@ async def get_github_service_health(
     if not github_user_service.github_client:
         return GitHubServiceHealthResponse(status="error", message="GitHub client not initialized.")
     try:
-        github_user_service.github_client.get_user("octocat")  # Test with a public user
+        await github_user_service.github_client.get_user("octocat")  # Test with a public user
         # Check rate limit
-        rate_limit = github_user_service.github_client.get_rate_limit()
-        core_rate_limit = rate_limit.rate
-        if core_rate_limit.remaining < 500:
-            logger.warning("GitHub API rate limit low: {remaining}/{limit}".format(remaining=core_rate_limit.remaining, limit=core_rate_limit.limit))
+        core_rate_limit = await github_user_service.github_client.get_rate_limit()
+        if core_rate_limit["remaining"] < 500:
+            logger.warning("GitHub API rate limit low: {remaining}/{limit}".format(remaining=core_rate_limit["remaining"], limit=core_rate_limit["limit"]))
             return GitHubServiceHealthResponse(
                 status="warning",
-                message=(f"GitHub API rate limit remaining: {core_rate_limit.remaining}/" f"{core_rate_limit.limit}. Reset at {core_rate_limit.reset}."),
+                message=(f"GitHub API rate limit remaining: {core_rate_limit['remaining']}/" f"{core_rate_limit['limit']}. Reset at {core_rate_limit['reset']}."),
             )
         return GitHubServiceHealthResponse(status="ok", message="GitHub service is healthy.")
     except Exception as e:
@@ -128,6 +138,7 @@ async def analyze_github_profile(
 
     if cached_analysis and not request.force_refresh:
         logger.info(f"💨 Returning cached GitHub analysis for {request.username}")
+        github_user_service.revalidate_profile_if_stale(cached_analysis, cache_key, request.username)
         return ProfileAnalysisResponse(**cached_analysis)
 
     # For heavy analysis, use background processing
@@ -357,44 +368,51 @@ async def stream_github_analysis_progress(task_id: str):
         try:
             logger.info(f"🎯 SSE stream started for GitHub analysis task: {task_id}")
 
+            # Replay the updates published so far, then block until the next one arrives
+            last_id = "0"
+            block_ms = None
             while True:
-                # Check task status
-                status_data = await get_cache(f"task_status:{task_id}")
-
-                if not status_data:
-                    # Task not found or expired
-                    yield 'data: {"status": "not_found", "message": "Task not found or expired"}\n\n'
-                    break
-
-                status = status_data.get("status", "unknown")
-                message = status_data.get("message", "")
-                progress = status_data.get("progress", 0)
-
-                # Create progress update
-                progress_data = {"task_id": task_id, "status": status, "stage": message, "progress": progress, "timestamp": datetime.now(timezone.utc).isoformat()}
-
-                # If completed, include result
-                if status == "completed":
-                    result_data = await get_cache(f"task_result:{task_id}")
-                    if result_data:
-                        progress_data["result"] = result_data
-
-                # Send progress update
-                yield f"data: {progress_data}\n\n"
-
-                # If completed or failed, end the stream
-                if status in ["completed", "failed"]:
-                    logger.info(f"🎯 SSE stream ended for task {task_id}: {status}")
-                    break
-
-                # Wait before next check
-                import asyncio
-
-                await asyncio.sleep(1)
+                events = await read_stream(f"task_progress:{task_id}", last_id, block_ms=block_ms)
+
+                if not events:
+                    if events is None or block_ms is None or not await get_cache(f"task_status:{task_id}"):
+                        # Task not found or expired
+                        yield 'data: {"status": "not_found", "message": "Task not found or expired"}\n\n'
+                        break
+                    # Nothing new yet; keep the connection alive
+                    yield ": keepalive\n\n"
+                    continue
+
+                block_ms = TASK_PROGRESS_BLOCK_MS
+                for last_id, status_data in events:
+                    status = status_data.get("status", "unknown")
+
+                    # Create progress update
+                    progress_data = {
+                        "task_id": task_id,
+                        "status": status,
+                        "stage": status_data.get("message", ""),
+                        "progress": status_data.get("progress", 0),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }
+
+                    # If completed, include result
+                    if status == "completed":
+                        result_data = await get_cache(f"task_result:{task_id}")
+                        if result_data:
+                            progress_data["result"] = result_data
+
+                    # Send progress update
+                    yield f"data: {json.dumps(progress_data)}\n\n"
+
+                    # If completed or failed, end the stream
+                    if status in ["completed", "failed"]:
+                        logger.info(f"🎯 SSE stream ended for task {task_id}: {status}")
+                        return
 
         except Exception as e:
             logger.error(f"Error in GitHub analysis SSE stream for task {task_id}: {e}")
-            yield f'data: {{"status": "error", "message": "Stream error: {str(e)}"}}\n\n'
+            yield f"data: {json.dumps({'status': 'error', 'message': f'Stream error: {str(e)}'})}\n\n"
 
     return StreamingResponse(
         generate_progress_stream(),
@@ -428,9 +446,7 @@ async def start_github_analysis_stream(
         logger.info(f"   • Task ID: {task_id}")
 
         # Set initial status
-        await set_cache(
-            f"task_status:{task_id}", {"status": "queued", "username": request.username, "started_at": datetime.now(timezone.utc).isoformat(), "message": "Analysis queued...", "progress": 0}, ttl=3600
-        )
+        await _publish_task_status(task_id, {"status": "queued", "username": request.username, "started_at": datetime.now(timezone.utc).isoformat(), "message": "Analysis queued...", "progress": 0})
 
         # Start background analysis
         background_tasks.add_task(_process_github_analysis_background, task_id, request.username, request.force_refresh)
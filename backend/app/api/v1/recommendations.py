@@ -1,5 +1,6 @@
 """Recommendation API endpoints."""
 
+import asyncio
 import logging
 import time
 from typing import Optional, Union
@@ -7,18 +8,25 @@ from typing import Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.api.v1.auth import get_current_active_user
+from app.core.database import AsyncSessionLocal
 from app.core.dependencies import (
     AnonymousUser,
     PaginationParams,
+    StreamedGenerationCredit,
     check_generation_limit,
+    confirm_generation_credit,
+    generation_credit,
     get_current_user_optional,
     get_database_session,
     get_pagination_params,
     get_recommendation_service,
     increment_generation_count,
+    reserve_generation_credit,
 )
+from app.core.pagination import encode_cursor
 from app.models.user import User
 from app.schemas.recommendation import (
     DynamicRefinementRequest,
@@ -53,6 +61,21 @@ async def check_recommendation_limit_only(
     await check_generation_limit(user, db)
 
 
+async def finish_generation_stream(credit: StreamedGenerationCredit, stream_db: AsyncSession) -> None:
+    """Refund an unconfirmed credit and end a streamed generation's session.
+
+    Streamed bodies run after the request's session dependency has exited, so each stream
+    owns its session. Anything it wrote without completing is rolled back here, releasing
+    the connection and any row locks instead of leaving them idle in transaction.
+    """
+    try:
+        await credit.release()
+    finally:
+        if not credit.completed:
+            await stream_db.rollback()
+        await stream_db.close()
+
+
 async def increment_recommendation_count(
     db: AsyncSession,
     user: Union[User, AnonymousUser],
@@ -105,25 +128,24 @@ async def generate_recommendation(
 
     try:
         logger.info("🎯 Starting recommendation creation process...")
-        recommendation = await recommendation_service.create_recommendation(
-            db=db,
-            user_id=user_id,  # Can be None for anonymous users
-            github_username=request.github_username,
-            recommendation_type=request.recommendation_type,
-            tone=request.tone,
-            length=request.length,
-            custom_prompt=request.custom_prompt,
-            shared_work_context=request.shared_work_context,
-            target_role=request.target_role,
-            specific_skills=request.include_specific_skills,
-            include_keywords=request.include_keywords,
-            exclude_keywords=request.exclude_keywords,
-            analysis_context_type=request.analysis_context_type,
-            repository_url=request.repository_url,
-        )
-
-        # Only increment after successful generation
-        await increment_recommendation_count(db, current_user, req)
+        # Hold a credit during generation; it is refunded if generation fails
+        async with generation_credit(current_user, req, db):
+            recommendation = await recommendation_service.create_recommendation(
+                db=db,
+                user_id=user_id,  # Can be None for anonymous users
+                github_username=request.github_username,
+                recommendation_type=request.recommendation_type,
+                tone=request.tone,
+                length=request.length,
+                custom_prompt=request.custom_prompt,
+                shared_work_context=request.shared_work_context,
+                target_role=request.target_role,
+                specific_skills=request.include_specific_skills,
+                include_keywords=request.include_keywords,
+                exclude_keywords=request.exclude_keywords,
+                analysis_context_type=request.analysis_context_type,
+                repository_url=request.repository_url,
+            )
 
         logger.info("✅ RECOMMENDATION GENERATION COMPLETED SUCCESSFULLY")
         logger.info("📊 Final Stats:")
@@ -173,27 +195,26 @@ async def generate_recommendation_options(
 
     try:
         logger.info("🎯 Starting multiple options generation process...")
-        result = await recommendation_service.create_recommendation_options(
-            db=db,
-            user_id=user_id,  # Can be None for anonymous users
-            github_username=request.github_username,
-            recommendation_type=request.recommendation_type,
-            tone=request.tone,
-            length=request.length,
-            custom_prompt=request.custom_prompt,
-            target_role=request.target_role,
-            specific_skills=request.include_specific_skills,
-            include_keywords=request.include_keywords,
-            exclude_keywords=request.exclude_keywords,
-            analysis_context_type=getattr(request, "analysis_context_type", "profile"),
-            repository_url=getattr(request, "repository_url", None),
-        )
-
-        # Extract the options response from the result
-        options_response = result.get("options_response")
+        # Hold a credit during generation; it is refunded if generation fails
+        async with generation_credit(current_user, req, db):
+            result = await recommendation_service.create_recommendation_options(
+                db=db,
+                user_id=user_id,  # Can be None for anonymous users
+                github_username=request.github_username,
+                recommendation_type=request.recommendation_type,
+                tone=request.tone,
+                length=request.length,
+                custom_prompt=request.custom_prompt,
+                target_role=request.target_role,
+                specific_skills=request.include_specific_skills,
+                include_keywords=request.include_keywords,
+                exclude_keywords=request.exclude_keywords,
+                analysis_context_type=getattr(request, "analysis_context_type", "profile"),
+                repository_url=getattr(request, "repository_url", None),
+            )
 
-        # Only increment after successful generation
-        await increment_recommendation_count(db, current_user, req)
+            # Extract the options response from the result
+            options_response = result.get("options_response")
 
         logger.info("✅ MULTIPLE OPTIONS GENERATION COMPLETED SUCCESSFULLY")
         logger.info("📊 Final Stats:")
@@ -368,18 +389,17 @@ async def create_recommendation_from_option(
 
     try:
         logger.info("🎯 Starting recommendation creation from selected option...")
-        recommendation = await recommendation_service.create_recommendation_from_option(
-            db=db,
-            user_id=user_id,  # Can be None for anonymous users
-            github_username=request.github_username,
-            selected_option=request.selected_option.model_dump(),
-            all_options=[option.model_dump() for option in request.all_options],
-            analysis_context_type=request.analysis_context_type or "profile",
-            repository_url=request.repository_url,
-        )
-
-        # Only increment after successful generation
-        await increment_recommendation_count(db, current_user, req)
+        # Hold a credit during generation; it is refunded if generation fails
+        async with generation_credit(current_user, req, db):
+            recommendation = await recommendation_service.create_recommendation_from_option(
+                db=db,
+                user_id=user_id,  # Can be None for anonymous users
+                github_username=request.github_username,
+                selected_option=request.selected_option.model_dump(),
+                all_options=[option.model_dump() for option in request.all_options],
+                analysis_context_type=request.analysis_context_type or "profile",
+                repository_url=request.repository_url,
+            )
 
         logger.info("✅ RECOMMENDATION CREATION FROM OPTION COMPLETED SUCCESSFULLY")
         logger.info("📊 Final Stats:")
@@ -446,23 +466,22 @@ async def regenerate_recommendation(
         logger.info(f"   • Original Content Length: {len(original_content)} characters")
         logger.info(f"   • Refinement Instructions: {refinement_instructions[:100]}...")
 
-        recommendation = await recommendation_service.regenerate_recommendation(
-            db=db,
-            user_id=user_id,  # Can be None for anonymous users
-            original_content=original_content,
-            refinement_instructions=refinement_instructions,
-            github_username=github_username,
-            recommendation_type=recommendation_type,
-            tone=tone,
-            length=length,
-            shared_work_context=shared_work_context,
-            analysis_context_type=analysis_context_type,
-            repository_url=repository_url,
-            display_name=display_name,
-        )
-
-        # Only increment after successful generation
-        await increment_recommendation_count(db, current_user, req)
+        # Hold a credit during generation; it is refunded if generation fails
+        async with generation_credit(current_user, req, db):
+            recommendation = await recommendation_service.regenerate_recommendation(
+                db=db,
+                user_id=user_id,  # Can be None for anonymous users
+                original_content=original_content,
+                refinement_instructions=refinement_instructions,
+                github_username=github_username,
+                recommendation_type=recommendation_type,
+                tone=tone,
+                length=length,
+                shared_work_context=shared_work_context,
+                analysis_context_type=analysis_context_type,
+                repository_url=repository_url,
+                display_name=display_name,
+            )
 
         logger.info("✅ RECOMMENDATION REGENERATION COMPLETED SUCCESSFULLY")
         logger.info("📊 Final Stats:")
@@ -539,8 +558,10 @@ async def generate_recommendation_options_stream(
         force_refresh=force_refresh,  # Pass force_refresh
     )
 
-    # Check limit but don't increment yet
+    # Check limit and hold a credit; the stream confirms it on completion or refunds it
     await check_recommendation_limit_only(db, current_user)
+    await reserve_generation_credit(current_user)
+    credit = StreamedGenerationCredit(current_user)
 
     user_type = "authenticated" if isinstance(current_user, User) else "anonymous"
 
@@ -550,6 +571,7 @@ async def generate_recommendation_options_stream(
     logger.info(f"👤 User: {current_user.username} (ID: {current_user.id}, Type: {user_type})")
 
     async def generate_stream():
+        stream_db = AsyncSessionLocal()
         try:
             logger.info("🎯 SSE stream started - using RecommendationService...")
 
@@ -570,7 +592,7 @@ async def generate_recommendation_options_stream(
 
             # Use the RecommendationService which handles repo_only context properly
             result = await recommendation_service.create_recommendation_options(
-                db=db,
+                db=stream_db,
                 github_username=request.github_username,
                 user_id=current_user.id if isinstance(current_user, User) else None,
                 recommendation_type=request.recommendation_type,
@@ -625,7 +647,9 @@ async def generate_recommendation_options_stream(
                 # Update progress in the update
                 progress_update["progress"] = mapped_progress
 
-                logger.info(f"📡 SSE yielding progress: {progress_update.get('stage', 'Unknown')} - {mapped_progress}%")
+                # Text deltas are forwarded as-is; only log stage changes
+                if progress_update.get("status") != "streaming":
+                    logger.info(f"📡 SSE yielding progress: {progress_update.get('stage', 'Unknown')} - {mapped_progress}%")
 
                 # Send heartbeat to keep connection alive
                 current_time = time.time()
@@ -636,18 +660,25 @@ async def generate_recommendation_options_stream(
 
                 # Format as SSE data
                 data = f"data: {StreamProgressResponse(**progress_update).model_dump_json()}\n\n"
-                yield data
 
-                # If complete, increment the counter
+                # If complete, confirm the held credit before sending the event: the
+                # client disconnects as soon as it sees it, which cancels this generator
                 if progress_update.get("status") == "complete":
-                    await increment_recommendation_count(db, current_user, req)
+                    await confirm_generation_credit(current_user, req, stream_db)
+                    await stream_db.commit()
+                    credit.completed = True
                     logger.info("✅ STREAMING OPTIONS GENERATION COMPLETED SUCCESSFULLY")
                     logger.info("=" * 80)
 
+                yield data
+
         except Exception as e:
             logger.error(f"💥 CRITICAL ERROR in streaming options generation: {e}")
             error_data = f"data: {StreamProgressResponse(stage=f'Error: {str(e)}', progress=0, status='error', error=str(e)).model_dump_json()}\n\n"
             yield error_data
+        finally:
+            # Refund the held credit and end the session on errors and disconnects; shielded so cancellation can't skip it
+            await asyncio.shield(finish_generation_stream(credit, stream_db))
 
     return StreamingResponse(
         generate_stream(),
@@ -656,6 +687,8 @@ async def generate_recommendation_options_stream(
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
         },
+        # Also runs when the client disconnects before the stream starts, so the credit is never stranded
+        background=BackgroundTask(credit.release),
     )
 
 
@@ -669,8 +702,10 @@ async def regenerate_recommendation_stream(
 ):
     """Regenerate a recommendation with streaming progress and dynamic refinement via SSE."""
 
-    # Check limit but don't increment yet
+    # Check limit and hold a credit; the stream confirms it on completion or refunds it
     await check_recommendation_limit_only(db, current_user)
+    await reserve_generation_credit(current_user)
+    credit = StreamedGenerationCredit(current_user)
 
     user_type = "authenticated" if isinstance(current_user, User) else "anonymous"
 
@@ -680,6 +715,7 @@ async def regenerate_recommendation_stream(
     logger.info(f"👤 User: {current_user.username} (ID: {current_user.id}, Type: {user_type})")
 
     async def regenerate_stream():
+        stream_db = AsyncSessionLocal()
         try:
             # Phase 1: Data preparation (0-30%)
             yield f"data: {StreamProgressResponse(stage='Preparing refinement...', progress=5, status='initializing').model_dump_json()}\n\n"
@@ -688,7 +724,7 @@ async def regenerate_recommendation_stream(
 
             # Get GitHub data
             github_data = await recommendation_service._get_or_create_github_profile_data(
-                db=db, github_username=request.github_username, analysis_context_type=request.analysis_context_type, repository_url=request.repository_url, force_refresh=request.force_refresh
+                db=stream_db, github_username=request.github_username, analysis_context_type=request.analysis_context_type, repository_url=request.repository_url, force_refresh=request.force_refresh
             )
 
             yield f"data: {StreamProgressResponse(stage='Processing refinement instructions...', progress=30, status='processing').model_dump_json()}\n\n"
@@ -718,18 +754,25 @@ async def regenerate_recommendation_stream(
 
                 # Format as SSE data
                 data = f"data: {StreamProgressResponse(**progress_update).model_dump_json()}\n\n"
-                yield data
 
-                # If complete, increment the counter
+                # If complete, confirm the held credit before sending the event: the
+                # client disconnects as soon as it sees it, which cancels this generator
                 if progress_update.get("status") == "complete":
-                    await increment_recommendation_count(db, current_user, req)
+                    await confirm_generation_credit(current_user, req, stream_db)
+                    await stream_db.commit()
+                    credit.completed = True
                     logger.info("✅ STREAMING REGENERATION COMPLETED SUCCESSFULLY")
                     logger.info("=" * 80)
 
+                yield data
+
         except Exception as e:
             logger.error(f"💥 CRITICAL ERROR in streaming regeneration: {e}")
             error_data = f"data: {StreamProgressResponse(stage=f'Error: {str(e)}', progress=0, status='error', error=str(e)).model_dump_json()}\n\n"
             yield error_data
+        finally:
+            # Refund the held credit and end the session on errors and disconnects; shielded so cancellation can't skip it
+            await asyncio.shield(finish_generation_stream(credit, stream_db))
 
     return StreamingResponse(
         regenerate_stream(),
@@ -738,6 +781,8 @@ async def regenerate_recommendation_stream(
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
         },
+        # Also runs when the client disconnects before the stream starts, so the credit is never stranded
+        background=BackgroundTask(credit.release),
     )
 
 
@@ -759,9 +804,14 @@ async def list_recommendations(
             user_id=current_user.id,  # type: ignore # Filter by user ID
             github_username=github_username,
             recommendation_type=recommendation_type,
-            limit=pagination.limit,
+            # One extra row tells us whether there is a next page
+            limit=pagination.limit + 1,
             offset=pagination.offset,
+            cursor=pagination.cursor,
         )
+        has_more = len(recommendations) > pagination.limit
+        recommendations = recommendations[: pagination.limit]
+        next_cursor = encode_cursor(recommendations[-1].created_at, recommendations[-1].id) if has_more else None
 
         # TODO: Get total count for proper pagination
         total = len(recommendations)  # Simplified for now
@@ -771,6 +821,7 @@ async def list_recommendations(
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
+            next_cursor=next_cursor,
         )
 
     except Exception as e:
@@ -0,0 +1,123 @@
+"""Binary encoding for Redis cache values.
+
+Encoded values start with a header byte naming the serializer and compressor, followed by
+the payload. Values written before the header existed (plain JSON text, or raw strings)
+never start with a header byte and are still decoded.
+"""
+
+import json
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Handle optional fast JSON and zstd imports
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson = None  # type: ignore
+    orjson_available = False
+
+try:
+    import zstandard
+
+    zstd_available = True
+except ImportError:
+    zstandard = None  # type: ignore
+    zstd_available = False
+
+# Header byte: serializer id in the upper bits, compressor id in the lower two
+SERIALIZER_JSON = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+_zstd_compressor: Optional["zstandard.ZstdCompressor"] = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if zstd_available else None
+_zstd_decompressor: Optional["zstandard.ZstdDecompressor"] = zstandard.ZstdDecompressor() if zstd_available else None
+
+
+def _dumps_json(value: Any) -> bytes:
+    if orjson_available:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    return orjson.loads(data) if orjson_available else json.loads(data)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    if _zstd_compressor is None:
+        raise ValueError("zstd cache compression requested but zstandard is not installed")
+    return _zstd_compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    if _zstd_decompressor is None:
+        raise ValueError("zstd-compressed cache value found but zstandard is not installed")
+    return _zstd_decompressor.decompress(data)
+
+
+SERIALIZERS: Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    SERIALIZER_JSON: (_dumps_json, _loads_json),
+}
+
+COMPRESSORS: Dict[int, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    COMPRESSION_NONE: (lambda data: data, lambda data: data),
+    COMPRESSION_ZLIB: (lambda data: zlib.compress(data, ZLIB_LEVEL), zlib.decompress),
+    COMPRESSION_ZSTD: (_zstd_compress, _zstd_decompress),
+}
+
+
+def _header(serializer: int, compression: int) -> int:
+    return serializer << 2 | compression
+
+
+# Header bytes are low control characters, which never start JSON text or a normal string
+HEADER_BYTES = {_header(serializer, compression) for serializer in SERIALIZERS for compression in COMPRESSORS}
+
+
+def configured_compression() -> int:
+    """Return the compressor id selected by ``CACHE_COMPRESSION``."""
+    choice = settings.CACHE_COMPRESSION
+    if choice == "auto":
+        return COMPRESSION_ZSTD if zstd_available else COMPRESSION_ZLIB
+    if choice == "zstd" and not zstd_available:
+        return COMPRESSION_ZLIB
+    return {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "zstd": COMPRESSION_ZSTD}[choice]
+
+
+def encode_cache_value(value: Any) -> bytes:
+    """Encode a value for Redis, compressing payloads above ``CACHE_COMPRESSION_THRESHOLD`` bytes.
+
+    Strings are stored as plain UTF-8, as before, so they stay readable to other clients.
+    """
+    if isinstance(value, str):
+        return value.encode("utf-8")
+
+    dumps, _ = SERIALIZERS[SERIALIZER_JSON]
+    payload = dumps(value)
+    compression = COMPRESSION_NONE
+    if len(payload) >= settings.CACHE_COMPRESSION_THRESHOLD:
+        compression = configured_compression()
+        payload = COMPRESSORS[compression][0](payload)
+    return bytes([_header(SERIALIZER_JSON, compression)]) + payload
+
+
+def decode_cache_value(data: bytes) -> Any:
+    """Decode a value read from Redis, including values written without a header."""
+    if data and data[0] in HEADER_BYTES:
+        serializer, compression = data[0] >> 2, data[0] & 0b11
+        return SERIALIZERS[serializer][1](COMPRESSORS[compression][1](data[1:]))
+
+    # Legacy value: JSON text, or a raw string
+    text = data.decode("utf-8")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
@@ -0,0 +1,64 @@
+"""Deterministic cache key builders."""
+
+import hashlib
+import json
+import unicodedata
+from typing import Any, Dict, Optional
+
+# Bump when prompt templates or the cached result shape change so stale entries are never served
+AI_RECOMMENDATION_CACHE_VERSION = "v4"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so cosmetic whitespace and Unicode differences hash identically."""
+    normalized = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in normalized.split("\n")).strip()
+
+
+def content_digest(payload: Dict[str, Any]) -> str:
+    """Return a SHA-256 hex digest of a JSON-serializable payload in canonical form."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def repository_path(repository_url: Optional[str]) -> Optional[str]:
+    """Reduce a GitHub repository URL to its ``owner/name`` path."""
+    if not repository_url:
+        return None
+    return repository_url.replace("https://github.com/", "").split("?")[0]
+
+
+def build_ai_recommendation_cache_key(
+    prompt: str,
+    model: str,
+    generation_params: Dict[str, Any],
+    analysis_context_type: str = "profile",
+    repository_url: Optional[str] = None,
+) -> str:
+    """Build the cache key for a generated AI recommendation.
+
+    The digest covers the normalized prompt, the model, the generation parameters and the
+    analysis context, so keys are identical across processes and restarts (unlike ``hash()``,
+    which is randomized per interpreter) and change whenever anything affecting the output does.
+    ``repo_only`` results live in their own namespace to keep them isolated from profile results.
+    """
+    repo_path = repository_path(repository_url)
+    digest = content_digest(
+        {
+            "prompt": normalize_prompt(prompt),
+            "model": model,
+            "generation": generation_params,
+            "context": {"type": analysis_context_type, "repository": repo_path},
+        }
+    )
+
+    if analysis_context_type == "repo_only":
+        cache_key = f"ai_recommendation_repo_only:{AI_RECOMMENDATION_CACHE_VERSION}:{digest}"
+        return f"{cache_key}:{repo_path}" if repo_path else cache_key
+
+    cache_key = f"ai_recommendation:{AI_RECOMMENDATION_CACHE_VERSION}:{digest}"
+    if analysis_context_type != "profile":
+        cache_key += f":{analysis_context_type}"
+        if repo_path:
+            cache_key += f":{repo_path}"
+    return cache_key
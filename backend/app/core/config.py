@@ -40,10 +40,31 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(default="redis://redis:6379/0", description="Redis connection URL")
     REDIS_TIMEOUT: int = Field(default=5, ge=1, le=30, description="Redis timeout in seconds")
     REDIS_DEFAULT_TTL: int = Field(default=3600, ge=60, le=86400, description="Default cache TTL")
+    REDIS_L1_CACHE_ENABLED: bool = Field(default=False, description="Keep an in-process LRU of cache reads in front of Redis")
+    REDIS_L1_CACHE_MAX_ENTRIES: int = Field(default=1024, ge=16, le=100000, description="Max entries in the in-process cache")
+    REDIS_L1_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, ge=1024 * 1024, description="Max total size of values in the in-process cache")
+    REDIS_L1_CACHE_TTL: int = Field(default=60, ge=1, le=3600, description="Max seconds an entry stays in the in-process cache")
+    CACHE_COMPRESSION: Literal["auto", "zstd", "zlib", "none"] = Field(default="auto", description="Compressor for large cache values (auto picks zstd when installed, else zlib)")
+    CACHE_COMPRESSION_THRESHOLD: int = Field(default=2048, ge=0, description="Compress cache values whose serialized size is at least this many bytes")
+    SINGLE_FLIGHT_LOCK_TTL: int = Field(default=600, ge=10, le=3600, description="Seconds a single-flight lock is held before it expires")
+    SINGLE_FLIGHT_WAIT_TIMEOUT: int = Field(default=300, ge=1, le=3600, description="Seconds to wait for another worker's in-flight computation")
 
     # External APIs
     GITHUB_TOKEN: str = Field(default="", description="GitHub API token")
     GITHUB_RATE_LIMIT: int = Field(default=5000, ge=1000, le=15000, description="GitHub API rate limit")
+    GITHUB_API_URL: str = Field(default="https://api.github.com", description="GitHub REST API base URL")
+    GITHUB_HTTP_TIMEOUT: float = Field(default=15.0, ge=1.0, le=120.0, description="GitHub HTTP request timeout in seconds")
+    GITHUB_MAX_CONNECTIONS: int = Field(default=20, ge=1, le=100, description="Max pooled keep-alive connections to GitHub")
+    GITHUB_MAX_CONCURRENT_REQUESTS: int = Field(default=10, ge=1, le=50, description="Max in-flight GitHub API requests per process")
+    GITHUB_COMMIT_STATS_MODE: Literal["rest", "graphql", "lazy"] = Field(
+        default="graphql",
+        description="How commit file counts are fetched: rest (one call per commit), graphql (one batched query per repository), lazy (only for top-ranked commits)",
+    )
+    GITHUB_COMMIT_STATS_LAZY_LIMIT: int = Field(default=10, ge=1, le=100, description="Commits enriched with file counts in lazy stats mode")
+    GITHUB_PROFILE_FETCH_MODE: Literal["rest", "graphql"] = Field(default="graphql", description="How profile analysis fetches user, repository, commit and PR data: graphql (batched queries) or rest")
+    GITHUB_DEPENDENCY_SCAN: bool = Field(
+        default=False, description="Fetch the top repositories' dependency manifests for skill extraction (a tree listing plus one request per manifest, per repository)"
+    )
 
     GEMINI_API_KEY: str = Field(default="", description="Google Gemini API key")
     GEMINI_MODEL: str = Field(default="gemini-2.5-flash-lite", description="Gemini model name")
@@ -2,15 +2,19 @@
 
 import logging
 import re
-from datetime import date
-from typing import Any, AsyncGenerator, TypeVar, Union, cast
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Any, AsyncGenerator, AsyncIterator, Optional, Tuple, TypeVar, Union, cast
 
 from fastapi import Depends, HTTPException, Request
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.database import AsyncSessionLocal
 from app.core.exceptions import DatabaseError
-from app.core.redis_client import get_redis
+from app.core.pagination import decode_cursor
+from app.core.redis_client import consume_quota, get_redis, increment_quota, release_quota
 from app.models.user import User
 from app.services.ai.ai_service_new import AIService
 from app.services.analysis.profile_analysis_service import ProfileAnalysisService
@@ -186,9 +190,13 @@ async def validate_github_username(username: str) -> str:
 
 # Pagination Dependencies
 class PaginationParams:
-    """Pagination parameters."""
+    """Pagination parameters.
 
-    def __init__(self, page: int = 1, page_size: int = 10):
+    A ``cursor`` from a previous page selects keyset pagination and takes precedence over
+    ``page``; without one, offset pagination is used.
+    """
+
+    def __init__(self, page: int = 1, page_size: int = 10, cursor: Optional[str] = None):
         if page < 1:
             raise HTTPException(status_code=400, detail="Page must be >= 1")
         if page_size < 1 or page_size > 100:
@@ -198,11 +206,17 @@ class PaginationParams:
         self.page_size = page_size
         self.offset = (page - 1) * page_size
         self.limit = page_size
+        self.cursor: Optional[Tuple[datetime, int]] = None
+        if cursor:
+            try:
+                self.cursor = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
 
-def get_pagination_params(page: int = 1, page_size: int = 10) -> PaginationParams:
+def get_pagination_params(page: int = 1, page_size: int = 10, cursor: Optional[str] = None) -> PaginationParams:
     """Dependency provider for pagination parameters."""
-    return PaginationParams(page, page_size)
+    return PaginationParams(page, page_size, cursor)
 
 
 # Anonymous User Support
@@ -216,55 +230,41 @@ class AnonymousUser:
         self.role = "anonymous"
         self.daily_limit = 3  # Anonymous users get 3 generations per day
         self.recommendation_count = 0
-        self.last_recommendation_date = None
+        self.last_recommendation_date: Optional[date] = None
         self.is_active = True
 
     def __repr__(self) -> str:
         return f"<AnonymousUser(ip={self.ip_address}, count={self.recommendation_count}/{self.daily_limit})>"
 
 
-async def get_anonymous_user_data(request: Request) -> AnonymousUser:
-    """Get anonymous user data from Redis based on IP address."""
-    # Get client IP address
+def _anonymous_client_ip(request: Request) -> str:
+    """Client IP used to track an anonymous user, with localhost/development IPs folded together."""
     client_ip = request.client.host if request.client else "unknown"
-
-    # Handle localhost/development IPs
     if client_ip in ["127.0.0.1", "localhost", "::1"]:
         client_ip = "localhost"
+    return client_ip
+
+
+def anonymous_quota_key(client_ip: str, day: date) -> str:
+    """Redis key counting an anonymous user's generations on ``day``; it expires on its own."""
+    return f"anonymous:{client_ip}:{day.isoformat()}"
+
+
+async def get_anonymous_user_data(request: Request) -> AnonymousUser:
+    """Get anonymous user data from Redis based on IP address."""
+    client_ip = _anonymous_client_ip(request)
 
     logger.debug(f"Anonymous user IP: {client_ip}")
 
     user = AnonymousUser(client_ip)
+    user.last_recommendation_date = date.today()
 
-    # Try to get data from Redis
+    # Try to get today's count from Redis; a new day starts a new key
     redis = await get_redis()
     if redis:
         try:
-            today = date.today().isoformat()
-            redis_key = f"anonymous:{client_ip}:recommendations"
-
-            # Get current count and date
-            stored_data = await redis.hgetall(redis_key)
-
-            if stored_data:
-                stored_date = stored_data.get(b"date", b"").decode("utf-8")
-                stored_count = int(stored_data.get(b"count", b"0").decode("utf-8"))
-
-                # Reset count if it's a new day
-                if stored_date != today:
-                    user.recommendation_count = 0
-                    user.last_recommendation_date = date.today()
-                    # Update Redis with reset data
-                    await redis.hset(redis_key, mapping={"count": "0", "date": today})
-                else:
-                    user.recommendation_count = stored_count
-                    user.last_recommendation_date = date.fromisoformat(stored_date)
-            else:
-                # No data in Redis, initialize
-                user.recommendation_count = 0
-                user.last_recommendation_date = date.today()
-                await redis.hset(redis_key, mapping={"count": "0", "date": today})
-
+            stored_count = await redis.get(anonymous_quota_key(client_ip, user.last_recommendation_date))
+            user.recommendation_count = int(stored_count or 0)
         except Exception as e:
             logger.warning(f"Failed to get anonymous user data from Redis: {e}")
             # Fall back to default values
@@ -298,23 +298,11 @@ async def get_current_user_optional(
 
 async def increment_anonymous_user_count(request: Request) -> None:
     """Increment the recommendation count for an anonymous user."""
-    client_ip = request.client.host if request.client else "unknown"
-    if client_ip in ["127.0.0.1", "localhost", "::1"]:
-        client_ip = "localhost"
-
-    redis = await get_redis()
-    if redis:
-        try:
-            today = date.today().isoformat()
-            redis_key = f"anonymous:{client_ip}:recommendations"
-
-            # Increment count
-            await redis.hincrby(redis_key, "count", 1)
-            await redis.hset(redis_key, "date", today)
+    client_ip = _anonymous_client_ip(request)
 
-            logger.info(f"Anonymous user {client_ip} count incremented")
-        except Exception as e:
-            logger.warning(f"Failed to increment anonymous user count: {e}")
+    count = await increment_quota(anonymous_quota_key(client_ip, date.today()))
+    if count is not None:
+        logger.info(f"Anonymous user {client_ip} count incremented to {count}")
 
 
 async def check_generation_limit(user: Union[User, AnonymousUser], db: AsyncSession) -> None:
@@ -354,30 +342,144 @@ async def check_generation_limit(user: Union[User, AnonymousUser], db: AsyncSess
         )
 
 
+NO_CREDITS_DETAIL = "No credits remaining. Purchase a credit pack to continue."
+
+
+def _holds_credit(user: Union[User, AnonymousUser]) -> bool:
+    """Whether a generation by ``user`` spends a credit."""
+    return isinstance(user, User) and not (user.has_unlimited_generations or user.role == "admin")
+
+
+async def _update_user_counters(db: AsyncSession, user: User, values: dict, *criteria: Any) -> bool:
+    """Apply ``values`` to the user's row in one UPDATE ... RETURNING and mirror the result onto ``user``.
+
+    Returns False when ``criteria`` matched no row (e.g. no credits left).
+    """
+    statement = update(User).where(User.id == user.id, *criteria).values(**values).returning(User.credits, User.recommendation_count).execution_options(synchronize_session=False)
+    row = (await db.execute(statement)).one_or_none()
+    if row is None:
+        return False
+    # Store the database's values as loaded state so nothing is re-flushed
+    set_committed_value(user, "credits", row.credits)
+    set_committed_value(user, "recommendation_count", row.recommendation_count)
+    return True
+
+
 async def increment_generation_count(user: Union[User, AnonymousUser], request: Request, db: AsyncSession) -> None:
-    """Increment generation count / deduct credits for both authenticated and anonymous users."""
+    """Increment generation count / deduct credits for both authenticated and anonymous users.
+
+    The credit is deducted with a conditional UPDATE, so concurrent generations cannot
+    spend the same credit. The change is committed with the rest of the request.
+    """
     if isinstance(user, User):
-        # Authenticated user - deduct credit (unless unlimited)
-        if user.has_unlimited_generations or user.role == "admin":
+        count = {"recommendation_count": User.recommendation_count + 1}
+        if not _holds_credit(user):
             # Track usage but don't deduct credits
-            user.recommendation_count += 1  # type: ignore
-            await db.commit()
-            await db.refresh(user)
+            await _update_user_counters(db, user, count)
             logger.info(f"User {user.username} (ID: {user.id}, tier: {user.effective_tier}) generated (unlimited)")
-        else:
-            # Deduct one credit
-            success = user.use_credit()
-            if not success:
-                raise HTTPException(
-                    status_code=429,
-                    detail="No credits remaining. Purchase a credit pack to continue.",
-                    headers={"X-Upgrade-URL": "/pricing"},
-                )
-            user.recommendation_count += 1  # type: ignore
-            await db.commit()
-            await db.refresh(user)
+        elif await _update_user_counters(db, user, {**count, "credits": User.credits - 1}, User.credits > 0):
             logger.info(f"User {user.username} (ID: {user.id}) used 1 credit, {user.credits} remaining")
+        else:
+            raise HTTPException(status_code=429, detail=NO_CREDITS_DETAIL, headers={"X-Upgrade-URL": "/pricing"})
     else:
         # Anonymous user - increment in Redis
         await increment_anonymous_user_count(request)
         logger.info(f"Anonymous user {user.ip_address} has used {user.recommendation_count + 1}/{user.daily_limit} generations today")
+
+
+async def reserve_generation_credit(user: Union[User, AnonymousUser]) -> None:
+    """Hold one credit (or one of an anonymous user's daily generations) for a generation that is about to run.
+
+    The deduction is committed in its own short transaction, so the credit is held (and
+    the row unlocked) while the AI call runs. Anonymous generations are counted with one
+    atomic check-and-increment. Follow with confirm_generation_credit on success or
+    release_generation_credit on failure. Raises 429 if nothing is left.
+    """
+    if isinstance(user, AnonymousUser):
+        user.last_recommendation_date = date.today()
+        allowed, count = await consume_quota(anonymous_quota_key(user.ip_address, user.last_recommendation_date), user.daily_limit)
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Daily limit ({user.daily_limit}) exceeded for anonymous users. Sign up for free credits or try again tomorrow.",
+                headers={"X-Upgrade-URL": "/pricing"},
+            )
+        user.recommendation_count = count
+        return
+
+    if not _holds_credit(user):
+        return
+
+    async with AsyncSessionLocal() as session:
+        if not await _update_user_counters(session, user, {"credits": User.credits - 1}, User.credits > 0):
+            raise HTTPException(status_code=429, detail=NO_CREDITS_DETAIL, headers={"X-Upgrade-URL": "/pricing"})
+        await session.commit()
+    logger.info(f"User {user.username} (ID: {user.id}) reserved 1 credit, {user.credits} remaining")
+
+
+async def confirm_generation_credit(user: Union[User, AnonymousUser], request: Request, db: AsyncSession) -> None:
+    """Record a successful generation whose credit was reserved; the caller commits it.
+
+    Anonymous generations were already counted when reserved.
+    """
+    if isinstance(user, User):
+        await _update_user_counters(db, user, {"recommendation_count": User.recommendation_count + 1})
+
+
+async def release_generation_credit(user: Union[User, AnonymousUser]) -> None:
+    """Refund a credit reserved for a generation that failed."""
+    if isinstance(user, AnonymousUser):
+        # Same key as the reservation, even if the day has changed since
+        await release_quota(anonymous_quota_key(user.ip_address, user.last_recommendation_date or date.today()))
+        return
+
+    if not _holds_credit(user):
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await _update_user_counters(session, user, {"credits": User.credits + 1})
+            await session.commit()
+        logger.info(f"User {user.username} (ID: {user.id}) refunded 1 credit, {user.credits} remaining")
+    except Exception as e:
+        # Don't mask the error that failed the generation
+        logger.error(f"Failed to refund credit for user {user.id}: {e}")
+
+
+@asynccontextmanager
+async def generation_credit(user: Union[User, AnonymousUser], request: Request, db: AsyncSession) -> AsyncIterator[None]:
+    """Reserve a credit around a generation, confirming it on success and refunding it on failure.
+
+    The generation's writes are committed here rather than when the request ends, so a
+    failing commit (e.g. on the flushed recommendation insert) also refunds the credit.
+    """
+    await reserve_generation_credit(user)
+    try:
+        yield
+        await confirm_generation_credit(user, request, db)
+        await db.commit()
+    except BaseException:
+        await release_generation_credit(user)
+        raise
+
+
+class StreamedGenerationCredit:
+    """A credit reserved for a streamed generation, refunded at most once.
+
+    The stream sets ``completed`` once the generation is confirmed and committed. Until
+    then ``release`` refunds the credit; it is called from the stream's ``finally`` and
+    from the response's background task, which Starlette still runs when the client
+    disconnects before the body is iterated and the ``finally`` never executes.
+    """
+
+    def __init__(self, user: Union[User, AnonymousUser]) -> None:
+        self.user = user
+        self.completed = False
+        self._released = False
+
+    async def release(self) -> None:
+        """Refund the credit unless the generation completed or it was already refunded."""
+        if self.completed or self._released:
+            return
+        self._released = True
+        await release_generation_credit(self.user)
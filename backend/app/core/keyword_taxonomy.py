@@ -0,0 +1,77 @@
+"""Keyword taxonomy compiled once and matched against a text in a single pass."""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set
+
+# {group: {category: keywords found}}; every group is present, categories only when hit
+KeywordHits = Dict[str, Dict[str, Set[str]]]
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex that matches the longest of ``keywords`` starting at the current position.
+
+    The keywords are folded into a trie so each position is tested by walking shared
+    prefixes once, instead of trying every keyword in turn.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # A keyword ends here
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            # Greedy, so the longer keyword wins and the shorter one is the fallback
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class KeywordTaxonomy:
+    """Groups of keyword categories matched against a text in one regex scan.
+
+    A keyword matches when it occurs anywhere in the lowercased text, exactly like
+    ``keyword in text``. The scan finds the longest keyword starting at each position;
+    shorter keywords contained in it (e.g. ``test`` in ``testing``) are added from a
+    table built at compile time, so overlapping keywords are all reported.
+    """
+
+    def __init__(self, groups: Mapping[str, Mapping[str, Sequence[str]]]) -> None:
+        """Compile ``{group: {category: [keyword, ...]}}``."""
+        self.groups = {group: {category: tuple(keyword.lower() for keyword in keywords) for category, keywords in categories.items()} for group, categories in groups.items()}
+
+        self._categories: Dict[str, List[tuple]] = {}
+        for group, categories in self.groups.items():
+            for category, keywords in categories.items():
+                for keyword in dict.fromkeys(keywords):
+                    self._categories.setdefault(keyword, []).append((group, category))
+
+        all_keywords = list(self._categories)
+        self._contained: Dict[str, FrozenSet[str]] = {keyword: frozenset(other for other in all_keywords if other in keyword) for keyword in all_keywords}
+        self._pattern = re.compile(f"(?=({_trie_pattern(all_keywords)}))")
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """Return every taxonomy keyword that occurs in ``text``."""
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._contained[match.group(1)]
+        return found
+
+    def classify(self, text: str) -> KeywordHits:
+        """Return the keywords of each category that occur in ``text``."""
+        hits: KeywordHits = {group: {} for group in self.groups}
+        for keyword in self.keywords_in(text):
+            for group, category in self._categories[keyword]:
+                hits[group].setdefault(category, set()).add(keyword)
+        return hits
+
+    def classify_all(self, texts: Iterable[str]) -> List[KeywordHits]:
+        """Classify each of ``texts``."""
+        return [self.classify(text) for text in texts]
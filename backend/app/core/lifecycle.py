@@ -8,7 +8,8 @@ from fastapi import FastAPI
 
 from app.core.config import settings
 from app.core.database import init_database, run_migrations
-from app.core.redis_client import init_redis
+from app.core.redis_client import close_redis, init_redis
+from app.services.github.github_api_client import close_github_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("🔄 Shutting down application...")
+    await close_github_api_client()
+    await close_redis()
 
 
 async def _initialize_database() -> None:
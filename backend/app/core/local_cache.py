@@ -0,0 +1,78 @@
+"""Bounded in-process cache used as an L1 in front of Redis."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class LocalCache:
+    """LRU cache bounded by entry count, total value size and per-entry TTL.
+
+    Values are stored in their serialized form and sized with ``len()``, so the byte
+    budget tracks the payloads Redis would return. Expired entries are dropped lazily on
+    access and evicted first when space is needed.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        """Initialize local cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for ``key``, or None when it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.invalidate(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Store ``value`` for at most ``ttl`` seconds (capped at the cache TTL); returns False when it is too large."""
+        size = len(value)
+        self.invalidate(key)
+        if size > self.max_bytes:
+            return False
+
+        lifetime = min(ttl, self.ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + lifetime, value, size)
+        self.current_bytes += size
+        self._evict()
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """Drop ``key`` if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current size and limits."""
+        return {"entries": len(self._entries), "bytes": self.current_bytes, "max_entries": self.max_entries, "max_bytes": self.max_bytes, "ttl_seconds": self.ttl}
+
+    def _evict(self) -> None:
+        """Evict expired entries, then least recently used ones, until within bounds."""
+        if len(self._entries) <= self.max_entries and self.current_bytes <= self.max_bytes:
+            return
+
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _, _) in self._entries.items() if expires_at <= now]:
+            self.invalidate(key)
+
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
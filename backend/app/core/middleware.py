@@ -3,12 +3,13 @@
 import logging
 import time
 import uuid
-from typing import Any, Awaitable, Callable
+from typing import Any, Dict, Optional
 
-from fastapi import Request, Response
+from fastapi import Request
 from starlette import status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.exceptions import (
@@ -23,130 +24,113 @@ from app.core.security_config import filter_pii_for_logging
 
 logger = logging.getLogger(__name__)
 
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+}
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Add unique request ID to each request for tracing."""
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        # Add request ID to response headers
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+class ApplicationMiddleware:
+    """Request IDs, logging, security headers, error handling and optional rate limiting.
 
-        return response
+    Implemented as a single pure ASGI middleware: the app runs in the request's own task and
+    response messages, including server-sent event chunks, are passed straight through.
+    Headers are added to the ``http.response.start`` message on its way out.
+    """
 
+    def __init__(self, app: ASGIApp, requests_per_minute: Optional[int] = None) -> None:
+        self.app = app
+        self.requests_per_minute = requests_per_minute
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Log request and response details with PII filtering."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        request = Request(scope)
 
         # Sanitize URL and query parameters for logging
         safe_url = filter_pii_for_logging(str(request.url))
         safe_client = request.client.host if request.client else "unknown"
 
         # Log request
-        logger.info(f"Request started - ID: {request_id}, Method: {request.method}, " f"URL: {safe_url}, Client: {safe_client}")
-
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
+        logger.info(f"Request started - ID: {request_id}, Method: {request.method}, URL: {safe_url}, Client: {safe_client}")
 
-            # Log response
-            logger.info(f"Request completed - ID: {request_id}, Status: {response.status_code}, " f"Duration: {duration:.3f}s")
-
-            return response
+        response_headers = {"X-Request-ID": request_id, **SECURITY_HEADERS}
+        if settings.ENVIRONMENT == "production":
+            response_headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        response_started = False
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                MutableHeaders(scope=message).update(response_headers)
+            await send(message)
 
+        try:
+            try:
+                rate_limited_response = await self._check_rate_limit(safe_client, response_headers)
+                if rate_limited_response is not None:
+                    await rate_limited_response(scope, receive, send_with_headers)
+                else:
+                    await self.app(scope, receive, send_with_headers)
+            except Exception as e:
+                # Once the response has started (e.g. a stream failing midway) it can no longer be replaced
+                if response_started:
+                    raise
+                error_response = await self._handle_error(e, request)
+                await error_response(scope, receive, send_with_headers)
         except Exception as e:
             duration = time.time() - start_time
             safe_error = filter_pii_for_logging(str(e))
-            logger.error(
-                f"Request failed - ID: {request_id}, Error: {safe_error}, " f"Duration: {duration:.3f}s",
-                exc_info=True,
-            )
+            logger.error(f"Request failed - ID: {request_id}, Error: {safe_error}, Duration: {duration:.3f}s", exc_info=True)
             raise
 
+        # Log response
+        duration = time.time() - start_time
+        logger.info(f"Request completed - ID: {request_id}, Status: {status_code}, Duration: {duration:.3f}s")
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to responses."""
-
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        if settings.ENVIRONMENT == "production":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        return response
-
-
-class RateLimitingMiddleware(BaseHTTPMiddleware):
-    """Redis-based rate limiting middleware with sliding window algorithm."""
-
-    def __init__(self, app: Any, requests_per_minute: int = 60) -> None:
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        if not settings.ENABLE_RATE_LIMITING:
-            return await call_next(request)
-
-        client_ip = request.client.host if request.client else "unknown"
+    async def _check_rate_limit(self, client_ip: str, response_headers: Dict[str, str]) -> Optional[JSONResponse]:
+        """Apply the Redis rate limit, adding its headers; returns a 429 response when the client is over it."""
+        if self.requests_per_minute is None or not settings.ENABLE_RATE_LIMITING:
+            return None
 
         # Use Redis-based rate limiting
-        from app.core.redis_client import check_rate_limit, get_rate_limit_remaining
-
-        is_allowed, current_count = await check_rate_limit(client_ip, self.requests_per_minute)
-
-        if not is_allowed:
-            remaining = await get_rate_limit_remaining(client_ip, self.requests_per_minute)
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "RATE_LIMIT_EXCEEDED",
-                    "message": "Rate limit exceeded. Please try again later.",
-                    "type": "rate_limit_error",
-                },
-                headers={
-                    "Retry-After": "60",
-                    "X-RateLimit-Limit": str(self.requests_per_minute),
-                    "X-RateLimit-Remaining": str(remaining),
-                    "X-RateLimit-Reset": str(int(time.time()) + 60),
-                },
-            )
-
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        remaining = await get_rate_limit_remaining(client_ip, self.requests_per_minute)
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
-
-        return response
+        from app.core.redis_client import check_rate_limit
 
+        is_allowed, remaining, reset_at = await check_rate_limit(client_ip, self.requests_per_minute)
+        response_headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
+        response_headers["X-RateLimit-Remaining"] = str(remaining)
+        response_headers["X-RateLimit-Reset"] = str(reset_at)
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """Centralized error handling middleware with support for custom exceptions."""
+        if is_allowed:
+            return None
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": "RATE_LIMIT_EXCEEDED",
+                "message": "Rate limit exceeded. Please try again later.",
+                "type": "rate_limit_error",
+            },
+            headers={"Retry-After": str(max(1, reset_at - int(time.time())))},
+        )
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        try:
-            return await call_next(request)
-        except BaseApplicationError as e:
+    async def _handle_error(self, error: Exception, request: Request) -> JSONResponse:
+        """Map an unhandled exception to an error response."""
+        if isinstance(error, BaseApplicationError):
             # Handle custom application exceptions
-            return await self._handle_application_error(e, request)
-        except ValueError as e:
+            return await self._handle_application_error(error, request)
+        if isinstance(error, ValueError):
             # Handle standard Python ValueError
-            logger.warning(f"Validation error: {filter_pii_for_logging(str(e))}")
+            logger.warning(f"Validation error: {filter_pii_for_logging(str(error))}")
             return JSONResponse(
                 status_code=400,
                 content={
@@ -156,9 +140,9 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "request_id": getattr(request.state, "request_id", "unknown"),
                 },
             )
-        except ConnectionError as e:
+        if isinstance(error, ConnectionError):
             # Handle connection errors
-            logger.error(f"Connection error: {filter_pii_for_logging(str(e))}")
+            logger.error(f"Connection error: {filter_pii_for_logging(str(error))}")
             return JSONResponse(
                 status_code=503,
                 content={
@@ -168,9 +152,9 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "request_id": getattr(request.state, "request_id", "unknown"),
                 },
             )
-        except TimeoutError as e:
+        if isinstance(error, TimeoutError):
             # Handle timeout errors
-            logger.error(f"Timeout error: {filter_pii_for_logging(str(e))}")
+            logger.error(f"Timeout error: {filter_pii_for_logging(str(error))}")
             return JSONResponse(
                 status_code=504,
                 content={
@@ -180,33 +164,33 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "request_id": getattr(request.state, "request_id", "unknown"),
                 },
             )
-        except Exception as e:
-            # Handle any other unhandled exceptions
-            request_id = getattr(request.state, "request_id", "unknown")
-            safe_error = filter_pii_for_logging(str(e))
-            logger.error(f"Unhandled error in request {request_id}: {safe_error}", exc_info=True)
-
-            if settings.API_DEBUG:
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        "error": "INTERNAL_ERROR",
-                        "message": "An internal server error occurred.",
-                        "detail": safe_error,
-                        "type": "internal_error",
-                        "request_id": request_id,
-                    },
-                )
-            else:
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        "error": "INTERNAL_ERROR",
-                        "message": "Internal server error. Please try again later.",
-                        "type": "internal_error",
-                        "request_id": request_id,
-                    },
-                )
+
+        # Handle any other unhandled exceptions
+        request_id = getattr(request.state, "request_id", "unknown")
+        safe_error = filter_pii_for_logging(str(error))
+        logger.error(f"Unhandled error in request {request_id}: {safe_error}", exc_info=True)
+
+        if settings.API_DEBUG:
+            return JSONResponse(
+                status_code=500,
+                content={
+                    "error": "INTERNAL_ERROR",
+                    "message": "An internal server error occurred.",
+                    "detail": safe_error,
+                    "type": "internal_error",
+                    "request_id": request_id,
+                },
+            )
+        else:
+            return JSONResponse(
+                status_code=500,
+                content={
+                    "error": "INTERNAL_ERROR",
+                    "message": "Internal server error. Please try again later.",
+                    "type": "internal_error",
+                    "request_id": request_id,
+                },
+            )
 
     async def _handle_application_error(self, error: BaseApplicationError, request: Request) -> JSONResponse:
         """Handle custom application exceptions with proper error mapping."""
@@ -264,12 +248,8 @@ def setup_middleware(app: Any) -> None:
     """Configure essential middleware only.
 
     Middleware execution order (reverse of addition):
-    1. RequestIDMiddleware - Generate request IDs
-    2. LoggingMiddleware - Log requests/responses
-    3. SecurityHeadersMiddleware - Basic security headers
-    4. ErrorHandlingMiddleware - Handle errors
-    5. RateLimitingMiddleware - Rate limiting (if enabled)
-    6. CORSMiddleware - CORS handling
+    1. ApplicationMiddleware - Request IDs, logging, security headers, error handling and rate limiting (if enabled)
+    2. CORSMiddleware - CORS handling
     """
     from fastapi.middleware.cors import CORSMiddleware
 
@@ -283,15 +263,8 @@ def setup_middleware(app: Any) -> None:
         max_age=86400,  # 24 hours cache for preflight
     )
 
-    # Rate limiting (optional, controlled by settings)
-    if settings.ENABLE_RATE_LIMITING:
-        app.add_middleware(
-            RateLimitingMiddleware,
-            requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
-        )
-
-    # Core middleware (executed in reverse order)
-    app.add_middleware(ErrorHandlingMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(RequestIDMiddleware)
+    # Core middleware; rate limiting is optional, controlled by settings
+    app.add_middleware(
+        ApplicationMiddleware,
+        requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE if settings.ENABLE_RATE_LIMITING else None,
+    )
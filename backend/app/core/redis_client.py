@@ -1,19 +1,115 @@
 """Redis client configuration."""
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 from redis.exceptions import ConnectionError, TimeoutError
 
+from app.core.cache_codec import decode_cache_value, encode_cache_value
 from app.core.config import settings
+from app.core.local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Global Redis client
 redis_client: Optional[Redis] = None
 
+# Optional in-process L1 in front of Redis, kept coherent across workers over pub/sub
+local_cache: Optional[LocalCache] = None
+_invalidation_listener: Optional["asyncio.Task[None]"] = None
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+INSTANCE_ID = uuid.uuid4().hex
+
+# Key namespaces whose second segment names the kind of entry (github:user_data:..., github:repos:...)
+CACHE_NAMESPACES = ("github",)
+
+# Cache lookups by key prefix: l1_hits, redis_hits, misses
+_cache_stats: Dict[str, Counter] = defaultdict(Counter)
+
+# Single-flight computations running in this process, by key
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+SINGLE_FLIGHT_POLL_INTERVAL = 0.25
+
+# Delete the lock only while it still holds the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Longest a blocking stream read waits; kept under the socket timeout so a quiet stream
+# isn't mistaken for a dead connection
+MAX_STREAM_BLOCK_MS = max(settings.REDIS_TIMEOUT * 1000 - 1000, 500)
+
+# Daily quota keys expire a day after their first use
+QUOTA_TTL_SECONDS = 24 * 60 * 60
+
+# Count one use against a quota key, setting its expiry on first use. A use over the
+# limit is not counted. Returns {allowed, count} in one round-trip.
+QUOTA_SCRIPT = """
+local count = redis.call("incr", KEYS[1])
+if count == 1 then
+    redis.call("expire", KEYS[1], ARGV[2])
+end
+if count > tonumber(ARGV[1]) then
+    redis.call("decr", KEYS[1])
+    return {0, count - 1}
+end
+return {1, count}
+"""
+
+# Give back one use of a quota key, unless it has expired: a bare DECR would recreate it
+# at -1 with no TTL, leaving a permanent counter that grants an extra use.
+RELEASE_QUOTA_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 1 then
+    return redis.call("decr", KEYS[1])
+end
+return 0
+"""
+
+# Limit passed to QUOTA_SCRIPT to count a use without enforcing a limit
+UNLIMITED_QUOTA = 2**53
+
+RATE_LIMIT_WINDOW_MS = 60_000
+
+# Sliding-window log: drop requests older than the window, admit this one under a unique
+# member if there is room, and report {allowed, remaining, reset_ms} in one round-trip.
+# KEYS[1] = rate limit key; ARGV = now_ms, window_ms, limit, member
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call("zremrangebyscore", KEYS[1], "-inf", now - window)
+local count = redis.call("zcard", KEYS[1])
+local allowed = 0
+if count < limit then
+    redis.call("zadd", KEYS[1], now, ARGV[4])
+    count = count + 1
+    allowed = 1
+end
+redis.call("pexpire", KEYS[1], window)
+local reset = now + window
+local oldest = redis.call("zrange", KEYS[1], 0, 0, "WITHSCORES")
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window
+end
+return {allowed, math.max(limit - count, 0), reset}
+"""
+
+_rate_limit_script: Optional[AsyncScript] = None
+_quota_script: Optional[AsyncScript] = None
+_release_quota_script: Optional[AsyncScript] = None
+
 
 async def init_redis() -> None:
     """Initialize Redis connection."""
@@ -21,8 +117,6 @@ async def init_redis() -> None:
     try:
         redis_client = Redis.from_url(
             settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
             socket_timeout=settings.REDIS_TIMEOUT,
             socket_connect_timeout=settings.REDIS_TIMEOUT,
             retry_on_timeout=True,
@@ -35,12 +129,89 @@ async def init_redis() -> None:
         else:
             raise ConnectionError("Failed to initialize Redis client")
 
+        if settings.REDIS_L1_CACHE_ENABLED:
+            init_local_cache()
+
     except (ConnectionError, TimeoutError) as e:
         logger.error(f"Failed to connect to Redis: {e}")
         redis_client = None
         raise
 
 
+def init_local_cache() -> None:
+    """Create the in-process L1 cache and start listening for invalidations from other workers."""
+    global local_cache, _invalidation_listener
+    local_cache = LocalCache(settings.REDIS_L1_CACHE_MAX_ENTRIES, settings.REDIS_L1_CACHE_MAX_BYTES, settings.REDIS_L1_CACHE_TTL)
+    _invalidation_listener = asyncio.create_task(_listen_for_invalidations())
+    logger.info(f"L1 cache enabled: {settings.REDIS_L1_CACHE_MAX_ENTRIES} entries, {settings.REDIS_L1_CACHE_MAX_BYTES} bytes, {settings.REDIS_L1_CACHE_TTL}s TTL")
+
+
+async def close_redis() -> None:
+    """Stop the invalidation listener and close the Redis connection."""
+    global redis_client, local_cache, _invalidation_listener
+    if _invalidation_listener is not None:
+        _invalidation_listener.cancel()
+        _invalidation_listener = None
+    local_cache = None
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+
+async def _listen_for_invalidations() -> None:
+    """Drop L1 entries that other workers changed, resubscribing after connection errors."""
+    while True:
+        try:
+            client = await get_redis()
+            if client is None:
+                return
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        handle_invalidation_message(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Cache invalidation listener failed, clearing L1 cache: {e}")
+            # Invalidations may have been missed while disconnected
+            if local_cache is not None:
+                local_cache.clear()
+            await asyncio.sleep(1)
+
+
+def handle_invalidation_message(data: Union[bytes, str]) -> None:
+    """Apply an ``{instance_id}:{key}`` invalidation published by another worker."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    origin, _, key = data.partition(":")
+    if origin != INSTANCE_ID and local_cache is not None:
+        local_cache.invalidate(key)
+
+
+def cache_key_prefix(key: str) -> str:
+    """Return the prefix cache statistics are grouped by, e.g. ``github_profile`` or ``github:repo_info``."""
+    parts = key.split(":", 2)
+    if parts[0] in CACHE_NAMESPACES and len(parts) > 1:
+        return f"{parts[0]}:{parts[1]}"
+    return parts[0]
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters per key prefix and L1 cache usage."""
+    prefixes = {}
+    for prefix, counts in sorted(_cache_stats.items()):
+        lookups = counts["l1_hits"] + counts["redis_hits"] + counts["misses"]
+        prefixes[prefix] = {
+            "l1_hits": counts["l1_hits"],
+            "redis_hits": counts["redis_hits"],
+            "misses": counts["misses"],
+            "lookups": lookups,
+            "hit_rate": round((counts["l1_hits"] + counts["redis_hits"]) / lookups, 3) if lookups else 0.0,
+        }
+    return {"l1": local_cache.stats() if local_cache is not None else None, "prefixes": prefixes}
+
+
 async def get_redis() -> Optional[Redis]:
     """Get Redis client instance."""
     if redis_client is None:
@@ -55,9 +226,17 @@ async def set_cache(key: str, value: Any, ttl: Optional[int] = None) -> bool:
         if client is None:
             logger.warning("Redis not available, skipping cache set")
             return False
-        serialized_value = json.dumps(value) if not isinstance(value, str) else value
+        serialized_value = encode_cache_value(value)
         cache_ttl = ttl or settings.REDIS_DEFAULT_TTL
-        await client.setex(key, cache_ttl, serialized_value)
+        if local_cache is None:
+            await client.setex(key, cache_ttl, serialized_value)
+            return True
+
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(key, cache_ttl, serialized_value)
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, f"{INSTANCE_ID}:{key}")
+        await pipe.execute()
+        local_cache.set(key, serialized_value, cache_ttl)
         return True
     except Exception as e:
         logger.error(f"Failed to set cache for key {key}: {e}")
@@ -65,21 +244,30 @@ async def set_cache(key: str, value: Any, ttl: Optional[int] = None) -> bool:
 
 
 async def get_cache(key: str) -> Optional[Any]:
-    """Get a value from Redis cache."""
+    """Get a value from the L1 cache or Redis."""
     try:
+        stats = _cache_stats[cache_key_prefix(key)]
+        if local_cache is not None:
+            value = local_cache.get(key)
+            if value is not None:
+                stats["l1_hits"] += 1
+                return decode_cache_value(value)
+
         client = await get_redis()
         if client is None:
             logger.warning("Redis not available, skipping cache get")
             return None
         value = await client.get(key)
         if value is None:
+            stats["misses"] += 1
             return None
 
-        # Try to deserialize JSON, fallback to string
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return value
+        stats["redis_hits"] += 1
+        if local_cache is not None:
+            local_cache.set(key, value)
+
+        # Values are deserialized per read so callers never share (and mutate) one object
+        return decode_cache_value(value)
 
     except Exception as e:
         logger.error(f"Failed to get cache for key {key}: {e}")
@@ -93,7 +281,15 @@ async def delete_cache(key: str) -> bool:
         if client is None:
             logger.warning("Redis not available, skipping cache delete")
             return False
-        await client.delete(key)
+        if local_cache is None:
+            await client.delete(key)
+            return True
+
+        local_cache.invalidate(key)
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(key)
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, f"{INSTANCE_ID}:{key}")
+        await pipe.execute()
         return True
     except Exception as e:
         logger.error(f"Failed to delete cache for key {key}: {e}")
@@ -113,78 +309,275 @@ async def check_redis_health() -> str:
         return "error"
 
 
-async def check_rate_limit(client_ip: str, requests_per_minute: int) -> tuple[bool, int]:
+async def check_rate_limit(client_ip: str, requests_per_minute: int) -> tuple[bool, int, int]:
     """
-    Check if a client has exceeded the rate limit using Redis sliding window.
+    Check and record a request against the client's sliding-window rate limit.
+
+    Runs ``RATE_LIMIT_SCRIPT`` in a single Redis round-trip.
 
     Args:
         client_ip: The client's IP address
         requests_per_minute: Maximum allowed requests per minute
 
     Returns:
-        Tuple of (is_allowed, current_count)
+        Tuple of (is_allowed, remaining, reset_at), where reset_at is the Unix time at which
+        the oldest request in the window expires and a slot frees up
     """
     try:
         client = await get_redis()
         if client is None:
             # If Redis is unavailable, allow the request (fail open)
             logger.warning("Redis not available for rate limiting, allowing request")
-            return True, 0
+            return True, requests_per_minute, int(time.time()) + RATE_LIMIT_WINDOW_MS // 1000
 
-        import time
+        now_ms = int(time.time() * 1000)
+        allowed, remaining, reset_ms = await _get_rate_limit_script(client)(
+            keys=[f"rate_limit:{client_ip}"],
+            args=[now_ms, RATE_LIMIT_WINDOW_MS, requests_per_minute, f"{now_ms}:{uuid.uuid4().hex[:8]}"],
+        )
+        is_allowed = bool(allowed)
 
-        key = f"rate_limit:{client_ip}"
-        current_time = int(time.time())
-        window_start = current_time - 60  # 1-minute sliding window
+        if not is_allowed:
+            logger.warning(f"Rate limit exceeded for {client_ip}: {requests_per_minute} requests per minute")
+
+        return is_allowed, int(remaining), -(-int(reset_ms) // 1000)
 
-        # Use Redis pipeline for atomic operations
-        pipe = client.pipeline()
+    except Exception as e:
+        logger.error(f"Rate limit check failed for {client_ip}: {e}")
+        # Fail open - allow request if Redis has issues
+        return True, requests_per_minute, int(time.time()) + RATE_LIMIT_WINDOW_MS // 1000
 
-        # Remove old entries outside the window
-        pipe.zremrangebyscore(key, 0, window_start)
 
-        # Add current request with timestamp as score
-        pipe.zadd(key, {str(current_time): current_time})
+def _get_rate_limit_script(client: Redis) -> AsyncScript:
+    """Return the rate limit script registered on ``client`` (run with EVALSHA, loaded on first use)."""
+    global _rate_limit_script
+    if _rate_limit_script is None or _rate_limit_script.registered_client is not client:
+        _rate_limit_script = client.register_script(RATE_LIMIT_SCRIPT)
+    return _rate_limit_script
 
-        # Count requests in the current window
-        pipe.zcard(key)
 
-        # Set expiry on the key (auto-cleanup)
-        pipe.expire(key, 120)  # 2 minutes to account for window
+async def consume_quota(key: str, limit: int, ttl: int = QUOTA_TTL_SECONDS) -> tuple[bool, int]:
+    """
+    Atomically check and count one use of a quota key.
 
-        results = await pipe.execute()
-        current_count = results[2]  # zcard result
+    Runs ``QUOTA_SCRIPT`` in a single Redis round-trip.
 
-        is_allowed = current_count <= requests_per_minute
+    Args:
+        key: The quota key (scope it by period, e.g. include the date)
+        limit: Maximum uses of the key
+        ttl: Seconds the key lives after its first use
 
-        if not is_allowed:
-            logger.warning(f"Rate limit exceeded for {client_ip}: {current_count}/{requests_per_minute}")
+    Returns:
+        Tuple of (is_allowed, count), where count is the number of uses recorded
+    """
+    try:
+        client = await get_redis()
+        if client is None:
+            logger.warning("Redis not available for quota check, allowing request")
+            return True, 0
 
-        return is_allowed, current_count
+        allowed, count = await _get_quota_script(client)(keys=[key], args=[limit, ttl])
+        return bool(allowed), int(count)
 
     except Exception as e:
-        logger.error(f"Rate limit check failed for {client_ip}: {e}")
-        # Fail open - allow request if Redis has issues
+        logger.error(f"Quota check failed for {key}: {e}")
+        # Fail open, like rate limiting
         return True, 0
 
 
-async def get_rate_limit_remaining(client_ip: str, requests_per_minute: int) -> int:
-    """Get the number of remaining requests for a client."""
+async def increment_quota(key: str, ttl: int = QUOTA_TTL_SECONDS) -> Optional[int]:
+    """Count one use of a quota key regardless of its limit; returns the new count, or None if Redis is unavailable."""
+    try:
+        client = await get_redis()
+        if client is None:
+            return None
+
+        # QUOTA_SCRIPT sets the expiry only on first use, so later uses never push it back
+        _, count = await _get_quota_script(client)(keys=[key], args=[UNLIMITED_QUOTA, ttl])
+        return int(count)
+
+    except Exception as e:
+        logger.error(f"Quota increment failed for {key}: {e}")
+        return None
+
+
+async def release_quota(key: str) -> None:
+    """Give back one use of a quota key taken by consume_quota; an expired key is left absent."""
+    try:
+        client = await get_redis()
+        if client is not None:
+            await _get_release_quota_script(client)(keys=[key])
+    except Exception as e:
+        logger.error(f"Quota release failed for {key}: {e}")
+
+
+def _get_quota_script(client: Redis) -> AsyncScript:
+    """Return the quota script registered on ``client`` (run with EVALSHA, loaded on first use)."""
+    global _quota_script
+    if _quota_script is None or _quota_script.registered_client is not client:
+        _quota_script = client.register_script(QUOTA_SCRIPT)
+    return _quota_script
+
+
+def _get_release_quota_script(client: Redis) -> AsyncScript:
+    """Return the quota release script registered on ``client`` (run with EVALSHA, loaded on first use)."""
+    global _release_quota_script
+    if _release_quota_script is None or _release_quota_script.registered_client is not client:
+        _release_quota_script = client.register_script(RELEASE_QUOTA_SCRIPT)
+    return _release_quota_script
+
+
+async def append_to_stream(key: str, value: Any, ttl: int, maxlen: int = 100) -> Optional[str]:
+    """Append ``value`` to the Redis stream ``key`` (capped near ``maxlen`` entries) and refresh its TTL; returns the entry id."""
+    try:
+        client = await get_redis()
+        if client is None:
+            return None
+
+        pipe = client.pipeline(transaction=True)
+        pipe.xadd(key, {"data": encode_cache_value(value)}, maxlen=maxlen, approximate=True)
+        pipe.expire(key, ttl)
+        entry_id, _ = await pipe.execute()
+        return entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
+
+    except Exception as e:
+        logger.error(f"Stream append failed for {key}: {e}")
+        return None
+
+
+async def read_stream(key: str, last_id: str = "0", block_ms: Optional[int] = None) -> Optional[List[Tuple[str, Any]]]:
+    """
+    Read entries of the Redis stream ``key`` after ``last_id``.
+
+    Args:
+        key: The stream key
+        last_id: Return entries after this id ("0" reads from the start)
+        block_ms: Wait up to this long (at most MAX_STREAM_BLOCK_MS) for a new entry; None returns immediately
+
+    Returns:
+        List of (entry_id, value) pairs, empty if nothing arrived, or None if Redis is unavailable
+    """
     try:
         client = await get_redis()
         if client is None:
-            return requests_per_minute
+            return None
 
-        import time
+        if block_ms is not None:
+            block_ms = min(block_ms, MAX_STREAM_BLOCK_MS)
+        response = await client.xread({key: last_id}, block=block_ms)
 
-        key = f"rate_limit:{client_ip}"
-        window_start = int(time.time()) - 60
+        entries = []
+        for _, stream_entries in response or []:
+            for entry_id, fields in stream_entries:
+                entry_id = entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
+                entries.append((entry_id, decode_cache_value(fields[b"data"])))
+        return entries
 
-        # Count current requests in window
-        current_count = await client.zcount(key, window_start, "+inf")
+    except Exception as e:
+        logger.error(f"Stream read failed for {key}: {e}")
+        return None
 
-        return max(0, requests_per_minute - current_count)
 
+async def single_flight(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    read_result: Callable[[], Awaitable[Optional[T]]],
+    lock_ttl: Optional[int] = None,
+    wait_timeout: Optional[float] = None,
+) -> T:
+    """Coalesce concurrent computations of ``key`` into one, within this process and across workers.
+
+    Callers in the same process share the in-flight task. Across workers a Redis lock
+    (``single_flight:{key}``) elects one leader; the others wait for the lock to clear and
+    then take the leader's result via ``read_result`` (typically a cache read). A caller
+    falls back to running ``compute`` itself when Redis is unavailable, the wait times out,
+    or the leader produced no result.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = _start_single_flight(key, compute, read_result, lock_ttl, wait_timeout)
+    else:
+        logger.info(f"Joining in-flight computation for {key}")
+    return await asyncio.shield(task)
+
+
+def _start_single_flight(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    read_result: Callable[[], Awaitable[Optional[T]]],
+    lock_ttl: Optional[int] = None,
+    wait_timeout: Optional[float] = None,
+) -> "asyncio.Task[T]":
+    """Start the shared task for ``key`` and register it until it finishes."""
+    task = asyncio.create_task(_run_single_flight(key, compute, read_result, lock_ttl or settings.SINGLE_FLIGHT_LOCK_TTL, wait_timeout or settings.SINGLE_FLIGHT_WAIT_TIMEOUT))
+    _inflight[key] = task
+    task.add_done_callback(lambda done: _inflight.pop(key, None) if _inflight.get(key) is done else None)
+    return task
+
+
+async def _run_single_flight(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    read_result: Callable[[], Awaitable[Optional[T]]],
+    lock_ttl: int,
+    wait_timeout: float,
+) -> T:
+    """Run ``compute`` under the cross-worker lock for ``key``, or wait for the worker holding it."""
+    lock_key = f"single_flight:{key}"
+    token = uuid.uuid4().hex
+    try:
+        client = await get_redis()
+        acquired = client is None or await client.set(lock_key, token, nx=True, ex=lock_ttl)
+    except Exception as e:
+        logger.error(f"Failed to acquire single-flight lock for {key}: {e}")
+        return await compute()
+
+    if acquired or client is None:
+        try:
+            return await compute()
+        finally:
+            if client is not None:
+                try:
+                    await cast(Awaitable[Any], client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+                except Exception as e:
+                    logger.error(f"Failed to release single-flight lock for {key}: {e}")
+
+    logger.info(f"Waiting for another worker to finish {key}")
+    deadline = time.monotonic() + wait_timeout
+    timed_out = False
+    try:
+        while await client.exists(lock_key):
+            if time.monotonic() >= deadline:
+                timed_out = True
+                break
+            await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
     except Exception as e:
-        logger.error(f"Failed to get rate limit remaining for {client_ip}: {e}")
-        return requests_per_minute
+        logger.error(f"Failed to wait on single-flight lock for {key}: {e}")
+
+    if timed_out:
+        logger.warning(f"Timed out waiting for in-flight computation of {key}, computing locally")
+        return await compute()
+
+    result = await read_result()
+    if result is not None:
+        return result
+
+    logger.info(f"In-flight computation of {key} produced no result, computing locally")
+    return await compute()
+
+
+def refresh_in_background(key: str, compute: Callable[[], Awaitable[Any]], read_result: Callable[[], Awaitable[Optional[Any]]]) -> bool:
+    """Start a single-flight recomputation of ``key`` without waiting for it.
+
+    Returns False when a computation of ``key`` is already running in this process; other
+    workers are deduplicated by the single-flight lock.
+    """
+    if key in _inflight:
+        return False
+
+    def log_failure(task: "asyncio.Task[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background refresh of {key} failed: {task.exception()}")
+
+    _start_single_flight(key, compute, read_result).add_done_callback(log_failure)
+    return True
@@ -2,8 +2,9 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -33,11 +34,12 @@ class GitHubProfile(Base):
     following = Column(Integer, default=0)
     public_gists = Column(Integer, default=0)
 
-    # Analyzed data (stored as JSON)
-    repositories_data = Column(JSON, nullable=True)  # Repository analysis
-    languages_data = Column(JSON, nullable=True)  # Programming languages
-    contribution_data = Column(JSON, nullable=True)  # Contribution patterns
-    skills_analysis = Column(JSON, nullable=True)  # Extracted skills
+    # Analyzed data (stored as JSONB); deferred so profile lookups skip it,
+    # load with .options(undefer_group("analysis")) when needed
+    repositories_data = deferred(Column(JSONB, nullable=True), group="analysis")  # Repository analysis
+    languages_data = deferred(Column(JSONB, nullable=True), group="analysis")  # Programming languages
+    contribution_data = deferred(Column(JSONB, nullable=True), group="analysis")  # Contribution patterns
+    skills_analysis = deferred(Column(JSONB, nullable=True), group="analysis")  # Extracted skills
 
     # Metadata
     last_analyzed = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
@@ -3,7 +3,8 @@
 from datetime import datetime, timezone
 
 from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -30,8 +31,8 @@ class Recommendation(Base):
 
     # AI generation metadata
     ai_model = Column(String, nullable=False)  # gemini-2.5-flash-lite, etc.
-    generation_prompt = Column(Text, nullable=True)
-    generation_parameters = Column(JSON, nullable=True)
+    generation_prompt = deferred(Column(Text, nullable=True))
+    generation_parameters = Column(JSONB, nullable=True)
 
     # Quality metrics
     word_count = Column(Integer, default=0)
@@ -40,7 +41,7 @@ class Recommendation(Base):
     selected_option_id = Column(Integer, nullable=True)
     selected_option_name = Column(String, nullable=True)
     selected_option_focus = Column(String, nullable=True)
-    generated_options = Column(JSON, nullable=True)  # Store all generated options for reference
+    generated_options = deferred(Column(JSONB, nullable=True))  # Store all generated options for reference (not loaded by default)
 
     # Metadata
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
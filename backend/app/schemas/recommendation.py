@@ -270,9 +270,11 @@ class StreamProgressResponse(BaseModel):
 
     stage: str = Field(..., description="Current processing stage")
     progress: int = Field(..., ge=0, le=100, description="Progress percentage")
-    status: str = Field(..., description="Current status: preparing, analyzing, processing, generating, finalizing, complete, error")
-    result: Optional[Dict[str, Any]] = Field(None, description="Final result when complete")
+    status: str = Field(..., description="Current status: preparing, analyzing, processing, generating, streaming, option_complete, finalizing, complete, error")
+    result: Optional[Dict[str, Any]] = Field(None, description="Final result when complete, or the finished option when status is option_complete")
     error: Optional[str] = Field(None, description="Error message if status is error")
+    option_id: Optional[int] = Field(None, description="Option the update belongs to when status is streaming or option_complete")
+    delta: Optional[str] = Field(None, description="Newly generated text for the option when status is streaming")
 
 
 class RecommendationListResponse(BaseModel):
@@ -282,3 +284,4 @@ class RecommendationListResponse(BaseModel):
     total: int
     page: int = 1
     page_size: int = 10
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page; pass as ?cursor= to continue")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark cache value encodings on profile analysis payloads.
+
+Builds profile analyses shaped like the ones ``GitHubUserService`` caches (profile data
+from ``app.scripts.factories`` plus repositories, commits and pull requests) and reports
+encoded size and encode/decode time for stdlib JSON text (the previous format) and for
+``app.core.cache_codec`` with each available compressor.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_cache_codec
+
+    # With options
+    python -m app.scripts.benchmark_cache_codec --repos 25 --commits 500 --iterations 200
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core import cache_codec  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.scripts.factories import create_github_profile_data  # noqa: E402
+
+LANGUAGES = ["Python", "TypeScript", "Go", "Rust", "JavaScript"]
+MESSAGES = [
+    "feat(api): add pagination to the search endpoint",
+    "fix: handle empty payloads in the webhook parser",
+    "refactor database layer for performance and security",
+    "docs: update README with deployment notes",
+    "test: cover retry behaviour of the GitHub client",
+]
+
+
+def build_analysis(username: str, repos: int, commits: int, pull_requests: int) -> Dict[str, Any]:
+    """Build a profile analysis payload of the given size."""
+    profile = create_github_profile_data(username)
+    return {
+        "user_data": profile,
+        "repositories": [
+            {
+                "name": f"project-{i}",
+                "full_name": f"{username}/project-{i}",
+                "description": f"Service {i} for handling {LANGUAGES[i % len(LANGUAGES)]} workloads at scale",
+                "language": LANGUAGES[i % len(LANGUAGES)],
+                "stars": i * 7,
+                "forks": i * 2,
+                "topics": ["api", "backend", LANGUAGES[i % len(LANGUAGES)].lower()],
+                "updated_at": f"2025-0{i % 9 + 1}-15T12:00:00Z",
+            }
+            for i in range(repos)
+        ],
+        "commit_analysis": {
+            "total_commits_analyzed": commits,
+            "commits": [
+                {
+                    "sha": f"{i:040x}",
+                    "message": MESSAGES[i % len(MESSAGES)],
+                    "repository": f"{username}/project-{i % max(repos, 1)}",
+                    "date": f"2025-0{i % 9 + 1}-{i % 28 + 1:02d}T09:30:00Z",
+                    "additions": i % 120,
+                    "deletions": i % 45,
+                }
+                for i in range(commits)
+            ],
+        },
+        "pull_requests": [
+            {
+                "number": i,
+                "title": f"Improve {MESSAGES[i % len(MESSAGES)].split(':')[-1].strip()}",
+                "state": "merged" if i % 3 else "open",
+                "repository": f"{username}/project-{i % max(repos, 1)}",
+                "body": "This change updates the module and adds tests for the new behaviour. " * 3,
+            }
+            for i in range(pull_requests)
+        ],
+        "skills": profile["skills_analysis"],
+        "languages": profile["languages_data"],
+        "analyzed_at": "2025-09-01T12:00:00+00:00",
+    }
+
+
+def time_per_call(fn: Callable[[], Any], iterations: int) -> float:
+    """Return mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def benchmark(payload: Dict[str, Any], iterations: int) -> List[Dict[str, Any]]:
+    """Measure each encoding of ``payload``."""
+    results = []
+
+    text = json.dumps(payload)
+    results.append(
+        {
+            "encoding": "json text (legacy)",
+            "bytes": len(text.encode("utf-8")),
+            "encode_ms": time_per_call(lambda: json.dumps(payload), iterations),
+            "decode_ms": time_per_call(lambda: json.loads(text), iterations),
+        }
+    )
+
+    compressions: List[Literal["zstd", "zlib", "none"]] = ["none", "zlib"]
+    if cache_codec.zstd_available:
+        compressions.append("zstd")
+    serializer = "orjson" if cache_codec.orjson_available else "json"
+    for compression in compressions:
+        settings.CACHE_COMPRESSION = compression
+        encoded = cache_codec.encode_cache_value(payload)
+        results.append(
+            {
+                "encoding": f"{serializer} + {compression}",
+                "bytes": len(encoded),
+                "encode_ms": time_per_call(lambda: cache_codec.encode_cache_value(payload), iterations),
+                "decode_ms": time_per_call(lambda: cache_codec.decode_cache_value(encoded), iterations),
+            }
+        )
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark cache value encodings")
+    parser.add_argument("--repos", type=int, default=10, help="Repositories per analysis")
+    parser.add_argument("--commits", type=int, default=150, help="Commits per analysis")
+    parser.add_argument("--pull-requests", type=int, default=40, help="Pull requests per analysis")
+    parser.add_argument("--iterations", type=int, default=500, help="Timed calls per encoding")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run every encoding and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    payload = build_analysis("octocat", args.repos, args.commits, args.pull_requests)
+    print(f"Profile analysis: {args.repos} repos, {args.commits} commits, {args.pull_requests} PRs; {args.iterations} iterations\n")
+    print(f"{'encoding':<20} {'bytes':>9} {'ratio':>6} {'encode ms':>10} {'decode ms':>10}")
+    results = benchmark(payload, args.iterations)
+    baseline = results[0]["bytes"]
+    for result in results:
+        print(f"{result['encoding']:<20} {result['bytes']:>9} {result['bytes'] / baseline:>6.2f} {result['encode_ms']:>10.3f} {result['decode_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Benchmark GitHub API calls per commit analysis for each commit stats mode.
+
+Runs ``GitHubCommitService.analyze_contributor_commits`` against an in-process fake
+GitHub API (no network, no token needed) and reports how many REST and GraphQL
+requests each ``GITHUB_COMMIT_STATS_MODE`` issues, plus wall time under a simulated
+per-request latency. It also reports the REST requests the dependency scan adds to a
+cold profile analysis when ``GITHUB_DEPENDENCY_SCAN`` is enabled.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_commit_stats
+
+    # With options
+    python -m app.scripts.benchmark_commit_stats --repos 10 --commits-per-repo 15 --latency-ms 50 --manifests-per-repo 6
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Tuple
+
+import httpx
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import app.services.ai  # noqa: E402,F401  (load the AI package first; it sits on an import cycle with analysis)
+from app.core.config import settings  # noqa: E402
+from app.services.github.github_api_client import GitHubAPIClient  # noqa: E402
+from app.services.github.github_commit_service import GitHubCommitService  # noqa: E402
+from app.services.github.github_user_service import DEPENDENCY_MANIFESTS, GitHubUserService  # noqa: E402
+
+USERNAME = "octocat"
+MESSAGES = [
+    "feat(api): add pagination to the search endpoint",
+    "fix: handle empty payloads in the webhook parser",
+    "refactor database layer for performance and security",
+    "docs: update README",
+    "chore: bump dependencies",
+]
+
+
+def build_transport(repos: int, commits_per_repo: int, latency_ms: float, counter: Counter) -> httpx.MockTransport:
+    """Build a fake GitHub API that serves commit lists, commit details and GraphQL stats."""
+
+    def commit_sha(repo_index: int, commit_index: int) -> str:
+        return f"{repo_index:04d}{commit_index:036d}"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_ms / 1000)
+        path = request.url.path
+
+        if path == "/graphql":
+            counter["graphql"] += 1
+            variables = json.loads(request.content)["variables"]
+            nodes = {f"c{key[3:]}": {"additions": 12, "deletions": 3, "changedFilesIfAvailable": 4} for key in variables if key.startswith("oid")}
+            return httpx.Response(200, json={"data": {"repository": nodes}})
+
+        counter["rest"] += 1
+        parts = path.strip("/").split("/")  # repos/{owner}/{name}/commits[/{sha}]
+        repo_index = int(parts[2].split("-")[1])
+
+        if len(parts) == 4:
+            commits = [{"sha": commit_sha(repo_index, i), "commit": {"message": MESSAGES[i % len(MESSAGES)], "author": {"date": "2024-01-01T00:00:00Z"}}} for i in range(commits_per_repo)]
+            return httpx.Response(200, json=commits)
+
+        return httpx.Response(200, json={"sha": parts[4], "stats": {"additions": 12, "deletions": 3}, "files": [{"filename": f"f{i}.py"} for i in range(4)]})
+
+    return httpx.MockTransport(handler)
+
+
+async def run_mode(mode: Literal["rest", "graphql", "lazy"], repos: int, commits_per_repo: int, latency_ms: float) -> Dict[str, Any]:
+    """Run one commit analysis in the given stats mode and collect request counts."""
+    counter: Counter = Counter()
+    service = GitHubCommitService()
+    service.github_client = GitHubAPIClient("ghp_benchmark", base_url="https://api.github.test", transport=build_transport(repos, commits_per_repo, latency_ms, counter))
+    repositories: List[Dict[str, Any]] = [{"name": f"repo-{i}", "full_name": f"{USERNAME}/repo-{i}"} for i in range(repos)]
+
+    original_mode = settings.GITHUB_COMMIT_STATS_MODE
+    settings.GITHUB_COMMIT_STATS_MODE = mode
+    try:
+        start = time.perf_counter()
+        analysis = await service.analyze_contributor_commits(USERNAME, repositories, max_commits=repos * commits_per_repo)
+        elapsed = time.perf_counter() - start
+    finally:
+        settings.GITHUB_COMMIT_STATS_MODE = original_mode
+        await service.github_client.aclose()
+
+    return {
+        "mode": mode,
+        "commits": analysis.get("total_commits_analyzed", 0),
+        "rest": counter["rest"],
+        "graphql": counter["graphql"],
+        "total": counter["rest"] + counter["graphql"],
+        "seconds": elapsed,
+    }
+
+
+def build_dependency_transport(manifests_per_repo: int, latency_ms: float, counter: Counter) -> httpx.MockTransport:
+    """Build a fake GitHub API whose repositories each hold ``manifests_per_repo`` dependency manifests."""
+    manifests = list(DEPENDENCY_MANIFESTS)[:manifests_per_repo]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_ms / 1000)
+        counter["rest"] += 1
+        parts = request.url.path.strip("/").split("/")  # repos/{owner}/{name}/git/trees/HEAD or repos/{owner}/{name}/contents/{path}
+
+        if parts[3] == "git":
+            return httpx.Response(200, json={"sha": f"tree-{parts[2]}", "tree": [{"path": name, "type": "blob"} for name in manifests], "truncated": False})
+
+        return httpx.Response(200, json={"type": "file", "encoding": "base64", "content": base64.b64encode(b"").decode()})
+
+    return httpx.MockTransport(handler)
+
+
+async def run_dependency_scan(repos: int, manifests_per_repo: int, latency_ms: float) -> Dict[str, Any]:
+    """Run the dependency scan of one cold profile analysis and collect its request count."""
+    counter: Counter = Counter()
+    service = GitHubUserService(GitHubCommitService())
+    service.github_client = GitHubAPIClient("ghp_benchmark", base_url="https://api.github.test", transport=build_dependency_transport(manifests_per_repo, latency_ms, counter))
+    repositories: List[Dict[str, Any]] = [{"name": f"repo-{i}", "full_name": f"{USERNAME}/repo-{i}"} for i in range(repos)]
+
+    try:
+        start = time.perf_counter()
+        await service._attach_dependencies(repositories)
+        elapsed = time.perf_counter() - start
+    finally:
+        await service.github_client.aclose()
+
+    return {"repositories": min(repos, service.DEPENDENCY_REPOSITORY_LIMIT), "rest": counter["rest"], "seconds": elapsed}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark GitHub API calls per commit analysis")
+    parser.add_argument("--repos", type=int, default=10, help="Repositories analyzed")
+    parser.add_argument("--commits-per-repo", type=int, default=15, help="Commits returned per repository")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated latency per request")
+    parser.add_argument("--manifests-per-repo", type=int, default=2, choices=range(len(DEPENDENCY_MANIFESTS) + 1), help="Dependency manifests in each repository's root")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run every mode and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    print(f"Commit analysis: {args.repos} repos x {args.commits_per_repo} commits, {args.latency_ms:.0f}ms simulated latency\n")
+    print(f"{'mode':<8} {'commits':>8} {'rest':>6} {'graphql':>8} {'total':>6} {'seconds':>8}")
+    modes: Tuple[Literal["rest", "graphql", "lazy"], ...] = ("rest", "graphql", "lazy")
+    for mode in modes:
+        result = await run_mode(mode, args.repos, args.commits_per_repo, args.latency_ms)
+        print(f"{result['mode']:<8} {result['commits']:>8} {result['rest']:>6} {result['graphql']:>8} {result['total']:>6} {result['seconds']:>8.2f}")
+
+    # The dependency scan is part of profile analysis, not commit analysis, and only runs when enabled
+    scan = await run_dependency_scan(args.repos, args.manifests_per_repo, args.latency_ms)
+    print(f"\nDependency scan per cold profile analysis: {scan['repositories']} repos x {args.manifests_per_repo} manifests")
+    print(f"{'GITHUB_DEPENDENCY_SCAN':<24} {'rest':>6} {'seconds':>8}")
+    print(f"{'false (default)':<24} {0:>6} {0:>8.2f}")
+    print(f"{'true':<24} {scan['rest']:>6} {scan['seconds']:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Time recommendation listing and profile lookups with and without the JSON blob columns.
+
+Run against a database seeded with ``python -m app.scripts.seed``. Each query is timed
+as the application now issues it (blob columns deferred) and with the blobs undeferred,
+which is what every ORM fetch loaded before. Seeded rows carry small blobs, so by default
+the seeded recommendations get realistic ``generated_options`` and profiles get larger
+repository data for the duration of the run; the changes are rolled back at the end.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.seed
+    python -m app.scripts.benchmark_json_columns
+
+    # With options
+    python -m app.scripts.benchmark_json_columns --iterations 200 --repos 100 --no-inflate
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer, undefer_group
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import AsyncSessionLocal  # noqa: E402
+from app.models import GitHubProfile, Recommendation  # noqa: E402
+from app.scripts.factories import SEED_GITHUB_PROFILES, _generate_sample_recommendation  # noqa: E402
+
+
+async def inflate_blobs(session: AsyncSession, repos: int) -> None:
+    """Give seeded rows blobs of realistic size (three options per recommendation, ``repos`` repositories per profile)."""
+    recommendations = (await session.execute(select(Recommendation))).scalars().all()
+    for recommendation in recommendations:
+        recommendation.generated_options = [
+            {"id": i, "name": f"Option {i}", "focus": focus, "content": _generate_sample_recommendation(str(recommendation.recommendation_type), str(recommendation.tone)) * 3, "word_count": 450}
+            for i, focus in enumerate(["technical", "leadership", "collaboration"], start=1)
+        ]
+
+    profiles = (await session.execute(select(GitHubProfile))).scalars().all()
+    for profile in profiles:
+        profile.repositories_data = [
+            {"name": f"project-{i}", "description": "A production service with extensive tests and documentation " * 3, "language": "Python", "stars": i, "topics": ["api", "backend"]}
+            for i in range(repos)
+        ]
+    await session.flush()
+    session.expunge_all()
+
+
+async def fetch_all(session: AsyncSession, query: Any) -> List[Any]:
+    """Execute ``query`` and load every row."""
+    return (await session.execute(query)).all()
+
+
+async def time_query(session: AsyncSession, run: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    """Return the median milliseconds of ``run``, expunging loaded rows between runs."""
+    timings: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    return statistics.median(timings)
+
+
+async def benchmark(session: AsyncSession, iterations: int) -> List[Dict[str, Any]]:
+    """Time listing and profile lookups with deferred and with undeferred blobs."""
+    username = SEED_GITHUB_PROFILES[0]["github_username"]
+
+    def listing(*options: Any) -> Callable[[], Awaitable[Any]]:
+        query = select(Recommendation, GitHubProfile.github_username).join(GitHubProfile).options(*options).order_by(Recommendation.created_at.desc()).limit(50)
+        return lambda: fetch_all(session, query)
+
+    def profile_lookup(*options: Any) -> Callable[[], Awaitable[Any]]:
+        query = select(GitHubProfile).where(GitHubProfile.github_username == username).options(*options)
+        return lambda: fetch_all(session, query)
+
+    rows = []
+    for name, before, after in (
+        ("list recommendations", listing(undefer(Recommendation.generated_options), undefer(Recommendation.generation_prompt)), listing()),
+        ("profile lookup", profile_lookup(undefer_group("analysis")), profile_lookup()),
+    ):
+        rows.append({"query": name, "before": await time_query(session, before, iterations), "after": await time_query(session, after, iterations)})
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Time queries with and without JSON blob columns")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed runs per query")
+    parser.add_argument("--repos", type=int, default=50, help="Repositories per profile when inflating blobs")
+    parser.add_argument("--no-inflate", action="store_true", help="Use the seeded blobs as they are")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    async with AsyncSessionLocal() as session:
+        try:
+            if not args.no_inflate:
+                await inflate_blobs(session, args.repos)
+            rows = await benchmark(session, args.iterations)
+        finally:
+            await session.rollback()
+
+    print(f"Median of {args.iterations} runs; before = blob columns loaded, after = deferred\n")
+    print(f"{'query':<22} {'before ms':>10} {'after ms':>9} {'speedup':>8}")
+    for row in rows:
+        print(f"{row['query']:<22} {row['before']:>10.3f} {row['after']:>9.3f} {row['before'] / row['after']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
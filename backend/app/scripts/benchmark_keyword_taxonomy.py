@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark keyword classification of commit messages.
+
+Classifies synthetic commit messages against ``COMMIT_KEYWORDS`` the way the commit
+analyzers used to (``keyword in message`` for every keyword of every category) and with
+the compiled taxonomy, checks both find the same keywords, and reports the timings.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_keyword_taxonomy
+
+    # With options
+    python -m app.scripts.benchmark_keyword_taxonomy --messages 10000 --iterations 5
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import app.services.ai  # noqa: E402,F401  (load the AI package first; it sits on an import cycle with analysis)
+from app.core.keyword_taxonomy import KeywordHits  # noqa: E402
+from app.services.github.github_commit_service import COMMIT_KEYWORDS  # noqa: E402
+
+PREFIXES = ["feat", "fix", "docs", "refactor", "test", "chore", "perf", ""]
+FILLER = ["the", "user", "settings", "page", "handler", "module", "when", "empty", "request", "config", "widget", "flow", "for", "and", "in"]
+
+
+def generate_messages(count: int, seed: int) -> List[str]:
+    """Build ``count`` commit messages mixing taxonomy keywords with filler words."""
+    rng = random.Random(seed)
+    keywords = sorted({keyword for categories in COMMIT_KEYWORDS.groups.values() for words in categories.values() for keyword in words})
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(keywords) if rng.random() < 0.25 else rng.choice(FILLER) for _ in range(rng.randint(3, 12))]
+        prefix = rng.choice(PREFIXES)
+        message = " ".join(words)
+        messages.append(f"{prefix}: {message}" if prefix else message.capitalize())
+    return messages
+
+
+def classify_with_substring_scans(messages: List[str]) -> List[KeywordHits]:
+    """Classify each message by testing every keyword with ``in``, as the analyzers did."""
+    results = []
+    for message in messages:
+        text = message.lower()
+        hits: KeywordHits = {}
+        for group, categories in COMMIT_KEYWORDS.groups.items():
+            hits[group] = {}
+            for category, keywords in categories.items():
+                found = {keyword for keyword in keywords if keyword in text}
+                if found:
+                    hits[group][category] = found
+        results.append(hits)
+    return results
+
+
+def time_run(run: Callable[[], Any], iterations: int) -> float:
+    """Return the median milliseconds of ``run``."""
+    timings: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark keyword classification of commit messages")
+    parser.add_argument("--messages", type=int, default=10_000, help="Synthetic commit messages to classify")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per matcher")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic messages")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run both matchers and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    messages = generate_messages(args.messages, args.seed)
+
+    if classify_with_substring_scans(messages) != COMMIT_KEYWORDS.classify_all(messages):
+        sys.exit("Matchers disagree; not reporting timings")
+
+    before = time_run(lambda: classify_with_substring_scans(messages), args.iterations)
+    after = time_run(lambda: COMMIT_KEYWORDS.classify_all(messages), args.iterations)
+    keyword_count = sum(len(words) for categories in COMMIT_KEYWORDS.groups.values() for words in categories.values())
+
+    print(f"{args.messages} messages, {keyword_count} keywords in {len(COMMIT_KEYWORDS.groups)} groups; median of {args.iterations} runs\n")
+    print(f"{'matcher':<18} {'ms':>10} {'us/message':>11}")
+    for name, elapsed in (("substring scans", before), ("compiled taxonomy", after)):
+        print(f"{name:<18} {elapsed:>10.1f} {elapsed * 1000 / args.messages:>11.2f}")
+    print(f"\nspeedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Benchmark the ASGI middleware against the previous BaseHTTPMiddleware stack.
+
+Serves a JSON endpoint and an SSE endpoint in-process behind either
+``ApplicationMiddleware`` or a replica of the previous stack (request ID, logging,
+security headers and error handling as four ``BaseHTTPMiddleware`` layers) and reports
+requests per second plus per-event SSE delivery latency. Rate limiting is left disabled
+so no Redis is needed.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_middleware
+
+    # With options
+    python -m app.scripts.benchmark_middleware --requests 5000 --concurrency 100 --events 200
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.middleware import SECURITY_HEADERS, ApplicationMiddleware  # noqa: E402
+
+CallNext = Callable[[Request], Awaitable[Response]]
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """Previous RequestIDMiddleware."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        request.state.request_id = str(uuid.uuid4())
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request.state.request_id
+        return response
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """Previous LoggingMiddleware."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        start_time = time.time()
+        logging.getLogger("app.core.middleware").info(f"Request started - URL: {request.url}")
+        response = await call_next(request)
+        logging.getLogger("app.core.middleware").info(f"Request completed - Status: {response.status_code}, Duration: {time.time() - start_time:.3f}s")
+        return response
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """Previous SecurityHeadersMiddleware."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        response = await call_next(request)
+        response.headers.update(SECURITY_HEADERS)
+        return response
+
+
+class LegacyErrorHandlingMiddleware(BaseHTTPMiddleware):
+    """Previous ErrorHandlingMiddleware, with the current error mapping."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        try:
+            return await call_next(request)
+        except Exception as e:
+            return await ApplicationMiddleware(self.app)._handle_error(e, request)
+
+
+def build_app(stack: str, sse_sent_at: List[float], events: int) -> FastAPI:
+    """Build an app with a JSON endpoint and an SSE endpoint behind ``stack``."""
+    api = FastAPI()
+    if stack == "asgi":
+        api.add_middleware(ApplicationMiddleware)
+    else:
+        for middleware in (LegacyErrorHandlingMiddleware, LegacySecurityHeadersMiddleware, LegacyLoggingMiddleware, LegacyRequestIDMiddleware):
+            api.add_middleware(middleware)
+
+    @api.get("/ping")
+    async def ping() -> Dict[str, bool]:
+        return {"ok": True}
+
+    @api.get("/events")
+    async def stream_events() -> StreamingResponse:
+        async def generate():
+            for i in range(events):
+                await asyncio.sleep(0.001)
+                sse_sent_at.append(time.perf_counter())
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    return api
+
+
+async def requests_per_second(api: FastAPI, requests: int, concurrency: int) -> float:
+    """Send ``requests`` JSON requests with ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(transport=ASGITransport(app=api), base_url="http://bench") as client:
+
+        async def one() -> None:
+            async with semaphore:
+                await client.get("/ping")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+async def sse_latencies(api: FastAPI, sse_sent_at: List[float]) -> List[float]:
+    """Stream /events over raw ASGI and return ms from each yield to its arrival at the server's send."""
+    received_at: List[float] = []
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/events",
+        "raw_path": b"/events",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        await asyncio.Event().wait()
+        return {}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            received_at.append(time.perf_counter())
+
+    await api(scope, receive, send)
+    return [(received - sent) * 1000 for sent, received in zip(sse_sent_at, received_at)]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark ASGI middleware against the BaseHTTPMiddleware stack")
+    parser.add_argument("--requests", type=int, default=2000, help="JSON requests per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight")
+    parser.add_argument("--events", type=int, default=100, help="Events per SSE stream")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both stacks and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    print(f"{args.requests} requests, {args.concurrency} concurrent; SSE stream of {args.events} events\n")
+    print(f"{'stack':<22} {'req/s':>9} {'sse mean ms':>12} {'sse p95 ms':>11}")
+    for stack, label in (("legacy", "BaseHTTPMiddleware x4"), ("asgi", "ApplicationMiddleware")):
+        sse_sent_at: List[float] = []
+        api = build_app(stack, sse_sent_at, args.events)
+        rps = await requests_per_second(api, args.requests, args.concurrency)
+        latencies = await sse_latencies(api, sse_sent_at)
+        print(f"{label:<22} {rps:>9.0f} {statistics.mean(latencies):>12.3f} {statistics.quantiles(latencies, n=20)[-1]:>11.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
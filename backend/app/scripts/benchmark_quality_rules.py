@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark per-option validation time of the recommendation quality checks.
+
+Every generated option is checked for naturalness, semantic alignment and generic content,
+and the confidence score adds specificity and natural voice scores on top. This times
+the full set of checks per option, and separately the phrase matching underneath them:
+``phrase.lower() in text.lower()`` for every rule phrase, the way the validators used
+to match, against one scan of the compiled ``QUALITY_RULES``.
+
+Options are the few-shot prompt examples with a distinct closing line each, so no two
+timed options share a cached text profile.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_quality_rules
+
+    # With options
+    python -m app.scripts.benchmark_quality_rules --options 2000 --iterations 5
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, cast
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.ai.ai_recommendation_service import AIRecommendationService  # noqa: E402
+from app.services.ai.human_story_generator import HumanStoryGenerator  # noqa: E402
+from app.services.ai.prompt_service import FEW_SHOT_EXAMPLES  # noqa: E402
+from app.services.ai.quality_rules import QUALITY_PHRASES, QUALITY_RULES, TextProfile  # noqa: E402
+
+GITHUB_DATA: Dict[str, Any] = {
+    "user_data": {"github_username": "marcus", "full_name": "Marcus Lee"},
+    "skills": {"technical_skills": ["python", "distributed systems", "postgresql", "redis", "docker"], "frameworks": ["django", "celery"]},
+    "languages": [],
+    "high_impact_contributions": {"notable_contributions": [{"repository": "payments"}]},
+}
+
+
+def build_options(count: int) -> List[str]:
+    """Build ``count`` distinct option texts from the few-shot examples."""
+    excellent = cast(List[Dict[str, str]], FEW_SHOT_EXAMPLES["excellent"])
+    avoid = cast(List[Dict[str, str]], FEW_SHOT_EXAMPLES["avoid"])
+    examples = [example["recommendation"] for example in excellent] + [example["example"] for example in avoid]
+    return [f"{examples[i % len(examples)]}\n\nOption {i} was reviewed on day {i % 365}." for i in range(count)]
+
+
+def match_with_substring_scans(text: str) -> Dict[str, Dict[str, List[str]]]:
+    """Find every rule phrase in ``text`` by testing each one with ``in``, as the validators did."""
+    return {group: {category: [phrase for phrase in phrases if phrase.lower() in text.lower()] for category, phrases in categories.items()} for group, categories in QUALITY_PHRASES.items()}
+
+
+def match_with_compiled_rules(text: str) -> Dict[str, Dict[str, List[str]]]:
+    """Find every rule phrase in ``text`` with one scan of the compiled rules."""
+    profile = TextProfile(text)
+    return {group: {category: profile.found(group, category) for category in categories} for group, categories in QUALITY_PHRASES.items()}
+
+
+def validate_option(service: AIRecommendationService, stories: HumanStoryGenerator, text: str) -> None:
+    """Run every quality check an option goes through."""
+    stories.validate_naturalness(text)
+    stories.validate_human_voice(text)
+    service._validate_semantic_alignment(text, GITHUB_DATA)
+    service._detect_generic_content(text)
+    service._score_specificity(text)
+    service._score_naturalness(text)
+
+
+def time_per_option(run: Callable[[str], Any], options: List[str], iterations: int) -> float:
+    """Return the median microseconds per option of ``run`` over ``options``."""
+    timings: List[float] = []
+    for iteration in range(iterations):
+        # A fresh suffix per iteration keeps cached text profiles from being reused across runs
+        texts = [f"{option} Run {iteration}." for option in options]
+        start = time.perf_counter()
+        for text in texts:
+            run(text)
+        timings.append((time.perf_counter() - start) * 1_000_000 / len(texts))
+    return statistics.median(timings)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark per-option recommendation quality checks")
+    parser.add_argument("--options", type=int, default=1000, help="Distinct option texts per run")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per measurement")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the measurements and print a table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    options = build_options(args.options)
+
+    if any(match_with_substring_scans(option) != match_with_compiled_rules(option) for option in options):
+        sys.exit("Matchers disagree; not reporting timings")
+
+    service = object.__new__(AIRecommendationService)  # The validators need no AI client
+    stories = HumanStoryGenerator()
+    rows = [
+        ("phrase matching, substring scans", time_per_option(match_with_substring_scans, options, args.iterations)),
+        ("phrase matching, compiled rules", time_per_option(match_with_compiled_rules, options, args.iterations)),
+        ("all quality checks per option", time_per_option(lambda text: validate_option(service, stories, text), options, args.iterations)),
+    ]
+
+    phrase_count = sum(len(phrases) for categories in QUALITY_PHRASES.values() for phrases in categories.values())
+    print(f"{args.options} options, {phrase_count} rule phrases ({len(QUALITY_RULES.groups)} groups); median of {args.iterations} runs\n")
+    print(f"{'measurement':<34} {'us/option':>10}")
+    for name, elapsed in rows:
+        print(f"{name:<34} {elapsed:>10.1f}")
+    print(f"\nphrase matching speedup: {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Load test the Redis rate limiter against a live Redis.
+
+Sends concurrent requests through ``ApplicationMiddleware`` on a minimal app and reports
+per-request latency with the limiter against the same app without it, plus how many
+requests of a same-instant burst were admitted. The previous limiter (a four-command
+pipeline followed by a ``ZCOUNT``, with second-granularity members) is run alongside
+for comparison.
+
+Requires a Redis server at ``REDIS_URL``; keys are written under ``rate_limit_bench:``.
+
+Usage:
+    # From backend directory
+    python -m app.scripts.benchmark_rate_limit
+
+    # With options
+    python -m app.scripts.benchmark_rate_limit --requests 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import app.services.ai  # noqa: E402,F401  (load the AI package first; it sits on an import cycle with analysis)
+from app.core import redis_client  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.middleware import ApplicationMiddleware  # noqa: E402
+
+
+async def legacy_check_rate_limit(client_ip: str, requests_per_minute: int) -> tuple[bool, int, int]:
+    """The previous limiter: pipeline then ZCOUNT, two round-trips per request."""
+    client = await redis_client.get_redis()
+    if client is None:
+        raise RuntimeError("This benchmark requires a Redis server at REDIS_URL")
+    key = f"rate_limit:{client_ip}"
+    current_time = int(time.time())
+    pipe = client.pipeline()
+    pipe.zremrangebyscore(key, 0, current_time - 60)
+    pipe.zadd(key, {str(current_time): current_time})
+    pipe.zcard(key)
+    pipe.expire(key, 120)
+    current_count = (await pipe.execute())[2]
+    remaining = max(0, requests_per_minute - await client.zcount(key, current_time - 60, "+inf"))
+    return current_count <= requests_per_minute, remaining, current_time + 60
+
+
+def build_app(rate_limited: bool) -> FastAPI:
+    """Build an app with one trivial endpoint."""
+    api = FastAPI()
+    if rate_limited:
+        api.add_middleware(ApplicationMiddleware, requests_per_minute=10**9)
+
+    @api.get("/ping")
+    async def ping() -> Dict[str, bool]:
+        return {"ok": True}
+
+    return api
+
+
+async def run_load(api: FastAPI, requests: int, concurrency: int) -> List[float]:
+    """Send ``requests`` requests with ``concurrency`` in flight and return latencies in ms."""
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(transport=ASGITransport(app=api, client=("198.51.100.7", 1234)), base_url="http://bench") as client:
+
+        async def one() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies
+
+
+async def admitted_in_burst(check: Callable[[str, int], Awaitable[tuple[bool, int, int]]], limit: int, burst: int) -> int:
+    """Fire ``burst`` checks at once against a fresh key with ``limit`` and count admissions."""
+    client_ip = f"rate_limit_bench:{time.time_ns()}"
+    results = await asyncio.gather(*(check(client_ip, limit) for _ in range(burst)))
+    return sum(1 for allowed, _, _ in results if allowed)
+
+
+def summarize(name: str, latencies: List[float], baseline: float) -> Dict[str, Any]:
+    """Return mean/p95 latency and overhead over the baseline mean."""
+    mean = statistics.mean(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    return {"name": name, "mean": mean, "p95": p95, "overhead": mean - baseline}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Load test the Redis rate limiter")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight")
+    parser.add_argument("--burst", type=int, default=100, help="Same-instant requests for the accuracy check")
+    parser.add_argument("--limit", type=int, default=60, help="Per-minute limit for the accuracy check")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the load test and print a comparison table."""
+    logging.getLogger("app").setLevel(logging.ERROR)
+    settings.ENABLE_RATE_LIMITING = True
+    await redis_client.init_redis()
+
+    try:
+        baseline = statistics.mean(await run_load(build_app(False), args.requests, args.concurrency))
+        script_check = redis_client.check_rate_limit
+        rows = [summarize("lua script", await run_load(build_app(True), args.requests, args.concurrency), baseline)]
+        redis_client.check_rate_limit = legacy_check_rate_limit
+        rows.append(summarize("pipeline + zcount", await run_load(build_app(True), args.requests, args.concurrency), baseline))
+        redis_client.check_rate_limit = script_check
+
+        print(f"{args.requests} requests, {args.concurrency} concurrent; no limiter mean {baseline:.3f}ms\n")
+        print(f"{'limiter':<18} {'mean ms':>8} {'p95 ms':>8} {'overhead ms':>12}")
+        for row in rows:
+            print(f"{row['name']:<18} {row['mean']:>8.3f} {row['p95']:>8.3f} {row['overhead']:>12.3f}")
+
+        print(f"\nBurst of {args.burst} with limit {args.limit}:")
+        print(f"  lua script:        {await admitted_in_burst(script_check, args.limit, args.burst)} admitted")
+        print(f"  pipeline + zcount: {await admitted_in_burst(legacy_check_rate_limit, args.limit, args.burst)} admitted")
+    finally:
+        await redis_client.close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,13 +1,16 @@
 """AI Recommendation Service for generating LinkedIn recommendations."""
 
+import asyncio
 import logging
 import re
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
+from app.core.cache_keys import build_ai_recommendation_cache_key
 from app.core.config import settings
 from app.core.redis_client import get_cache, set_cache
 from app.services.ai.human_story_generator import HumanStoryGenerator
 from app.services.ai.prompt_service import PromptService
+from app.services.ai.quality_rules import profile_text
 
 # Handle optional Google Generative AI import
 try:
@@ -22,6 +25,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Sampling parameters sent with every Gemini request; also part of the result cache key.
+GENERATION_SAMPLING_PARAMS: Dict[str, Any] = {"top_p": 0.9, "top_k": 40}
+
 
 class AIRecommendationService:
     """Service for generating AI-powered recommendations."""
@@ -37,8 +43,7 @@ class AIRecommendationService:
             self.generation_config = types.GenerateContentConfig(
                 temperature=settings.GEMINI_TEMPERATURE,
                 max_output_tokens=settings.GEMINI_MAX_TOKENS,
-                top_p=0.9,
-                top_k=40,
+                **GENERATION_SAMPLING_PARAMS,
             )
         self.rate_limit_requests_per_minute = 15
         self.request_timestamps = []
@@ -107,26 +112,11 @@ class AIRecommendationService:
                 "status": "processing",
             }
 
-            # Check cache for final result - include analysis context in cache key
-            # CRITICAL: Separate cache keys for different contexts to prevent data contamination
+            # Check cache for final result - the key covers prompt, model, generation params and context;
+            # repo_only results use a separate namespace to prevent data contamination
+            cache_key = self._build_cache_key(initial_prompt, analysis_context_type, repository_url)
             if analysis_context_type == "repo_only":
-                # Use separate cache namespace for repo_only to ensure complete isolation
-                if repository_url:
-                    repo_path = repository_url.replace("https://github.com/", "").split("?")[0]
-                    cache_key = f"ai_recommendation_repo_only:{hash(initial_prompt)}:{repo_path}"
-                else:
-                    cache_key = f"ai_recommendation_repo_only:{hash(initial_prompt)}"
                 logger.info(f"🔒 Using isolated cache key for repo_only context: {cache_key}")
-            else:
-                # Original caching logic for other contexts
-                context_suffix = ""
-                if analysis_context_type != "profile":
-                    context_suffix = f":{analysis_context_type}"
-                    if repository_url:
-                        repo_path = repository_url.replace("https://github.com/", "").split("?")[0]
-                        context_suffix += f":{repo_path}"
-
-                cache_key = f"ai_recommendation_v3:{hash(initial_prompt)}{context_suffix}"
 
             # Skip cache if force_refresh is requested
             if not force_refresh:
@@ -156,8 +146,6 @@ class AIRecommendationService:
                 "status": "generating",
             }
 
-            # Generate options with progress updates
-            options = []
             base_username = github_data["user_data"]["github_username"]
 
             # Extract display name for consistent naming (prioritizes first name)
@@ -179,49 +167,14 @@ class AIRecommendationService:
                 },
             ]
 
-            for i, config in enumerate(option_configs, 1):
-                progress = 50 + (i * 20)  # 70%, 90%
-                yield {
-                    "stage": f"Drafting {config['name']}...",
-                    "progress": progress,
-                    "status": "generating",
-                }
-
-                # Create customized prompt for this option
-                option_prompt = self.prompt_service.build_option_prompt(
-                    initial_prompt,
-                    str(config["custom_instruction"]),
-                    str(config["focus"]),
-                    focus_keywords,
-                    focus_weights,
-                )
-
-                # Generate the option
-                temp_modifier = config.get("temperature_modifier", 0.7)
-                temp_modifier = float(temp_modifier) if isinstance(temp_modifier, (int, float, str)) else 0.7
-
-                option_gen_params = {
-                    "github_username": base_username,
-                    "recommendation_type": recommendation_type,
-                    "tone": tone,
-                    "length": length,
-                    "focus": config["focus"],
-                }
-
-                option_content, validation_results = await self._generate_single_option(option_prompt, temp_modifier, length, option_gen_params, github_data)
-
-                # Create option object
-                option = {
-                    "id": i,
-                    "name": config["name"],
-                    "content": option_content.strip(),
-                    "title": self.prompt_service.extract_title(option_content, base_username, None, display_name),
-                    "word_count": len(option_content.split()),
-                    "focus": config["focus"],
-                    "validation_results": validation_results,
-                }
-
-                options.append(option)
+            # Stream every option concurrently; text deltas are forwarded as they arrive and each
+            # option is formatted and validated once its text is complete
+            options = []
+            async for update in self._stream_options(initial_prompt, option_configs, base_username, recommendation_type, tone, length, focus_keywords, focus_weights, display_name, github_data):
+                if update["status"] == "option_complete":
+                    options.append(update["result"])
+                yield update
+            options.sort(key=lambda option: option["id"])
 
             # Stage 5: Finalizing
             yield {
@@ -432,26 +385,11 @@ class AIRecommendationService:
             if settings.ENVIRONMENT == "development":
                 logger.info(f"✅ Prompt built with {len(initial_prompt)} characters")
 
-            # Check cache for final result - include analysis context in cache key
-            # CRITICAL: Separate cache keys for different contexts to prevent data contamination
+            # Check cache for final result - the key covers prompt, model, generation params and context;
+            # repo_only results use a separate namespace to prevent data contamination
+            cache_key = self._build_cache_key(initial_prompt, analysis_context_type, repository_url)
             if analysis_context_type == "repo_only":
-                # Use separate cache namespace for repo_only to ensure complete isolation
-                if repository_url:
-                    repo_path = repository_url.replace("https://github.com/", "").split("?")[0]
-                    cache_key = f"ai_recommendation_repo_only:{hash(initial_prompt)}:{repo_path}"
-                else:
-                    cache_key = f"ai_recommendation_repo_only:{hash(initial_prompt)}"
                 logger.info(f"🔒 Using isolated cache key for repo_only context: {cache_key}")
-            else:
-                # Original caching logic for other contexts
-                context_suffix = ""
-                if analysis_context_type != "profile":
-                    context_suffix = f":{analysis_context_type}"
-                    if repository_url:
-                        repo_path = repository_url.replace("https://github.com/", "").split("?")[0]
-                        context_suffix += f":{repo_path}"
-
-                cache_key = f"ai_recommendation_v3:{hash(initial_prompt)}{context_suffix}"
 
             # Skip cache if force_refresh is requested
             if not force_refresh:
@@ -651,7 +589,6 @@ class AIRecommendationService:
             parallel: If True, generate options concurrently for faster response.
                      Default True. Set False if hitting rate limits.
         """
-        import asyncio
         import time
 
         logger.info("🎭 GENERATING MULTIPLE OPTIONS")
@@ -721,7 +658,6 @@ class AIRecommendationService:
         github_data: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
         """Generate options in parallel using asyncio.gather for faster response."""
-        import asyncio
 
         logger.info(f"🚀 Starting parallel generation of {len(option_configs)} options")
 
@@ -884,6 +820,105 @@ class AIRecommendationService:
             parallel=False,
         )
 
+    async def _stream_options(
+        self,
+        initial_prompt: str,
+        option_configs: List[Dict[str, Any]],
+        base_username: str,
+        recommendation_type: str,
+        tone: str,
+        length: str,
+        focus_keywords: Optional[List[str]],
+        focus_weights: Optional[Dict[str, float]],
+        display_name: str,
+        github_data: Dict[str, Any],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream all options concurrently as progress updates.
+
+        Yields a ``streaming`` update with the option ``id`` and text ``delta`` for every chunk
+        Gemini returns, and an ``option_complete`` update carrying the formatted and validated
+        option once that option's text is complete.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def stream_option(config: Dict[str, Any], option_id: int) -> None:
+            try:
+                option_prompt = self.prompt_service.build_option_prompt(
+                    initial_prompt,
+                    str(config["custom_instruction"]),
+                    str(config["focus"]),
+                    focus_keywords,
+                    focus_weights,
+                )
+                temp_modifier = config.get("temperature_modifier", 0.7)
+                temp_modifier = float(temp_modifier) if isinstance(temp_modifier, (int, float, str)) else 0.7
+
+                chunks = []
+                async for delta in self._stream_single_option(option_prompt, temp_modifier):
+                    chunks.append(delta)
+                    await queue.put(("delta", option_id, delta))
+
+                option_gen_params = {
+                    "github_username": base_username,
+                    "recommendation_type": recommendation_type,
+                    "tone": tone,
+                    "length": length,
+                    "focus": config["focus"],
+                }
+                option_content, validation_results = self._process_option_content("".join(chunks), length, option_gen_params, github_data)
+                option = {
+                    "id": option_id,
+                    "name": config["name"],
+                    "content": option_content.strip(),
+                    "title": self.prompt_service.extract_title(option_content, base_username, None, display_name),
+                    "word_count": len(option_content.split()),
+                    "focus": config["focus"],
+                    "validation_results": validation_results,
+                }
+                await queue.put(("complete", option_id, option))
+            except Exception as e:
+                await queue.put(("error", option_id, e))
+
+        names = {i: config["name"] for i, config in enumerate(option_configs, 1)}
+        tasks = [asyncio.create_task(stream_option(config, i)) for i, config in enumerate(option_configs, 1)]
+        completed = 0
+        try:
+            while completed < len(tasks):
+                kind, option_id, payload = await queue.get()
+                if kind == "error":
+                    raise payload
+
+                if kind == "delta":
+                    yield {
+                        "stage": f"Drafting {names[option_id]}...",
+                        "progress": 50 + int(40 * completed / len(tasks)),
+                        "status": "streaming",
+                        "option_id": option_id,
+                        "delta": payload,
+                    }
+                    continue
+
+                completed += 1
+                yield {
+                    "stage": f"{names[option_id]} ready",
+                    "progress": 50 + int(40 * completed / len(tasks)),
+                    "status": "option_complete",
+                    "option_id": option_id,
+                    "result": payload,
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _build_cache_key(self, initial_prompt: str, analysis_context_type: str, repository_url: Optional[str]) -> str:
+        """Build the stable cache key for a recommendation generated from ``initial_prompt``."""
+        generation_params = {
+            "temperature": settings.GEMINI_TEMPERATURE,
+            "max_output_tokens": settings.GEMINI_MAX_TOKENS,
+            **GENERATION_SAMPLING_PARAMS,
+        }
+        return build_ai_recommendation_cache_key(initial_prompt, settings.GEMINI_MODEL, generation_params, analysis_context_type, repository_url)
+
     def _log_generation_complete(self, options: List[Dict[str, Any]], total_time: float) -> None:
         """Log completion of multiple options generation."""
         logger.info("🎉 MULTIPLE OPTIONS GENERATION COMPLETED")
@@ -1015,36 +1050,58 @@ class AIRecommendationService:
         if not self.client or not genai_available:
             raise ValueError("AI client not initialized")
 
-        # Adjust temperature for variety
-        config = types.GenerateContentConfig(
-            temperature=min(settings.GEMINI_TEMPERATURE + temperature_modifier, 2.0),
-            max_output_tokens=settings.GEMINI_MAX_TOKENS,
-            top_p=0.9,
-            top_k=40,
-        )
         try:
-            response = self.client.models.generate_content(model=settings.GEMINI_MODEL, contents=prompt, config=config)
+            response = await self.client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents=prompt, config=self._option_generation_config(temperature_modifier))
         except Exception as e:
-            if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                # Extract retry delay from error
-                import re
+            raise self._translate_generation_error(e)
 
-                match = re.search(r"retryDelay.*?(\d+)s", str(e))
-                retry_seconds = int(match.group(1)) if match else 60
+        # Get the raw content
+        raw_content = response.candidates[0].content.parts[0].text or ""
+        return self._process_option_content(raw_content, length, generation_params, github_data)
 
-                raise Exception(
-                    {
-                        "type": "rate_limit_exceeded",
-                        "message": f"API rate limit reached. Please wait {retry_seconds} seconds.",
-                        "retry_after": retry_seconds,
-                        "suggestions": ["Wait and try again", "Consider upgrading to Gemini Pro for higher limits", "Use fewer options to reduce API calls"],
-                    }
-                )
-            raise e
+    async def _stream_single_option(self, prompt: str, temperature_modifier: float) -> AsyncGenerator[str, None]:
+        """Stream the raw text of a single recommendation option as Gemini produces it."""
+        if not self.client or not genai_available:
+            raise ValueError("AI client not initialized")
 
-        # Get the raw content
-        raw_content = response.candidates[0].content.parts[0].text
+        try:
+            stream = await self.client.aio.models.generate_content_stream(model=settings.GEMINI_MODEL, contents=prompt, config=self._option_generation_config(temperature_modifier))
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise self._translate_generation_error(e)
+
+    def _option_generation_config(self, temperature_modifier: float) -> Any:
+        """Build the Gemini generation config for an option, adjusting temperature for variety."""
+        return types.GenerateContentConfig(
+            temperature=min(settings.GEMINI_TEMPERATURE + temperature_modifier, 2.0),
+            max_output_tokens=settings.GEMINI_MAX_TOKENS,
+            **GENERATION_SAMPLING_PARAMS,
+        )
+
+    def _translate_generation_error(self, error: Exception) -> Exception:
+        """Turn Gemini rate-limit errors into the structured error the API layer reports."""
+        if "429" not in str(error) and "RESOURCE_EXHAUSTED" not in str(error):
+            return error
+
+        # Extract retry delay from error
+        match = re.search(r"retryDelay.*?(\d+)s", str(error))
+        retry_seconds = int(match.group(1)) if match else 60
+
+        return Exception(
+            {
+                "type": "rate_limit_exceeded",
+                "message": f"API rate limit reached. Please wait {retry_seconds} seconds.",
+                "retry_after": retry_seconds,
+                "suggestions": ["Wait and try again", "Consider upgrading to Gemini Pro for higher limits", "Use fewer options to reduce API calls"],
+            }
+        )
 
+    def _process_option_content(
+        self, raw_content: str, length: str = "medium", generation_params: Optional[Dict[str, Any]] = None, github_data: Optional[Dict[str, Any]] = None
+    ) -> tuple[str, Optional[Dict[str, Any]]]:
+        """Format and validate the completed raw text of an option."""
         # Debug: Log raw AI output to see what we're working with
         logger.info(f"🔍 RAW AI OUTPUT (length: {len(raw_content)} chars):")
         logger.info(f"🔍 First 300 chars: {raw_content[:300]}...")
@@ -1266,7 +1323,7 @@ class AIRecommendationService:
         """Validate that the generated content semantically aligns with the input GitHub data."""
         validation_results = {"is_aligned": True, "alignment_score": 100, "issues": [], "suggestions": [], "data_coverage": {}}
 
-        content_lower = content.lower()
+        content_lower = profile_text(content).lower
 
         # Extract key data points from github_data
         user_data = github_data.get("user_data", {})
@@ -1343,248 +1400,41 @@ class AIRecommendationService:
         - Specificity requirements (technology mentions, examples, outcomes)
         - Structural quality checks
         """
-        generic_indicators = {
-            "buzzwords": [
-                "passionate",
-                "dedicated",
-                "hardworking",
-                "team player",
-                "quick learner",
-                "detail-oriented",
-                "problem solver",
-                "innovative",
-                "creative",
-                "proactive",
-                "results-driven",
-                "customer-focused",
-                "self-motivated",
-                "excellent communication",
-                "dynamic",
-                "synergistic",
-                "motivated",
-                "enthusiastic",
-                "driven",
-                "committed",
-            ],
-            "generic_phrases": [
-                "worked on various projects",
-                "contributed to the team",
-                "helped improve",
-                "was responsible for",
-                "played a key role",
-                "worked closely with",
-                "gained experience in",
-                "developed skills in",
-                "learned to use",
-                "has a strong background",
-                "brings a wealth of experience",
-                "demonstrated ability to",
-                "proven track record",
-                "exceeded expectations",
-                "went above and beyond",
-                "takes initiative",
-                "adds value",
-            ],
-            "vague_descriptors": [
-                "good at",
-                "skilled in",
-                "experienced with",
-                "knowledge of",
-                "understanding of",
-                "familiar with",
-                "comfortable with",
-                "proficient in",
-                "competent in",
-                "capable of",
-            ],
-            "linkedin_platitudes": [
-                "pleasure to work with",
-                "asset to any team",
-                "would be an asset",
-                "highly recommend",
-                "would not hesitate to recommend",
-                "without hesitation",
-                "any team would be lucky",
-                "lucky to have",
-                "pleasure of working",
-                "honor to work with",
-                "privilege to work",
-                "strongly recommend",
-                "wholeheartedly recommend",
-                "cannot recommend enough",
-                "one of the best",
-                "among the best",
-                "top performer",
-                "star performer",
-                "outstanding individual",
-                "exceptional talent",
-            ],
-            "ai_tells": [
-                "it's worth noting",
-                "importantly",
-                "furthermore",
-                "moreover",
-                "additionally",
-                "in conclusion",
-                "to summarize",
-                "it should be mentioned",
-                "notably",
-                "indeed",
-                "certainly",
-                "undoubtedly",
-                "without a doubt",
-                "needless to say",
-            ],
-        }
-
-        content_lower = content.lower()
+        profile = profile_text(content)
         detected_issues = []
 
-        # Count buzzwords
-        buzzword_count = 0
-        found_buzzwords = []
-        for buzzword in generic_indicators["buzzwords"]:
-            if buzzword in content_lower:
-                buzzword_count += 1
-                found_buzzwords.append(buzzword)
-
-        # Count generic phrases
-        generic_phrase_count = 0
-        found_generic_phrases = []
-        for phrase in generic_indicators["generic_phrases"]:
-            if phrase in content_lower:
-                generic_phrase_count += 1
-                found_generic_phrases.append(phrase)
-
-        # Count vague descriptors
-        vague_descriptor_count = 0
-        found_vague_descriptors = []
-        for descriptor in generic_indicators["vague_descriptors"]:
-            if descriptor in content_lower:
-                vague_descriptor_count += 1
-                found_vague_descriptors.append(descriptor)
-
-        # Count LinkedIn platitudes (heavily penalized)
-        platitude_count = 0
-        found_platitudes = []
-        for platitude in generic_indicators["linkedin_platitudes"]:
-            if platitude in content_lower:
-                platitude_count += 1
-                found_platitudes.append(platitude)
-
-        # Count AI tells
-        ai_tell_count = 0
-        found_ai_tells = []
-        for tell in generic_indicators["ai_tells"]:
-            if tell in content_lower:
-                ai_tell_count += 1
-                found_ai_tells.append(tell)
+        found_buzzwords = profile.found("generic_content", "buzzwords")
+        found_generic_phrases = profile.found("generic_content", "generic_phrases")
+        found_vague_descriptors = profile.found("generic_content", "vague_descriptors")
+        found_platitudes = profile.found("generic_content", "linkedin_platitudes")  # Heavily penalized
+        found_ai_tells = profile.found("generic_content", "ai_tells")
+        buzzword_count = len(found_buzzwords)
+        generic_phrase_count = len(found_generic_phrases)
+        vague_descriptor_count = len(found_vague_descriptors)
+        platitude_count = len(found_platitudes)
+        ai_tell_count = len(found_ai_tells)
 
         # SPECIFICITY REQUIREMENTS CHECK
         specificity_score = 100
         specificity_issues = []
 
         # Check for technology/skill mentions (at least 1 specific tech)
-        tech_indicators = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "go",
-            "rust",
-            "c++",
-            "c#",
-            "react",
-            "vue",
-            "angular",
-            "node",
-            "django",
-            "flask",
-            "fastapi",
-            "spring",
-            "docker",
-            "kubernetes",
-            "aws",
-            "gcp",
-            "azure",
-            "postgresql",
-            "mongodb",
-            "redis",
-            "graphql",
-            "rest",
-            "api",
-            "microservices",
-            "machine learning",
-            "tensorflow",
-            "pytorch",
-            "sql",
-            "nosql",
-            "ci/cd",
-            "git",
-            "linux",
-        ]
-        has_tech = any(tech in content_lower for tech in tech_indicators)
-        if not has_tech:
+        if not profile.count("generic_content", "technologies"):
             specificity_score -= 15
             specificity_issues.append("No specific technology mentioned")
 
         # Check for specific examples/incidents
-        example_indicators = [
-            "when",
-            "during",
-            "there was",
-            "i remember",
-            "one time",
-            "specifically",
-            "for example",
-            "in particular",
-            "instance",
-            "situation",
-            "project",
-            "incident",
-            "challenge",
-            "problem we faced",
-            "deadline",
-        ]
-        has_example = sum(1 for ind in example_indicators if ind in content_lower) >= 2
-        if not has_example:
+        if profile.count("generic_content", "examples") < 2:
             specificity_score -= 20
             specificity_issues.append("No specific examples or incidents mentioned")
 
         # Check for outcome/impact statements
-        outcome_indicators = [
-            "resulted in",
-            "led to",
-            "improved",
-            "reduced",
-            "increased",
-            "saved",
-            "achieved",
-            "delivered",
-            "completed",
-            "launched",
-            "shipped",
-            "fixed",
-            "solved",
-            "built",
-            "created",
-            "implemented",
-            "automated",
-            "streamlined",
-            "within an hour",
-            "in record time",
-            "ahead of schedule",
-            "under budget",
-        ]
-        has_outcome = any(ind in content_lower for ind in outcome_indicators)
-        if not has_outcome:
+        if not profile.count("generic_content", "outcomes"):
             specificity_score -= 15
             specificity_issues.append("No specific outcomes or impact mentioned")
 
         # Check for first-person perspective (personal voice)
-        first_person = ["i worked", "i saw", "i observed", "i watched", "i noticed", "impressed me", "what i", "my experience", "i've seen", "i remember", "i learned", "we worked", "our team"]
-        has_personal_voice = sum(1 for fp in first_person if fp in content_lower) >= 2
-        if not has_personal_voice:
+        if profile.count("generic_content", "first_person") < 2:
             specificity_score -= 10
             specificity_issues.append("Lacks personal voice/first-person perspective")
 
@@ -1894,117 +1744,43 @@ class AIRecommendationService:
 
     def _score_specificity(self, recommendation: str) -> Dict[str, Any]:
         """Score how specific vs generic the recommendation is."""
+        profile = profile_text(recommendation)
         score = 100
-        recommendation_lower = recommendation.lower()
 
-        # Penalize generic buzzwords
-        buzzwords = [
-            "passionate",
-            "dedicated",
-            "hardworking",
-            "team player",
-            "innovative",
-            "creative",
-            "proactive",
-            "results-driven",
-        ]
-        buzzword_count = sum(1 for bw in buzzwords if bw in recommendation_lower)
-        score -= buzzword_count * 5
-
-        # Penalize generic phrases
-        generic_phrases = [
-            "asset to any team",
-            "highly recommend",
-            "pleasure to work with",
-            "without hesitation",
-            "would be lucky",
-        ]
-        generic_count = sum(1 for phrase in generic_phrases if phrase in recommendation_lower)
-        score -= generic_count * 10
-
-        # Reward specific indicators
-        specific_indicators = [
-            "when",
-            "during",
-            "specifically",
-            "for example",
-            "i remember",
-            "one time",
-            "project",
-            "deadline",
-            "challenge",
-        ]
-        specific_count = sum(1 for ind in specific_indicators if ind in recommendation_lower)
-        score += min(20, specific_count * 5)
-
-        # Reward outcome mentions
-        outcome_words = [
-            "resulted",
-            "improved",
-            "reduced",
-            "saved",
-            "achieved",
-            "delivered",
-            "fixed",
-            "solved",
-            "built",
-            "launched",
-        ]
-        outcome_count = sum(1 for word in outcome_words if word in recommendation_lower)
-        score += min(15, outcome_count * 5)
+        # Penalize generic buzzwords and phrases
+        score -= profile.count("specificity", "buzzwords") * 5
+        score -= profile.count("specificity", "generic_phrases") * 10
+
+        # Reward specific indicators and outcome mentions
+        score += min(20, profile.count("specificity", "specific_indicators") * 5)
+        score += min(15, profile.count("specificity", "outcomes") * 5)
 
         return {"score": max(0, min(100, score))}
 
     def _score_naturalness(self, recommendation: str) -> Dict[str, Any]:
         """Score how natural and human-like the writing is."""
+        profile = profile_text(recommendation)
         score = 100
-        recommendation_lower = recommendation.lower()
 
         # Penalize AI tells
-        ai_tells = [
-            "it's worth noting",
-            "importantly",
-            "furthermore",
-            "moreover",
-            "additionally",
-            "in conclusion",
-            "notably",
-            "indeed",
-        ]
-        ai_tell_count = sum(1 for tell in ai_tells if tell in recommendation_lower)
-        score -= ai_tell_count * 10
+        score -= profile.count("naturalness", "ai_tells") * 10
 
         # Reward first-person voice
-        first_person = ["i ", "i've", "my ", "we ", "our "]
-        first_person_count = sum(1 for fp in first_person if fp in recommendation_lower)
-        score += min(15, first_person_count * 3)
+        score += min(15, profile.count("naturalness", "first_person") * 3)
 
         # Check sentence variety (penalize if all similar length)
-        sentences = [s.strip() for s in recommendation.split(".") if s.strip()]
+        sentences = profile.sentences
         if len(sentences) >= 3:
             lengths = [len(s.split()) for s in sentences]
             avg_len = sum(lengths) / len(lengths)
-            variance = sum((l - avg_len) ** 2 for l in lengths) / len(lengths)
+            variance = sum((length - avg_len) ** 2 for length in lengths) / len(lengths)
             if variance > 20:  # Good variety
                 score += 10
             elif variance < 5:  # Too uniform
                 score -= 10
 
         # Reward emotional language
-        emotion_words = [
-            "impressed",
-            "amazed",
-            "appreciate",
-            "admire",
-            "respect",
-            "enjoy",
-            "love",
-            "proud",
-            "grateful",
-            "pleasure",
-        ]
-        emotion_count = sum(1 for word in emotion_words if word in recommendation_lower)
-        score += min(10, emotion_count * 3)
+        score += min(10, profile.count("naturalness", "emotions") * 3)
 
         return {"score": max(0, min(100, score))}
 
@@ -2114,31 +1890,15 @@ class AIRecommendationService:
         config = types.GenerateContentConfig(
             temperature=settings.GEMINI_TEMPERATURE + 0.1,  # Slightly higher for refinement
             max_output_tokens=settings.GEMINI_MAX_TOKENS,
-            top_p=0.9,
-            top_k=40,
+            **GENERATION_SAMPLING_PARAMS,
         )
         try:
-            response = self.client.models.generate_content(model=settings.GEMINI_MODEL, contents=prompt, config=config)
+            response = await self.client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents=prompt, config=config)
         except Exception as e:
-            if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                # Extract retry delay from error
-                import re
-
-                match = re.search(r"retryDelay.*?(\d+)s", str(e))
-                retry_seconds = int(match.group(1)) if match else 60
-
-                raise Exception(
-                    {
-                        "type": "rate_limit_exceeded",
-                        "message": f"API rate limit reached. Please wait {retry_seconds} seconds.",
-                        "retry_after": retry_seconds,
-                        "suggestions": ["Wait and try again", "Consider upgrading to Gemini Pro for higher limits", "Use fewer options to reduce API calls"],
-                    }
-                )
-            raise e
+            raise self._translate_generation_error(e)
 
         # Get the raw content
-        raw_content = response.candidates[0].content.parts[0].text
+        raw_content = response.candidates[0].content.parts[0].text or ""
 
         # Debug: Log raw AI output to see what we're working with
         logger.info(f"🔄 RAW REGENERATION AI OUTPUT (length: {len(raw_content)} chars):")
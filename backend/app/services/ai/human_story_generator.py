@@ -4,6 +4,8 @@ import logging
 import random
 from typing import Any, Dict, List, Optional
 
+from app.services.ai.quality_rules import PERSONAL_PRONOUNS, QUALITY_PHRASES, profile_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -258,57 +260,7 @@ class HumanStoryGenerator:
         }
 
         # Advanced robotic pattern detection
-        self.robotic_patterns = {
-            "corporate_speak": [
-                "leverage",
-                "utilize",
-                "implement solutions",
-                "deliver value",
-                "drive results",
-                "optimize outcomes",
-                "facilitate",
-                "streamline",
-                "synergize",
-                "operationalize",
-                "monetize",
-                "ideate",
-            ],
-            "academic_language": [
-                "demonstrate proficiency",
-                "exhibit competency",
-                "possess knowledge",
-                "display aptitude",
-                "manifest skills",
-                "evidence suggests",
-                "data indicates",
-                "research shows",
-                "studies demonstrate",
-            ],
-            "ai_tells": [
-                "it's worth noting",
-                "it should be mentioned",
-                "importantly",
-                "additionally",
-                "furthermore",
-                "moreover",
-                "notably",
-                "it's important to note",
-                "one should consider",
-                "it must be said",
-            ],
-            "measurement_language": [
-                "commits per day",
-                "lines of code",
-                "productivity metrics",
-                "efficiency ratings",
-                "performance indicators",
-                "KPIs",
-                "benchmarks",
-                "quantifiable results",
-                "statistical analysis",
-            ],
-            "buzzword_overuse": ["passionate", "dedicated", "hardworking", "team player", "results-driven", "detail-oriented", "self-motivated", "proactive", "innovative", "dynamic", "synergistic"],
-        }
+        self.robotic_patterns = QUALITY_PHRASES["robotic_patterns"]
 
     def infer_personality_traits(self, commit_analysis: Dict[str, Any], pr_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Infer personality traits from technical contribution patterns."""
@@ -509,34 +461,14 @@ class HumanStoryGenerator:
 
     def validate_naturalness(self, text: str) -> Dict[str, Any]:
         """Validate that text sounds natural and human-like."""
-        robotic_phrases = [
-            "demonstrates expertise",
-            "shows proficiency",
-            "utilizes technologies",
-            "exhibits capabilities",
-            "maintains standards",
-            "total commits:",
-            "pull requests:",
-            "commit analysis",
-            "technical competency",
-            "contribution patterns",
-            "development activity",
-        ]
-
-        issues = []
-        for phrase in robotic_phrases:
-            if phrase.lower() in text.lower():
-                issues.append(f"Contains robotic phrase: '{phrase}'")
+        profile = profile_text(text)
+        issues = [f"Contains robotic phrase: '{phrase}'" for phrase in profile.found("story_naturalness", "robotic_phrases")]
 
         # Check for overly technical language
-        technical_words = ["SHA", "commit ID", "repository statistics", "API endpoints"]
-        for word in technical_words:
-            if word.lower() in text.lower():
-                issues.append(f"Contains technical jargon: '{word}'")
+        issues.extend(f"Contains technical jargon: '{word}'" for word in profile.found("story_naturalness", "technical_jargon"))
 
         # Check for paragraph structure
-        paragraphs = text.split("\n\n")
-        if len(paragraphs) < 2:
+        if len(profile.paragraphs) < 2:
             issues.append("Missing proper paragraph breaks")
 
         naturalness_score = max(0, 100 - len(issues) * 15)
@@ -679,12 +611,11 @@ class HumanStoryGenerator:
         issues = []
         suggestions = []
 
+        profile = profile_text(text)
+
         # Check for robotic patterns
-        for pattern_type, patterns in self.robotic_patterns.items():
-            found_patterns = []
-            for pattern in patterns:
-                if pattern.lower() in text.lower():
-                    found_patterns.append(pattern)
+        for pattern_type in self.robotic_patterns:
+            found_patterns = profile.found("robotic_patterns", pattern_type)
 
             if found_patterns:
                 issues.append(f"Contains {pattern_type}: {', '.join(found_patterns[:3])}")
@@ -697,7 +628,7 @@ class HumanStoryGenerator:
                     suggestions.append("Remove AI transition phrases - jump straight to the point")
 
         # Check sentence variety
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
+        sentences = profile.sentences
         if sentences:
             avg_length = sum(len(s.split()) for s in sentences) / len(sentences)
             if avg_length > 25:
@@ -705,9 +636,8 @@ class HumanStoryGenerator:
                 suggestions.append("Use shorter, more conversational sentences")
 
         # Check for personal pronouns (should have them)
-        personal_pronouns = ["I", "we", "my", "our", "me"]
-        text_words = text.lower().split()
-        personal_count = sum(1 for word in text_words if word in [p.lower() for p in personal_pronouns])
+        text_words = profile.words
+        personal_count = sum(1 for word in text_words if word in PERSONAL_PRONOUNS)
 
         if personal_count == 0:
             issues.append("Missing personal perspective - no first-person language")
@@ -717,24 +647,21 @@ class HumanStoryGenerator:
             suggestions.append("Include more personal observations and experiences")
 
         # Check for emotional language
-        emotion_words = ["impressed", "amazed", "surprised", "pleased", "proud", "excited", "grateful", "appreciate", "admire", "respect", "enjoy", "love"]
-        emotion_count = sum(1 for word in emotion_words if word.lower() in text.lower())
+        emotion_count = profile.count("human_voice", "emotions")
 
         if emotion_count == 0:
             issues.append("No emotional language - sounds detached")
             suggestions.append("Add emotional reactions to show genuine experience")
 
         # Check for specific examples vs general statements
-        specific_indicators = ["when", "during", "there was this", "I remember", "one time", "specifically", "for example", "in particular", "like when"]
-        specific_count = sum(1 for indicator in specific_indicators if indicator.lower() in text.lower())
+        specific_count = profile.count("human_voice", "specific_indicators")
 
         if specific_count == 0:
             issues.append("No specific examples - too general")
             suggestions.append("Include specific incidents and examples")
 
         # Check paragraph structure
-        paragraphs = text.split("\n\n")
-        if len(paragraphs) < 2:
+        if len(profile.paragraphs) < 2:
             issues.append("Missing paragraph structure")
             suggestions.append("Break content into clear paragraphs")
 
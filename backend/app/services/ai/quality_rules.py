@@ -0,0 +1,306 @@
+"""Phrase rules for recommendation quality checks, compiled once and shared by every validator.
+
+The phrase lists are compiled into one ``KeywordTaxonomy`` at import. ``profile_text``
+lowercases and tokenizes a text and scans it for every phrase in one pass; validators
+read their categories from the resulting ``TextProfile``. A phrase matches when it
+occurs anywhere in the lowercased text.
+"""
+
+from functools import cached_property, lru_cache
+from typing import Dict, List
+
+from app.core.keyword_taxonomy import KeywordTaxonomy
+
+# {rule group: {category: [phrase, ...]}}; phrases keep their casing for reporting
+QUALITY_PHRASES: Dict[str, Dict[str, List[str]]] = {
+    # Generic-content detection (AIRecommendationService._detect_generic_content)
+    "generic_content": {
+        "buzzwords": [
+            "passionate",
+            "dedicated",
+            "hardworking",
+            "team player",
+            "quick learner",
+            "detail-oriented",
+            "problem solver",
+            "innovative",
+            "creative",
+            "proactive",
+            "results-driven",
+            "customer-focused",
+            "self-motivated",
+            "excellent communication",
+            "dynamic",
+            "synergistic",
+            "motivated",
+            "enthusiastic",
+            "driven",
+            "committed",
+        ],
+        "generic_phrases": [
+            "worked on various projects",
+            "contributed to the team",
+            "helped improve",
+            "was responsible for",
+            "played a key role",
+            "worked closely with",
+            "gained experience in",
+            "developed skills in",
+            "learned to use",
+            "has a strong background",
+            "brings a wealth of experience",
+            "demonstrated ability to",
+            "proven track record",
+            "exceeded expectations",
+            "went above and beyond",
+            "takes initiative",
+            "adds value",
+        ],
+        "vague_descriptors": ["good at", "skilled in", "experienced with", "knowledge of", "understanding of", "familiar with", "comfortable with", "proficient in", "competent in", "capable of"],
+        "linkedin_platitudes": [
+            "pleasure to work with",
+            "asset to any team",
+            "would be an asset",
+            "highly recommend",
+            "would not hesitate to recommend",
+            "without hesitation",
+            "any team would be lucky",
+            "lucky to have",
+            "pleasure of working",
+            "honor to work with",
+            "privilege to work",
+            "strongly recommend",
+            "wholeheartedly recommend",
+            "cannot recommend enough",
+            "one of the best",
+            "among the best",
+            "top performer",
+            "star performer",
+            "outstanding individual",
+            "exceptional talent",
+        ],
+        "ai_tells": [
+            "it's worth noting",
+            "importantly",
+            "furthermore",
+            "moreover",
+            "additionally",
+            "in conclusion",
+            "to summarize",
+            "it should be mentioned",
+            "notably",
+            "indeed",
+            "certainly",
+            "undoubtedly",
+            "without a doubt",
+            "needless to say",
+        ],
+        "technologies": [
+            "python",
+            "javascript",
+            "typescript",
+            "java",
+            "go",
+            "rust",
+            "c++",
+            "c#",
+            "react",
+            "vue",
+            "angular",
+            "node",
+            "django",
+            "flask",
+            "fastapi",
+            "spring",
+            "docker",
+            "kubernetes",
+            "aws",
+            "gcp",
+            "azure",
+            "postgresql",
+            "mongodb",
+            "redis",
+            "graphql",
+            "rest",
+            "api",
+            "microservices",
+            "machine learning",
+            "tensorflow",
+            "pytorch",
+            "sql",
+            "nosql",
+            "ci/cd",
+            "git",
+            "linux",
+        ],
+        "examples": [
+            "when",
+            "during",
+            "there was",
+            "i remember",
+            "one time",
+            "specifically",
+            "for example",
+            "in particular",
+            "instance",
+            "situation",
+            "project",
+            "incident",
+            "challenge",
+            "problem we faced",
+            "deadline",
+        ],
+        "outcomes": [
+            "resulted in",
+            "led to",
+            "improved",
+            "reduced",
+            "increased",
+            "saved",
+            "achieved",
+            "delivered",
+            "completed",
+            "launched",
+            "shipped",
+            "fixed",
+            "solved",
+            "built",
+            "created",
+            "implemented",
+            "automated",
+            "streamlined",
+            "within an hour",
+            "in record time",
+            "ahead of schedule",
+            "under budget",
+        ],
+        "first_person": ["i worked", "i saw", "i observed", "i watched", "i noticed", "impressed me", "what i", "my experience", "i've seen", "i remember", "i learned", "we worked", "our team"],
+    },
+    # Specificity score of the confidence breakdown (AIRecommendationService._score_specificity)
+    "specificity": {
+        "buzzwords": ["passionate", "dedicated", "hardworking", "team player", "innovative", "creative", "proactive", "results-driven"],
+        "generic_phrases": ["asset to any team", "highly recommend", "pleasure to work with", "without hesitation", "would be lucky"],
+        "specific_indicators": ["when", "during", "specifically", "for example", "i remember", "one time", "project", "deadline", "challenge"],
+        "outcomes": ["resulted", "improved", "reduced", "saved", "achieved", "delivered", "fixed", "solved", "built", "launched"],
+    },
+    # Natural voice score of the confidence breakdown (AIRecommendationService._score_naturalness)
+    "naturalness": {
+        "ai_tells": ["it's worth noting", "importantly", "furthermore", "moreover", "additionally", "in conclusion", "notably", "indeed"],
+        "first_person": ["i ", "i've", "my ", "we ", "our "],
+        "emotions": ["impressed", "amazed", "appreciate", "admire", "respect", "enjoy", "love", "proud", "grateful", "pleasure"],
+    },
+    # Naturalness check of formatted options (HumanStoryGenerator.validate_naturalness)
+    "story_naturalness": {
+        "robotic_phrases": [
+            "demonstrates expertise",
+            "shows proficiency",
+            "utilizes technologies",
+            "exhibits capabilities",
+            "maintains standards",
+            "total commits:",
+            "pull requests:",
+            "commit analysis",
+            "technical competency",
+            "contribution patterns",
+            "development activity",
+        ],
+        "technical_jargon": ["SHA", "commit ID", "repository statistics", "API endpoints"],
+    },
+    # Robotic patterns reported by HumanStoryGenerator.validate_human_voice, by pattern type
+    "robotic_patterns": {
+        "corporate_speak": [
+            "leverage",
+            "utilize",
+            "implement solutions",
+            "deliver value",
+            "drive results",
+            "optimize outcomes",
+            "facilitate",
+            "streamline",
+            "synergize",
+            "operationalize",
+            "monetize",
+            "ideate",
+        ],
+        "academic_language": [
+            "demonstrate proficiency",
+            "exhibit competency",
+            "possess knowledge",
+            "display aptitude",
+            "manifest skills",
+            "evidence suggests",
+            "data indicates",
+            "research shows",
+            "studies demonstrate",
+        ],
+        "ai_tells": [
+            "it's worth noting",
+            "it should be mentioned",
+            "importantly",
+            "additionally",
+            "furthermore",
+            "moreover",
+            "notably",
+            "it's important to note",
+            "one should consider",
+            "it must be said",
+        ],
+        "measurement_language": [
+            "commits per day",
+            "lines of code",
+            "productivity metrics",
+            "efficiency ratings",
+            "performance indicators",
+            "KPIs",
+            "benchmarks",
+            "quantifiable results",
+            "statistical analysis",
+        ],
+        "buzzword_overuse": ["passionate", "dedicated", "hardworking", "team player", "results-driven", "detail-oriented", "self-motivated", "proactive", "innovative", "dynamic", "synergistic"],
+    },
+    # Human voice signals (HumanStoryGenerator.validate_human_voice)
+    "human_voice": {
+        "emotions": ["impressed", "amazed", "surprised", "pleased", "proud", "excited", "grateful", "appreciate", "admire", "respect", "enjoy", "love"],
+        "specific_indicators": ["when", "during", "there was this", "I remember", "one time", "specifically", "for example", "in particular", "like when"],
+    },
+}
+
+QUALITY_RULES = KeywordTaxonomy(QUALITY_PHRASES)
+
+# Whole words counted as first-person language by HumanStoryGenerator.validate_human_voice
+PERSONAL_PRONOUNS = frozenset({"i", "we", "my", "our", "me"})
+
+
+class TextProfile:
+    """A text normalized once for every quality check: lowercased, tokenized and scanned for all rule phrases."""
+
+    def __init__(self, text: str) -> None:
+        """Lowercase ``text``, split it into words and find every rule phrase in it."""
+        self.text = text
+        self.lower = text.lower()
+        self.words = self.lower.split()
+        self.phrases = QUALITY_RULES.keywords_in(self.lower)
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Non-empty sentences, split on periods."""
+        return [sentence.strip() for sentence in self.text.split(".") if sentence.strip()]
+
+    @cached_property
+    def paragraphs(self) -> List[str]:
+        """Paragraphs, split on blank lines."""
+        return self.text.split("\n\n")
+
+    def found(self, group: str, category: str) -> List[str]:
+        """Return the phrases of a rule category that occur in the text, in rule order."""
+        return [phrase for phrase, normalized in zip(QUALITY_PHRASES[group][category], QUALITY_RULES.groups[group][category]) if normalized in self.phrases]
+
+    def count(self, group: str, category: str) -> int:
+        """Return how many phrases of a rule category occur in the text."""
+        return len(self.found(group, category))
+
+
+@lru_cache(maxsize=64)
+def profile_text(text: str) -> TextProfile:
+    """Return the profile of ``text``; validators run on the same option text share one scan."""
+    return TextProfile(text)
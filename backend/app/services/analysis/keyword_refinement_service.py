@@ -70,7 +70,7 @@ class KeywordRefinementService:
                 top_k=40,
             )
 
-            response = self.client.models.generate_content(model=settings.GEMINI_MODEL, contents=refinement_prompt, config=config)
+            response = await self.client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents=refinement_prompt, config=config)
             refined_content = response.candidates[0].content.parts[0].text
 
             # Apply formatting
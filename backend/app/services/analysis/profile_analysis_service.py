@@ -4,6 +4,8 @@ import json
 import logging
 from typing import Any, Dict, List
 
+from app.services.analysis.skill_detector import get_skill_detector
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,90 +24,7 @@ class ProfileAnalysisService:
         domains = set()
         dependencies_found = set()
 
-        # Enhanced framework and technology mappings
-        framework_patterns = {
-            # JavaScript Frameworks
-            "React": ["react", "reactjs", "react.js", "next.js", "nextjs", "create-react-app", "react-native"],
-            "Vue": ["vue", "vuejs", "vue.js", "nuxt", "nuxtjs", "nuxt.js"],
-            "Angular": ["angular", "angularjs", "angular.js", "@angular"],
-            "Svelte": ["svelte", "sveltekit"],
-            "Express": ["express", "expressjs", "express.js"],
-            "NestJS": ["nestjs", "nest.js", "@nestjs"],
-            # Python Frameworks
-            "Django": ["django", "django-rest-framework", "djangorestframework"],
-            "Flask": ["flask", "flask-restful", "flask-sqlalchemy"],
-            "FastAPI": ["fastapi", "fastapi-users", "fastapi-admin"],
-            "TensorFlow": ["tensorflow", "tf-", "keras"],
-            "PyTorch": ["torch", "pytorch", "torchvision"],
-            "Scikit-learn": ["scikit-learn", "sklearn"],
-            "Pandas": ["pandas", "pandas-profiling"],
-            "NumPy": ["numpy", "numpy-financial"],
-            "Matplotlib": ["matplotlib", "matplotlib.pyplot"],
-            # Java Frameworks
-            "Spring": ["spring", "spring-boot", "spring-framework", "spring-mvc", "spring-data", "spring-security"],
-            "Hibernate": ["hibernate", "hibernate-core"],
-            "Maven": ["maven", "maven-plugin"],
-            "Gradle": ["gradle", "gradle-wrapper"],
-            # .NET Frameworks
-            "ASP.NET": ["asp.net", "asp.net-core", "asp.net-mvc", "asp.net-web-api"],
-            "Entity Framework": ["entity-framework", "entityframework", "ef-core"],
-            # Go Frameworks
-            "Gin": ["gin", "gin-gonic/gin"],
-            "Echo": ["echo", "labstack/echo"],
-            "Fiber": ["fiber", "gofiber/fiber"],
-            # Ruby Frameworks
-            "Rails": ["rails", "ruby-on-rails", "ror"],
-            "Sinatra": ["sinatra"],
-            # PHP Frameworks
-            "Laravel": ["laravel", "laravel/framework"],
-            "Symfony": ["symfony", "symfony/framework"],
-            "CodeIgniter": ["codeigniter"],
-            # Rust Frameworks
-            "Actix": ["actix", "actix-web"],
-            "Rocket": ["rocket", "rocket_contrib"],
-            "Tokio": ["tokio", "tokio-util"],
-        }
-
-        tool_patterns = {
-            # Cloud Platforms
-            "AWS": ["aws", "amazon-web-services", "boto3", "aws-sdk", "aws-cli", "ec2", "s3", "lambda"],
-            "Google Cloud": ["gcp", "google-cloud", "google-cloud-platform", "gcloud", "firebase"],
-            "Azure": ["azure", "microsoft-azure", "azure-sdk"],
-            "Heroku": ["heroku", "heroku-cli"],
-            "Vercel": ["vercel", "vercel-cli"],
-            "Netlify": ["netlify", "netlify-cli"],
-            # Containers & Orchestration
-            "Docker": ["docker", "docker-compose", "dockerfile", "containerd"],
-            "Kubernetes": ["kubernetes", "k8s", "kubectl", "helm", "istio"],
-            "Podman": ["podman", "buildah"],
-            # Databases
-            "PostgreSQL": ["postgresql", "psycopg2", "postgres", "pg"],
-            "MySQL": ["mysql", "pymysql", "mysql-connector"],
-            "MongoDB": ["mongodb", "pymongo", "mongoose"],
-            "Redis": ["redis", "redis-py"],
-            "SQLite": ["sqlite", "sqlite3"],
-            "Elasticsearch": ["elasticsearch", "elasticsearch-py"],
-            # CI/CD & DevOps
-            "Jenkins": ["jenkins", "jenkins-pipeline"],
-            "GitLab CI": ["gitlab-ci", "gitlab-ci.yml"],
-            "GitHub Actions": ["github-actions", "actions"],
-            "CircleCI": ["circleci", "circle-ci"],
-            "Travis CI": ["travis-ci", ".travis.yml"],
-            # Version Control
-            "Git": ["git", "git-flow", "git-lfs"],
-            "GitHub": ["github", "github-api"],
-            # Testing
-            "Jest": ["jest", "@testing-library"],
-            "Mocha": ["mocha", "chai"],
-            "PyTest": ["pytest", "pytest-django"],
-            "JUnit": ["junit", "junit5"],
-            "Selenium": ["selenium", "selenium-webdriver"],
-            # Build Tools
-            "Webpack": ["webpack", "webpack-cli"],
-            "Vite": ["vite", "vitejs"],
-            "Babel": ["babel", "@babel"],
-            "TypeScript": ["typescript", "ts-node", "@types"],
-        }
+        detector = get_skill_detector()
 
         # Extract from languages
         languages = {repo.get("language") for repo in repositories if repo.get("language")}
@@ -117,20 +36,12 @@ class ProfileAnalysisService:
             topics = repo.get("topics", [])
             technical_skills.update(topics)
 
-            # Enhanced description analysis
+            # Check for frameworks and tools in description
             description = repo.get("description", "")
             if description:
-                description_lower = description.lower()
-
-                # Check for frameworks in description
-                for framework, patterns in framework_patterns.items():
-                    if any(pattern in description_lower for pattern in patterns):
-                        frameworks.add(framework)
-
-                # Check for tools in description
-                for tool, patterns in tool_patterns.items():
-                    if any(pattern in description_lower for pattern in patterns):
-                        tools.add(tool)
+                matches = detector.match_text(description)
+                frameworks.update(matches["frameworks"])
+                tools.update(matches["tools"])
 
             # Analyze repository dependencies (if available)
             try:
@@ -139,76 +50,33 @@ class ProfileAnalysisService:
 
                 # Map dependencies to frameworks and tools
                 for dep in repo_dependencies:
-                    dep_lower = dep.lower()
-
-                    # Check if dependency matches known frameworks
-                    for framework, patterns in framework_patterns.items():
-                        if any(pattern in dep_lower or dep_lower in pattern for pattern in patterns):
-                            frameworks.add(framework)
-                            break
-
-                    # Check if dependency matches known tools
-                    for tool, patterns in tool_patterns.items():
-                        if any(pattern in dep_lower or dep_lower in pattern for pattern in patterns):
-                            tools.add(tool)
-                            break
+                    matches = detector.match_dependency(dep)
+                    frameworks.update(matches["frameworks"])
+                    tools.update(matches["tools"])
 
                     # Add dependency as technical skill if it's a well-known library
-                    if len(dep) > 2 and not any(char.isdigit() for char in dep):
-                        technical_skills.add(dep.title())
+                    skill_name = dep.split("/")[-1].lstrip("@") if dep.startswith("@") else dep
+                    if len(skill_name) > 2 and not any(char.isdigit() for char in skill_name):
+                        technical_skills.add(skill_name.title())
 
             except Exception as e:
                 logger.debug(f"Error analyzing dependencies for {repo.get('name', 'unknown')}: {e}")
 
-        # Extract from repository names (additional signal)
-        for repo in repositories:
-            repo_name = repo.get("name", "").lower()
-            for framework, patterns in framework_patterns.items():
-                if any(pattern in repo_name for pattern in patterns):
-                    frameworks.add(framework)
+            # Extract frameworks from the repository name (additional signal)
+            frameworks.update(detector.match_text(repo.get("name", ""))["frameworks"])
 
-        # Extract from bio with enhanced pattern matching
+        # Extract domains, frameworks and tools from bio
         bio = user_data.get("bio", "")
         if bio:
-            bio_lower = bio.lower()
-
-            # Domain detection
-            domain_patterns = {
-                "Machine Learning": ["machine learning", "ml", "deep learning", "neural network", "ai", "artificial intelligence"],
-                "Data Science": ["data science", "data analysis", "data visualization", "statistics", "analytics"],
-                "Web Development": ["web development", "web dev", "frontend", "backend", "fullstack", "web application"],
-                "Mobile Development": ["mobile", "ios", "android", "react native", "flutter", "swift", "kotlin"],
-                "DevOps": ["devops", "infrastructure", "deployment", "ci/cd", "automation", "cloud"],
-                "Cybersecurity": ["security", "cybersecurity", "encryption", "authentication", "penetration testing"],
-                "Game Development": ["game", "unity", "unreal", "godot", "game engine"],
-                "Blockchain": ["blockchain", "ethereum", "smart contract", "web3", "cryptocurrency"],
-                "IoT": ["iot", "internet of things", "embedded", "raspberry pi", "arduino"],
-                "API Development": ["api", "rest", "graphql", "microservices", "soap"],
-            }
-
-            for domain, patterns in domain_patterns.items():
-                if any(pattern in bio_lower for pattern in patterns):
-                    domains.add(domain)
-
-            # Extract additional frameworks and tools from bio
-            for framework, patterns in framework_patterns.items():
-                if any(pattern in bio_lower for pattern in patterns):
-                    frameworks.add(framework)
-
-            for tool, patterns in tool_patterns.items():
-                if any(pattern in bio_lower for pattern in patterns):
-                    tools.add(tool)
+            matches = detector.match_text(bio)
+            domains.update(matches["domains"])
+            frameworks.update(matches["frameworks"])
+            tools.update(matches["tools"])
 
         # Extract from user company/location (additional context)
-        company = user_data.get("company", "")
-        location = user_data.get("location", "")
-
-        for field in [company, location]:
+        for field in [user_data.get("company", ""), user_data.get("location", "")]:
             if field:
-                field_lower = field.lower()
-                for tool, patterns in tool_patterns.items():
-                    if any(pattern in field_lower for pattern in patterns):
-                        tools.add(tool)
+                tools.update(detector.match_text(field)["tools"])
 
         # Clean up and deduplicate
         technical_skills = {skill for skill in technical_skills if skill and len(str(skill)) > 1}
@@ -227,7 +95,8 @@ class ProfileAnalysisService:
 
     def _analyze_repository_dependencies(self, repo: Dict[str, Any]) -> List[str]:
         """Analyze repository dependencies from various dependency files."""
-        dependencies = []
+        # Names GitHubUserService already parsed from the repository's manifests
+        dependencies = list(repo.get("dependencies", []))
         dependency_files = repo.get("dependency_files", [])
 
         for file_info in dependency_files:
@@ -243,9 +112,7 @@ class ProfileAnalysisService:
 
                     for dep_dict in [deps, dev_deps]:
                         for package_name in dep_dict.keys():
-                            # Remove scope for scoped packages
-                            if package_name.startswith("@"):
-                                package_name = package_name.split("/")[1] if "/" in package_name else package_name[1:]
+                            # Scoped packages keep their scope; the skill detector resolves it
                             dependencies.append(package_name.lower())
                 except json.JSONDecodeError:
                     pass
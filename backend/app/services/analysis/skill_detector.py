@@ -0,0 +1,87 @@
+"""Skill detection from dependencies, free text and file paths over a shared taxonomy."""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Mapping, Set, Tuple
+
+from app.core.keyword_taxonomy import KeywordTaxonomy
+
+SKILL_TAXONOMY_PATH = Path(__file__).with_name("skill_taxonomy.json")
+
+# Separators after a package's leading name segment, e.g. django-filter, flask_cors, echo/v4
+DEPENDENCY_SEGMENT_SEPARATORS = re.compile(r"[-_./]")
+
+# {kind: skill names found}; kind is one of the taxonomy's top-level keys (frameworks, tools, domains)
+SkillMatches = Dict[str, Set[str]]
+
+
+class SkillDetector:
+    """Skill taxonomy compiled into lookup indexes.
+
+    The taxonomy maps ``{kind: {skill: {"patterns": [...], "files": [...], "packages": [...]}}}``.
+    Patterns are matched as substrings of free text (descriptions, bios, commit messages)
+    in a single scan, and as package names in a dict lookup. File patterns are only
+    matched against file paths, together with the patterns. Packages are extra package
+    names (e.g. ``next``) that are too generic to look for in free text.
+    """
+
+    def __init__(self, taxonomy: Mapping[str, Mapping[str, Mapping[str, List[str]]]]) -> None:
+        """Compile the text, path and dependency indexes."""
+        self.kinds = list(taxonomy)
+        self._text = KeywordTaxonomy({kind: {skill: entry["patterns"] for skill, entry in skills.items()} for kind, skills in taxonomy.items()})
+        self._paths = KeywordTaxonomy({kind: {skill: entry["patterns"] + entry.get("files", []) for skill, entry in skills.items()} for kind, skills in taxonomy.items()})
+
+        self._dependencies: Dict[str, List[Tuple[str, str]]] = {}
+        for kind, skills in taxonomy.items():
+            for skill, entry in skills.items():
+                for pattern in entry["patterns"] + entry.get("packages", []):
+                    self._dependencies.setdefault(pattern.lower(), []).append((kind, skill))
+
+    def skills(self, kind: str) -> List[str]:
+        """Return the skill names of ``kind`` in taxonomy order."""
+        return list(self._text.groups[kind])
+
+    def _empty(self) -> SkillMatches:
+        """Return matches with no skill of any kind."""
+        return {kind: set() for kind in self.kinds}
+
+    def match_text(self, text: str) -> SkillMatches:
+        """Return the skills whose patterns occur anywhere in ``text``."""
+        hits = self._text.classify(text)
+        return {kind: set(hits[kind]) for kind in self.kinds}
+
+    def match_path(self, path: str) -> SkillMatches:
+        """Return the skills whose patterns or file patterns occur in ``path``."""
+        hits = self._paths.classify(path)
+        return {kind: set(hits[kind]) for kind in self.kinds}
+
+    def _lookup_dependency(self, name: str) -> List[Tuple[str, str]]:
+        """Return the (kind, skill) entries for a package's whole name, else its leading segment."""
+        return self._dependencies.get(name) or self._dependencies.get(DEPENDENCY_SEGMENT_SEPARATORS.split(name, 1)[0], [])
+
+    def match_dependency(self, name: str) -> SkillMatches:
+        """Return the skills a package name belongs to.
+
+        The whole name is looked up first, then its leading segment, so ``django-filter``
+        and ``pytest-cov`` resolve to Django and PyTest. An unknown scoped package
+        ``@scope/name`` falls back to its scope, with or without the ``@``, plus its
+        unscoped name, so ``@vue/cli`` is Vue and ``@tanstack/react-query`` is React.
+        """
+        name = name.lower()
+        entries = self._lookup_dependency(name)
+        scope, _, package = name.partition("/")
+        if not entries and scope.startswith("@") and package:
+            entries = (self._dependencies.get(scope) or self._dependencies.get(scope[1:], [])) + self._lookup_dependency(package)
+        matches = self._empty()
+        for kind, skill in entries:
+            matches[kind].add(skill)
+        return matches
+
+
+@lru_cache()
+def get_skill_detector() -> SkillDetector:
+    """Load the skill taxonomy once and return its compiled detector."""
+    with SKILL_TAXONOMY_PATH.open(encoding="utf-8") as taxonomy_file:
+        return SkillDetector(json.load(taxonomy_file))
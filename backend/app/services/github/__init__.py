@@ -1,11 +1,13 @@
 """GitHub services package."""
 
 from .github_commit_service import GitHubCommitService
+from .github_graphql_service import GitHubGraphQLService
 from .github_repository_service import GitHubRepositoryService
 from .github_user_service import GitHubUserService
 
 __all__ = [
     "GitHubCommitService",
+    "GitHubGraphQLService",
     "GitHubRepositoryService",
     "GitHubUserService",
 ]
@@ -0,0 +1,302 @@
+"""Async GitHub REST API client backed by a shared httpx connection pool."""
+
+import asyncio
+import base64
+import importlib.util
+import logging
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.exceptions import GitHubAPIError
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_VERSION = "2022-11-28"
+MAX_PER_PAGE = 100
+
+# HTTP/2 needs the optional ``h2`` package (installed via ``httpx[http2]``)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def normalize_timestamp(value: Optional[str]) -> Optional[str]:
+    """Convert a GitHub ISO-8601 timestamp to the ``datetime.isoformat()`` form used in cached payloads."""
+    if not value:
+        return None
+    if value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+class GitHubAPIClient:
+    """Thin async wrapper over the GitHub REST API.
+
+    A single instance owns one ``httpx.AsyncClient`` so every service shares the same
+    keep-alive connection pool (HTTP/2 multiplexed when available). A client-wide
+    semaphore caps the number of in-flight requests regardless of how many
+    analyses are running concurrently.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the client and its connection pool."""
+        max_connections = max_connections or settings.GITHUB_MAX_CONNECTIONS
+        self.request_count = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests or settings.GITHUB_MAX_CONCURRENT_REQUESTS)
+        self._client = httpx.AsyncClient(
+            base_url=base_url or settings.GITHUB_API_URL,
+            headers={
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {token}",
+                "X-GitHub-Api-Version": GITHUB_API_VERSION,
+                "User-Agent": "linkedin-recommendation-writer",
+            },
+            timeout=httpx.Timeout(timeout or settings.GITHUB_HTTP_TIMEOUT),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections, keepalive_expiry=30.0),
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """Return True once the underlying connection pool has been closed."""
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # ------------------------------------------------------------------
+    # Transport helpers
+    # ------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send a request and raise ``GitHubAPIError`` for any non-success response."""
+        async with self._semaphore:
+            self.request_count += 1
+            try:
+                response = await self._client.request(method, path, params=params, json=json, headers=headers)
+            except httpx.HTTPError as e:
+                raise GitHubAPIError(f"{method} {path} failed: {e}") from e
+
+        if response.status_code >= 400:
+            raise self._error_from_response(method, path, response)
+        return response
+
+    def _error_from_response(self, method: str, path: str, response: httpx.Response) -> GitHubAPIError:
+        """Build a ``GitHubAPIError`` carrying the status code and rate-limit headers."""
+        try:
+            message = response.json().get("message", response.reason_phrase)
+        except ValueError:
+            message = response.reason_phrase
+
+        details: Dict[str, Any] = {"method": method, "path": path}
+        if response.headers.get("x-ratelimit-remaining") is not None:
+            details["rate_limit_remaining"] = int(response.headers["x-ratelimit-remaining"])
+        if response.headers.get("x-ratelimit-reset") is not None:
+            details["rate_limit_reset"] = int(response.headers["x-ratelimit-reset"])
+
+        return GitHubAPIError(f"{response.status_code} {message}", status_code=response.status_code, details=details)
+
+    async def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a path and return the decoded JSON body."""
+        response = await self.request("GET", path, params=params)
+        return response.json()
+
+    async def iter_items(self, path: str, params: Optional[Dict[str, Any]] = None, per_page: int = MAX_PER_PAGE) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over a paginated list endpoint, following ``Link: rel="next"`` headers lazily."""
+        request_params: Optional[Dict[str, Any]] = {**(params or {}), "per_page": min(per_page, MAX_PER_PAGE)}
+        next_path: Optional[str] = path
+
+        while next_path:
+            response = await self.request("GET", next_path, params=request_params)
+            for item in response.json():
+                yield item
+
+            next_link = response.links.get("next")
+            next_path = next_link["url"] if next_link else None
+            request_params = None  # The next URL already carries the query string
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Collect up to ``max_items`` entries from a paginated list endpoint."""
+        per_page = min(max_items, MAX_PER_PAGE) if max_items else MAX_PER_PAGE
+        items: List[Dict[str, Any]] = []
+        async for item in self.iter_items(path, params=params, per_page=per_page):
+            items.append(item)
+            if max_items is not None and len(items) >= max_items:
+                break
+        return items
+
+    # ------------------------------------------------------------------
+    # Users and organizations
+    # ------------------------------------------------------------------
+
+    async def get_user(self, username: str) -> Dict[str, Any]:
+        """Get a user's public profile."""
+        return await self.get_json(f"/users/{username}")
+
+    def iter_user_repos(self, username: str, sort: str = "updated", direction: str = "desc") -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over public repositories owned by a user."""
+        return self.iter_items(f"/users/{username}/repos", params={"sort": sort, "direction": direction})
+
+    async def get_user_starred(self, username: str, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List repositories starred by a user."""
+        return await self.paginate(f"/users/{username}/starred", max_items=max_items)
+
+    async def get_user_orgs(self, username: str) -> List[Dict[str, Any]]:
+        """List a user's public organization memberships."""
+        return await self.paginate(f"/users/{username}/orgs")
+
+    async def get_org(self, org: str) -> Dict[str, Any]:
+        """Get an organization's profile."""
+        return await self.get_json(f"/orgs/{org}")
+
+    # ------------------------------------------------------------------
+    # Repositories
+    # ------------------------------------------------------------------
+
+    async def get_repo(self, full_name: str) -> Dict[str, Any]:
+        """Get a repository. The payload already includes ``topics``."""
+        return await self.get_json(f"/repos/{full_name}")
+
+    async def get_repo_languages(self, full_name: str) -> Dict[str, int]:
+        """Get the byte count per language for a repository."""
+        return await self.get_json(f"/repos/{full_name}/languages")
+
+    async def get_repo_contributors(self, full_name: str, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List repository contributors ordered by contribution count."""
+        return await self.paginate(f"/repos/{full_name}/contributors", max_items=max_items)
+
+    async def get_repo_commits(self, full_name: str, author: Optional[str] = None, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List commits on the default branch, optionally filtered by author login."""
+        params = {"author": author} if author else None
+        return await self.paginate(f"/repos/{full_name}/commits", params=params, max_items=max_items)
+
+    async def get_commit(self, full_name: str, sha: str) -> Dict[str, Any]:
+        """Get a single commit including ``stats`` and ``files``."""
+        return await self.get_json(f"/repos/{full_name}/commits/{sha}")
+
+    async def get_contents(self, full_name: str, path: str) -> Dict[str, Any]:
+        """Get a file or directory listing from the default branch."""
+        return await self.get_json(f"/repos/{full_name}/contents/{path}")
+
+    async def get_file_text(self, full_name: str, path: str) -> str:
+        """Get a file from the default branch decoded as UTF-8 text."""
+        payload = await self.get_contents(full_name, path)
+        if isinstance(payload, list):
+            raise GitHubAPIError(f"{path} is a directory", status_code=400)
+        return base64.b64decode(payload.get("content", "")).decode("utf-8", errors="replace")
+
+    async def get_tree(self, full_name: str, ref: str = "HEAD") -> Dict[str, Any]:
+        """List the top-level entries of a git tree; ``sha`` identifies the tree's exact contents."""
+        return await self.get_json(f"/repos/{full_name}/git/trees/{ref}")
+
+    # ------------------------------------------------------------------
+    # Pull requests and issues
+    # ------------------------------------------------------------------
+
+    def iter_repo_pulls(self, full_name: str, state: str = "all", sort: str = "created", direction: str = "desc") -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over pull requests lazily (list payloads omit additions/deletions/comments)."""
+        return self.iter_items(f"/repos/{full_name}/pulls", params={"state": state, "sort": sort, "direction": direction})
+
+    async def get_pull(self, full_name: str, number: int) -> Dict[str, Any]:
+        """Get a single pull request with its diff statistics."""
+        return await self.get_json(f"/repos/{full_name}/pulls/{number}")
+
+    async def get_pull_review_comments(self, full_name: str, number: int) -> List[Dict[str, Any]]:
+        """List inline review comments on a pull request."""
+        return await self.paginate(f"/repos/{full_name}/pulls/{number}/comments")
+
+    def iter_repo_issues(self, full_name: str, state: str = "all", sort: str = "created", direction: str = "desc") -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over issues lazily (the issues API also returns pull requests)."""
+        return self.iter_items(f"/repos/{full_name}/issues", params={"state": state, "sort": sort, "direction": direction})
+
+    async def get_issue(self, full_name: str, number: int) -> Dict[str, Any]:
+        """Get a single issue, including ``closed_by``."""
+        return await self.get_json(f"/repos/{full_name}/issues/{number}")
+
+    async def get_issue_comments(self, full_name: str, number: int) -> List[Dict[str, Any]]:
+        """List comments on an issue."""
+        return await self.paginate(f"/repos/{full_name}/issues/{number}/comments")
+
+    # ------------------------------------------------------------------
+    # GraphQL
+    # ------------------------------------------------------------------
+
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL v4 query and return its ``data`` object.
+
+        GraphQL reports most failures with a 200 status and an ``errors`` list; the
+        request only raises when no data came back at all, so callers can use the
+        fields that did resolve.
+        """
+        response = await self.request("POST", "/graphql", json={"query": query, "variables": variables or {}})
+        payload = response.json()
+        errors = payload.get("errors") or []
+        if errors:
+            logger.debug(f"GitHub GraphQL returned {len(errors)} error(s): {errors[0].get('message')}")
+        if payload.get("data") is None:
+            message = errors[0].get("message", "Unknown GraphQL error") if errors else "Empty GraphQL response"
+            raise GitHubAPIError(message, status_code=response.status_code, details={"errors": errors})
+        return payload["data"]
+
+    # ------------------------------------------------------------------
+    # Meta
+    # ------------------------------------------------------------------
+
+    async def get_rate_limit(self) -> Dict[str, Any]:
+        """Get the core REST rate-limit bucket, with ``reset`` as a UTC datetime."""
+        payload = await self.get_json("/rate_limit")
+        core = payload.get("resources", {}).get("core", payload.get("rate", {}))
+        return {
+            "limit": core.get("limit", 0),
+            "remaining": core.get("remaining", 0),
+            "reset": datetime.fromtimestamp(core.get("reset", 0), tz=timezone.utc),
+        }
+
+
+# Global GitHub client (one connection pool per process)
+github_api_client: Optional[GitHubAPIClient] = None
+
+
+def get_github_api_client() -> Optional[GitHubAPIClient]:
+    """Get the shared GitHub client, or None when no token is configured."""
+    global github_api_client
+    if not settings.GITHUB_TOKEN:
+        return None
+    if github_api_client is None or github_api_client.is_closed:
+        github_api_client = GitHubAPIClient(settings.GITHUB_TOKEN)
+        logger.info(f"🔧 GitHub HTTP client initialized (http2={HTTP2_AVAILABLE})")
+    return github_api_client
+
+
+def require_github_client(client: Optional[GitHubAPIClient]) -> GitHubAPIClient:
+    """Narrow a service's optional client, raising when no token was configured."""
+    if client is None:
+        raise GitHubAPIError("GitHub client not initialized - set GITHUB_TOKEN")
+    return client
+
+
+async def close_github_api_client() -> None:
+    """Close the shared GitHub client's connection pool."""
+    global github_api_client
+    if github_api_client is not None:
+        await github_api_client.aclose()
+        github_api_client = None
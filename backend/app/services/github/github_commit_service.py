@@ -1,16 +1,96 @@
 import asyncio
 import logging
 import re
+from abc import ABC, abstractmethod
 from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
-
-from github import Github
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, TypedDict
 
 from app.core.config import settings
+from app.core.exceptions import GitHubAPIError
+from app.core.keyword_taxonomy import KeywordHits, KeywordTaxonomy
+from app.services.github.github_api_client import get_github_api_client, normalize_timestamp, require_github_client
 
 logger = logging.getLogger(__name__)
 
+# Keyword categories the commit and PR analyzers look for, compiled once into a single-pass matcher
+COMMIT_KEYWORDS = KeywordTaxonomy(
+    {
+        # What a contributor's commits focus on
+        "excellence": {
+            "bug_fixing": ["fix", "bug", "resolve", "patch", "correct", "debug", "issue", "error", "crash", "hotfix", "quickfix", "workaround", "regression", "defect", "fault", "problem"],
+            "feature_development": ["add", "implement", "create", "build", "develop", "feature", "new", "introduce", "launch", "deploy", "rollout", "integrate", "connect", "establish", "setup"],
+            "optimization": ["optimize", "improve", "enhance", "performance", "speed", "efficient", "faster", "quicker", "accelerate", "boost", "streamline", "refine", "tune", "polish"],
+            "refactoring": ["refactor", "restructure", "reorganize", "clean", "simplify", "tidy", "modernize", "upgrade", "migrate", "consolidate", "extract", "split", "merge", "rename"],
+            "testing": ["test", "testing", "spec", "coverage", "unit", "integration", "e2e", "qa", "verify", "validate", "assert", "mock", "stub", "fixture", "suite"],
+            "documentation": ["doc", "comment", "documentation", "guide", "wiki", "tutorial", "example", "sample", "demo", "explain", "describe", "clarify"],
+            "security": ["security", "auth", "secure", "vulnerability", "encrypt", "protect", "safe", "access", "permission", "authorization", "authentication", "ssl", "https"],
+            "ui_ux": ["ui", "ux", "interface", "design", "styling", "css", "frontend", "user", "experience", "interaction", "responsive", "mobile", "web", "layout", "theme"],
+            "data_handling": ["data", "database", "query", "sql", "nosql", "migration", "schema", "model", "entity", "table", "collection", "index", "cache", "store"],
+            "api_development": ["api", "endpoint", "rest", "graphql", "http", "request", "response", "service", "microservice", "client", "server", "route", "controller"],
+            "devops_automation": ["ci", "cd", "pipeline", "deploy", "build", "automation", "script", "config", "infrastructure", "docker", "kubernetes", "cloud", "aws", "azure"],
+            "code_quality": ["lint", "format", "style", "quality", "standard", "convention", "consistency", "maintain", "sustainable", "readable", "clear"],
+        },
+        # Tools and technologies mentioned in commits
+        "tools": {
+            "databases": ["sql", "mongodb", "postgres", "mysql", "redis", "sqlite"],
+            "frameworks": ["react", "vue", "angular", "django", "flask", "express", "spring"],
+            "cloud_services": ["aws", "azure", "gcp", "docker", "kubernetes", "heroku"],
+            "testing_tools": ["jest", "pytest", "mocha", "cypress", "selenium"],
+            "build_tools": ["webpack", "vite", "gulp", "grunt", "maven", "gradle"],
+            "monitoring": ["logging", "monitoring", "metrics", "analytics", "sentry"],
+        },
+        # Technical depth of commits
+        "technical": {
+            "architecture": ["architecture", "design pattern", "structure", "architecture"],
+            "performance": ["performance", "optimization", "caching", "lazy loading"],
+            "scalability": ["scalable", "scale", "horizontal", "vertical", "load"],
+            "maintainability": ["maintainable", "clean code", "readable", "modular"],
+            "integration": ["api", "integration", "webhook", "service", "endpoint"],
+        },
+        # Technical focus areas of a contributor's commits
+        "technical_focus": {
+            "frontend": ["ui", "component", "react", "vue", "angular", "frontend", "interface", "ux", "styling"],
+            "backend": ["api", "server", "database", "endpoint", "service", "backend", "authentication", "security"],
+            "testing": ["test", "spec", "unit", "integration", "coverage", "assert", "mock"],
+            "performance": ["optimize", "performance", "speed", "memory", "cache", "efficiency"],
+            "architecture": ["refactor", "architecture", "structure", "design", "pattern"],
+            "bug_fixing": ["fix", "bug", "issue", "resolve", "correct", "patch"],
+            "features": ["feature", "implement", "add", "create", "build", "develop"],
+        },
+        # Specific problem types
+        "problem_types": {
+            "memory_management": ["memory leak", "memory optimization", "garbage collection", "heap", "memory usage"],
+            "concurrency": ["race condition", "deadlock", "thread", "concurrency", "async", "parallel"],
+            "database_optimization": ["query optimization", "index", "database performance", "n+1", "slow query"],
+            "security_fixes": ["vulnerability", "xss", "sql injection", "csrf", "authentication", "authorization"],
+        },
+        # Architectural patterns
+        "architectural_patterns": {
+            "design_patterns": ["singleton", "factory", "observer", "strategy", "decorator", "adapter"],
+            "architectural_styles": ["mvc", "mvvm", "microservices", "event-driven", "layered", "hexagonal"],
+        },
+        # Integration patterns
+        "integration_patterns": {
+            "api_types": ["rest api", "graphql", "websocket", "grpc", "soap"],
+            "messaging": ["message queue", "pub/sub", "event bus", "kafka", "rabbitmq"],
+        },
+        # Design discussion in PR titles and bodies
+        "pr_discussion": {
+            "architectural": ["architecture", "design", "pattern", "refactor", "restructure"],
+            "trade_off": ["trade-off", "tradeoff", "vs", "versus", "alternative", "option"],
+        },
+        # Problem types in PR titles
+        "pr_problem_types": {
+            "bug_fix": ["bug", "fix", "issue", "error", "crash"],
+            "performance": ["performance", "optimize", "speed", "memory", "cache"],
+            "security": ["security", "auth", "vulnerability", "encrypt"],
+            "feature": ["feature", "implement", "add", "new"],
+        },
+    }
+)
+
 
 class ConventionalStats(TypedDict):
     total_commits: int
@@ -25,6 +105,520 @@ class ConventionalStats(TypedDict):
     top_scopes: Dict[str, int]
 
 
+class CommitFacts:
+    """One commit and what the analyzers derive from it, each computed at most once."""
+
+    def __init__(self, service: "GitHubCommitService", commit: Dict[str, Any]) -> None:
+        """Wrap ``commit``; derived values are computed on first access."""
+        self.service = service
+        self.commit = commit
+
+    @cached_property
+    def message(self) -> str:
+        """Lowercased commit message."""
+        return self.commit.get("message", "").lower()
+
+    @cached_property
+    def conventional_info(self) -> Dict[str, Any]:
+        """Parsed conventional commit header."""
+        return self.service._parse_conventional_commit(self.commit.get("message", ""))
+
+    @cached_property
+    def impact(self) -> Dict[str, Any]:
+        """Impact analysis of the commit."""
+        return self.service._analyze_commit_impact(self.commit, self.conventional_info)
+
+    @cached_property
+    def keyword_hits(self) -> KeywordHits:
+        """Taxonomy keywords found in the message."""
+        return COMMIT_KEYWORDS.classify(self.message)
+
+    @cached_property
+    def date(self) -> Optional[datetime]:
+        """Commit date, or None when missing or unparseable."""
+        try:
+            return datetime.fromisoformat(self.commit["date"].replace("Z", "+00:00")) if self.commit.get("date") else None
+        except ValueError:
+            return None
+
+
+class CommitAnalyzer(ABC):
+    """One section of the commit analysis, fed a commit at a time.
+
+    ``finalize`` receives the sections finalized before it, keyed by result name, so later
+    sections can build on earlier ones (e.g. excellence areas on conventional commits).
+    """
+
+    @abstractmethod
+    def update(self, facts: CommitFacts) -> None:
+        """Account for one commit."""
+
+    @abstractmethod
+    def finalize(self, results: Dict[str, Any]) -> Any:
+        """Return this section of the analysis."""
+
+
+class ConventionalCommitAnalyzer(CommitAnalyzer):
+    """Conventional commit adoption, types, scopes and breaking changes."""
+
+    def __init__(self, service: "GitHubCommitService") -> None:
+        """Start with no commits counted."""
+        self.service = service
+        self.total_commits = 0
+        self.breaking_changes = 0
+        self.types: Dict[str, int] = {}
+        self.scopes: Dict[str, int] = {}
+        self.categories: Dict[str, int] = {}
+        self.conventional_commits: List[Dict[str, Any]] = []
+
+    def update(self, facts: CommitFacts) -> None:
+        """Record the commit's conventional type, scope, category and breaking change."""
+        self.total_commits += 1
+        conventional_info = facts.conventional_info
+        if not conventional_info["is_conventional"]:
+            return
+
+        self.conventional_commits.append({"commit": facts.commit, "conventional_info": conventional_info})
+        self.types[conventional_info["type"]] = self.types.get(conventional_info["type"], 0) + 1
+        if conventional_info["scope"]:
+            self.scopes[conventional_info["scope"]] = self.scopes.get(conventional_info["scope"], 0) + 1
+        self.categories[conventional_info["category"]] = self.categories.get(conventional_info["category"], 0) + 1
+        if conventional_info["is_breaking_change"]:
+            self.breaking_changes += 1
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the conventional commit stats, the conventional commits and their quality score."""
+        conventional_count = len(self.conventional_commits)
+        conventional_stats: ConventionalStats = {
+            "total_commits": self.total_commits,
+            "conventional_commits": conventional_count,
+            "breaking_changes": self.breaking_changes,
+            "types": self.types,
+            "scopes": self.scopes,
+            "categories": self.categories,
+            "conventional_percentage": round((conventional_count / self.total_commits) * 100, 1) if self.total_commits > 0 else 0,
+            # Sort types and categories by frequency
+            "top_types": dict(sorted(self.types.items(), key=lambda x: x[1], reverse=True)[:5]),
+            "top_categories": dict(sorted(self.categories.items(), key=lambda x: x[1], reverse=True)[:5]),
+            "top_scopes": dict(sorted(self.scopes.items(), key=lambda x: x[1], reverse=True)[:5]),
+        }
+
+        return {
+            "stats": conventional_stats,
+            "conventional_commits": self.conventional_commits,
+            "quality_score": self.service._calculate_conventional_quality_score(conventional_stats),
+        }
+
+
+class CommitImpactAnalyzer(CommitAnalyzer):
+    """Impact distribution across commits, keeping the first high-impact ones as examples."""
+
+    MAX_HIGH_IMPACT = 10
+    MAX_CONVENTIONAL_HIGH_IMPACT = 5
+
+    def __init__(self) -> None:
+        """Start with an empty impact distribution."""
+        self.distribution = {"high": 0, "moderate": 0, "low": 0, "minimal": 0}
+        self.impact_scores: List[int] = []
+        self.high_impact_commits: List[Dict[str, Any]] = []
+        self.conventional_high_impact: List[Dict[str, Any]] = []
+
+    def update(self, facts: CommitFacts) -> None:
+        """Count the commit's impact level and keep it as an example if it has high or moderate impact."""
+        impact_analysis = facts.impact
+        self.distribution[impact_analysis["impact_level"]] += 1
+        self.impact_scores.append(impact_analysis["impact_score"])
+
+        if impact_analysis["impact_level"] in ["high", "moderate"]:
+            entry = {"commit": facts.commit, "impact_analysis": impact_analysis}
+            if len(self.high_impact_commits) < self.MAX_HIGH_IMPACT:
+                self.high_impact_commits.append(entry)
+            if impact_analysis["conventional_info"]["is_conventional"] and len(self.conventional_high_impact) < self.MAX_CONVENTIONAL_HIGH_IMPACT:
+                self.conventional_high_impact.append(entry)
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the impact distribution, score statistics and example commits."""
+        scores = self.impact_scores
+        total_commits = len(scores)
+        return {
+            "distribution": self.distribution,
+            "average_impact_score": round(sum(scores) / total_commits, 1) if scores else 0,
+            "high_impact_commits": self.high_impact_commits,
+            "conventional_high_impact": self.conventional_high_impact,
+            "impact_score_range": {
+                "min": min(scores) if scores else 0,
+                "max": max(scores) if scores else 0,
+                "median": sorted(scores)[total_commits // 2] if scores else 0,
+            },
+            "quality_distribution": {level: round((count / total_commits) * 100, 1) if total_commits > 0 else 0 for level, count in self.distribution.items()},
+        }
+
+
+class ExcellenceAnalyzer(CommitAnalyzer):
+    """What the contributor excels at, from message keywords boosted by conventional commit evidence."""
+
+    # Conventional commit categories and the excellence areas they evidence
+    CONVENTIONAL_TO_EXCELLENCE = {
+        "feature_development": "feature_development",
+        "bug_fixing": "bug_fixing",
+        "refactoring": "refactoring",
+        "testing": "testing",
+        "documentation": "documentation",
+        "optimization": "optimization",
+        "code_quality": "refactoring",
+        "maintenance": "refactoring",
+        "ci_cd": "testing",
+        "build": "refactoring",
+    }
+
+    def __init__(self, service: "GitHubCommitService") -> None:
+        """Start with no excellence areas counted."""
+        self.service = service
+        self.total_commits = 0
+        self.counts: Counter = Counter()
+
+    def update(self, facts: CommitFacts) -> None:
+        """Count the excellence areas the commit message mentions."""
+        self.total_commits += 1
+        self.counts.update(facts.keyword_hits["excellence"].keys())
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the excellence areas by frequency, boosted by conventional commit evidence."""
+        total_commits = self.total_commits
+        conventional_analysis = results.get("conventional_commit_analysis")
+
+        # Base keyword analysis
+        pattern_counts = {
+            category: {"count": self.counts[category], "percentage": round((self.counts[category] / total_commits) * 100, 1)}
+            for category in COMMIT_KEYWORDS.groups["excellence"]
+            if self.counts[category] > 0
+        }
+
+        # Enhance with conventional commit analysis if available
+        if conventional_analysis:
+            conventional_stats = conventional_analysis.get("stats", {})
+
+            # Boost categories that have conventional commit evidence
+            for conv_category, excellence_category in self.CONVENTIONAL_TO_EXCELLENCE.items():
+                if conv_category in conventional_stats.get("categories", {}):
+                    conv_count = conventional_stats["categories"][conv_category]
+
+                    if excellence_category in pattern_counts:
+                        # Boost existing category
+                        pattern_counts[excellence_category]["count"] += conv_count * 0.5  # Partial boost
+                        pattern_counts[excellence_category]["percentage"] = round((pattern_counts[excellence_category]["count"] / total_commits) * 100, 1)
+                    else:
+                        # Add new category based on conventional commits
+                        pattern_counts[excellence_category] = {
+                            "count": conv_count,
+                            "percentage": round((conv_count / total_commits) * 100, 1),
+                        }
+
+            # Boost code quality if they use conventional commits well
+            conventional_quality = conventional_analysis.get("quality_score", 0)
+            if conventional_quality > 70 and "refactoring" in pattern_counts:
+                pattern_counts["refactoring"]["count"] += conventional_quality * 0.1
+                pattern_counts["refactoring"]["percentage"] = round((pattern_counts["refactoring"]["count"] / total_commits) * 100, 1)
+
+        # Sort by frequency
+        sorted_patterns = dict(sorted(pattern_counts.items(), key=lambda x: x[1]["count"], reverse=True))
+
+        return {
+            "patterns": sorted_patterns,
+            "primary_strength": (list(sorted_patterns.keys())[0] if sorted_patterns else None),
+            "conventional_commit_enhanced": conventional_analysis is not None,
+            # Infer soft skills from technical patterns
+            "inferred_soft_skills": self.service._infer_soft_skills_from_patterns(sorted_patterns),
+        }
+
+
+class ToolsAndFeaturesAnalyzer(CommitAnalyzer):
+    """Tools, libraries and features mentioned in commit messages."""
+
+    FEATURE_PATTERN = re.compile(r"(?:add|implement|create|build)\s+([a-zA-Z\s]{3,20})")
+
+    def __init__(self) -> None:
+        """Start with no tools or features found."""
+        # {category: {tool: None}}, in order of first mention
+        self.tools: Dict[str, Dict[str, None]] = {}
+        self.features: Counter = Counter()
+
+    def update(self, facts: CommitFacts) -> None:
+        """Record the tools and implemented features the commit message mentions."""
+        tool_hits = facts.keyword_hits["tools"]
+        for category, hits in tool_hits.items():
+            category_tools = self.tools.setdefault(category, {})
+            for tool in COMMIT_KEYWORDS.groups["tools"][category]:
+                if tool in hits:
+                    category_tools.setdefault(tool)
+
+        self.features.update(match.strip() for match in self.FEATURE_PATTERN.findall(facts.message))
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the tools found by category and the most frequent features."""
+        found_tools = {category: list(self.tools[category]) for category in COMMIT_KEYWORDS.groups["tools"] if self.tools.get(category)}
+        return {
+            "tools_by_category": found_tools,
+            "features_implemented": dict(self.features.most_common(10)),
+            "total_unique_tools": sum(len(tools) for tools in found_tools.values()),
+        }
+
+
+class CommitPatternAnalyzer(CommitAnalyzer):
+    """Commit frequency, consistency and size."""
+
+    def __init__(self) -> None:
+        """Start with no commits counted."""
+        self.total_commits = 0
+        self.dated_commits = 0
+        self.first_date: Optional[datetime] = None
+        self.last_date: Optional[datetime] = None
+        self.files_changed_total = 0
+        self.commits_with_files = 0
+
+    def update(self, facts: CommitFacts) -> None:
+        """Account for the commit's date and files changed."""
+        self.total_commits += 1
+        if facts.commit.get("files_changed"):
+            self.files_changed_total += facts.commit["files_changed"]
+            self.commits_with_files += 1
+
+        date = facts.date
+        if date is not None:
+            self.dated_commits += 1
+            self.first_date = min(self.first_date, date) if self.first_date else date
+            self.last_date = max(self.last_date, date) if self.last_date else date
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return commit frequency, consistency and size, with impact figures when available."""
+        if not self.dated_commits:
+            return {}
+
+        # Calculate time spans and frequency
+        total_days = (self.last_date - self.first_date).days if self.dated_commits > 1 and self.first_date and self.last_date else 1
+        commits_per_day = self.total_commits / max(total_days, 1)
+        avg_files_per_commit = self.files_changed_total / self.commits_with_files if self.commits_with_files else 0
+
+        result = {
+            "commits_per_day": round(commits_per_day, 2),
+            "avg_files_per_commit": round(avg_files_per_commit, 1),
+            "total_days_active": total_days,
+            "consistency_score": min(commits_per_day * 10, 100),  # Scale to 0-100
+        }
+
+        # Enhance with impact analysis if available
+        impact_analysis = results.get("impact_analysis")
+        if impact_analysis:
+            result.update(
+                {
+                    "impact_distribution": impact_analysis.get("distribution", {}),
+                    "average_impact_score": impact_analysis.get("average_impact_score", 0),
+                    "high_impact_commits_count": len(impact_analysis.get("high_impact_commits", [])),
+                    "impact_quality_distribution": impact_analysis.get("quality_distribution", {}),
+                }
+            )
+
+            # Calculate impact-weighted consistency score
+            avg_impact = impact_analysis.get("average_impact_score", 0)
+            result["impact_weighted_consistency"] = round(min((result["consistency_score"] + avg_impact) / 2, 100), 1)
+
+        return result
+
+
+class TechnicalContributionAnalyzer(CommitAnalyzer):
+    """Technical depth and contribution types."""
+
+    # Technical contributions and the conventional commit types that evidence them
+    CONVENTIONAL_TO_TECHNICAL = {
+        "architecture": ["feat", "refactor"],
+        "performance": ["perf", "optimize"],
+        "scalability": ["feat", "refactor"],
+        "maintainability": ["refactor", "docs"],
+        "integration": ["feat", "ci"],
+    }
+
+    def __init__(self) -> None:
+        """Start with no contributions counted."""
+        self.counts: Counter = Counter()
+
+    def update(self, facts: CommitFacts) -> None:
+        """Count the technical contribution types the commit message mentions."""
+        self.counts.update(facts.keyword_hits["technical"].keys())
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return technical contribution counts, boosted by conventional commit evidence."""
+        contributions = {category: self.counts[category] for category in COMMIT_KEYWORDS.groups["technical"] if self.counts[category] > 0}
+
+        # Enhance with conventional commit analysis if available
+        conventional_analysis = results.get("conventional_commit_analysis")
+        if conventional_analysis:
+            conventional_types = conventional_analysis.get("stats", {}).get("types", {})
+
+            # Boost technical contributions based on conventional commit evidence
+            for tech_category, conv_types in self.CONVENTIONAL_TO_TECHNICAL.items():
+                conv_count = sum(conventional_types.get(conv_type, 0) for conv_type in conv_types)
+                if conv_count > 0:
+                    contributions[tech_category] = contributions.get(tech_category, 0) + conv_count
+
+            # Add conventional commit quality metrics
+            conventional_quality = conventional_analysis.get("quality_score", 0)
+            if conventional_quality > 0:
+                contributions["conventional_commit_quality"] = conventional_quality
+
+        return contributions
+
+
+class TopRepositoriesAnalyzer(CommitAnalyzer):
+    """Repositories with the most commits from the contributor."""
+
+    def __init__(self) -> None:
+        """Start with no commits counted."""
+        self.repo_counts: Counter = Counter()
+
+    def update(self, facts: CommitFacts) -> None:
+        """Count the commit against its repository."""
+        self.repo_counts[facts.commit.get("repository", "unknown")] += 1
+
+    def finalize(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the five repositories with the most commits."""
+        total_commits = sum(self.repo_counts.values())
+        return [
+            {
+                "repository": repo_name,
+                "commits": count,
+                "percentage": round((count / total_commits) * 100, 1),
+            }
+            for repo_name, count in self.repo_counts.most_common(5)
+        ]
+
+
+class ContributorMetricsAnalyzer(CommitAnalyzer):
+    """Contributor-specific metrics: repository spread, activity span and impact productivity."""
+
+    def __init__(self) -> None:
+        """Start with no commits counted."""
+        self.total_commits = 0
+        self.repo_counts: Dict[str, int] = {}
+        self.dated_commits = 0
+        self.first_date: Optional[datetime] = None
+        self.last_date: Optional[datetime] = None
+
+    def update(self, facts: CommitFacts) -> None:
+        """Count the commit against its repository and activity span."""
+        self.total_commits += 1
+        repo_name = facts.commit.get("repository", "unknown")
+        self.repo_counts[repo_name] = self.repo_counts.get(repo_name, 0) + 1
+
+        date = facts.date
+        if date is not None:
+            self.dated_commits += 1
+            self.first_date = min(self.first_date, date) if self.first_date else date
+            self.last_date = max(self.last_date, date) if self.last_date else date
+
+    def finalize(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Return repository spread and activity metrics, with impact productivity when available."""
+        total_commits = self.total_commits
+        if not total_commits:
+            return {
+                "repositories_with_commits": 0,
+                "avg_commits_per_repo": 0,
+                "most_active_repository": None,
+                "commit_frequency_analysis": {},
+                "contribution_span_days": 0,
+            }
+
+        repositories_with_commits = len(self.repo_counts)
+        most_active_repo = max(self.repo_counts.items(), key=lambda x: x[1])
+        contribution_span_days = (self.last_date - self.first_date).days if self.dated_commits > 1 and self.first_date and self.last_date else 0
+
+        result = {
+            "repositories_with_commits": repositories_with_commits,
+            "avg_commits_per_repo": round(total_commits / repositories_with_commits, 1),
+            "most_active_repository": most_active_repo[0],
+            "commit_frequency_analysis": {
+                "daily_average": (total_commits / contribution_span_days if contribution_span_days > 0 else 0),
+                "most_productive_repo": most_active_repo[0],
+                "most_productive_repo_commits": most_active_repo[1],
+                "repository_diversity_score": min(100, (repositories_with_commits / total_commits) * 100),
+            },
+            "contribution_span_days": contribution_span_days,
+        }
+
+        # Enhance with impact analysis if available
+        impact_analysis = results.get("impact_analysis")
+        if impact_analysis:
+            high_impact_count = len(impact_analysis.get("high_impact_commits", []))
+            result.update(
+                {
+                    "impact_metrics": {
+                        "average_impact_score": impact_analysis.get("average_impact_score", 0),
+                        "high_impact_commits": high_impact_count,
+                        "impact_distribution": impact_analysis.get("distribution", {}),
+                        "conventional_high_impact": len(impact_analysis.get("conventional_high_impact", [])),
+                    },
+                    "quality_metrics": {
+                        "impact_quality_distribution": impact_analysis.get("quality_distribution", {}),
+                        "impact_score_range": impact_analysis.get("impact_score_range", {}),
+                    },
+                    # Impact-weighted productivity
+                    "impact_productivity_ratio": round(high_impact_count / total_commits * 100, 1),
+                }
+            )
+
+        return result
+
+
+class CommitAnalysisPipeline:
+    """Commit analysis computed in a single pass, so commits can be fed as they are fetched.
+
+    Each commit is wrapped once in ``CommitFacts`` and handed to every analyzer; message
+    parsing and keyword classification happen once per commit however many analyzers read
+    them. Analyzers are finalized in registration order, so ones that build on others
+    (excellence areas, technical contributions, patterns, metrics) come after the
+    conventional commit and impact analyzers.
+    """
+
+    def __init__(self, service: "GitHubCommitService") -> None:
+        """Register the analyzers, keyed by the result section each produces."""
+        self.service = service
+        self.total_commits = 0
+        self.analyzers: Dict[str, CommitAnalyzer] = {
+            "conventional_commit_analysis": ConventionalCommitAnalyzer(service),
+            "impact_analysis": CommitImpactAnalyzer(),
+            "excellence_areas": ExcellenceAnalyzer(service),
+            "tools_and_features": ToolsAndFeaturesAnalyzer(),
+            "commit_patterns": CommitPatternAnalyzer(),
+            "technical_contributions": TechnicalContributionAnalyzer(),
+            "top_repositories": TopRepositoriesAnalyzer(),
+            "contributor_metrics": ContributorMetricsAnalyzer(),
+        }
+
+    def add(self, commits: Iterable[Dict[str, Any]]) -> None:
+        """Feed ``commits`` to every analyzer."""
+        analyzers = list(self.analyzers.values())
+        for commit in commits:
+            facts = CommitFacts(self.service, commit)
+            for analyzer in analyzers:
+                analyzer.update(facts)
+            self.total_commits += 1
+
+    def finalize(self) -> Dict[str, Any]:
+        """Return the full commit analysis of every commit added."""
+        if not self.total_commits:
+            return self.service._empty_commit_analysis()
+
+        results: Dict[str, Any] = {}
+        for name, analyzer in self.analyzers.items():
+            results[name] = analyzer.finalize(results)
+
+        return {
+            "total_commits_analyzed": self.total_commits,
+            "contributor_focused": True,
+            "analysis_method": "contributor_specific_enhanced",
+            **results,
+        }
+
+
 class GitHubCommitService:
     """Service for fetching and analyzing GitHub commit data."""
 
@@ -32,13 +626,14 @@ class GitHubCommitService:
     REPOSITORY_BATCH_SIZE = 5  # Process repositories in batches
     MAX_COMMITS_PER_REPO = 30  # Max commits per repository for better distribution
     COMMIT_ANALYSIS_CACHE_TTL = 14400  # 4 hours cache for expensive operations
+    GRAPHQL_COMMIT_BATCH_SIZE = 50  # Commits resolved per GraphQL stats query
 
     def __init__(self) -> None:
         """Initialize GitHub commit service."""
         self.github_client = None
         if settings.GITHUB_TOKEN:
             logger.info("🔧 Initializing GitHub client with token for commit service")
-            self.github_client = Github(settings.GITHUB_TOKEN)
+            self.github_client = get_github_api_client()
         else:
             logger.warning("⚠️  GitHub token not configured - GitHub API calls will fail in commit service")
 
@@ -64,6 +659,12 @@ class GitHubCommitService:
             all_commits = []
             commits_collected = 0
 
+            # Commits are analyzed batch by batch while the next batch is fetched. Lazy stats mode
+            # ranks every commit before enriching some, so it analyzes once collection is done.
+            pipeline = CommitAnalysisPipeline(self)
+            stream_analysis = settings.GITHUB_COMMIT_STATS_MODE != "lazy"
+            unanalyzed: List[Dict[str, Any]] = []
+
             # For contributor-focused analysis, we want to maximize commits from this specific user
             # Calculate optimal commits per repo, but prioritize repositories with more activity
             optimal_commits_per_repo = self._calculate_contributor_optimal_commits_per_repo(len(repositories), max_commits)
@@ -96,7 +697,13 @@ class GitHubCommitService:
                     batch_tasks.append(task)
 
                 # Execute batch concurrently
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+                batch = asyncio.gather(*batch_tasks, return_exceptions=True)
+                if stream_analysis and unanalyzed:
+                    # Let the batch's requests go out, then analyze the previous batch while they are in flight
+                    await asyncio.sleep(0)
+                    pipeline.add(unanalyzed)
+                    unanalyzed = []
+                batch_results = await batch
 
                 # Process results
                 for result in batch_results:
@@ -107,6 +714,7 @@ class GitHubCommitService:
                     if isinstance(result, list) and result:
                         commits_to_add = min(len(result), max_commits - commits_collected)
                         all_commits.extend(result[:commits_to_add])
+                        unanalyzed.extend(result[:commits_to_add])
                         commits_collected += commits_to_add
 
                         if commits_collected >= max_commits:
@@ -125,8 +733,12 @@ class GitHubCommitService:
             if len(all_commits) < max_commits:
                 logger.info(f"ℹ️  Note: Only {len(all_commits)} commits available (target was {max_commits})")
 
-            # Analyze the collected commits with contributor focus
-            return self._perform_commit_analysis(all_commits)
+            if not stream_analysis:
+                await self._enrich_high_impact_commits(all_commits)
+
+            # Analyze whatever has not been analyzed yet, with contributor focus
+            pipeline.add(unanalyzed)
+            return pipeline.finalize()
 
         except Exception as e:
             logger.error(f"Error analyzing commits for {username}: {e}")
@@ -142,15 +754,22 @@ class GitHubCommitService:
         """Fetch commits from a single repository asynchronously with rate limiting."""
         async with semaphore:
             try:
-                # Run GitHub API calls in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                repo_commits = await loop.run_in_executor(
-                    None,
-                    self._fetch_repo_commits_sync,
-                    username,
-                    repo_data,
-                    max_commits_per_repo,
-                )
+                client = require_github_client(self.github_client)
+                commits = await client.get_repo_commits(f"{username}/{repo_data['name']}", author=username, max_items=max_commits_per_repo)
+                commit_stats = await self._fetch_commit_stats(f"{username}/{repo_data['name']}", commits)
+
+                repo_commits = [
+                    {
+                        "message": commit["commit"]["message"],
+                        "date": normalize_timestamp((commit["commit"].get("author") or {}).get("date")),
+                        "repository": repo_data["name"],
+                        "sha": commit["sha"],
+                        "files_changed": commit_stats.get(commit["sha"], {}).get("files_changed", 0),
+                    }
+                    for commit in commits
+                ]
+
+                logger.debug(f"Fetched {len(repo_commits)} commits from {repo_data['name']}")
                 return repo_commits
 
             except Exception as e:
@@ -167,148 +786,138 @@ class GitHubCommitService:
         """Fetch commits specifically from a contributor across any repository they have access to."""
         async with semaphore:
             try:
-                # Run GitHub API calls in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                repo_commits = await loop.run_in_executor(
-                    None,
-                    self._fetch_contributor_commits_sync,
-                    contributor_username,
-                    repo_data,
-                    max_commits_per_repo,
-                )
-                return repo_commits
-
-            except Exception as e:
-                logger.warning(f"Error fetching commits from contributor {contributor_username} in {repo_data['name']}: {e}")
-                return []
-
-    def _fetch_repo_commits_sync(
-        self,
-        username: str,
-        repo_data: Dict[str, Any],
-        max_commits_per_repo: int,
-    ) -> List[Dict[str, Any]]:
-        """Synchronous helper to fetch commits from a repository (runs in thread pool)."""
-        if not self.github_client:
-            logger.error("GitHub client not initialized")
-            return []
-
-        try:
-            user = self.github_client.get_user(username)
-            repo = self.github_client.get_repo(f"{username}/{repo_data['name']}")
-            commits = repo.get_commits(author=user)
+                # The repository might be owned by the contributor or someone else, so try each candidate name in turn
+                candidate_names = [f"{contributor_username}/{repo_data['name']}"]
+                if "full_name" in repo_data:
+                    candidate_names.append(repo_data["full_name"])
+                elif "url" in repo_data and "/repos/" in repo_data["url"]:
+                    # Extract full name from URL
+                    url_parts = repo_data["url"].split("/repos/")[-1].split("/")[0:2]
+                    if len(url_parts) == 2:
+                        candidate_names.append(f"{url_parts[0]}/{url_parts[1]}")
+
+                repo_full_name = None
+                commits: List[Dict[str, Any]] = []
+                client = require_github_client(self.github_client)
+                for candidate in dict.fromkeys(candidate_names):
+                    try:
+                        # Get commits specifically from this contributor
+                        commits = await client.get_repo_commits(candidate, author=contributor_username, max_items=max_commits_per_repo)
+                        repo_full_name = candidate
+                        logger.debug(f"✅ Accessing {candidate} for commits from {contributor_username}")
+                        break
+                    except GitHubAPIError as e:
+                        if e.status_code != 404:
+                            raise
 
-            repo_commits = []
-            commits_collected = 0
+                if not repo_full_name:
+                    logger.debug(f"❌ Could not access repository {repo_data['name']}")
+                    return []
 
-            for commit in commits:
-                if commits_collected >= max_commits_per_repo:
-                    break
+                commit_stats = await self._fetch_commit_stats(repo_full_name, commits)
 
-                try:
-                    commit_data = {
-                        "message": commit.commit.message,
-                        "date": (commit.commit.author.date.isoformat() if commit.commit.author.date else None),
+                repo_commits = [
+                    {
+                        "message": commit["commit"]["message"],
+                        "date": normalize_timestamp((commit["commit"].get("author") or {}).get("date")),
                         "repository": repo_data["name"],
-                        "sha": commit.sha,
-                        "files_changed": (len(list(commit.files)) if hasattr(commit, "files") else 0),
+                        "repository_full_name": repo_full_name,
+                        "sha": commit["sha"],
+                        "files_changed": commit_stats.get(commit["sha"], {}).get("files_changed", 0),
+                        "contributor": contributor_username,
                     }
-                    repo_commits.append(commit_data)
-                    commits_collected += 1
-
-                except Exception as e:
-                    logger.debug(f"Error processing commit {commit.sha}: {e}")
-                    continue
-
-            logger.debug(f"Fetched {len(repo_commits)} commits from {repo_data['name']}")
-            return repo_commits
-
-        except Exception as e:
-            logger.warning(f"Error in sync fetch for {repo_data['name']}: {e}")
-            return []
-
-    def _fetch_contributor_commits_sync(
-        self,
-        contributor_username: str,
-        repo_data: Dict[str, Any],
-        max_commits_per_repo: int,
-    ) -> List[Dict[str, Any]]:
-        """Synchronous helper to fetch commits from a specific contributor in any repository."""
-        if not self.github_client:
-            logger.error("GitHub client not initialized")
-            return []
-
-        try:
-            # Get the contributor as a user object
-            contributor = self.github_client.get_user(contributor_username)
+                    for commit in commits
+                ]
 
-            # Try to access the repository - it might be owned by the contributor or someone else
-            repo = None
+                if repo_commits:
+                    logger.debug(f"✅ Found {len(repo_commits)} commits from {contributor_username} in {repo_data['name']}")
+                else:
+                    logger.debug(f"ℹ️  No commits found from {contributor_username} in {repo_data['name']}")
 
-            # First, try to access as contributor's own repo
-            try:
-                repo = self.github_client.get_repo(f"{contributor_username}/{repo_data['name']}")
-                logger.debug(f"✅ Accessing {repo_data['name']} as {contributor_username}'s own repository")
-            except Exception:
-                # If that fails, try to access it via the full name if available
-                try:
-                    if "full_name" in repo_data:
-                        repo = self.github_client.get_repo(repo_data["full_name"])
-                        logger.debug(f"✅ Accessing {repo_data['full_name']} as contributed repository")
-                    elif "url" in repo_data and "/repos/" in repo_data["url"]:
-                        # Extract full name from URL
-                        repo_full_name = repo_data["url"].split("/repos/")[-1].split("/")[0:2]
-                        if len(repo_full_name) == 2:
-                            full_repo_name = f"{repo_full_name[0]}/{repo_full_name[1]}"
-                            repo = self.github_client.get_repo(full_repo_name)
-                            logger.debug(f"✅ Accessing {full_repo_name} via URL extraction")
-                except Exception as e2:
-                    logger.debug(f"❌ Could not access repository {repo_data['name']}: {e2}")
-                    return []
+                return repo_commits
 
-            if not repo:
-                logger.debug(f"❌ Could not access repository {repo_data['name']}")
+            except Exception as e:
+                logger.warning(f"Error fetching commits from contributor {contributor_username} in {repo_data['name']}: {e}")
                 return []
 
-            # Get commits specifically from this contributor
-            commits = repo.get_commits(author=contributor)
-
-            repo_commits = []
-            commits_collected = 0
+    async def _fetch_commit_stats(self, repo_full_name: str, commits: List[Dict[str, Any]], mode: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Fetch additions, deletions and files changed for commits, keyed by SHA.
 
-            logger.debug(f"🔍 Scanning {repo_data['name']} for commits from {contributor_username}")
-
-            for commit in commits:
-                if commits_collected >= max_commits_per_repo:
-                    break
+        Commit list payloads carry no stats, so how they are filled in depends on ``GITHUB_COMMIT_STATS_MODE``:
+        ``rest`` fetches every commit individually, ``graphql`` resolves a whole repository's commits in one
+        batched query, and ``lazy`` skips them here so only top-ranked commits are enriched afterwards.
+        """
+        mode = mode or settings.GITHUB_COMMIT_STATS_MODE
+        if not commits or mode == "lazy":
+            return {}
 
-                try:
-                    commit_data = {
-                        "message": commit.commit.message,
-                        "date": (commit.commit.author.date.isoformat() if commit.commit.author.date else None),
-                        "repository": repo_data["name"],
-                        "repository_full_name": repo.full_name,
-                        "sha": commit.sha,
-                        "files_changed": (len(list(commit.files)) if hasattr(commit, "files") else 0),
-                        "contributor": contributor_username,
+        if mode == "graphql":
+            try:
+                return await self._fetch_commit_stats_graphql(repo_full_name, commits)
+            except Exception as e:
+                logger.warning(f"GraphQL commit stats failed for {repo_full_name}, falling back to REST: {e}")
+
+        client = require_github_client(self.github_client)
+        details = await asyncio.gather(*(client.get_commit(repo_full_name, commit["sha"]) for commit in commits), return_exceptions=True)
+
+        commit_stats = {}
+        for commit, detail in zip(commits, details):
+            if isinstance(detail, BaseException):
+                logger.debug(f"Error processing commit {commit['sha']}: {detail}")
+                continue
+            stats = detail.get("stats") or {}
+            commit_stats[commit["sha"]] = {
+                "additions": stats.get("additions", 0),
+                "deletions": stats.get("deletions", 0),
+                "files_changed": len(detail.get("files") or []),
+            }
+        return commit_stats
+
+    async def _fetch_commit_stats_graphql(self, repo_full_name: str, commits: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+        """Resolve commit stats for one repository with aliased ``object(oid:)`` lookups, one query per chunk."""
+        owner, name = repo_full_name.split("/", 1)
+        commit_stats = {}
+
+        for start in range(0, len(commits), self.GRAPHQL_COMMIT_BATCH_SIZE):
+            chunk = commits[start : start + self.GRAPHQL_COMMIT_BATCH_SIZE]
+            variables: Dict[str, Any] = {"owner": owner, "name": name}
+            fields = []
+            for index, commit in enumerate(chunk):
+                variables[f"oid{index}"] = commit["sha"]
+                fields.append(f"c{index}: object(oid: $oid{index}) {{ ... on Commit {{ additions deletions changedFilesIfAvailable }} }}")
+
+            declarations = ", ".join(f"$oid{index}: GitObjectID!" for index in range(len(chunk)))
+            query = f"query($owner: String!, $name: String!, {declarations}) {{ repository(owner: $owner, name: $name) {{ {' '.join(fields)} }} }}"
+
+            data = await require_github_client(self.github_client).graphql(query, variables)
+            repository = data.get("repository") or {}
+            for index, commit in enumerate(chunk):
+                node = repository.get(f"c{index}")
+                if node:
+                    commit_stats[commit["sha"]] = {
+                        "additions": node.get("additions") or 0,
+                        "deletions": node.get("deletions") or 0,
+                        "files_changed": node.get("changedFilesIfAvailable") or 0,
                     }
-                    repo_commits.append(commit_data)
-                    commits_collected += 1
 
-                except Exception as e:
-                    logger.debug(f"Error processing commit {commit.sha}: {e}")
-                    continue
+        return commit_stats
 
-            if repo_commits:
-                logger.debug(f"✅ Found {len(repo_commits)} commits from {contributor_username} in {repo_data['name']}")
-            else:
-                logger.debug(f"ℹ️  No commits found from {contributor_username} in {repo_data['name']}")
+    async def _enrich_high_impact_commits(self, commits: List[Dict[str, Any]]) -> None:
+        """Fill in file counts for the commits that rank highest on message signals alone (lazy stats mode)."""
+        ranked = sorted(commits, key=lambda commit: self._analyze_commit_impact(commit)["impact_score"], reverse=True)
+        candidates = [commit for commit in ranked if commit.get("repository_full_name")][: settings.GITHUB_COMMIT_STATS_LAZY_LIMIT]
 
-            return repo_commits
+        by_repo: Dict[str, List[Dict[str, Any]]] = {}
+        for commit in candidates:
+            by_repo.setdefault(commit["repository_full_name"], []).append(commit)
 
-        except Exception as e:
-            logger.warning(f"Error fetching contributor commits from {repo_data['name']}: {e}")
-            return []
+        results = await asyncio.gather(*(self._fetch_commit_stats(repo, repo_commits, mode="rest") for repo, repo_commits in by_repo.items()))
+        for repo_stats in results:
+            for commit in candidates:
+                if commit["sha"] in repo_stats:
+                    commit.update({key: value for key, value in repo_stats[commit["sha"]].items() if key in commit})
+
+        logger.info(f"🎯 Lazy commit stats: enriched {len(candidates)} of {len(commits)} commits")
 
     def _calculate_optimal_commits_per_repo(self, total_repos: int, max_commits: int) -> int:
         """Calculate optimal commits per repository for better distribution."""
@@ -419,13 +1028,13 @@ class GitHubCommitService:
 
         return result
 
-    def _analyze_commit_impact(self, commit_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_commit_impact(self, commit_data: Dict[str, Any], conventional_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyze the impact and significance of a single commit."""
         message = commit_data.get("message", "")
         files_changed = commit_data.get("files_changed", 0)
 
-        # Parse conventional commit
-        conventional_info = self._parse_conventional_commit(message)
+        # Parse conventional commit, unless the caller already has
+        conventional_info = conventional_info or self._parse_conventional_commit(message)
 
         # Calculate impact score based on multiple factors
         impact_score = 0
@@ -495,226 +1104,43 @@ class GitHubCommitService:
 
     def _analyze_conventional_commits(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze conventional commit patterns across all commits."""
-        conventional_commits: List[Dict[str, Any]] = []
-        conventional_stats: ConventionalStats = {
-            "total_commits": len(commits),
-            "conventional_commits": 0,
-            "breaking_changes": 0,
-            "types": {},
-            "scopes": {},
-            "categories": {},
-            "conventional_percentage": 0.0,  # Initialize with default value
-            "top_types": {},
-            "top_categories": {},
-            "top_scopes": {},
-        }
-
-        for commit in commits:
-            message = commit.get("message", "")
-            conventional_info = self._parse_conventional_commit(message)
-
-            if conventional_info["is_conventional"]:
-                conventional_commits.append(
-                    {
-                        "commit": commit,
-                        "conventional_info": conventional_info,
-                    }
-                )
-
-                conventional_stats["conventional_commits"] += 1
-
-                # Track commit types
-                commit_type = conventional_info["type"]
-                conventional_stats["types"][commit_type] = conventional_stats["types"].get(commit_type, 0) + 1
-
-                # Track scopes
-                if conventional_info["scope"]:
-                    scope = conventional_info["scope"]
-                    conventional_stats["scopes"][scope] = conventional_stats["scopes"].get(scope, 0) + 1
-
-                # Track categories
-                category = conventional_info["category"]
-                conventional_stats["categories"][category] = conventional_stats["categories"].get(category, 0) + 1
-
-                # Track breaking changes
-                if conventional_info["is_breaking_change"]:
-                    conventional_stats["breaking_changes"] += 1
-
-        # Calculate percentages
-        conventional_stats["conventional_percentage"] = (
-            round((conventional_stats["conventional_commits"] / conventional_stats["total_commits"]) * 100, 1) if conventional_stats["total_commits"] > 0 else 0
-        )
-
-        # Sort types and categories by frequency
-        conventional_stats["top_types"] = dict(sorted(conventional_stats["types"].items(), key=lambda x: x[1], reverse=True)[:5])
-        conventional_stats["top_categories"] = dict(sorted(conventional_stats["categories"].items(), key=lambda x: x[1], reverse=True)[:5])
-        conventional_stats["top_scopes"] = dict(sorted(conventional_stats["scopes"].items(), key=lambda x: x[1], reverse=True)[:5])
-
-        return {
-            "stats": conventional_stats,
-            "conventional_commits": conventional_commits,
-            "quality_score": self._calculate_conventional_quality_score(conventional_stats),
-        }
-
-    def _calculate_conventional_quality_score(self, conventional_stats: ConventionalStats) -> float:
-        """Calculate a quality score based on conventional commit adherence."""
-        score = 0.0
-
-        total_commits = conventional_stats["total_commits"]
-        conventional_commits_count = conventional_stats["conventional_commits"]
-        breaking_changes_count = conventional_stats["breaking_changes"]
-        types = conventional_stats["types"]
-        scopes = conventional_stats["scopes"]
-
-        # Conventional commit adoption (40 points max)
-        if total_commits > 0:
-            conventional_percentage = (conventional_commits_count / total_commits) * 100
-            score += min(conventional_percentage * 0.4, 40)
-
-        # Type diversity (30 points max)
-        unique_types = len(types)
-        score += min(unique_types * 10, 30)
-
-        # Scope usage (20 points max)
-        scope_usage = len(scopes)
-        score += min(scope_usage * 5, 20)
-
-        # Breaking changes (10 points max, penalize if too many, reward if handled well)
-        # For simplicity, we'll give points for having breaking changes as it implies significant work,
-        # but ideally, this would be more nuanced.
-        score += min(breaking_changes_count * 2, 10)
-
-        return round(score, 1)
-
-    def _perform_commit_analysis(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Perform comprehensive analysis of commits."""
-        if not commits:
-            return self._empty_commit_analysis()
-
-        commit_messages = [commit["message"].lower() for commit in commits]
-
-        # Enhanced commit analysis with conventional commit parsing
-        conventional_analysis = self._analyze_conventional_commits(commits)
-        impact_analysis = self._analyze_commit_impacts(commits)
-
-        # Analyze what the user excels at (action patterns) - enhanced with conventional commit data
-        excellence_patterns = self._analyze_excellence_patterns(commit_messages, conventional_analysis)
-
-        # Analyze tools and features added
-        tools_and_features = self._analyze_tools_and_features(commit_messages)
-
-        # Analyze commit frequency and consistency - enhanced with impact data
-        commit_patterns = self._analyze_commit_patterns(commits, impact_analysis)
-
-        # Extract technical contributions - enhanced with conventional commit categories
-        technical_contributions = self._analyze_technical_contributions(commit_messages, conventional_analysis)
-
-        # Calculate contributor-specific metrics - enhanced with impact analysis
-        contributor_metrics = self._calculate_contributor_metrics(commits, impact_analysis)
-
-        return {
-            "total_commits_analyzed": len(commits),
-            "contributor_focused": True,
-            "analysis_method": "contributor_specific_enhanced",
-            "conventional_commit_analysis": conventional_analysis,
-            "impact_analysis": impact_analysis,
-            "excellence_areas": excellence_patterns,
-            "tools_and_features": tools_and_features,
-            "commit_patterns": commit_patterns,
-            "technical_contributions": technical_contributions,
-            "top_repositories": self._get_top_commit_repositories(commits),
-            "contributor_metrics": contributor_metrics,
-        }
-
-    def _analyze_excellence_patterns(self, commit_messages: List[str], conventional_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Identify what the user excels at based on commit message patterns with enhanced analysis."""
-        excellence_keywords = {
-            "bug_fixing": ["fix", "bug", "resolve", "patch", "correct", "debug", "issue", "error", "crash", "hotfix", "quickfix", "workaround", "regression", "defect", "fault", "problem"],
-            "feature_development": ["add", "implement", "create", "build", "develop", "feature", "new", "introduce", "launch", "deploy", "rollout", "integrate", "connect", "establish", "setup"],
-            "optimization": ["optimize", "improve", "enhance", "performance", "speed", "efficient", "faster", "quicker", "accelerate", "boost", "streamline", "refine", "tune", "polish"],
-            "refactoring": ["refactor", "restructure", "reorganize", "clean", "simplify", "tidy", "modernize", "upgrade", "migrate", "consolidate", "extract", "split", "merge", "rename"],
-            "testing": ["test", "testing", "spec", "coverage", "unit", "integration", "e2e", "qa", "verify", "validate", "assert", "mock", "stub", "fixture", "suite"],
-            "documentation": ["doc", "comment", "documentation", "guide", "wiki", "tutorial", "example", "sample", "demo", "explain", "describe", "clarify"],
-            "security": ["security", "auth", "secure", "vulnerability", "encrypt", "protect", "safe", "access", "permission", "authorization", "authentication", "ssl", "https"],
-            "ui_ux": ["ui", "ux", "interface", "design", "styling", "css", "frontend", "user", "experience", "interaction", "responsive", "mobile", "web", "layout", "theme"],
-            "data_handling": ["data", "database", "query", "sql", "nosql", "migration", "schema", "model", "entity", "table", "collection", "index", "cache", "store"],
-            "api_development": ["api", "endpoint", "rest", "graphql", "http", "request", "response", "service", "microservice", "client", "server", "route", "controller"],
-            "devops_automation": ["ci", "cd", "pipeline", "deploy", "build", "automation", "script", "config", "infrastructure", "docker", "kubernetes", "cloud", "aws", "azure"],
-            "code_quality": ["lint", "format", "style", "quality", "standard", "convention", "consistency", "maintain", "sustainable", "readable", "clear"],
-        }
-
-        pattern_counts = {}
-        total_commits = len(commit_messages)
-
-        # Base keyword analysis
-        for category, keywords in excellence_keywords.items():
-            count = sum(1 for message in commit_messages if any(keyword in message for keyword in keywords))
-            if count > 0:
-                pattern_counts[category] = {
-                    "count": count,
-                    "percentage": round((count / total_commits) * 100, 1),
-                }
-
-        # Enhance with conventional commit analysis if available
-        if conventional_analysis:
-            conventional_stats = conventional_analysis.get("stats", {})
+        return self._run_analyzer(ConventionalCommitAnalyzer(self), commits)
 
-            # Map conventional commit categories to excellence areas
-            conventional_to_excellence = {
-                "feature_development": "feature_development",
-                "bug_fixing": "bug_fixing",
-                "refactoring": "refactoring",
-                "testing": "testing",
-                "documentation": "documentation",
-                "optimization": "optimization",
-                "code_quality": "refactoring",
-                "maintenance": "refactoring",
-                "ci_cd": "testing",
-                "build": "refactoring",
-            }
+    def _calculate_conventional_quality_score(self, conventional_stats: ConventionalStats) -> float:
+        """Calculate a quality score based on conventional commit adherence."""
+        score = 0.0
 
-            # Boost categories that have conventional commit evidence
-            for conv_category, excellence_category in conventional_to_excellence.items():
-                if conv_category in conventional_stats.get("categories", {}):
-                    conv_count = conventional_stats["categories"][conv_category]
+        total_commits = conventional_stats["total_commits"]
+        conventional_commits_count = conventional_stats["conventional_commits"]
+        breaking_changes_count = conventional_stats["breaking_changes"]
+        types = conventional_stats["types"]
+        scopes = conventional_stats["scopes"]
 
-                    if excellence_category in pattern_counts:
-                        # Boost existing category
-                        pattern_counts[excellence_category]["count"] += conv_count * 0.5  # Partial boost
-                        pattern_counts[excellence_category]["percentage"] = round((pattern_counts[excellence_category]["count"] / total_commits) * 100, 1)
-                    else:
-                        # Add new category based on conventional commits
-                        pattern_counts[excellence_category] = {
-                            "count": conv_count,
-                            "percentage": round((conv_count / total_commits) * 100, 1),
-                        }
+        # Conventional commit adoption (40 points max)
+        if total_commits > 0:
+            conventional_percentage = (conventional_commits_count / total_commits) * 100
+            score += min(conventional_percentage * 0.4, 40)
 
-            # Add conventional commit quality score
-            conventional_quality = conventional_analysis.get("quality_score", 0)
-            if conventional_quality > 70:
-                # Boost code quality if they use conventional commits well
-                if "refactoring" in pattern_counts:
-                    pattern_counts["refactoring"]["count"] += conventional_quality * 0.1
-                    pattern_counts["refactoring"]["percentage"] = round((pattern_counts["refactoring"]["count"] / total_commits) * 100, 1)
+        # Type diversity (30 points max)
+        unique_types = len(types)
+        score += min(unique_types * 10, 30)
 
-        # Sort by frequency
-        sorted_patterns = dict(
-            sorted(
-                pattern_counts.items(),
-                key=lambda x: x[1]["count"],
-                reverse=True,
-            )
-        )
+        # Scope usage (20 points max)
+        scope_usage = len(scopes)
+        score += min(scope_usage * 5, 20)
 
-        # Infer soft skills from technical patterns
-        soft_skills_inference = self._infer_soft_skills_from_patterns(sorted_patterns)
+        # Breaking changes (10 points max, penalize if too many, reward if handled well)
+        # For simplicity, we'll give points for having breaking changes as it implies significant work,
+        # but ideally, this would be more nuanced.
+        score += min(breaking_changes_count * 2, 10)
 
-        return {
-            "patterns": sorted_patterns,
-            "primary_strength": (list(sorted_patterns.keys())[0] if sorted_patterns else None),
-            "conventional_commit_enhanced": conventional_analysis is not None,
-            "inferred_soft_skills": soft_skills_inference,
-        }
+        return round(score, 1)
+
+    def _perform_commit_analysis(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Perform comprehensive analysis of commits."""
+        pipeline = CommitAnalysisPipeline(self)
+        pipeline.add(commits)
+        return pipeline.finalize()
 
     def _infer_soft_skills_from_patterns(self, excellence_patterns: Dict[str, Any], pr_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Infer soft skills from technical excellence patterns and PR data."""
@@ -834,300 +1260,6 @@ class GitHubCommitService:
             "inference_method": "pattern_and_pr_based_analysis" if pr_data else "pattern_based_analysis",
         }
 
-    def _analyze_tools_and_features(self, commit_messages: List[str]) -> Dict[str, Any]:
-        """Extract tools, libraries, and features mentioned in commits."""
-        # Common tools and technologies to look for
-        tool_patterns = {
-            "databases": [
-                "sql",
-                "mongodb",
-                "postgres",
-                "mysql",
-                "redis",
-                "sqlite",
-            ],
-            "frameworks": [
-                "react",
-                "vue",
-                "angular",
-                "django",
-                "flask",
-                "express",
-                "spring",
-            ],
-            "cloud_services": [
-                "aws",
-                "azure",
-                "gcp",
-                "docker",
-                "kubernetes",
-                "heroku",
-            ],
-            "testing_tools": [
-                "jest",
-                "pytest",
-                "mocha",
-                "cypress",
-                "selenium",
-            ],
-            "build_tools": [
-                "webpack",
-                "vite",
-                "gulp",
-                "grunt",
-                "maven",
-                "gradle",
-            ],
-            "monitoring": [
-                "logging",
-                "monitoring",
-                "metrics",
-                "analytics",
-                "sentry",
-            ],
-        }
-
-        found_tools = {}
-        feature_keywords = []
-
-        # Extract tools
-        for category, tools in tool_patterns.items():
-            category_tools = []
-            for message in commit_messages:
-                for tool in tools:
-                    if tool in message and tool not in category_tools:
-                        category_tools.append(tool)
-            if category_tools:
-                found_tools[category] = category_tools
-
-        # Extract feature-related keywords using regex
-        feature_pattern = re.compile(r"(?:add|implement|create|build)\s+([a-zA-Z\s]{3,20})")
-        for message in commit_messages:
-            matches = feature_pattern.findall(message)
-            feature_keywords.extend([match.strip() for match in matches])
-
-        # Count feature frequencies
-        feature_counter = Counter(feature_keywords)
-        top_features = dict(feature_counter.most_common(10))
-
-        return {
-            "tools_by_category": found_tools,
-            "features_implemented": top_features,
-            "total_unique_tools": sum(len(tools) for tools in found_tools.values()),
-        }
-
-    def _analyze_commit_patterns(self, commits: List[Dict[str, Any]], impact_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Analyze commit frequency and timing patterns."""
-        if not commits:
-            return {}
-
-        dates = [datetime.fromisoformat(commit["date"].replace("Z", "+00:00")) for commit in commits if commit["date"]]
-
-        if not dates:
-            return {}
-
-        # Calculate time spans and frequency
-        dates.sort()
-        total_days = (dates[-1] - dates[0]).days if len(dates) > 1 else 1
-        commits_per_day = len(commits) / max(total_days, 1)
-
-        # Analyze file change patterns
-        files_changed = [commit["files_changed"] for commit in commits if commit["files_changed"]]
-        avg_files_per_commit = sum(files_changed) / len(files_changed) if files_changed else 0
-
-        result = {
-            "commits_per_day": round(commits_per_day, 2),
-            "avg_files_per_commit": round(avg_files_per_commit, 1),
-            "total_days_active": total_days,
-            "consistency_score": min(commits_per_day * 10, 100),  # Scale to 0-100
-        }
-
-        # Enhance with impact analysis if available
-        if impact_analysis:
-            result.update(
-                {
-                    "impact_distribution": impact_analysis.get("distribution", {}),
-                    "average_impact_score": impact_analysis.get("average_impact_score", 0),
-                    "high_impact_commits_count": len(impact_analysis.get("high_impact_commits", [])),
-                    "impact_quality_distribution": impact_analysis.get("quality_distribution", {}),
-                }
-            )
-
-            # Calculate impact-weighted consistency score
-            avg_impact = impact_analysis.get("average_impact_score", 0)
-            base_consistency = result["consistency_score"]
-            impact_weighted_score = min((base_consistency + avg_impact) / 2, 100)
-            result["impact_weighted_consistency"] = round(impact_weighted_score, 1)
-
-        return result
-
-    def _analyze_technical_contributions(self, commit_messages: List[str], conventional_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Analyze technical depth and contribution types."""
-        technical_indicators = {
-            "architecture": [
-                "architecture",
-                "design pattern",
-                "structure",
-                "architecture",
-            ],
-            "performance": [
-                "performance",
-                "optimization",
-                "caching",
-                "lazy loading",
-            ],
-            "scalability": [
-                "scalable",
-                "scale",
-                "horizontal",
-                "vertical",
-                "load",
-            ],
-            "maintainability": [
-                "maintainable",
-                "clean code",
-                "readable",
-                "modular",
-            ],
-            "integration": [
-                "api",
-                "integration",
-                "webhook",
-                "service",
-                "endpoint",
-            ],
-        }
-
-        contributions = {}
-        for category, indicators in technical_indicators.items():
-            count = sum(1 for message in commit_messages if any(indicator in message for indicator in indicators))
-            if count > 0:
-                contributions[category] = count
-
-        # Enhance with conventional commit analysis if available
-        if conventional_analysis:
-            conventional_stats = conventional_analysis.get("stats", {})
-
-            # Map conventional commit types to technical contributions
-            conventional_to_technical = {
-                "architecture": ["feat", "refactor"],
-                "performance": ["perf", "optimize"],
-                "scalability": ["feat", "refactor"],
-                "maintainability": ["refactor", "docs"],
-                "integration": ["feat", "ci"],
-            }
-
-            # Boost technical contributions based on conventional commit evidence
-            for tech_category, conv_types in conventional_to_technical.items():
-                conv_count = sum(conventional_stats.get("types", {}).get(conv_type, 0) for conv_type in conv_types)
-
-                if conv_count > 0:
-                    if tech_category in contributions:
-                        contributions[tech_category] += conv_count
-                    else:
-                        contributions[tech_category] = conv_count
-
-            # Add conventional commit quality metrics
-            conventional_quality = conventional_analysis.get("quality_score", 0)
-            if conventional_quality > 0:
-                contributions["conventional_commit_quality"] = conventional_quality
-
-        return contributions
-
-    def _get_top_commit_repositories(self, commits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Get repositories with most commits from the user."""
-        repo_counts = Counter(commit["repository"] for commit in commits)
-        top_repos = []
-
-        for repo_name, count in repo_counts.most_common(5):
-            top_repos.append(
-                {
-                    "repository": repo_name,
-                    "commits": count,
-                    "percentage": round((count / len(commits)) * 100, 1),
-                }
-            )
-
-        return top_repos
-
-    def _calculate_contributor_metrics(self, commits: List[Dict[str, Any]], impact_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Calculate contributor-specific metrics from commits."""
-        if not commits:
-            return {
-                "repositories_with_commits": 0,
-                "avg_commits_per_repo": 0,
-                "most_active_repository": None,
-                "commit_frequency_analysis": {},
-                "contribution_span_days": 0,
-            }
-
-        # Repository analysis
-        repo_counts: Dict[str, int] = {}
-        for commit in commits:
-            repo_name = commit.get("repository", "unknown")
-            repo_counts[repo_name] = repo_counts.get(repo_name, 0) + 1
-
-        repositories_with_commits = len(repo_counts)
-        avg_commits_per_repo = len(commits) / repositories_with_commits if repositories_with_commits > 0 else 0
-        most_active_repo = max(repo_counts.items(), key=lambda x: x[1]) if repo_counts else None
-
-        # Time span analysis
-        dates = []
-        for commit in commits:
-            if commit.get("date"):
-                try:
-                    commit_date = datetime.fromisoformat(commit["date"].replace("Z", "+00:00"))
-                    dates.append(commit_date)
-                except Exception:
-                    continue
-
-        contribution_span_days = 0
-        if len(dates) > 1:
-            dates.sort()
-            contribution_span_days = (dates[-1] - dates[0]).days
-
-        # Frequency analysis
-        commit_frequency_analysis = {
-            "daily_average": (len(commits) / max(1, contribution_span_days) if contribution_span_days > 0 else 0),
-            "most_productive_repo": most_active_repo[0] if most_active_repo else None,
-            "most_productive_repo_commits": (most_active_repo[1] if most_active_repo else 0),
-            "repository_diversity_score": (min(100, (repositories_with_commits / len(commits)) * 100) if commits else 0),
-        }
-
-        result = {
-            "repositories_with_commits": repositories_with_commits,
-            "avg_commits_per_repo": round(avg_commits_per_repo, 1),
-            "most_active_repository": most_active_repo[0] if most_active_repo else None,
-            "commit_frequency_analysis": commit_frequency_analysis,
-            "contribution_span_days": contribution_span_days,
-        }
-
-        # Enhance with impact analysis if available
-        if impact_analysis:
-            result.update(
-                {
-                    "impact_metrics": {
-                        "average_impact_score": impact_analysis.get("average_impact_score", 0),
-                        "high_impact_commits": len(impact_analysis.get("high_impact_commits", [])),
-                        "impact_distribution": impact_analysis.get("distribution", {}),
-                        "conventional_high_impact": len(impact_analysis.get("conventional_high_impact", [])),
-                    },
-                    "quality_metrics": {
-                        "impact_quality_distribution": impact_analysis.get("quality_distribution", {}),
-                        "impact_score_range": impact_analysis.get("impact_score_range", {}),
-                    },
-                }
-            )
-
-            # Calculate impact-weighted productivity metrics
-            high_impact_count = len(impact_analysis.get("high_impact_commits", []))
-            total_commits = len(commits)
-            if total_commits > 0:
-                impact_productivity_ratio = high_impact_count / total_commits
-                result["impact_productivity_ratio"] = round(impact_productivity_ratio * 100, 1)
-
-        return result
-
     def _empty_commit_analysis(self) -> Dict[str, Any]:
         """Return empty commit analysis structure for contributor-focused analysis."""
         return {
@@ -1187,50 +1319,58 @@ class GitHubCommitService:
                 logger.error(f"Invalid repository name format: {repository_full_name}")
                 return self._empty_contributor_summary()
 
-            owner, repo_name = repo_parts
-
-            # Get repository and user data
-            repo = self.github_client.get_repo(repository_full_name)
-            user = self.github_client.get_user(username)
-
             # Get contributor's commits
             contributor_commits = []
             try:
-                commits = repo.get_commits(author=user, since=None)
-                for commit in commits[:max_commits]:
+                commits = await self.github_client.get_repo_commits(repository_full_name, author=username, max_items=max_commits)
+
+                commit_stats = await self._fetch_commit_stats(repository_full_name, commits)
+
+                for commit in commits:
+                    stats = commit_stats.get(commit["sha"], {})
                     commit_data = {
-                        "sha": commit.sha,
-                        "message": commit.commit.message,
-                        "date": commit.commit.author.date.isoformat() if commit.commit.author else None,
-                        "files_changed": len(list(commit.files)) if commit.files else 0,
-                        "additions": commit.stats.additions if commit.stats else 0,
-                        "deletions": commit.stats.deletions if commit.stats else 0,
+                        "sha": commit["sha"],
+                        "message": commit["commit"]["message"],
+                        "date": normalize_timestamp((commit["commit"].get("author") or {}).get("date")),
+                        "files_changed": stats.get("files_changed", 0),
+                        "additions": stats.get("additions", 0),
+                        "deletions": stats.get("deletions", 0),
                         "repository": repository_full_name,
+                        "repository_full_name": repository_full_name,
                     }
                     contributor_commits.append(commit_data)
             except Exception as e:
                 logger.warning(f"Could not fetch commits for {username} in {repository_full_name}: {e}")
 
+            if settings.GITHUB_COMMIT_STATS_MODE == "lazy":
+                await self._enrich_high_impact_commits(contributor_commits)
+
             # Get contributor's pull requests
             contributor_prs = []
             try:
-                pulls = repo.get_pulls(state="all", sort="created", direction="desc")
-                for pr in pulls:
-                    if pr.user.login == username:
-                        pr_data = {
-                            "number": pr.number,
-                            "title": pr.title,
-                            "body": pr.body[:500] if pr.body else "",  # Truncate body
-                            "state": pr.state,
-                            "created_at": pr.created_at.isoformat(),
-                            "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-                            "additions": pr.additions,
-                            "deletions": pr.deletions,
-                            "changed_files": pr.changed_files,
-                            "review_comments": pr.review_comments,
-                            "labels": [label.name for label in pr.labels],
-                        }
-                        contributor_prs.append(pr_data)
+                authored = [
+                    pr async for pr in self.github_client.iter_repo_pulls(repository_full_name, state="all", sort="created", direction="desc") if (pr.get("user") or {}).get("login") == username
+                ]
+
+                # List payloads omit additions/deletions/review counts, so fetch PR details concurrently
+                details = await asyncio.gather(*(self.github_client.get_pull(repository_full_name, pr["number"]) for pr in authored), return_exceptions=True)
+
+                for pr, detail in zip(authored, details):
+                    pr = detail if isinstance(detail, dict) else pr
+                    pr_data = {
+                        "number": pr["number"],
+                        "title": pr["title"],
+                        "body": pr["body"][:500] if pr.get("body") else "",  # Truncate body
+                        "state": pr["state"],
+                        "created_at": normalize_timestamp(pr.get("created_at")),
+                        "merged_at": normalize_timestamp(pr.get("merged_at")),
+                        "additions": pr.get("additions", 0),
+                        "deletions": pr.get("deletions", 0),
+                        "changed_files": pr.get("changed_files", 0),
+                        "review_comments": pr.get("review_comments", 0),
+                        "labels": [label["name"] for label in pr.get("labels", [])],
+                    }
+                    contributor_prs.append(pr_data)
             except Exception as e:
                 logger.warning(f"Could not fetch PRs for {username} in {repository_full_name}: {e}")
 
@@ -1286,60 +1426,14 @@ class GitHubCommitService:
         """Extract technical focus areas from commit messages with enhanced pattern detection."""
         patterns = []
 
-        # Enhanced technical patterns with specific problem types
-        tech_indicators = {
-            "frontend": ["ui", "component", "react", "vue", "angular", "frontend", "interface", "ux", "styling"],
-            "backend": ["api", "server", "database", "endpoint", "service", "backend", "authentication", "security"],
-            "testing": ["test", "spec", "unit", "integration", "coverage", "assert", "mock"],
-            "performance": ["optimize", "performance", "speed", "memory", "cache", "efficiency"],
-            "architecture": ["refactor", "architecture", "structure", "design", "pattern"],
-            "bug_fixing": ["fix", "bug", "issue", "resolve", "correct", "patch"],
-            "features": ["feature", "implement", "add", "create", "build", "develop"],
-        }
-
-        # Specific problem types (enhanced detection)
-        problem_types = {
-            "memory_management": ["memory leak", "memory optimization", "garbage collection", "heap", "memory usage"],
-            "concurrency": ["race condition", "deadlock", "thread", "concurrency", "async", "parallel"],
-            "database_optimization": ["query optimization", "index", "database performance", "n+1", "slow query"],
-            "security_fixes": ["vulnerability", "xss", "sql injection", "csrf", "authentication", "authorization"],
-        }
-
-        # Architectural patterns (enhanced detection)
-        architectural_patterns = {
-            "design_patterns": ["singleton", "factory", "observer", "strategy", "decorator", "adapter"],
-            "architectural_styles": ["mvc", "mvvm", "microservices", "event-driven", "layered", "hexagonal"],
-        }
-
-        # Integration patterns (enhanced detection)
-        integration_patterns = {
-            "api_types": ["rest api", "graphql", "websocket", "grpc", "soap"],
-            "messaging": ["message queue", "pub/sub", "event bus", "kafka", "rabbitmq"],
-        }
+        commit_hits = COMMIT_KEYWORDS.classify_all(commit_messages)
 
-        # Check standard technical indicators
-        for category, keywords in tech_indicators.items():
-            matches = sum(1 for msg in commit_messages for keyword in keywords if keyword.lower() in msg.lower())
-            if matches > 0:
-                patterns.append(f"{category.replace('_', ' ').title()}: {matches} contributions")
-
-        # Check specific problem types
-        for category, keywords in problem_types.items():
-            matches = sum(1 for msg in commit_messages for keyword in keywords if keyword.lower() in msg.lower())
-            if matches > 0:
-                patterns.append(f"{category.replace('_', ' ').title()}: {matches} instances")
-
-        # Check architectural patterns
-        for category, keywords in architectural_patterns.items():
-            matches = sum(1 for msg in commit_messages for keyword in keywords if keyword.lower() in msg.lower())
-            if matches > 0:
-                patterns.append(f"{category.replace('_', ' ').title()}: {matches} implementations")
-
-        # Check integration patterns
-        for category, keywords in integration_patterns.items():
-            matches = sum(1 for msg in commit_messages for keyword in keywords if keyword.lower() in msg.lower())
-            if matches > 0:
-                patterns.append(f"{category.replace('_', ' ').title()}: {matches} integrations")
+        # Each matching keyword in a message counts once
+        for group, noun in (("technical_focus", "contributions"), ("problem_types", "instances"), ("architectural_patterns", "implementations"), ("integration_patterns", "integrations")):
+            for category in COMMIT_KEYWORDS.groups[group]:
+                matches = sum(len(hits[group].get(category, ())) for hits in commit_hits)
+                if matches > 0:
+                    patterns.append(f"{category.replace('_', ' ').title()}: {matches} {noun}")
 
         return patterns
 
@@ -1446,59 +1540,13 @@ class GitHubCommitService:
 
     def _analyze_commit_impacts(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze the impact distribution across all commits."""
-        impact_distribution = {
-            "high": 0,
-            "moderate": 0,
-            "low": 0,
-            "minimal": 0,
-        }
-
-        impact_scores = []
-        high_impact_commits = []
-        conventional_high_impact = []
+        return self._run_analyzer(CommitImpactAnalyzer(), commits)
 
+    def _run_analyzer(self, analyzer: CommitAnalyzer, commits: List[Dict[str, Any]]) -> Any:
+        """Run a single commit analyzer over ``commits``."""
         for commit in commits:
-            impact_analysis = self._analyze_commit_impact(commit)
-            impact_level = impact_analysis["impact_level"]
-            impact_score = impact_analysis["impact_score"]
-
-            impact_distribution[impact_level] += 1
-            impact_scores.append(impact_score)
-
-            # Track high impact commits
-            if impact_level in ["high", "moderate"]:
-                high_impact_commits.append(
-                    {
-                        "commit": commit,
-                        "impact_analysis": impact_analysis,
-                    }
-                )
-
-                # Track conventional commits that are high impact
-                if impact_analysis["conventional_info"]["is_conventional"]:
-                    conventional_high_impact.append(
-                        {
-                            "commit": commit,
-                            "impact_analysis": impact_analysis,
-                        }
-                    )
-
-        # Calculate statistics
-        total_commits = len(commits)
-        avg_impact_score = sum(impact_scores) / len(impact_scores) if impact_scores else 0
-
-        return {
-            "distribution": impact_distribution,
-            "average_impact_score": round(avg_impact_score, 1),
-            "high_impact_commits": high_impact_commits[:10],  # Top 10
-            "conventional_high_impact": conventional_high_impact[:5],  # Top 5
-            "impact_score_range": {
-                "min": min(impact_scores) if impact_scores else 0,
-                "max": max(impact_scores) if impact_scores else 0,
-                "median": sorted(impact_scores)[len(impact_scores) // 2] if impact_scores else 0,
-            },
-            "quality_distribution": {level: round((count / total_commits) * 100, 1) if total_commits > 0 else 0 for level, count in impact_distribution.items()},
-        }
+            analyzer.update(CommitFacts(self, commit))
+        return analyzer.finalize({})
 
     async def fetch_user_pull_requests_across_repos(
         self,
@@ -1599,42 +1647,42 @@ class GitHubCommitService:
             if not self.github_client:
                 return []
 
-            repo = self.github_client.get_repo(repository_full_name)
-            pulls = repo.get_pulls(state="all", sort="created", direction="desc")
-
-            prs_data = []
-            count = 0
-
-            for pr in pulls:
-                if count >= max_prs:
+            # Filter by author if specified
+            pulls: List[Dict[str, Any]] = []
+            async for pr in self.github_client.iter_repo_pulls(repository_full_name, state="all", sort="created", direction="desc"):
+                if len(pulls) >= max_prs:
                     break
-
-                # Filter by author if specified
-                if author_username and pr.user.login != author_username:
+                if author_username and (pr.get("user") or {}).get("login") != author_username:
                     continue
+                pulls.append(pr)
 
+            # List payloads omit additions/deletions/comment counts, so fetch PR details concurrently
+            details = await asyncio.gather(*(self.github_client.get_pull(repository_full_name, pr["number"]) for pr in pulls), return_exceptions=True)
+
+            prs_data = []
+            for pr, detail in zip(pulls, details):
+                pr = detail if isinstance(detail, dict) else pr
                 pr_data = {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "body": pr.body[:1000] if pr.body else "",  # Truncate body
-                    "state": pr.state,
-                    "created_at": pr.created_at.isoformat() if pr.created_at else None,
-                    "updated_at": pr.updated_at.isoformat() if pr.updated_at else None,
-                    "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-                    "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
-                    "author": pr.user.login if pr.user else None,
-                    "additions": pr.additions,
-                    "deletions": pr.deletions,
-                    "changed_files": pr.changed_files,
-                    "comments": pr.comments,
-                    "review_comments": pr.review_comments,
-                    "commits": pr.commits,
-                    "labels": [label.name for label in pr.labels] if pr.labels else [],
-                    "milestone": pr.milestone.title if pr.milestone else None,
+                    "number": pr["number"],
+                    "title": pr["title"],
+                    "body": pr["body"][:1000] if pr.get("body") else "",  # Truncate body
+                    "state": pr["state"],
+                    "created_at": normalize_timestamp(pr.get("created_at")),
+                    "updated_at": normalize_timestamp(pr.get("updated_at")),
+                    "merged_at": normalize_timestamp(pr.get("merged_at")),
+                    "closed_at": normalize_timestamp(pr.get("closed_at")),
+                    "author": (pr.get("user") or {}).get("login"),
+                    "additions": pr.get("additions", 0),
+                    "deletions": pr.get("deletions", 0),
+                    "changed_files": pr.get("changed_files", 0),
+                    "comments": pr.get("comments", 0),
+                    "review_comments": pr.get("review_comments", 0),
+                    "commits": pr.get("commits", 0),
+                    "labels": [label["name"] for label in pr.get("labels") or []],
+                    "milestone": (pr.get("milestone") or {}).get("title"),
                     "repository": repository_full_name,
                 }
                 prs_data.append(pr_data)
-                count += 1
 
             # Cache the results
             from app.core.redis_client import set_cache
@@ -1658,74 +1706,50 @@ class GitHubCommitService:
         """Fetch PRs from a single repository asynchronously with rate limiting."""
         async with semaphore:
             try:
-                loop = asyncio.get_event_loop()
-                prs = await loop.run_in_executor(
-                    None,
-                    self._fetch_user_prs_from_repo_sync,
-                    username,
-                    repo_data,
-                    max_prs_per_repo,
-                )
-                return prs
-
-            except Exception as e:
-                logger.warning(f"Error fetching PRs from {repo_data.get('name', 'unknown')}: {e}")
-                return []
-
-    def _fetch_user_prs_from_repo_sync(
-        self,
-        username: str,
-        repo_data: Dict[str, Any],
-        max_prs_per_repo: int,
-    ) -> List[Dict[str, Any]]:
-        """Synchronous helper to fetch PRs from a repository (runs in thread pool)."""
-        if not self.github_client:
-            return []
-
-        try:
-            # Try to get the repository
-            repo_full_name = repo_data.get("full_name") or f"{username}/{repo_data['name']}"
-            repo = self.github_client.get_repo(repo_full_name)
-
-            pulls = repo.get_pulls(state="all", sort="created", direction="desc")
+                repo_full_name = repo_data.get("full_name") or f"{username}/{repo_data['name']}"
 
-            prs_data = []
-            count = 0
+                # Only get PRs authored by this user
+                client = require_github_client(self.github_client)
+                authored: List[Dict[str, Any]] = []
+                async for pr in client.iter_repo_pulls(repo_full_name, state="all", sort="created", direction="desc"):
+                    if len(authored) >= max_prs_per_repo:
+                        break
+                    if (pr.get("user") or {}).get("login") == username:
+                        authored.append(pr)
 
-            for pr in pulls:
-                if count >= max_prs_per_repo:
-                    break
+                # List payloads omit additions/deletions/comment counts, so fetch PR details concurrently
+                details = await asyncio.gather(*(client.get_pull(repo_full_name, pr["number"]) for pr in authored), return_exceptions=True)
 
-                # Only get PRs authored by this user
-                if pr.user and pr.user.login == username:
+                prs_data = []
+                for pr, detail in zip(authored, details):
+                    pr = detail if isinstance(detail, dict) else pr
                     pr_data = {
-                        "number": pr.number,
-                        "title": pr.title,
-                        "body": pr.body[:1000] if pr.body else "",
-                        "state": pr.state,
-                        "created_at": pr.created_at.isoformat() if pr.created_at else None,
-                        "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-                        "author": pr.user.login,
-                        "additions": pr.additions,
-                        "deletions": pr.deletions,
-                        "changed_files": pr.changed_files,
-                        "comments": pr.comments,
-                        "review_comments": pr.review_comments,
-                        "labels": [label.name for label in pr.labels] if pr.labels else [],
+                        "number": pr["number"],
+                        "title": pr["title"],
+                        "body": pr["body"][:1000] if pr.get("body") else "",
+                        "state": pr["state"],
+                        "created_at": normalize_timestamp(pr.get("created_at")),
+                        "merged_at": normalize_timestamp(pr.get("merged_at")),
+                        "author": username,
+                        "additions": pr.get("additions", 0),
+                        "deletions": pr.get("deletions", 0),
+                        "changed_files": pr.get("changed_files", 0),
+                        "comments": pr.get("comments", 0),
+                        "review_comments": pr.get("review_comments", 0),
+                        "labels": [label["name"] for label in pr.get("labels") or []],
                         "repository": repo_data.get("name", ""),
                         "repository_full_name": repo_full_name,
                     }
                     prs_data.append(pr_data)
-                    count += 1
 
-            if prs_data:
-                logger.debug(f"✅ Found {len(prs_data)} PRs from {username} in {repo_data.get('name', '')}")
+                if prs_data:
+                    logger.debug(f"✅ Found {len(prs_data)} PRs from {username} in {repo_data.get('name', '')}")
 
-            return prs_data
+                return prs_data
 
-        except Exception as e:
-            logger.debug(f"Error fetching PRs from {repo_data.get('name', '')}: {e}")
-            return []
+            except Exception as e:
+                logger.debug(f"Error fetching PRs from {repo_data.get('name', '')}: {e}")
+                return []
 
     def _perform_pr_analysis(self, prs: List[Dict[str, Any]], username: str) -> Dict[str, Any]:
         """Perform comprehensive analysis of pull requests."""
@@ -1802,31 +1826,24 @@ class GitHubCommitService:
             "solution_approaches": [],
         }
 
-        architectural_keywords = ["architecture", "design", "pattern", "refactor", "restructure"]
-        trade_off_keywords = ["trade-off", "tradeoff", "vs", "versus", "alternative", "option"]
-        problem_keywords = {
-            "bug_fix": ["bug", "fix", "issue", "error", "crash"],
-            "performance": ["performance", "optimize", "speed", "memory", "cache"],
-            "security": ["security", "auth", "vulnerability", "encrypt"],
-            "feature": ["feature", "implement", "add", "new"],
-        }
-
         for pr in prs:
             title_lower = pr.get("title", "").lower()
             body_lower = pr.get("body", "").lower()
             combined = title_lower + " " + body_lower
+            combined_hits = COMMIT_KEYWORDS.classify(combined)["pr_discussion"]
+            title_hits = COMMIT_KEYWORDS.classify(title_lower)["pr_problem_types"]
 
             # Check for architectural discussions
-            if any(keyword in combined for keyword in architectural_keywords):
+            if "architectural" in combined_hits:
                 problem_patterns["architectural_decisions"] += 1
 
             # Check for trade-off discussions
-            if any(keyword in combined for keyword in trade_off_keywords):
+            if "trade_off" in combined_hits:
                 problem_patterns["trade_offs_discussed"] += 1
 
             # Identify problem types
-            for problem_type, keywords in problem_keywords.items():
-                if any(keyword in title_lower for keyword in keywords):
+            for problem_type in COMMIT_KEYWORDS.groups["pr_problem_types"]:
+                if problem_type in title_hits:
                     if problem_type not in problem_patterns["problem_types"]:
                         problem_patterns["problem_types"].append(problem_type)
 
@@ -2017,10 +2034,7 @@ class GitHubCommitService:
                 """Fetch issues for a single repository."""
                 async with semaphore:
                     try:
-                        loop = asyncio.get_event_loop()
-                        return await loop.run_in_executor(
-                            None,
-                            self._fetch_repo_issues_sync,
+                        return await self._fetch_repo_issues(
                             username,
                             repo_data,
                             max_issues // len(repositories) if repositories else 10,
@@ -2061,77 +2075,75 @@ class GitHubCommitService:
             logger.error(f"Error in issue analysis: {e}")
             return self._empty_issue_analysis()
 
-    def _fetch_repo_issues_sync(
+    async def _fetch_repo_issues(
         self,
         username: str,
         repo_data: Dict[str, Any],
         max_per_repo: int,
     ) -> Dict[str, Any]:
-        """Synchronously fetch issues from a repository."""
+        """Fetch issues from a repository."""
         if not self.github_client:
             return {"opened": [], "commented": [], "closed_by_user": []}
 
         try:
             repo_name = repo_data.get("full_name") or f"{username}/{repo_data['name']}"
-            repo = self.github_client.get_repo(repo_name)
 
             issues_opened = []
             issues_commented = []
             issues_closed_by_user = []
 
-            # Get all issues (open and closed)
-            all_issues = repo.get_issues(state="all", sort="created", direction="desc")
-
-            count = 0
-            for issue in all_issues:
-                if count >= max_per_repo:
+            # Get all issues (open and closed), skipping PRs (they show up in issues API)
+            issues: List[Dict[str, Any]] = []
+            async for issue in self.github_client.iter_repo_issues(repo_name, state="all", sort="created", direction="desc"):
+                if len(issues) >= max(max_per_repo, 20):
                     break
+                if issue.get("pull_request") is None:
+                    issues.append(issue)
 
-                # Skip PRs (they show up in issues API)
-                if issue.pull_request is not None:
-                    continue
+            # ``closed_by`` is only present on the single-issue payload
+            closed = [issue for issue in issues[:max_per_repo] if issue["state"] == "closed"]
+            closed_details = await asyncio.gather(*(self.github_client.get_issue(repo_name, issue["number"]) for issue in closed), return_exceptions=True)
+            closed_by = {issue["number"]: ((detail.get("closed_by") or {}).get("login") if isinstance(detail, dict) else None) for issue, detail in zip(closed, closed_details)}
 
+            for issue in issues[:max_per_repo]:
                 issue_data = {
-                    "number": issue.number,
-                    "title": issue.title,
-                    "body": (issue.body[:500] if issue.body else ""),
-                    "state": issue.state,
-                    "created_at": issue.created_at.isoformat() if issue.created_at else None,
-                    "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-                    "labels": [label.name for label in issue.labels],
-                    "comments_count": issue.comments,
+                    "number": issue["number"],
+                    "title": issue["title"],
+                    "body": (issue["body"][:500] if issue.get("body") else ""),
+                    "state": issue["state"],
+                    "created_at": normalize_timestamp(issue.get("created_at")),
+                    "closed_at": normalize_timestamp(issue.get("closed_at")),
+                    "labels": [label["name"] for label in issue.get("labels") or []],
+                    "comments_count": issue.get("comments", 0),
                     "repository": repo_name,
                 }
 
                 # Check if user opened this issue
-                if issue.user and issue.user.login == username:
+                if (issue.get("user") or {}).get("login") == username:
                     issues_opened.append(issue_data)
 
                 # Check if user closed this issue (assignee who closed)
-                if issue.state == "closed" and issue.closed_by:
-                    if issue.closed_by.login == username:
-                        issues_closed_by_user.append(issue_data)
-
-                count += 1
+                if closed_by.get(issue["number"]) == username:
+                    issues_closed_by_user.append(issue_data)
 
             # Get issues where user commented (sample)
             try:
-                for issue in all_issues[:20]:  # Check first 20 issues
-                    if issue.pull_request is not None:
+                commented = [issue for issue in issues[:20] if issue.get("comments", 0) > 0]  # Check first 20 issues
+                comment_lists = await asyncio.gather(*(self.github_client.get_issue_comments(repo_name, issue["number"]) for issue in commented), return_exceptions=True)
+                for issue, comments in zip(commented, comment_lists):
+                    if isinstance(comments, BaseException):
                         continue
-                    if issue.comments > 0:
-                        comments = issue.get_comments()
-                        for comment in comments:
-                            if comment.user and comment.user.login == username:
-                                issues_commented.append(
-                                    {
-                                        "issue_number": issue.number,
-                                        "issue_title": issue.title,
-                                        "comment_body": comment.body[:300] if comment.body else "",
-                                        "created_at": comment.created_at.isoformat() if comment.created_at else None,
-                                    }
-                                )
-                                break  # Only count once per issue
+                    for comment in comments:
+                        if (comment.get("user") or {}).get("login") == username:
+                            issues_commented.append(
+                                {
+                                    "issue_number": issue["number"],
+                                    "issue_title": issue["title"],
+                                    "comment_body": comment["body"][:300] if comment.get("body") else "",
+                                    "created_at": normalize_timestamp(comment.get("created_at")),
+                                }
+                            )
+                            break  # Only count once per issue
             except Exception:
                 pass  # Comments are optional enhancement
 
@@ -2348,10 +2360,7 @@ class GitHubCommitService:
                 """Fetch review comments for a single repository."""
                 async with semaphore:
                     try:
-                        loop = asyncio.get_event_loop()
-                        return await loop.run_in_executor(
-                            None,
-                            self._fetch_repo_reviews_sync,
+                        return await self._fetch_repo_reviews(
                             username,
                             repo_data,
                             max_reviews // len(repositories) if repositories else 5,
@@ -2384,48 +2393,43 @@ class GitHubCommitService:
             logger.error(f"Error in review analysis: {e}")
             return self._empty_review_analysis()
 
-    def _fetch_repo_reviews_sync(
+    async def _fetch_repo_reviews(
         self,
         username: str,
         repo_data: Dict[str, Any],
         max_per_repo: int,
     ) -> List[Dict[str, Any]]:
-        """Synchronously fetch review comments from a repository."""
+        """Fetch review comments from a repository."""
         if not self.github_client:
             return []
 
         try:
             repo_name = repo_data.get("full_name") or f"{username}/{repo_data['name']}"
-            repo = self.github_client.get_repo(repo_name)
-
-            reviews = []
 
-            # Get recent PRs and their reviews
-            pulls = repo.get_pulls(state="all", sort="updated", direction="desc")
-
-            pr_count = 0
-            for pr in pulls:
-                if pr_count >= max_per_repo:
+            # Get recent PRs and their review comments
+            pulls: List[Dict[str, Any]] = []
+            async for pr in self.github_client.iter_repo_pulls(repo_name, state="all", sort="updated", direction="desc"):
+                if len(pulls) >= max_per_repo:
                     break
+                pulls.append(pr)
 
-                try:
-                    # Get review comments
-                    review_comments = pr.get_review_comments()
-                    for comment in review_comments:
-                        if comment.user and comment.user.login == username:
-                            reviews.append(
-                                {
-                                    "pr_number": pr.number,
-                                    "pr_title": pr.title,
-                                    "body": comment.body[:500] if comment.body else "",
-                                    "path": comment.path,
-                                    "created_at": comment.created_at.isoformat() if comment.created_at else None,
-                                }
-                            )
-                except Exception:
-                    continue
+            comment_lists = await asyncio.gather(*(self.github_client.get_pull_review_comments(repo_name, pr["number"]) for pr in pulls), return_exceptions=True)
 
-                pr_count += 1
+            reviews = []
+            for pr, review_comments in zip(pulls, comment_lists):
+                if isinstance(review_comments, BaseException):
+                    continue
+                for comment in review_comments:
+                    if (comment.get("user") or {}).get("login") == username:
+                        reviews.append(
+                            {
+                                "pr_number": pr["number"],
+                                "pr_title": pr["title"],
+                                "body": comment["body"][:500] if comment.get("body") else "",
+                                "path": comment.get("path"),
+                                "created_at": normalize_timestamp(comment.get("created_at")),
+                            }
+                        )
 
             return reviews
 
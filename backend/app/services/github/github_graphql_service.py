@@ -0,0 +1,292 @@
+"""GitHub GraphQL v4 batch fetcher for profile analysis."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.github.github_api_client import get_github_api_client, normalize_timestamp, require_github_client
+
+logger = logging.getLogger(__name__)
+
+PROFILE_QUERY = """
+query($login: String!, $repoCount: Int!, $starCount: Int!, $prCount: Int!) {
+  user(login: $login) {
+    id
+    databaseId
+    login
+    name
+    bio
+    company
+    location
+    email
+    websiteUrl
+    avatarUrl
+    createdAt
+    updatedAt
+    followers { totalCount }
+    following { totalCount }
+    gists(privacy: PUBLIC) { totalCount }
+    publicRepositories: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    repositories(first: $repoCount, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        name
+        nameWithOwner
+        description
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        diskUsage
+        createdAt
+        updatedAt
+        url
+        isPrivate
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+    starredRepositories(first: $starCount, orderBy: {field: STARRED_AT, direction: DESC}) {
+      nodes {
+        name
+        nameWithOwner
+        description
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        url
+        owner { login }
+        isFork
+        isArchived
+        updatedAt
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+    organizations(first: 20) {
+      nodes {
+        login
+        name
+        description
+        url
+        avatarUrl
+        location
+        websiteUrl
+        email
+        membersWithRole { totalCount }
+        repositories(privacy: PUBLIC) { totalCount }
+      }
+    }
+    pullRequests(first: $prCount, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        body
+        state
+        createdAt
+        mergedAt
+        additions
+        deletions
+        changedFiles
+        comments { totalCount }
+        reviewThreads { totalCount }
+        labels(first: 10) { nodes { name } }
+        repository { name nameWithOwner }
+      }
+    }
+  }
+}
+"""
+
+HISTORY_FIELDS = """
+defaultBranchRef {
+  target {
+    ... on Commit {
+      history(first: $commitCount, author: {id: $authorId}) {
+        nodes { oid message committedDate additions deletions changedFilesIfAvailable }
+      }
+    }
+  }
+}
+"""
+
+
+class GitHubGraphQLService:
+    """Fetch everything a cold profile analysis needs in a couple of GraphQL queries.
+
+    The REST pipeline walks user → repositories → commits per repository → pull requests
+    per repository; here the first query returns the user, their top repositories (with
+    topics), starred repositories, organizations and authored pull requests, and the second
+    returns every repository's commit history filtered to the user. Results are mapped onto
+    the same dict shapes the REST fetchers produce.
+    """
+
+    MAX_COMMITS_PER_QUERY = 100  # GraphQL connection page size limit
+    MAX_STARRED = 20
+    PR_SCAN_LIMIT = 100  # Authored PRs scanned to find those in the analyzed repositories
+
+    def __init__(self) -> None:
+        """Initialize GraphQL service."""
+        self.github_client = get_github_api_client() if settings.GITHUB_TOKEN else None
+
+    async def fetch_profile_bundle(
+        self,
+        username: str,
+        max_repositories: int = 10,
+        commits_per_repo: int = 30,
+        max_commits: int = 150,
+        max_prs: int = 50,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch user data, repositories, commits and pull requests for a profile analysis.
+
+        Returns a dict with ``user_data`` (without ``starred_technologies``), ``repositories``,
+        ``commits`` and ``pull_requests``, or None when the user does not exist.
+        """
+        if not self.github_client:
+            return None
+
+        data = await self.github_client.graphql(
+            PROFILE_QUERY,
+            {"login": username, "repoCount": max_repositories, "starCount": self.MAX_STARRED, "prCount": self.PR_SCAN_LIMIT},
+        )
+        user = data.get("user")
+        if not user:
+            return None
+
+        repositories = [self._map_repository(repo) for repo in user["repositories"]["nodes"]]
+        commits = await self._fetch_commit_histories(user, repositories, min(commits_per_repo, self.MAX_COMMITS_PER_QUERY))
+
+        repo_names = {repo["full_name"] for repo in repositories}
+        pull_requests = [self._map_pull_request(pr, user["login"]) for pr in user["pullRequests"]["nodes"] if pr["repository"]["nameWithOwner"] in repo_names]
+
+        return {
+            "user_data": self._map_user(user),
+            "repositories": repositories,
+            "commits": commits[:max_commits],
+            "pull_requests": pull_requests[:max_prs],
+        }
+
+    async def _fetch_commit_histories(self, user: Dict[str, Any], repositories: List[Dict[str, Any]], commits_per_repo: int) -> List[Dict[str, Any]]:
+        """Fetch the user's commits on every repository's default branch in a single aliased query."""
+        if not repositories:
+            return []
+
+        declarations = ["$authorId: ID!", "$commitCount: Int!"]
+        variables: Dict[str, Any] = {"authorId": user["id"], "commitCount": commits_per_repo}
+        fields = []
+        for index, repo in enumerate(repositories):
+            owner, name = repo["full_name"].split("/", 1)
+            declarations += [f"$owner{index}: String!", f"$name{index}: String!"]
+            variables.update({f"owner{index}": owner, f"name{index}": name})
+            fields.append(f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {HISTORY_FIELDS} }}")
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        data = await require_github_client(self.github_client).graphql(query, variables)
+
+        commits = []
+        for index, repo in enumerate(repositories):
+            target = ((data.get(f"r{index}") or {}).get("defaultBranchRef") or {}).get("target") or {}
+            for node in (target.get("history") or {}).get("nodes", []):
+                commits.append(
+                    {
+                        "message": node["message"],
+                        "date": normalize_timestamp(node.get("committedDate")),
+                        "repository": repo["name"],
+                        "repository_full_name": repo["full_name"],
+                        "sha": node["oid"],
+                        "files_changed": node.get("changedFilesIfAvailable") or 0,
+                        "contributor": user["login"],
+                    }
+                )
+        return commits
+
+    def _map_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL user onto the REST user data shape."""
+        return {
+            "github_username": user["login"],
+            "github_id": user.get("databaseId"),
+            "full_name": user.get("name"),
+            "bio": user.get("bio"),
+            "company": user.get("company"),
+            "location": user.get("location"),
+            "email": user.get("email") or None,
+            "blog": user.get("websiteUrl") or "",
+            "avatar_url": user.get("avatarUrl"),
+            "public_repos": user["publicRepositories"]["totalCount"],
+            "followers": user["followers"]["totalCount"],
+            "following": user["following"]["totalCount"],
+            "public_gists": user["gists"]["totalCount"],
+            "created_at": normalize_timestamp(user.get("createdAt")),
+            "updated_at": normalize_timestamp(user.get("updatedAt")),
+            "starred_repositories": [self._map_starred_repository(repo) for repo in user["starredRepositories"]["nodes"]],
+            "organizations": [self._map_organization(org) for org in user["organizations"]["nodes"]],
+        }
+
+    def _map_repository(self, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL repository onto the REST repository shape."""
+        return {
+            "name": repo["name"],
+            "full_name": repo["nameWithOwner"],
+            "description": repo.get("description"),
+            "language": (repo.get("primaryLanguage") or {}).get("name"),
+            "stars": repo.get("stargazerCount", 0),
+            "forks": repo.get("forkCount", 0),
+            "size": repo.get("diskUsage") or 0,
+            "created_at": normalize_timestamp(repo.get("createdAt")),
+            "updated_at": normalize_timestamp(repo.get("updatedAt")),
+            "topics": [node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]],
+            "url": repo.get("url"),
+            "clone_url": f"{repo['url']}.git" if repo.get("url") else None,
+            "is_private": repo.get("isPrivate", False),
+        }
+
+    def _map_starred_repository(self, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL starred repository onto the REST starred repository shape."""
+        return {
+            "name": repo["name"],
+            "full_name": repo["nameWithOwner"],
+            "description": repo.get("description"),
+            "language": (repo.get("primaryLanguage") or {}).get("name"),
+            "stars": repo.get("stargazerCount", 0),
+            "forks": repo.get("forkCount", 0),
+            "topics": [node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]],
+            "url": repo.get("url"),
+            "owner": repo["owner"]["login"],
+            "is_fork": repo.get("isFork", False),
+            "archived": repo.get("isArchived", False),
+            "updated_at": normalize_timestamp(repo.get("updatedAt")),
+        }
+
+    def _map_organization(self, org: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL organization onto the REST organization shape."""
+        return {
+            "login": org["login"],
+            "name": org.get("name"),
+            "description": org.get("description"),
+            "url": org.get("url"),
+            "avatar_url": org.get("avatarUrl"),
+            "public_repos": (org.get("repositories") or {}).get("totalCount", 0),
+            "members_count": (org.get("membersWithRole") or {}).get("totalCount", 0),
+            "location": org.get("location"),
+            "blog": org.get("websiteUrl"),
+            "email": org.get("email") or None,
+        }
+
+    def _map_pull_request(self, pr: Dict[str, Any], username: str) -> Dict[str, Any]:
+        """Map a GraphQL pull request onto the REST pull request shape.
+
+        GraphQL has no direct review-comment count, so ``review_comments`` counts review threads.
+        """
+        return {
+            "number": pr["number"],
+            "title": pr["title"],
+            "body": pr["body"][:1000] if pr.get("body") else "",
+            "state": "open" if pr["state"] == "OPEN" else "closed",
+            "created_at": normalize_timestamp(pr.get("createdAt")),
+            "merged_at": normalize_timestamp(pr.get("mergedAt")),
+            "author": username,
+            "additions": pr.get("additions", 0),
+            "deletions": pr.get("deletions", 0),
+            "changed_files": pr.get("changedFiles", 0),
+            "comments": pr["comments"]["totalCount"],
+            "review_comments": pr["reviewThreads"]["totalCount"],
+            "labels": [label["name"] for label in pr["labels"]["nodes"]],
+            "repository": pr["repository"]["name"],
+            "repository_full_name": pr["repository"]["nameWithOwner"],
+        }
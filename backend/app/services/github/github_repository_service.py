@@ -1,15 +1,15 @@
+import asyncio
 import logging
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, cast
 
-from github import Github
-from github.GithubException import GithubException
-from github.Repository import Repository as GithubRepository
-
 from app.core.config import settings
-from app.core.redis_client import get_cache, set_cache
+from app.core.exceptions import GitHubAPIError
+from app.core.redis_client import get_cache, set_cache, single_flight
 from app.schemas.github import LanguageStats
+from app.services.analysis.skill_detector import SkillMatches, get_skill_detector
+from app.services.github.github_api_client import get_github_api_client, normalize_timestamp, require_github_client
 from app.services.github.github_commit_service import GitHubCommitService
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class GitHubRepositoryService:
         self.github_client = None
         if settings.GITHUB_TOKEN:
             logger.info("🔧 Initializing GitHub client with token for repository service")
-            self.github_client = Github(settings.GITHUB_TOKEN)
+            self.github_client = get_github_api_client()
         else:
             logger.warning("⚠️  GitHub token not configured - GitHub API calls will fail in repository service")
         self.commit_service = commit_service
@@ -52,88 +52,80 @@ class GitHubRepositoryService:
             if not self.github_client:
                 raise ValueError("GitHub token not configured")
 
-            # Get repository
-            repo = self.github_client.get_repo(repo_name)
+            # Get repository and its contributors concurrently
+            repo, contributors = await asyncio.gather(
+                self.github_client.get_repo(repo_name),
+                self.github_client.get_repo_contributors(repo_name, max_items=max_contributors),
+            )
 
             # Get repository details
             repo_info = {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "language": repo.language,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "url": repo.html_url,
-                "topics": list(repo.get_topics()),
-                "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description"),
+                "language": repo.get("language"),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "url": repo.get("html_url"),
+                "topics": repo.get("topics", []),
+                "created_at": normalize_timestamp(repo.get("created_at")),
+                "updated_at": normalize_timestamp(repo.get("updated_at")),
                 "owner": {
-                    "login": repo.owner.login,
-                    "avatar_url": repo.owner.avatar_url,
-                    "html_url": repo.owner.html_url,
+                    "login": repo["owner"]["login"],
+                    "avatar_url": repo["owner"].get("avatar_url"),
+                    "html_url": repo["owner"].get("html_url"),
                 },
             }
 
-            # Get contributors
-            contributors_list = []
-            contributors = repo.get_contributors()
+            # Get detailed user info (for real names) for every contributor concurrently
+            users = await asyncio.gather(*(self.github_client.get_user(contributor["login"]) for contributor in contributors), return_exceptions=True)
 
-            count = 0
-            for contributor in contributors:
-                if count >= max_contributors:
-                    break
+            contributors_list = []
+            for contributor, user in zip(contributors, users):
+                login = contributor["login"]
 
-                try:
-                    # Get detailed user info to get real name
-                    user = self.github_client.get_user(contributor.login)
-
-                    # Debug logging to see what GitHub API returns
-                    logger.info(f"🔍 GitHub API response for {contributor.login}:")
-                    logger.info(f"   • user.name: '{user.name}'")
-                    logger.info(f"   • user.login: '{user.login}'")
-                    logger.info(f"   • name is None: {user.name is None}")
-                    logger.info(f"   • name is empty: {user.name == '' if user.name else 'N/A'}")
-
-                    contributor_info = {
-                        "username": contributor.login,
-                        "full_name": user.name if user.name else contributor.login,
-                        "first_name": (self._extract_first_name(user.name) if user.name else ""),
-                        "last_name": (self._extract_last_name(user.name) if user.name else ""),
-                        "email": user.email,
-                        "bio": user.bio,
-                        "company": user.company,
-                        "location": user.location,
-                        "avatar_url": user.avatar_url,
-                        "contributions": contributor.contributions,
-                        "profile_url": user.html_url,
-                        "followers": user.followers,
-                        "public_repos": user.public_repos,
-                    }
-
-                    contributors_list.append(contributor_info)
-                    count += 1
-
-                except Exception as e:
-                    logger.warning(f"Could not get details for contributor " f"{contributor.login}: {e}")
+                if isinstance(user, BaseException):
+                    logger.warning(f"Could not get details for contributor " f"{login}: {user}")
                     # Add basic info even if detailed lookup fails
                     contributors_list.append(
                         {
-                            "username": contributor.login,
-                            "full_name": contributor.login,
+                            "username": login,
+                            "full_name": login,
                             "first_name": "",
                             "last_name": "",
                             "email": None,
                             "bio": None,
                             "company": None,
                             "location": None,
-                            "avatar_url": contributor.avatar_url,
-                            "contributions": contributor.contributions,
-                            "profile_url": (f"https://github.com/{contributor.login}"),
+                            "avatar_url": contributor.get("avatar_url"),
+                            "contributions": contributor.get("contributions", 0),
+                            "profile_url": (f"https://github.com/{login}"),
                             "followers": 0,
                             "public_repos": 0,
                         }
                     )
-                    count += 1
+                    continue
+
+                name = user.get("name")
+                logger.debug(f"🔍 GitHub user {login}: name={name!r}")
+
+                contributor_info = {
+                    "username": login,
+                    "full_name": name if name else login,
+                    "first_name": (self._extract_first_name(name) if name else ""),
+                    "last_name": (self._extract_last_name(name) if name else ""),
+                    "email": user.get("email"),
+                    "bio": user.get("bio"),
+                    "company": user.get("company"),
+                    "location": user.get("location"),
+                    "avatar_url": user.get("avatar_url"),
+                    "contributions": contributor.get("contributions", 0),
+                    "profile_url": user.get("html_url"),
+                    "followers": user.get("followers", 0),
+                    "public_repos": user.get("public_repos", 0),
+                }
+
+                contributors_list.append(contributor_info)
 
             result = {
                 "repository": repo_info,
@@ -147,8 +139,8 @@ class GitHubRepositoryService:
 
             return result
 
-        except GithubException as e:
-            if e.status == 404:
+        except GitHubAPIError as e:
+            if e.status_code == 404:
                 logger.error(f"Repository not found: {repo_name}")
                 return None
             else:
@@ -180,16 +172,12 @@ class GitHubRepositoryService:
         Args:
             target_username: For repo_only context, only analyze commits from this specific user
         """
-        import time
-
         logger.info("📁 REPOSITORY ANALYSIS STARTED")
         logger.info("=" * 60)
         logger.info(f"🏗️  Target repository: {repository_full_name}")
         logger.info(f"🔄 Force refresh: {force_refresh}")
         logger.info(f"👤 Target user (repo_only): {target_username if analysis_context_type == 'repo_only' else 'N/A'}")
 
-        analysis_start = time.time()
-
         # Create context-aware cache key - include target_username for repo_only to prevent cross-contamination
         context_suffix = ""
         if analysis_context_type != "profile":
@@ -215,6 +203,19 @@ class GitHubRepositoryService:
                 return cached_data
             logger.info("🚀 CACHE MISS: Proceeding with fresh repository analysis")
 
+        # Concurrent requests for the same repository analysis, in any worker, share one run
+        return await single_flight(
+            cache_key,
+            lambda: self._run_repository_analysis(repository_full_name, force_refresh, analysis_context_type, target_username, cache_key),
+            lambda: get_cache(cache_key),
+        )
+
+    async def _run_repository_analysis(self, repository_full_name: str, force_refresh: bool, analysis_context_type: str, target_username: Optional[str], cache_key: str) -> Optional[Dict[str, Any]]:
+        """Run the full repository analysis pipeline and cache the result under ``cache_key``."""
+        import time
+
+        analysis_start = time.time()
+
         try:
             # Parse repository full name
             if "/" not in repository_full_name:
@@ -456,72 +457,38 @@ class GitHubRepositoryService:
                 logger.error("   • This usually means GITHUB_TOKEN is not configured")
                 return None
 
-            repo = self.github_client.get_repo(f"{owner}/{repo_name}")
-
-            return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "language": repo.language,
-                "languages_url": repo.languages_url,
-                "html_url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "git_url": repo.git_url,
-                "ssh_url": repo.ssh_url,
-                "size": repo.size,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "watchers": repo.watchers_count,
-                "open_issues": repo.open_issues_count,
-                "has_issues": repo.has_issues,
-                "has_projects": repo.has_projects,
-                "has_wiki": repo.has_wiki,
-                "has_pages": repo.has_pages,
-                "archived": repo.archived,
-                "disabled": getattr(repo, "disabled", False),
-                "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
-                "topics": repo.get_topics(),
-                "visibility": getattr(repo, "visibility", "public"),  # For newer PyGitHub versions
-                "owner": {
-                    "login": repo.owner.login,
-                    "avatar_url": repo.owner.avatar_url,
-                    "html_url": repo.owner.html_url,
-                },
-            }
+            repo = await self.github_client.get_repo(f"{owner}/{repo_name}")
 
-            # Cache the result
             repo_info_result = {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "language": repo.language,
-                "languages_url": repo.languages_url,
-                "html_url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "git_url": repo.git_url,
-                "ssh_url": repo.ssh_url,
-                "size": repo.size,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "watchers": repo.watchers_count,
-                "open_issues": repo.open_issues_count,
-                "has_issues": repo.has_issues,
-                "has_projects": repo.has_projects,
-                "has_wiki": repo.has_wiki,
-                "has_pages": repo.has_pages,
-                "archived": repo.archived,
-                "disabled": getattr(repo, "disabled", False),
-                "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
-                "topics": repo.get_topics(),
-                "visibility": getattr(repo, "visibility", "public"),  # For newer PyGitHub versions
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description"),
+                "language": repo.get("language"),
+                "languages_url": repo.get("languages_url"),
+                "html_url": repo.get("html_url"),
+                "clone_url": repo.get("clone_url"),
+                "git_url": repo.get("git_url"),
+                "ssh_url": repo.get("ssh_url"),
+                "size": repo.get("size", 0),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "watchers": repo.get("watchers_count", 0),
+                "open_issues": repo.get("open_issues_count", 0),
+                "has_issues": repo.get("has_issues", False),
+                "has_projects": repo.get("has_projects", False),
+                "has_wiki": repo.get("has_wiki", False),
+                "has_pages": repo.get("has_pages", False),
+                "archived": repo.get("archived", False),
+                "disabled": repo.get("disabled", False),
+                "created_at": normalize_timestamp(repo.get("created_at")),
+                "updated_at": normalize_timestamp(repo.get("updated_at")),
+                "pushed_at": normalize_timestamp(repo.get("pushed_at")),
+                "topics": repo.get("topics", []),
+                "visibility": repo.get("visibility", "public"),
                 "owner": {
-                    "login": repo.owner.login,
-                    "avatar_url": repo.owner.avatar_url,
-                    "html_url": repo.owner.html_url,
+                    "login": repo["owner"]["login"],
+                    "avatar_url": repo["owner"].get("avatar_url"),
+                    "html_url": repo["owner"].get("html_url"),
                 },
             }
 
@@ -550,8 +517,7 @@ class GitHubRepositoryService:
             if not self.github_client:
                 return []
 
-            repo = self.github_client.get_repo(f"{owner}/{repo_name}")
-            languages = repo.get_languages()
+            languages = await self.github_client.get_repo_languages(f"{owner}/{repo_name}")
 
             total_bytes = sum(languages.values())
             language_stats: List[LanguageStats] = []
@@ -585,51 +551,13 @@ class GitHubRepositoryService:
             if not self.github_client:
                 return []
 
-            repo = self.github_client.get_repo(f"{owner}/{repo_name}")
-            commits = repo.get_commits()[:limit]  # Get first 'limit' commits
-
-            commit_data = []
-            for commit in commits:  # type: Any
-                commit_data.append(
-                    {
-                        "sha": commit.sha,
-                        "message": commit.commit.message,
-                        "author": {
-                            "name": (commit.commit.author.name if commit.commit.author else None),
-                            "email": (commit.commit.author.email if commit.commit.author else None),
-                            "date": (commit.commit.author.date.isoformat() if commit.commit.author else None),
-                        },
-                        "committer": {
-                            "name": (commit.commit.committer.name if commit.commit.committer else None),
-                            "email": (commit.commit.committer.email if commit.commit.committer else None),
-                            "date": (commit.commit.committer.date.isoformat() if commit.commit.committer else None),
-                        },
-                        "stats": (
-                            {
-                                "additions": (commit.stats.additions if commit.stats and hasattr(commit.stats, "additions") and commit.stats.additions is not None else 0),
-                                "deletions": (commit.stats.deletions if commit.stats and hasattr(commit.stats, "deletions") and commit.stats.deletions is not None else 0),
-                                "total": (commit.stats.total if commit.stats and hasattr(commit.stats, "total") and commit.stats.total is not None else 0),
-                            }
-                            if commit.stats
-                            else None
-                        ),
-                        "files": (
-                            [
-                                {
-                                    "filename": f.filename,
-                                    "additions": f.additions,
-                                    "deletions": f.deletions,
-                                    "changes": f.changes,
-                                    "status": f.status,
-                                }
-                                for f in commit.files
-                            ]
-                            if commit.files
-                            else []
-                        ),
-                        "html_url": commit.html_url,
-                    }
-                )
+            full_name = f"{owner}/{repo_name}"
+            commits = await self.github_client.get_repo_commits(full_name, max_items=limit)
+
+            # List payloads omit stats and files, so fetch commit details concurrently
+            details = await asyncio.gather(*(self.github_client.get_commit(full_name, commit["sha"]) for commit in commits), return_exceptions=True)
+
+            commit_data = [self._format_commit(detail if isinstance(detail, dict) else commit) for commit, detail in zip(commits, details)]
 
             return commit_data
         except Exception as e:
@@ -642,65 +570,18 @@ class GitHubRepositoryService:
             if not self.github_client:
                 return []
 
-            repo = self.github_client.get_repo(f"{owner}/{repo_name}")
+            full_name = f"{owner}/{repo_name}"
 
             # Get commits filtered by author
-            commits = repo.get_commits(author=target_username)
+            commits = await self.github_client.get_repo_commits(full_name, author=target_username, max_items=limit)
 
-            commit_data = []
-            count = 0
-            for commit in commits:  # type: Any
-                if count >= limit:
-                    break
+            # Double-check that each commit is by the target user
+            commits = [commit for commit in commits if target_username in ((commit.get("author") or {}).get("login"), (commit.get("committer") or {}).get("login"))]
 
-                # Double-check that this commit is by the target user
-                commit_author = commit.author.login if commit.author else None
-                commit_committer = commit.committer.login if commit.committer else None
+            # List payloads omit stats and files, so fetch commit details concurrently
+            details = await asyncio.gather(*(self.github_client.get_commit(full_name, commit["sha"]) for commit in commits), return_exceptions=True)
 
-                if commit_author == target_username or commit_committer == target_username:
-                    commit_data.append(
-                        {
-                            "sha": commit.sha,
-                            "message": commit.commit.message,
-                            "author": {
-                                "name": (commit.commit.author.name if commit.commit.author else None),
-                                "email": (commit.commit.author.email if commit.commit.author else None),
-                                "date": (commit.commit.author.date.isoformat() if commit.commit.author else None),
-                                "login": commit_author,  # Add GitHub username for verification
-                            },
-                            "committer": {
-                                "name": (commit.commit.committer.name if commit.commit.committer else None),
-                                "email": (commit.commit.committer.email if commit.commit.committer else None),
-                                "date": (commit.commit.committer.date.isoformat() if commit.commit.committer else None),
-                                "login": commit_committer,  # Add GitHub username for verification
-                            },
-                            "stats": (
-                                {
-                                    "additions": (commit.stats.additions if commit.stats and hasattr(commit.stats, "additions") and commit.stats.additions is not None else 0),
-                                    "deletions": (commit.stats.deletions if commit.stats and hasattr(commit.stats, "deletions") and commit.stats.deletions is not None else 0),
-                                    "total": (commit.stats.total if commit.stats and hasattr(commit.stats, "total") and commit.stats.total is not None else 0),
-                                }
-                                if commit.stats
-                                else None
-                            ),
-                            "files": (
-                                [
-                                    {
-                                        "filename": f.filename,
-                                        "additions": f.additions,
-                                        "deletions": f.deletions,
-                                        "changes": f.changes,
-                                        "status": f.status,
-                                    }
-                                    for f in commit.files
-                                ]
-                                if commit.files
-                                else []
-                            ),
-                            "html_url": commit.html_url,
-                        }
-                    )
-                    count += 1
+            commit_data = [self._format_commit(detail if isinstance(detail, dict) else commit, include_login=True) for commit, detail in zip(commits, details)]
 
             logger.info(f"🔒 REPO_ONLY: Found {len(commit_data)} commits by user {target_username} in {owner}/{repo_name}")
             return commit_data
@@ -709,6 +590,55 @@ class GitHubRepositoryService:
             logger.error(f"Error fetching commits by user {target_username} from repository {owner}/{repo_name}: {e}")
             return []
 
+    def _format_commit(self, commit: Dict[str, Any], include_login: bool = False) -> Dict[str, Any]:
+        """Convert a REST commit payload into the commit dict used by repository analysis."""
+        git_commit = commit.get("commit", {})
+        git_author = git_commit.get("author") or {}
+        git_committer = git_commit.get("committer") or {}
+        stats = commit.get("stats")
+
+        author = {
+            "name": git_author.get("name"),
+            "email": git_author.get("email"),
+            "date": normalize_timestamp(git_author.get("date")),
+        }
+        committer = {
+            "name": git_committer.get("name"),
+            "email": git_committer.get("email"),
+            "date": normalize_timestamp(git_committer.get("date")),
+        }
+        if include_login:
+            # Add GitHub usernames for verification
+            author["login"] = (commit.get("author") or {}).get("login")
+            committer["login"] = (commit.get("committer") or {}).get("login")
+
+        return {
+            "sha": commit["sha"],
+            "message": git_commit.get("message", ""),
+            "author": author,
+            "committer": committer,
+            "stats": (
+                {
+                    "additions": stats.get("additions") or 0,
+                    "deletions": stats.get("deletions") or 0,
+                    "total": stats.get("total") or 0,
+                }
+                if stats
+                else None
+            ),
+            "files": [
+                {
+                    "filename": f.get("filename"),
+                    "additions": f.get("additions", 0),
+                    "deletions": f.get("deletions", 0),
+                    "changes": f.get("changes", 0),
+                    "status": f.get("status"),
+                }
+                for f in commit.get("files") or []
+            ],
+            "html_url": commit.get("html_url"),
+        }
+
     def _extract_languages_from_user_commits(self, commits: List[Dict[str, Any]], target_username: str) -> List[LanguageStats]:
         """Extract languages from file extensions in user's commits (for repo_only context)."""
         try:
@@ -861,131 +791,25 @@ class GitHubRepositoryService:
             logger.info(f"   • technical_skills: {technical_skills}")
 
             # Extract frameworks and tools from commit messages and file names
-            frameworks = []
+            detector = get_skill_detector()
+            frameworks: List[str] = []
             tools: List[str] = []
-            domains = []
-
-            # Common framework patterns - more specific to avoid false positives
-            framework_patterns = {
-                "React": ["react", "jsx", "tsx", "component", "react-dom", "create-react-app"],
-                "Vue": ["vue", "vuex", "vue-router", "vue-cli"],
-                "Angular": ["angular", "ng-", "@angular", "angular-cli"],
-                "Django": ["django", "models.py", "views.py", "urls.py", "manage.py"],
-                "Flask": ["flask", "app.py", "routes", "flask-sqlalchemy"],
-                "Express": ["express", "app.js", "routes", "express-session"],
-                "Spring": ["spring", "@controller", "@service", "spring-boot"],
-                "Laravel": ["laravel", "artisan", "composer.json"],
-                "Rails": ["rails", "ruby on rails", "rails-assets"],
-                "Next.js": ["next.js", "next.config", "next-env"],
-                "Nuxt.js": ["nuxt", "nuxt.config", "nuxt-build"],
-                "Svelte": ["svelte", ".svelte", "svelte-kit"],
-                "FastAPI": ["fastapi", "pydantic", "uvicorn"],
-                "GraphQL": ["graphql", ".graphql", "apollo"],
-                "Docker": ["docker", "dockerfile", "docker-compose", "containerd"],
-                "Kubernetes": ["kubernetes", "k8s", "helm", "kubectl"],
-                "AWS": ["aws", "lambda", "s3", "ec2", "boto3"],
-                "Azure": ["azure", "azure-sdk", "azure-storage", "azure-functions", "azure-cli"],
-                "GCP": ["google cloud", "firebase", "gcp", "google-cloud"],
-            }
 
-            # Check commit messages and file names for frameworks
+            def add_matches(matches: SkillMatches) -> None:
+                for found, names in ((frameworks, matches["frameworks"]), (tools, matches["tools"])):
+                    found.extend(sorted(names - set(found)))
+
             if commits:
-                for commit in commits[:20]:  # Check first 20 commits
-                    message = commit.get("message", "").lower()
-                    for framework, patterns in framework_patterns.items():
-                        for pattern in patterns:
-                            if pattern in message:
-                                # For cloud providers, require more context to avoid false positives
-                                if framework in ["Azure", "AWS", "GCP"]:
-                                    # Check if it's not just a generic word like "function"
-                                    if pattern in ["function", "blob", "lambda"]:
-                                        # Require additional context for generic terms
-                                        context_words = ["azure", "aws", "gcp", "cloud", "storage", "sdk"]
-                                        if not any(context_word in message for context_word in context_words):
-                                            continue
-                                if framework not in frameworks:
-                                    frameworks.append(framework)
-                                break  # Found this framework, move to next
-
-                # Check file names for frameworks
+                # Check first 20 commit messages and the files of the first 10 commits
+                for commit in commits[:20]:
+                    add_matches(detector.match_text(commit.get("message", "")))
                 for commit in commits[:10]:
                     for file_info in commit.get("files", []):
-                        filename = file_info.get("filename", "").lower()
-                        for framework, patterns in framework_patterns.items():
-                            if any(pattern in filename for pattern in patterns):
-                                if framework not in frameworks:
-                                    frameworks.append(framework)
+                        add_matches(detector.match_path(file_info.get("filename", "")))
 
             # Determine domains based on repository content
-            repo_description = (repo_info.get("description") or "").lower()
-            repo_name = (repo_info.get("name") or "").lower()
-
-            domain_keywords = {
-                "Web Development": [
-                    "web",
-                    "frontend",
-                    "backend",
-                    "fullstack",
-                    "website",
-                    "application",
-                ],
-                "Mobile Development": [
-                    "mobile",
-                    "android",
-                    "ios",
-                    "react native",
-                    "flutter",
-                    "swift",
-                ],
-                "Data Science": [
-                    "data",
-                    "machine learning",
-                    "ml",
-                    "ai",
-                    "analytics",
-                    "visualization",
-                ],
-                "DevOps": [
-                    "devops",
-                    "ci/cd",
-                    "deployment",
-                    "infrastructure",
-                    "automation",
-                ],
-                "API Development": [
-                    "api",
-                    "rest",
-                    "graphql",
-                    "microservice",
-                    "backend",
-                ],
-                "Database": [
-                    "database",
-                    "sql",
-                    "nosql",
-                    "mongodb",
-                    "postgresql",
-                ],
-                "Cloud Computing": [
-                    "cloud",
-                    "aws",
-                    "azure",
-                    "gcp",
-                    "serverless",
-                ],
-                "Security": [
-                    "security",
-                    "authentication",
-                    "authorization",
-                    "encryption",
-                ],
-                "Testing": ["test", "testing", "jest", "cypress", "selenium"],
-                "Game Development": ["game", "unity", "unreal", "godot"],
-            }
-
-            for domain, keywords in domain_keywords.items():
-                if any(keyword in repo_description or keyword in repo_name for keyword in keywords):
-                    domains.append(domain)
+            domain_matches = detector.match_text(repo_info.get("description") or "")["domains"] | detector.match_text(repo_info.get("name") or "")["domains"]
+            domains = [domain for domain in detector.skills("domains") if domain in domain_matches]
 
             # Extract soft skills from commit patterns
             soft_skills = []
@@ -1113,7 +937,7 @@ class GitHubRepositoryService:
             logger.error(f"Error analyzing repository commit patterns: {e}")
             return self._empty_commit_analysis()
 
-    def _extract_api_endpoints_from_code(self, repository: GithubRepository, main_files: List[str]) -> List[str]:
+    async def _extract_api_endpoints_from_code(self, repository_full_name: str, main_files: List[str]) -> List[str]:
         """Extract API endpoints from source code files (basic implementation)."""
         endpoints = []
 
@@ -1122,9 +946,8 @@ class GitHubRepositoryService:
 
             for filename in main_files[:max_files_to_check]:
                 try:
-                    file_content = repository.get_contents(filename)
-                    if hasattr(file_content, "decoded_content"):
-                        content = file_content.decoded_content.decode("utf-8", errors="ignore")
+                    content = await require_github_client(self.github_client).get_file_text(repository_full_name, filename)
+                    if content:
 
                         # Simple regex patterns for common API endpoints
 
@@ -1,33 +1,61 @@
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from github import Github
-from github.GithubException import GithubException
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from app.core.config import settings
-from app.core.redis_client import get_cache, set_cache
+from app.core.exceptions import GitHubAPIError
+from app.core.redis_client import MAX_STREAM_BLOCK_MS, append_to_stream, delete_cache, get_cache, read_stream, refresh_in_background, set_cache, single_flight
 from app.services.analysis.profile_analysis_service import ProfileAnalysisService
+from app.services.github.github_api_client import get_github_api_client, normalize_timestamp, require_github_client
 from app.services.github.github_commit_service import GitHubCommitService
+from app.services.github.github_graphql_service import GitHubGraphQLService
 
 logger = logging.getLogger(__name__)
 
+# Called with (stage message, percent complete) as a profile analysis advances
+ProgressCallback = Callable[[str, int], Awaitable[None]]
+
+
+# Dependency manifests _parse_dependency_file reads, by file name, in the order they are looked up
+DEPENDENCY_MANIFESTS: Dict[str, str] = {
+    "requirements.txt": "python",
+    "package.json": "javascript",
+    "go.mod": "go",
+    "Cargo.toml": "rust",
+    "composer.json": "php",
+    "Gemfile": "ruby",
+}
+
+
+def find_dependency_manifests(tree_entries: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Return ``(path, language)`` for every dependency manifest among a tree's entries."""
+    files = {entry["path"] for entry in tree_entries if entry.get("type") == "blob"}
+    return [(name, language) for name, language in DEPENDENCY_MANIFESTS.items() if name in files]
+
 
 class GitHubUserService:
     """Service for fetching and analyzing GitHub user profile data."""
 
     COMMIT_ANALYSIS_CACHE_TTL = 14400  # 4 hours cache for expensive operations
+    PROFILE_ANALYSIS_SOFT_TTL = 14400  # Profile analyses are served as-is for 4 hours
+    PROFILE_ANALYSIS_HARD_TTL = 86400  # then served while refreshing in the background, for up to 24 hours
+    PROFILE_PROGRESS_TTL = 3600  # Analysis progress streams expire an hour after their last step
+    DEPENDENCY_CACHE_TTL = 604800  # Keyed by tree sha, so entries never go stale; 7 days only bounds storage
+    DEPENDENCY_FETCH_CONCURRENCY = 4  # Manifest downloads in flight per repository
+    DEPENDENCY_REPOSITORY_LIMIT = 5  # Most recently updated repositories whose manifests feed skill extraction
 
     def __init__(self, commit_service: GitHubCommitService) -> None:
         """Initialize GitHub user service."""
         self.github_client = None
         if settings.GITHUB_TOKEN:
             logger.info("🔧 Initializing GitHub client with token for user service")
-            self.github_client = Github(settings.GITHUB_TOKEN)
+            self.github_client = get_github_api_client()
         else:
             logger.warning("⚠️  GitHub token not configured - GitHub API calls will fail in user service")
         self.commit_service = commit_service
+        self.graphql_service = GitHubGraphQLService()
         self.profile_analysis_service = ProfileAnalysisService()
 
     async def analyze_github_profile(
@@ -37,18 +65,19 @@ class GitHubUserService:
         max_repositories: int = 10,
         analysis_context_type: str = "profile",
         repository_url: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Analyze a GitHub profile and return comprehensive data."""
-        import time
+        """Analyze a GitHub profile and return comprehensive data.
 
+        ``progress`` is awaited at each step of a fresh analysis (not for cache hits), including
+        one started by another caller, in this worker or another, that this call joined.
+        """
         logger.info("🐙 GITHUB PROFILE ANALYSIS STARTED")
         logger.info("=" * 60)
         logger.info(f"👤 Target user: {username}")
         logger.info(f"🔄 Force refresh: {force_refresh}")
         logger.info(f"📦 Max repositories: {max_repositories}")
 
-        analysis_start = time.time()
-
         # Create context-aware cache key
         context_suffix = ""
         if analysis_context_type != "profile":
@@ -68,9 +97,104 @@ class GitHubUserService:
                 logger.info("💨 CACHE HIT! Returning cached GitHub data")
                 logger.info(f"   • Cached repositories: {len(cached_data.get('repositories', []))}")
                 logger.info(f"   • Cached commits: {cached_data.get('commit_analysis', {}).get('total_commits_analyzed', 0)}")
+                self.revalidate_profile_if_stale(cached_data, cache_key, username, max_repositories)
                 return cached_data
             logger.info("🚀 CACHE MISS: Proceeding with fresh analysis")
 
+        # Concurrent requests for the same profile, in any worker, share one analysis
+        analysis = single_flight(cache_key, lambda: self._run_published_profile_analysis(username, force_refresh, max_repositories, cache_key), lambda: get_cache(cache_key))
+        if progress is None:
+            return await analysis
+        # The analysis may be running for another caller, so follow its steps on the shared stream
+        return await self._relay_progress(cache_key, analysis, progress)
+
+    def revalidate_profile_if_stale(self, analysis: Dict[str, Any], cache_key: str, username: str, max_repositories: int = 10) -> bool:
+        """Refresh a cached profile analysis in the background once it is past the soft TTL.
+
+        Returns True when a refresh was started. Refreshes are deduplicated per cache key
+        within this process and, through the single-flight lock, across workers.
+        """
+        age = self._analysis_age_seconds(analysis)
+        if age is not None and age < self.PROFILE_ANALYSIS_SOFT_TTL:
+            return False
+
+        logger.info(f"♻️  Cached analysis for {username} is stale, refreshing in background")
+        # Published like a foreground run, so a caller that joins this refresh follows its steps
+        return refresh_in_background(cache_key, lambda: self._run_published_profile_analysis(username, True, max_repositories, cache_key), lambda: get_cache(cache_key))
+
+    @staticmethod
+    def _analysis_age_seconds(analysis: Dict[str, Any]) -> Optional[float]:
+        """Return seconds since ``analyzed_at``, or None when it is missing or malformed."""
+        try:
+            analyzed_at = datetime.fromisoformat(analysis["analyzed_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if analyzed_at.tzinfo is None:
+            analyzed_at = analyzed_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - analyzed_at).total_seconds()
+
+    @staticmethod
+    async def _report_progress(progress: Optional[ProgressCallback], stage: str, percent: int) -> None:
+        """Report a step to ``progress``; a failing reporter never fails the analysis."""
+        if progress is None:
+            return
+        try:
+            await progress(stage, percent)
+        except Exception as e:
+            logger.warning(f"⚠️  Progress report failed: {e}")
+
+    @staticmethod
+    def _progress_key(cache_key: str) -> str:
+        """Return the Redis stream the analysis for ``cache_key`` publishes its steps to."""
+        return f"analysis_progress:{cache_key}"
+
+    async def _run_published_profile_analysis(self, username: str, force_refresh: bool, max_repositories: int, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Run the profile analysis, publishing its steps to the profile's progress stream.
+
+        Every caller waiting on this analysis reads the stream, so each one reports the same
+        steps. A final ``done`` entry tells them the run has finished.
+        """
+        progress_key = self._progress_key(cache_key)
+        # Each run starts an empty stream, so callers never replay a previous run's steps
+        await delete_cache(progress_key)
+
+        async def publish(stage: str, percent: int) -> None:
+            await append_to_stream(progress_key, {"stage": stage, "progress": percent}, ttl=self.PROFILE_PROGRESS_TTL)
+
+        try:
+            return await self._run_profile_analysis(username, force_refresh, max_repositories, cache_key, publish)
+        finally:
+            await append_to_stream(progress_key, {"done": True}, ttl=self.PROFILE_PROGRESS_TTL)
+
+    async def _relay_progress(self, cache_key: str, analysis: Awaitable[Optional[Dict[str, Any]]], progress: ProgressCallback) -> Optional[Dict[str, Any]]:
+        """Await ``analysis`` while reporting each step published to its progress stream to ``progress``."""
+        task = asyncio.ensure_future(analysis)
+        progress_key = self._progress_key(cache_key)
+        last_id = "0"
+        try:
+            while True:
+                # Once the analysis is over, drain what was published without waiting for more
+                finished = task.done()
+                steps = await read_stream(progress_key, last_id, block_ms=None if finished else MAX_STREAM_BLOCK_MS)
+                if steps is None:
+                    # Redis is unavailable; the analysis still completes, just without step reports
+                    break
+                for last_id, step in steps:
+                    if step.get("done"):
+                        return await task
+                    await self._report_progress(progress, step["stage"], step["progress"])
+                if finished:
+                    break
+            return await task
+        finally:
+            task.cancel()
+
+    async def _run_profile_analysis(self, username: str, force_refresh: bool, max_repositories: int, cache_key: str, progress: Optional[ProgressCallback] = None) -> Optional[Dict[str, Any]]:
+        """Run the full profile analysis pipeline and cache the result under ``cache_key``."""
+        import time
+
+        analysis_start = time.time()
+
         try:
             # Check if GitHub client is initialized
             if not self.github_client:
@@ -80,12 +204,21 @@ class GitHubUserService:
                 logger.error("   • Token should start with 'ghp_' or 'github_pat_'")
                 return None
 
+            # Fetch user, repositories, commits and PRs in a few batched GraphQL queries when enabled;
+            # the REST fetchers below remain the fallback
+            bundle = await self._fetch_graphql_bundle(username, max_repositories)
+
             # Get user data
+            await self._report_progress(progress, "Fetching user data...", 10)
             logger.info("👤 STEP 1: FETCHING USER DATA")
             logger.info("-" * 40)
             user_start = time.time()
 
-            user_data = await self._get_user_data(username, force_refresh)
+            user_data: Optional[Dict[str, Any]]
+            if bundle:
+                user_data = {**bundle["user_data"], "starred_technologies": await self._analyze_starred_technologies(bundle["user_data"]["starred_repositories"])}
+            else:
+                user_data = await self._get_user_data(username, force_refresh)
             if not user_data:
                 logger.error(f"❌ Failed to fetch user data for {username}")
                 logger.error("💡 This could mean:")
@@ -103,17 +236,19 @@ class GitHubUserService:
             logger.info(f"   • Followers: {user_data.get('followers', 0)}")
 
             # Get repositories
+            await self._report_progress(progress, "Fetching repositories...", 25)
             logger.info("📦 STEP 2: FETCHING REPOSITORIES")
             logger.info("-" * 40)
             repos_start = time.time()
 
-            repositories = await self._get_repositories(username, max_repositories, force_refresh)
+            repositories = bundle["repositories"] if bundle else await self._get_repositories(username, max_repositories, force_refresh)
 
             repos_end = time.time()
             logger.info(f"⏱️  Repositories fetched in {repos_end - repos_start:.2f} seconds")
             logger.info(f"✅ Found {len(repositories)} repositories")
 
             # Analyze languages
+            await self._report_progress(progress, "Analyzing languages...", 40)
             logger.info("💻 STEP 3: ANALYZING LANGUAGES")
             logger.info("-" * 40)
             lang_start = time.time()
@@ -128,10 +263,13 @@ class GitHubUserService:
                 logger.info(f"   • Top languages: {', '.join(top_langs)}")
 
             # Extract skills
+            await self._report_progress(progress, "Extracting skills...", 50)
             logger.info("🔧 STEP 4: EXTRACTING SKILLS")
             logger.info("-" * 40)
             skills_start = time.time()
 
+            if settings.GITHUB_DEPENDENCY_SCAN:
+                await self._attach_dependencies(repositories)
             skills = self.profile_analysis_service.extract_skills(user_data, repositories)
 
             skills_end = time.time()
@@ -142,11 +280,15 @@ class GitHubUserService:
             logger.info(f"   • Tools: {len(skills.get('tools', []))}")
 
             # Analyze commits (up to 150) using the commit service
+            await self._report_progress(progress, "Analyzing commits...", 60)
             logger.info("📝 STEP 5: ANALYZING COMMITS (ASYNC BATCH PROCESSING) with Commit Service")
             logger.info("-" * 40)
             commits_start = time.time()
 
-            commit_analysis = await self.commit_service.analyze_contributor_commits(username, repositories)
+            if bundle:
+                commit_analysis = self.commit_service._perform_commit_analysis(bundle["commits"])
+            else:
+                commit_analysis = await self.commit_service.analyze_contributor_commits(username, repositories)
 
             commits_end = time.time()
             logger.info(f"⏱️  Commit analysis completed in {commits_end - commits_start:.2f} seconds")
@@ -158,11 +300,19 @@ class GitHubUserService:
                 logger.info(f"   • Primary strength: {excellence['primary_strength'].replace('_', ' ').title()}")
 
             # Analyze pull requests (up to 50) using the commit service
+            await self._report_progress(progress, "Analyzing pull requests...", 80)
             logger.info("🔀 STEP 6: ANALYZING PULL REQUESTS (ASYNC BATCH PROCESSING) with Commit Service")
             logger.info("-" * 40)
             prs_start = time.time()
 
-            pr_data = await self.commit_service.fetch_user_pull_requests_across_repos(username, repositories, max_prs=50)
+            if bundle:
+                pr_data = {
+                    "pull_requests": bundle["pull_requests"],
+                    "pr_analysis": self.commit_service._perform_pr_analysis(bundle["pull_requests"], username),
+                    "total_prs_collected": len(bundle["pull_requests"]),
+                }
+            else:
+                pr_data = await self.commit_service.fetch_user_pull_requests_across_repos(username, repositories, max_prs=50)
 
             prs_end = time.time()
             logger.info(f"⏱️  PR analysis completed in {prs_end - prs_start:.2f} seconds")
@@ -187,15 +337,16 @@ class GitHubUserService:
             }
 
             # Cache for longer due to more expensive commit and PR analysis
+            await self._report_progress(progress, "Saving results...", 95)
             logger.info("💾 STEP 7: CACHING RESULTS")
             logger.info("-" * 40)
             cache_start = time.time()
 
-            await set_cache(cache_key, analysis, ttl=self.COMMIT_ANALYSIS_CACHE_TTL)
+            await set_cache(cache_key, analysis, ttl=self.PROFILE_ANALYSIS_HARD_TTL)
 
             cache_end = time.time()
             logger.info(f"⏱️  Results cached in {cache_end - cache_start:.2f} seconds")
-            logger.info(f"✅ Cache TTL: {self.COMMIT_ANALYSIS_CACHE_TTL/3600:.1f} hours")
+            logger.info(f"✅ Cache TTL: {self.PROFILE_ANALYSIS_SOFT_TTL/3600:.1f} hours fresh, {self.PROFILE_ANALYSIS_HARD_TTL/3600:.1f} hours stale")
 
             analysis_end = time.time()
             total_time = analysis_end - analysis_start
@@ -220,6 +371,22 @@ class GitHubUserService:
             logger.error(f"⏱️  Failed after {time.time() - analysis_start:.2f} seconds")
             return None
 
+    async def _fetch_graphql_bundle(self, username: str, max_repositories: int) -> Optional[Dict[str, Any]]:
+        """Fetch the profile analysis inputs through GraphQL, or return None to use the REST fetchers."""
+        if settings.GITHUB_PROFILE_FETCH_MODE != "graphql":
+            return None
+
+        try:
+            logger.info("🧬 Fetching profile data via GraphQL batch queries...")
+            commits_per_repo = self.commit_service._calculate_contributor_optimal_commits_per_repo(max_repositories, 150)
+            bundle = await self.graphql_service.fetch_profile_bundle(username, max_repositories=max_repositories, commits_per_repo=commits_per_repo, max_commits=150, max_prs=50)
+            if bundle:
+                logger.info(f"✅ GraphQL batch: {len(bundle['repositories'])} repos, {len(bundle['commits'])} commits, {len(bundle['pull_requests'])} PRs")
+            return bundle
+        except Exception as e:
+            logger.warning(f"⚠️  GraphQL profile fetch failed, falling back to REST: {e}")
+            return None
+
     async def _get_user_data(self, username: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """Get basic user data from GitHub with Redis caching."""
         cache_key = f"github:user_data:{username}"
@@ -239,65 +406,42 @@ class GitHubUserService:
                 raise ValueError("GitHub token not configured")
 
             logger.info("📡 Making GitHub API call to get user data...")
-            user = self.github_client.get_user(username)
+            user = await self.github_client.get_user(username)
 
             logger.info("✅ GitHub user found successfully")
-            logger.info(f"   • Username: {user.login}")
-            logger.info(f"   • Name: {user.name or 'Not provided'}")
-            logger.info(f"   • Public repos: {user.public_repos}")
-
-            # Fetch starred repositories (indicates interests and technologies they follow)
-            logger.info("⭐ Fetching starred repositories...")
-            starred_repositories = await self._get_starred_repositories(user)
+            logger.info(f"   • Username: {user['login']}")
+            logger.info(f"   • Name: {user.get('name') or 'Not provided'}")
+            logger.info(f"   • Public repos: {user.get('public_repos', 0)}")
+
+            # Fetch starred repositories (interests and technologies they follow) and
+            # organizations (community involvement and professional networks) concurrently
+            logger.info("⭐🏢 Fetching starred repositories and organizations...")
+            starred_repositories, organizations = await asyncio.gather(
+                self._get_starred_repositories(user["login"]),
+                self._get_user_organizations(user["login"]),
+            )
             logger.info(f"   • Found {len(starred_repositories)} starred repositories")
-
-            # Fetch organizations (shows community involvement and professional networks)
-            logger.info("🏢 Fetching organizations...")
-            organizations = await self._get_user_organizations(user)
             logger.info(f"   • Found {len(organizations)} organizations")
 
             # Analyze starred repositories for technology interests
             starred_tech_analysis = await self._analyze_starred_technologies(starred_repositories)
 
-            return {
-                "github_username": user.login,
-                "github_id": user.id,
-                "full_name": user.name,
-                "bio": user.bio,
-                "company": user.company,
-                "location": user.location,
-                "email": user.email,
-                "blog": user.blog,
-                "avatar_url": user.avatar_url,
-                "public_repos": user.public_repos,
-                "followers": user.followers,
-                "following": user.following,
-                "public_gists": user.public_gists,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-                # Enhanced data
-                "starred_repositories": starred_repositories,
-                "organizations": organizations,
-                "starred_technologies": starred_tech_analysis,
-            }
-
-            # Cache the result for future use
             user_data_result = {
-                "github_username": user.login,
-                "github_id": user.id,
-                "full_name": user.name,
-                "bio": user.bio,
-                "company": user.company,
-                "location": user.location,
-                "email": user.email,
-                "blog": user.blog,
-                "avatar_url": user.avatar_url,
-                "public_repos": user.public_repos,
-                "followers": user.followers,
-                "following": user.following,
-                "public_gists": user.public_gists,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+                "github_username": user["login"],
+                "github_id": user["id"],
+                "full_name": user.get("name"),
+                "bio": user.get("bio"),
+                "company": user.get("company"),
+                "location": user.get("location"),
+                "email": user.get("email"),
+                "blog": user.get("blog"),
+                "avatar_url": user.get("avatar_url"),
+                "public_repos": user.get("public_repos", 0),
+                "followers": user.get("followers", 0),
+                "following": user.get("following", 0),
+                "public_gists": user.get("public_gists", 0),
+                "created_at": normalize_timestamp(user.get("created_at")),
+                "updated_at": normalize_timestamp(user.get("updated_at")),
                 # Enhanced data
                 "starred_repositories": starred_repositories,
                 "organizations": organizations,
@@ -310,27 +454,27 @@ class GitHubUserService:
 
             return user_data_result
 
-        except GithubException as e:
+        except GitHubAPIError as e:
             logger.error(f"❌ GitHub API error for user {username}:")
-            logger.error(f"   • Status: {e.status if hasattr(e, 'status') else 'Unknown'}")
-            logger.error(f"   • Data: {e.data if hasattr(e, 'data') else 'No data'}")
+            logger.error(f"   • Status: {e.status_code or 'Unknown'}")
+            logger.error(f"   • Data: {e.details or 'No data'}")
             logger.error(f"   • Message: {str(e)}")
 
             # Provide more specific error messages based on the GitHub API response
-            if hasattr(e, "status"):
-                if e.status == 404:
+            if e.status_code:
+                if e.status_code == 404:
                     logger.error(f"   💡 User '{username}' was not found on GitHub")
                     logger.error("   💡 Possible reasons:")
                     logger.error("      • Username doesn't exist")
                     logger.error("      • Username has a typo")
                     logger.error("      • User profile is set to private")
                     logger.error(f"      • Username is case-sensitive (try: {username.lower()})")
-                elif e.status == 403:
+                elif e.status_code == 403:
                     logger.error("   💡 Access forbidden - this could mean:")
                     logger.error("      • GitHub API rate limit exceeded")
                     logger.error("      • Repository is private and token lacks access")
                     logger.error("      • GitHub token needs additional permissions")
-                elif e.status == 401:
+                elif e.status_code == 401:
                     logger.error("   💡 Authentication failed:")
                     logger.error("      • GitHub token is invalid or expired")
                     logger.error("      • Token doesn't have required permissions")
@@ -342,26 +486,27 @@ class GitHubUserService:
             logger.error(f"   • Stack trace: {e.__trace__ if hasattr(e, '__trace__') else 'No trace'}")
             return None
 
-    async def _get_starred_repositories(self, user) -> List[Dict[str, Any]]:
+    async def _get_starred_repositories(self, username: str) -> List[Dict[str, Any]]:
         """Fetch user's starred repositories to understand their interests."""
         try:
-            starred = []
             max_starred = 20  # Limit to avoid rate limits and focus on most recent/most relevant
 
-            for repo in user.get_starred()[:max_starred]:
+            # The REST payload already carries topics, so no per-repository follow-up calls are needed
+            starred = []
+            for repo in await require_github_client(self.github_client).get_user_starred(username, max_items=max_starred):
                 starred_repo = {
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "language": repo.language,
-                    "stars": repo.stargazers_count,
-                    "forks": repo.forks_count,
-                    "topics": list(repo.get_topics()) if hasattr(repo, "get_topics") else [],
-                    "url": repo.html_url,
-                    "owner": repo.owner.login,
-                    "is_fork": repo.fork,
-                    "archived": getattr(repo, "archived", False),
-                    "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
+                    "name": repo["name"],
+                    "full_name": repo["full_name"],
+                    "description": repo.get("description"),
+                    "language": repo.get("language"),
+                    "stars": repo.get("stargazers_count", 0),
+                    "forks": repo.get("forks_count", 0),
+                    "topics": repo.get("topics", []),
+                    "url": repo.get("html_url"),
+                    "owner": repo["owner"]["login"],
+                    "is_fork": repo.get("fork", False),
+                    "archived": repo.get("archived", False),
+                    "updated_at": normalize_timestamp(repo.get("updated_at")),
                 }
                 starred.append(starred_repo)
 
@@ -371,23 +516,29 @@ class GitHubUserService:
             logger.debug(f"Error fetching starred repositories: {e}")
             return []
 
-    async def _get_user_organizations(self, user) -> List[Dict[str, Any]]:
+    async def _get_user_organizations(self, username: str) -> List[Dict[str, Any]]:
         """Fetch user's organizations to understand their professional networks."""
         try:
-            organizations = []
+            client = require_github_client(self.github_client)
+            memberships = await client.get_user_orgs(username)
 
-            for org in user.get_orgs():
+            # The membership listing is a summary; fetch full organization profiles concurrently
+            profiles = await asyncio.gather(*(client.get_org(org["login"]) for org in memberships), return_exceptions=True)
+
+            organizations = []
+            for membership, profile in zip(memberships, profiles):
+                org = profile if isinstance(profile, dict) else membership
                 org_data = {
-                    "login": org.login,
-                    "name": getattr(org, "name", None),
-                    "description": getattr(org, "description", None),
-                    "url": org.html_url,
-                    "avatar_url": org.avatar_url,
-                    "public_repos": getattr(org, "public_repos", 0),
-                    "members_count": getattr(org, "members_count", 0),
-                    "location": getattr(org, "location", None),
-                    "blog": getattr(org, "blog", None),
-                    "email": getattr(org, "email", None),
+                    "login": org["login"],
+                    "name": org.get("name"),
+                    "description": org.get("description"),
+                    "url": org.get("html_url") or f"https://github.com/{org['login']}",
+                    "avatar_url": org.get("avatar_url"),
+                    "public_repos": org.get("public_repos", 0),
+                    "members_count": org.get("members_count", 0),
+                    "location": org.get("location"),
+                    "blog": org.get("blog"),
+                    "email": org.get("email"),
                 }
                 organizations.append(org_data)
 
@@ -486,36 +637,33 @@ class GitHubUserService:
             if not self.github_client:
                 return []
 
-            user = self.github_client.get_user(username)
-            repos = user.get_repos(sort="updated", direction="desc")
+            repositories: List[Dict[str, Any]] = []
 
-            repositories = []
-            count = 0
-
-            for repo in repos:
-                if count >= max_count:
+            # Iterate lazily so we stop paging as soon as enough non-fork repositories are found
+            async for repo in self.github_client.iter_user_repos(username, sort="updated", direction="desc"):
+                if len(repositories) >= max_count:
                     break
 
-                if repo.fork:  # Skip forked repositories
+                if repo.get("fork"):  # Skip forked repositories
                     continue
 
                 repo_data = {
-                    "name": repo.name,
-                    "description": repo.description,
-                    "language": repo.language,
-                    "stars": repo.stargazers_count,
-                    "forks": repo.forks_count,
-                    "size": repo.size,
-                    "created_at": (repo.created_at.isoformat() if repo.created_at else None),
-                    "updated_at": (repo.updated_at.isoformat() if repo.updated_at else None),
-                    "topics": list(repo.get_topics()),
-                    "url": repo.html_url,
-                    "clone_url": repo.clone_url,
-                    "is_private": repo.private,
+                    "name": repo["name"],
+                    "full_name": repo["full_name"],
+                    "description": repo.get("description"),
+                    "language": repo.get("language"),
+                    "stars": repo.get("stargazers_count", 0),
+                    "forks": repo.get("forks_count", 0),
+                    "size": repo.get("size", 0),
+                    "created_at": normalize_timestamp(repo.get("created_at")),
+                    "updated_at": normalize_timestamp(repo.get("updated_at")),
+                    "topics": repo.get("topics", []),
+                    "url": repo.get("html_url"),
+                    "clone_url": repo.get("clone_url"),
+                    "is_private": repo.get("private", False),
                 }
 
                 repositories.append(repo_data)
-                count += 1
 
             # Cache the result
             await set_cache(cache_key, repositories, ttl=self.COMMIT_ANALYSIS_CACHE_TTL)
@@ -557,96 +705,56 @@ class GitHubUserService:
             reverse=True,
         )
 
-    async def _fetch_dependency_data(self, repo_data: Dict[str, Any]) -> List[str]:
-        """Fetch and analyze dependency files from a repository."""
-        if not self.github_client:
-            return []
+    async def _attach_dependencies(self, repositories: List[Dict[str, Any]]) -> None:
+        """Store the parsed dependencies of the top repositories on each as ``dependencies``.
 
-        try:
-            # Common dependency file patterns
-            dependency_files = {
-                # Python
-                "requirements.txt": "python",
-                "pyproject.toml": "python",
-                "setup.py": "python",
-                "Pipfile": "python",
-                "poetry.lock": "python",
-                # JavaScript/Node.js
-                "package.json": "javascript",
-                "yarn.lock": "javascript",
-                "package-lock.json": "javascript",
-                # Java
-                "pom.xml": "java",
-                "build.gradle": "java",
-                "build.gradle.kts": "java",
-                # .NET/C#
-                ".csproj": "dotnet",
-                "packages.config": "dotnet",
-                "project.json": "dotnet",
-                # Go
-                "go.mod": "go",
-                "go.sum": "go",
-                # Rust
-                "Cargo.toml": "rust",
-                "Cargo.lock": "rust",
-                # PHP
-                "composer.json": "php",
-                "composer.lock": "php",
-                # Ruby
-                "Gemfile": "ruby",
-                "Gemfile.lock": "ruby",
-                # Swift/iOS
-                "Package.swift": "swift",
-                "Podfile": "swift",
-                "Cartfile": "swift",
-                # Infrastructure/DevOps
-                "Dockerfile": "docker",
-                "docker-compose.yml": "docker",
-                "docker-compose.yaml": "docker",
-            }
-
-            repo_full_name = repo_data.get("full_name") or f"{repo_data.get('name', '')}"
-            if not repo_full_name:
-                return []
-
-            # Try to get repository object
-            try:
-                repo = self.github_client.get_repo(repo_full_name)
-            except Exception:
-                # If we can't access the repo, skip dependency analysis
-                return []
+        Only the first ``DEPENDENCY_REPOSITORY_LIMIT`` repositories are inspected, concurrently;
+        ``extract_skills`` maps the names to frameworks and tools.
+        """
+        top_repositories = repositories[: self.DEPENDENCY_REPOSITORY_LIMIT]
+        results = await asyncio.gather(*(self._fetch_dependency_data(repo) for repo in top_repositories))
+        for repo, dependencies in zip(top_repositories, results):
+            if dependencies:
+                repo["dependencies"] = dependencies
 
-            dependencies: List[str] = []
-            max_files_to_check = 3  # Limit to avoid rate limits
+    async def _fetch_dependency_data(self, repo_data: Dict[str, Any]) -> List[str]:
+        """Fetch and analyze dependency files from a repository.
+
+        The root tree is listed once and only the manifests it contains are fetched,
+        concurrently. Parsed dependencies are cached per tree sha, so a repository whose
+        files have not changed is never fetched or parsed again.
+        """
+        client = self.github_client
+        if not client:
+            return []
 
-            for filename, language in dependency_files.items():
-                if len(dependencies) >= max_files_to_check:
-                    break
+        repo_full_name = repo_data.get("full_name") or f"{repo_data.get('name', '')}"
+        if not repo_full_name:
+            return []
 
-                try:
-                    # Check if file exists and get its content
-                    file_content = repo.get_contents(filename)
+        try:
+            tree = await client.get_tree(repo_full_name)
+            cache_key = f"github:dependencies:{repo_full_name}:{tree['sha']}"
+            cached_dependencies = await get_cache(cache_key)
+            if cached_dependencies is not None:
+                return cached_dependencies
 
-                    # Skip if it's a directory
-                    if hasattr(file_content, "type") and file_content.type == "dir":
-                        continue
+            semaphore = asyncio.Semaphore(self.DEPENDENCY_FETCH_CONCURRENCY)
 
-                    # Decode content
-                    if hasattr(file_content, "decoded_content"):
-                        content = file_content.decoded_content.decode("utf-8", errors="ignore")
-                    else:
-                        continue
+            async def fetch_manifest(filename: str, language: str) -> List[str]:
+                async with semaphore:
+                    content = await client.get_file_text(repo_full_name, filename)
+                return self._parse_dependency_file(content, filename, language)
 
-                    # Parse dependencies based on file type
-                    file_dependencies = self._parse_dependency_file(content, filename, language)
-                    dependencies.extend(file_dependencies)
+            manifests = find_dependency_manifests(tree.get("tree", []))
+            results = await asyncio.gather(*(fetch_manifest(filename, language) for filename, language in manifests), return_exceptions=True)
+            dependencies = sorted({dependency for result in results if not isinstance(result, BaseException) for dependency in result})
 
-                except Exception:
-                    # File doesn't exist or can't be read, continue
-                    continue
+            # A manifest that failed to download may succeed next time, so only complete results are cached
+            if not any(isinstance(result, BaseException) for result in results):
+                await set_cache(cache_key, dependencies, ttl=self.DEPENDENCY_CACHE_TTL)
 
-            # Remove duplicates and return
-            return list(set(dependencies))
+            return dependencies
 
         except Exception as e:
             logger.debug(f"Error fetching dependency data for {repo_data.get('name', 'unknown')}: {e}")
@@ -764,46 +872,42 @@ class GitHubUserService:
                 logger.error("💡 Make sure GITHUB_TOKEN environment variable is set")
                 return None
 
-            # Get repository object
-            logger.info("📡 Fetching repository data...")
-            repo = self.github_client.get_repo(repository_full_name)
+            # Fetch repository data and contributors concurrently
+            logger.info("📡 Fetching repository data and contributors...")
+            repo, contributors = await asyncio.gather(
+                self.github_client.get_repo(repository_full_name),
+                self.github_client.get_repo_contributors(repository_full_name, max_items=max_contributors),
+            )
 
             # Get repository info
             repo_info = {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "language": repo.language,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "url": repo.html_url,
-                "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                "topics": list(repo.get_topics()) if hasattr(repo, "get_topics") else [],
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description"),
+                "language": repo.get("language"),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "url": repo.get("html_url"),
+                "created_at": normalize_timestamp(repo.get("created_at")),
+                "updated_at": normalize_timestamp(repo.get("updated_at")),
+                "topics": repo.get("topics", []),
                 "owner": {
-                    "login": repo.owner.login,
-                    "avatar_url": repo.owner.avatar_url,
-                    "html_url": repo.owner.html_url,
+                    "login": repo["owner"]["login"],
+                    "avatar_url": repo["owner"].get("avatar_url"),
+                    "html_url": repo["owner"].get("html_url"),
                 },
             }
 
-            # Get contributors
-            logger.info("👥 Fetching contributors...")
-            contributors_data = []
-            contributors = repo.get_contributors()
-
-            for i, contributor in enumerate(contributors):
-                if i >= max_contributors:
-                    break
-
-                contributor_info = {
-                    "username": contributor.login,
-                    "contributions": contributor.contributions,
-                    "avatar_url": contributor.avatar_url,
-                    "html_url": contributor.html_url,
-                    "type": contributor.type,
+            contributors_data = [
+                {
+                    "username": contributor["login"],
+                    "contributions": contributor.get("contributions", 0),
+                    "avatar_url": contributor.get("avatar_url"),
+                    "html_url": contributor.get("html_url"),
+                    "type": contributor.get("type"),
                 }
-                contributors_data.append(contributor_info)
+                for contributor in contributors
+            ]
 
             logger.info(f"✅ Found {len(contributors_data)} contributors")
 
@@ -3,10 +3,12 @@
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.models.github_profile import GitHubProfile
 from app.models.recommendation import Recommendation, RecommendationVersion
@@ -165,10 +167,7 @@ class RecommendationService:
                 force_refresh=force_refresh,
             )
 
-            # Step 2: Get or create GitHub profile record
-            github_profile = await self._get_or_create_github_profile(db, github_data)
-
-            # Step 3: Generate AI recommendation
+            # Step 2: Generate AI recommendation
             ai_start = time.time()
 
             ai_result = await self.recommendation_engine_service.generate_recommendation(
@@ -192,6 +191,9 @@ class RecommendationService:
                 ai_result["word_count"],
             )
 
+            # Step 3: Upsert the profile only now, so its row lock is not held across the AI call
+            github_profile = await self._get_or_create_github_profile(db, github_data)
+
             # Step 4: Save recommendation
             recommendation_data = self.recommendation_engine_service.create_recommendation_data(
                 ai_result=ai_result,
@@ -203,8 +205,8 @@ class RecommendationService:
 
             recommendation = Recommendation(**recommendation_data.dict())
             db.add(recommendation)
-            await db.commit()
-            await db.refresh(recommendation)
+            # Flush for the ID; the request's session commits the whole unit of work
+            await db.flush()
 
             response = RecommendationResponse.from_orm(recommendation)
             response.github_username = github_username
@@ -235,10 +237,16 @@ class RecommendationService:
         recommendation_type: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: Optional[Tuple[datetime, int]] = None,
     ) -> List[RecommendationResponse]:
-        """Get recommendations with optional filtering."""
+        """Get recommendations with optional filtering, newest first.
+
+        ``cursor`` is the ``(created_at, id)`` of the last row of the previous page; when
+        given, rows after it are returned by keyset instead of skipping ``offset`` rows.
+        """
 
-        query = select(Recommendation).join(GitHubProfile)
+        # Select the username in the same query; large columns are deferred on the model
+        query = select(Recommendation, GitHubProfile.github_username).join(GitHubProfile)
 
         if user_id:
             query = query.where(Recommendation.user_id == user_id)
@@ -249,47 +257,48 @@ class RecommendationService:
         if recommendation_type:
             query = query.where(Recommendation.recommendation_type == recommendation_type)
 
-        query = query.order_by(desc(Recommendation.created_at)).limit(limit).offset(offset)
+        if cursor:
+            created_at, row_id = cursor
+            query = query.where(tuple_(Recommendation.created_at, Recommendation.id) < tuple_(literal(created_at), literal(row_id)))
+        else:
+            query = query.offset(offset)
+
+        query = query.order_by(desc(Recommendation.created_at), desc(Recommendation.id)).limit(limit)
 
         result = await db.execute(query)
-        recommendations = result.scalars().all()
 
         # Convert to responses
-        response_list = []
-        for rec in recommendations:
-            response = RecommendationResponse.from_orm(rec)
-            # Get GitHub username
-            github_profile_result = await db.execute(select(GitHubProfile.github_username).where(GitHubProfile.id == rec.github_profile_id))
-            github_username = github_profile_result.scalar_one_or_none()
-            response.github_username = github_username
-            response_list.append(response)
-
-        return response_list
+        return [self._to_response(rec, username) for rec, username in result.all()]
 
     async def get_recommendation_by_id(self, db: AsyncSession, recommendation_id: int, user_id: Optional[int] = None) -> Optional[RecommendationResponse]:
         """Get a specific recommendation by ID."""
 
-        query = select(Recommendation).where(Recommendation.id == recommendation_id)
+        query = select(Recommendation, GitHubProfile.github_username).join(GitHubProfile).where(Recommendation.id == recommendation_id)
         if user_id:
             query = query.where(Recommendation.user_id == user_id)
 
         result = await db.execute(query)
-        recommendation = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not recommendation:
+        if not row:
             return None
 
-        response = RecommendationResponse.from_orm(recommendation)
+        return self._to_response(*row)
 
-        # Get GitHub username
-        github_profile_result = await db.execute(select(GitHubProfile.github_username).where(GitHubProfile.id == recommendation.github_profile_id))
-        github_username = github_profile_result.scalar_one_or_none()
+    @staticmethod
+    def _to_response(recommendation: Recommendation, github_username: Optional[str]) -> RecommendationResponse:
+        """Build a response from a recommendation and its profile's username."""
+        response = RecommendationResponse.from_orm(recommendation)
         response.github_username = github_username
-
         return response
 
     async def _get_or_create_github_profile(self, db: AsyncSession, github_data: Dict[str, Any]) -> GitHubProfile:
-        """Get existing or create new GitHub profile record."""
+        """Insert or update the GitHub profile record in one statement.
+
+        Uses ``INSERT ... ON CONFLICT (github_username) DO UPDATE ... RETURNING`` so concurrent
+        generations for the same username cannot race on the unique constraint. The change is
+        left to the caller's transaction to commit.
+        """
 
         # Handle merged repository-contributor data
         if github_data.get("analysis_context_type") == "repository_contributor":
@@ -299,62 +308,37 @@ class RecommendationService:
             user_data = github_data["user_data"]
             username = user_data["github_username"]
 
-        # Check if profile exists
-        query = select(GitHubProfile).where(GitHubProfile.github_username == username)
-        result = await db.execute(query)
-        existing_profile = result.scalar_one_or_none()
-
-        if existing_profile:
-            # Update existing profile - exclude datetime fields for direct assignment
-            datetime_fields = {"created_at", "updated_at", "last_analyzed"}
-            for key, value in user_data.items():
-                if hasattr(existing_profile, key) and key not in datetime_fields:
-                    setattr(existing_profile, key, value)
-
-            # Handle datetime fields separately
-            if "created_at" in user_data:
-                existing_profile.created_at = parse_datetime(user_data["created_at"])
-            if "updated_at" in user_data:
-                existing_profile.updated_at = parse_datetime(user_data["updated_at"])
-
-            # Update analysis data
-            existing_profile.repositories_data = github_data["repositories"]
-            existing_profile.languages_data = github_data["languages"]
-            existing_profile.skills_analysis = github_data["skills"]
-            existing_profile.last_analyzed = parse_datetime(github_data["analyzed_at"])
-
-            await db.commit()
-            await db.refresh(existing_profile)
-            return existing_profile
-
-        else:
-            # Create new profile
-            new_profile = GitHubProfile(
-                github_username=user_data["github_username"],
-                github_id=user_data["github_id"],
-                full_name=user_data.get("full_name"),
-                bio=user_data.get("bio"),
-                company=user_data.get("company"),
-                location=user_data.get("location"),
-                email=user_data.get("email"),
-                blog=user_data.get("blog"),
-                avatar_url=user_data.get("avatar_url"),
-                public_repos=user_data.get("public_repos", 0),
-                followers=user_data.get("followers", 0),
-                following=user_data.get("following", 0),
-                public_gists=user_data.get("public_gists", 0),
-                repositories_data=github_data["repositories"],
-                languages_data=github_data["languages"],
-                skills_analysis=github_data["skills"],
-                last_analyzed=parse_datetime(github_data["analyzed_at"]),
-                created_at=(parse_datetime(user_data.get("created_at")) if user_data.get("created_at") else None),
-                updated_at=(parse_datetime(user_data.get("updated_at")) if user_data.get("updated_at") else None),
-            )
+        values: Dict[str, Any] = {
+            "github_username": username,
+            "github_id": user_data["github_id"],
+            "full_name": user_data.get("full_name"),
+            "bio": user_data.get("bio"),
+            "company": user_data.get("company"),
+            "location": user_data.get("location"),
+            "email": user_data.get("email"),
+            "blog": user_data.get("blog"),
+            "avatar_url": user_data.get("avatar_url"),
+            "public_repos": user_data.get("public_repos", 0),
+            "followers": user_data.get("followers", 0),
+            "following": user_data.get("following", 0),
+            "public_gists": user_data.get("public_gists", 0),
+            "repositories_data": github_data["repositories"],
+            "languages_data": github_data["languages"],
+            "skills_analysis": github_data["skills"],
+            "last_analyzed": parse_datetime(github_data["analyzed_at"]),
+            # ON CONFLICT DO UPDATE skips Column.onupdate, so updated_at is always set explicitly
+            "updated_at": parse_datetime(user_data["updated_at"]) if user_data.get("updated_at") else datetime.now(timezone.utc),
+        }
+        if user_data.get("created_at"):
+            values["created_at"] = parse_datetime(user_data["created_at"])
 
-            db.add(new_profile)
-            await db.commit()
-            await db.refresh(new_profile)
-            return new_profile
+        stmt = insert(GitHubProfile).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GitHubProfile.github_username],
+            set_={column: stmt.excluded[column] for column in values if column != "github_username"},
+        )
+        result = await db.execute(stmt.returning(GitHubProfile).execution_options(populate_existing=True))
+        return result.scalar_one()
 
     async def create_recommendation_options(
         self,
@@ -390,11 +374,7 @@ class RecommendationService:
                 force_refresh=False,
             )
 
-            # Step 2: Get or create GitHub profile (skip for repo_only)
-            if analysis_context_type != "repo_only":
-                await self._get_or_create_github_profile(db, github_data)
-
-            # Step 3: Generate AI recommendation options
+            # Step 2: Generate AI recommendation options
             response = await self.recommendation_engine_service.generate_recommendation_options(
                 github_data=github_data,
                 base_recommendation_type=recommendation_type,
@@ -404,6 +384,11 @@ class RecommendationService:
                 specific_skills=specific_skills,
             )
 
+            # Step 3: Get or create GitHub profile (skip for repo_only) after generation, so the
+            # upsert's row lock is not held across the AI calls
+            if analysis_context_type != "repo_only":
+                await self._get_or_create_github_profile(db, github_data)
+
             logger.info(
                 "Recommendation options created: user=%s, options=%d, duration=%.2fs",
                 github_username,
@@ -463,10 +448,7 @@ class RecommendationService:
                 prompt_service = PromptService()
                 display_name = prompt_service._extract_display_name(github_data["user_data"])
 
-            # Step 2: Get or create GitHub profile
-            github_profile = await self._get_or_create_github_profile(db, github_data)
-
-            # Step 3: Generate refined AI recommendation
+            # Step 2: Generate refined AI recommendation
             ai_result = await self.recommendation_engine_service.regenerate_recommendation(
                 original_content=original_content,
                 refinement_instructions=refinement_instructions,
@@ -481,6 +463,9 @@ class RecommendationService:
                 display_name=display_name,
             )
 
+            # Step 3: Upsert the profile only now, so its row lock is not held across the AI call
+            github_profile = await self._get_or_create_github_profile(db, github_data)
+
             # Step 4: Save recommendation
             github_profile_id = github_profile.id if github_profile else None
 
@@ -495,8 +480,8 @@ class RecommendationService:
 
             recommendation = Recommendation(**recommendation_data.dict())
             db.add(recommendation)
-            await db.commit()
-            await db.refresh(recommendation)
+            # Flush for the ID; the request's session commits the whole unit of work
+            await db.flush()
 
             response = RecommendationResponse.from_orm(recommendation)
             response.github_username = github_username
@@ -546,7 +531,7 @@ class RecommendationService:
                 raise ValueError(f"Recommendation with ID {recommendation_id} not found")
 
             # Get GitHub profile data for context
-            github_profile_query = select(GitHubProfile).where(GitHubProfile.id == original_recommendation.github_profile_id)
+            github_profile_query = select(GitHubProfile).where(GitHubProfile.id == original_recommendation.github_profile_id).options(undefer_group("analysis"))
             github_profile_result = await db.execute(github_profile_query)
             github_profile = github_profile_result.scalar_one_or_none()
 
@@ -664,7 +649,7 @@ class RecommendationService:
 
             try:
                 owner, repo_name = repository_full_name.split("/", 1)
-                repo = self.github_service.github_client.get_repo(repository_full_name)
+                repo = await self.github_service.github_client.get_repo(repository_full_name)
 
                 # Perform README-specific analysis
                 repository_analysis = self.github_service._analyze_repository_content_for_readme(repository_data.get("repository_info", {}), repo)
@@ -672,7 +657,7 @@ class RecommendationService:
                 # Extract API endpoints if applicable
                 main_files = repository_analysis.get("main_files", [])
                 if main_files:
-                    api_endpoints = self.github_service._extract_api_endpoints_from_code(repo, main_files)
+                    api_endpoints = await self.github_service._extract_api_endpoints_from_code(repository_full_name, main_files)
                     repository_analysis["api_endpoints"] = api_endpoints
 
             except Exception as e:
@@ -766,8 +751,7 @@ class RecommendationService:
         )
 
         db.add(version)
-        await db.commit()
-        await db.refresh(version)
+        await db.flush()
 
         logger.debug(
             "Created version %d for recommendation %s",
@@ -913,12 +897,13 @@ class RecommendationService:
             raise ValueError(f"Version {version_id} not found for recommendation {recommendation_id}")
 
         # Get the current recommendation
-        rec_query = select(Recommendation).where(Recommendation.id == recommendation_id)
+        rec_query = select(Recommendation, GitHubProfile.github_username).join(GitHubProfile).where(Recommendation.id == recommendation_id)
         rec_result = await db.execute(rec_query)
-        recommendation = rec_result.scalar_one_or_none()
+        row = rec_result.one_or_none()
 
-        if not recommendation:
+        if not row:
             raise ValueError(f"Recommendation {recommendation_id} not found")
+        recommendation, github_username = row
 
         # Create a version of the current state before reverting
         await self._create_recommendation_version(
@@ -945,17 +930,10 @@ class RecommendationService:
             created_by="user",
         )
 
-        await db.commit()
-        await db.refresh(recommendation)
+        await db.flush()
 
         # Convert to response
-        response = RecommendationResponse.from_orm(recommendation)
-
-        # Get GitHub username
-        github_profile_query = select(GitHubProfile.github_username).where(GitHubProfile.id == recommendation.github_profile_id)
-        github_result = await db.execute(github_profile_query)
-        github_username = github_result.scalar_one_or_none()
-        response.github_username = github_username
+        response = self._to_response(recommendation, github_username)
 
         logger.info(
             "Reverted recommendation %s to version %s",
@@ -1471,8 +1449,8 @@ class RecommendationService:
 
             recommendation = Recommendation(**recommendation_data.dict())
             db.add(recommendation)
-            await db.commit()
-            await db.refresh(recommendation)
+            # Flush for the ID; the request's session commits the whole unit of work
+            await db.flush()
 
             response = RecommendationResponse.from_orm(recommendation)
             response.github_username = github_username
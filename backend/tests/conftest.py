@@ -23,6 +23,110 @@ def mock_redis():
     return mock_client
 
 
+class FakePipeline:
+    """Queue commands and run them against a FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by caching and single-flight locks."""
+
+    def __init__(self) -> None:
+        self.store: dict = {}
+        self.ttls: dict = {}
+        self.streams: dict = {}
+        self.published: list = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    async def get(self, key):
+        # Like the binary-mode client, always return bytes
+        value = self.store.get(key)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    async def decr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) - 1
+        return self.store[key]
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return key in self.store
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        entries = self.streams.setdefault(key, [])
+        entry_id = f"{len(entries) + 1}-0".encode("utf-8")
+        entries.append((entry_id, {name.encode("utf-8"): value for name, value in fields.items()}))
+        return entry_id
+
+    async def xread(self, streams, block=None):
+        # Returns the entries after each id; a blocking read that finds none waits briefly, like one that timed out
+        response = []
+        for key, last_id in streams.items():
+            after = int(str(last_id).split("-")[0])
+            entries = [entry for entry in self.streams.get(key, []) if int(entry[0].split(b"-")[0]) > after]
+            if entries:
+                response.append([key.encode("utf-8"), entries])
+        if not response and block is not None:
+            await asyncio.sleep(0.01)
+        return response
+
+    async def delete(self, key):
+        self.streams.pop(key, None)
+        return int(self.store.pop(key, None) is not None)
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Serve app.core.redis_client from an in-memory fake Redis."""
+    import app.core.redis_client
+
+    fake = FakeRedis()
+
+    async def get_fake_redis():
+        return fake
+
+    monkeypatch.setattr(app.core.redis_client, "get_redis", get_fake_redis)
+    monkeypatch.setattr(app.core.redis_client, "SINGLE_FLIGHT_POLL_INTERVAL", 0.01)
+    return fake
+
+
 @pytest.fixture
 def mock_database_session():
     """Mock database session for testing."""
@@ -34,6 +138,65 @@ def mock_database_session():
     return mock_session
 
 
+class CountingSession:
+    """AsyncSession stand-in that counts round-trips and commits.
+
+    ``execute`` returns queued results in order. ``flush`` assigns ids and applies
+    Python-side column defaults to added objects, as the database would.
+    """
+
+    def __init__(self) -> None:
+        self.results: list = []
+        self.statements: list = []
+        self.pending: list = []
+        self.counts = {"execute": 0, "flush": 0, "commit": 0, "refresh": 0, "rollback": 0}
+        self._next_id = 1
+
+    async def __aenter__(self) -> "CountingSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def add(self, instance) -> None:
+        self.pending.append(instance)
+
+    async def execute(self, statement, *args, **kwargs):
+        self.counts["execute"] += 1
+        self.statements.append(statement)
+        return self.results.pop(0) if self.results else MagicMock()
+
+    async def flush(self) -> None:
+        self.counts["flush"] += 1
+        for instance in self.pending:
+            for column in instance.__table__.columns:
+                if getattr(instance, column.key, None) is not None:
+                    continue
+                if column.primary_key:
+                    setattr(instance, column.key, self._next_id)
+                    self._next_id += 1
+                elif column.default is not None and column.default.is_scalar:
+                    setattr(instance, column.key, column.default.arg)
+                elif column.default is not None and column.default.is_callable:
+                    setattr(instance, column.key, column.default.arg(None))
+        self.pending.clear()
+
+    async def commit(self) -> None:
+        self.counts["commit"] += 1
+
+    async def refresh(self, instance) -> None:
+        self.counts["refresh"] += 1
+
+    async def rollback(self) -> None:
+        self.counts["rollback"] += 1
+
+
+@pytest.fixture
+def counting_session():
+    """Database session that counts queries, flushes and commits."""
+    return CountingSession()
+
+
 @pytest.fixture
 def test_settings():
     """Test settings that don't require external dependencies."""
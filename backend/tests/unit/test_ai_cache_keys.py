@@ -0,0 +1,59 @@
+"""Tests for AI recommendation cache keys."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.core.cache_keys import AI_RECOMMENDATION_CACHE_VERSION, build_ai_recommendation_cache_key
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+MODEL = "gemini-2.5-flash"
+PARAMS = {"temperature": 0.7, "max_output_tokens": 2048, "top_p": 0.9, "top_k": 40}
+REPO_URL = "https://github.com/testuser/smart-gym"
+
+
+def build_key(prompt: str = "Write a recommendation for testuser.", **overrides) -> str:
+    """Build a cache key with test defaults."""
+    kwargs = {"model": MODEL, "generation_params": PARAMS, "analysis_context_type": "profile", "repository_url": None}
+    kwargs.update(overrides)
+    return build_ai_recommendation_cache_key(prompt, **kwargs)
+
+
+class TestAIRecommendationCacheKey:
+    """Tests for build_ai_recommendation_cache_key."""
+
+    def test_key_is_stable_across_interpreters(self):
+        """Test a worker with a different hash seed derives the same key."""
+        script = f"from app.core.cache_keys import build_ai_recommendation_cache_key as build; print(build('Write a recommendation for testuser.', {MODEL!r}, {PARAMS!r}, 'profile', None))"
+        env = {**os.environ, "PYTHONHASHSEED": "12345"}
+        result = subprocess.run([sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == build_key()
+
+    def test_key_is_versioned(self):
+        """Test keys live under the current cache version namespace."""
+        assert build_key().startswith(f"ai_recommendation:{AI_RECOMMENDATION_CACHE_VERSION}:")
+
+    def test_cosmetic_prompt_differences_share_a_key(self):
+        """Test line endings, trailing whitespace and Unicode composition are normalized."""
+        assert build_key("Café rocks.  \r\nShips fast.\n") == build_key("Café rocks.\nShips fast.")
+
+    def test_output_affecting_inputs_change_the_key(self):
+        """Test prompt, model and generation parameters are all part of the key."""
+        baseline = build_key()
+
+        assert build_key("Write a recommendation for someone else.") != baseline
+        assert build_key(model="gemini-2.5-pro") != baseline
+        assert build_key(generation_params={**PARAMS, "temperature": 0.9}) != baseline
+
+    def test_contexts_are_isolated(self):
+        """Test each analysis context gets its own key and repo_only its own namespace."""
+        profile = build_key()
+        contributor = build_key(analysis_context_type="repository_contributor", repository_url=REPO_URL)
+        repo_only = build_key(analysis_context_type="repo_only", repository_url=REPO_URL)
+
+        assert len({profile, contributor, repo_only}) == 3
+        assert contributor.endswith(":repository_contributor:testuser/smart-gym")
+        assert repo_only.startswith(f"ai_recommendation_repo_only:{AI_RECOMMENDATION_CACHE_VERSION}:")
+        assert repo_only.endswith(":testuser/smart-gym")
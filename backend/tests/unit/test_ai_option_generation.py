@@ -0,0 +1,117 @@
+"""Tests for concurrent and streaming Gemini option generation."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.services.ai.ai_recommendation_service import AIRecommendationService
+from app.services.ai.prompt_service import PromptService
+
+LATENCY = 0.3
+RECOMMENDATION = (
+    "I worked with Octo for two years on the payments platform, where they led the migration to FastAPI.\n\n"
+    "Octo rebuilt our caching layer in Python and cut response times in half while mentoring two new engineers.\n\n"
+    "I would gladly work with Octo again on any backend team."
+)
+GITHUB_DATA = {
+    "user_data": {"github_username": "octocat", "full_name": "Octo Cat"},
+    "repositories": [{"name": "payments", "language": "Python", "description": "Payments API"}],
+    "skills": {"technical_skills": ["Python", "FastAPI"], "frameworks": ["FastAPI"]},
+}
+
+
+class FakeAsyncModels:
+    """Stand-in for ``client.aio.models`` that answers after a fixed latency."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, model, contents, config):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(LATENCY)
+        self.in_flight -= 1
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(text=RECOMMENDATION)]))])
+
+    async def generate_content_stream(self, model, contents, config):
+        async def chunks():
+            for word in RECOMMENDATION.split(" "):
+                await asyncio.sleep(0)
+                yield SimpleNamespace(text=f"{word} ")
+
+        return chunks()
+
+
+def make_service() -> tuple[AIRecommendationService, FakeAsyncModels]:
+    """Build a recommendation service backed by the fake slow client."""
+    models = FakeAsyncModels()
+    service = AIRecommendationService(PromptService())
+    service.client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    return service, models
+
+
+class TestParallelOptionGeneration:
+    """Tests for _generate_options_parallel on the async Gemini client."""
+
+    async def test_options_complete_in_single_call_latency(self):
+        """Test N options overlap their Gemini calls instead of running back to back."""
+        service, models = make_service()
+        option_configs = [{"name": f"Option {i}", "focus": "technical_expertise", "temperature_modifier": 0.1, "custom_instruction": "Focus on skills."} for i in range(1, 5)]
+
+        start = time.perf_counter()
+        options = await service._generate_options_parallel(
+            initial_prompt="Write a recommendation for octocat.",
+            option_configs=option_configs,
+            base_username="octocat",
+            recommendation_type="professional",
+            tone="professional",
+            length="medium",
+            focus_keywords=None,
+            focus_weights=None,
+            display_name="Octo",
+            github_data=GITHUB_DATA,
+        )
+        elapsed = time.perf_counter() - start
+
+        assert len(options) == 4
+        assert models.max_in_flight == 4
+        assert elapsed < LATENCY * 2
+
+    async def test_event_loop_keeps_running_during_generation(self):
+        """Test other coroutines are scheduled while a Gemini call is pending."""
+        service, _ = make_service()
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await service._generate_refined_regeneration("Refine this recommendation.")
+        ticker_task.cancel()
+
+        assert ticks >= 10
+
+
+class TestTokenStreaming:
+    """Tests for per-option text deltas in generate_recommendation_stream."""
+
+    async def test_deltas_precede_formatted_options(self):
+        """Test deltas carry an option id and each option's formatted text follows its deltas."""
+        service, _ = make_service()
+
+        updates = [update async for update in service.generate_recommendation_stream(GITHUB_DATA, force_refresh=True)]
+
+        statuses = [update["status"] for update in updates]
+        assert statuses.index("streaming") < statuses.index("option_complete") < statuses.index("complete")
+        for option_id in (1, 2):
+            text = "".join(update["delta"] for update in updates if update["status"] == "streaming" and update["option_id"] == option_id)
+            assert text.strip() == RECOMMENDATION
+            completed = next(update for update in updates if update["status"] == "option_complete" and update["option_id"] == option_id)
+            assert completed["result"]["id"] == option_id
+            assert completed["result"]["validation_results"] is not None
+
+        assert [option["id"] for option in updates[-1]["result"]["options"]] == [1, 2]
@@ -0,0 +1,152 @@
+"""Tests for push-based GitHub analysis progress over a Redis stream."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.api.v1 import github as github_api
+from app.core.config import settings
+from app.core.redis_client import append_to_stream
+from app.services.github.github_user_service import GitHubUserService
+
+
+async def read_events(task_id: str) -> list:
+    """Collect the SSE data events the progress endpoint sends for ``task_id``."""
+    response = await github_api.stream_github_analysis_progress(task_id)
+    return [json.loads(chunk[len("data: ") :]) async for chunk in response.body_iterator if chunk.startswith("data: ")]
+
+
+def make_user_service() -> GitHubUserService:
+    """Build a user service whose GitHub fetchers return canned data."""
+    service = GitHubUserService(MagicMock())
+    service.github_client = MagicMock()
+    service._fetch_graphql_bundle = AsyncMock(return_value=None)
+    service._get_user_data = AsyncMock(return_value={"github_username": "octocat"})
+    service._get_repositories = AsyncMock(return_value=[{"name": "hello-world"}])
+    service._analyze_languages = AsyncMock(return_value=[])
+    service._fetch_dependency_data = AsyncMock(return_value=[])
+    service.profile_analysis_service = MagicMock(extract_skills=MagicMock(return_value={}))
+    service.commit_service.analyze_contributor_commits = AsyncMock(return_value={})
+    service.commit_service.fetch_user_pull_requests_across_repos = AsyncMock(return_value={})
+    return service
+
+
+class TestAnalysisProgress:
+    """Tests for analysis progress publishing and the SSE endpoint."""
+
+    async def test_each_step_is_published(self, fake_redis):
+        """Test a fresh analysis reports every step to the progress callback."""
+        stages = []
+
+        async def progress(stage, percent):
+            stages.append((stage, percent))
+
+        analysis = await make_user_service().analyze_github_profile("octocat", force_refresh=True, progress=progress)
+
+        assert analysis["user_data"] == {"github_username": "octocat"}
+        assert [stage for stage, _ in stages] == [
+            "Fetching user data...",
+            "Fetching repositories...",
+            "Analyzing languages...",
+            "Extracting skills...",
+            "Analyzing commits...",
+            "Analyzing pull requests...",
+            "Saving results...",
+        ]
+        assert [percent for _, percent in stages] == sorted(percent for _, percent in stages)
+
+    async def test_joining_caller_reports_the_running_analysis_steps(self, fake_redis):
+        """Test a caller that joins an in-flight analysis reports its steps instead of none."""
+        service = make_user_service()
+        user_data_fetched = asyncio.Event()
+
+        async def get_user_data(username, force_refresh=False):
+            await user_data_fetched.wait()
+            return {"github_username": username}
+
+        service._get_user_data = get_user_data
+        leader_stages, joiner_stages = [], []
+
+        async def leader_progress(stage, percent):
+            leader_stages.append(stage)
+
+        async def joiner_progress(stage, percent):
+            joiner_stages.append(stage)
+
+        leader = asyncio.create_task(service.analyze_github_profile("octocat", force_refresh=True, progress=leader_progress))
+        await asyncio.sleep(0.02)
+        joiner = asyncio.create_task(service.analyze_github_profile("octocat", force_refresh=True, progress=joiner_progress))
+        await asyncio.sleep(0.02)
+        user_data_fetched.set()
+        results = await asyncio.gather(leader, joiner)
+
+        assert service._fetch_graphql_bundle.await_count == 1
+        assert results[0] == results[1]
+        assert joiner_stages == leader_stages
+        assert joiner_stages[0] == "Fetching user data..."
+        assert joiner_stages[-1] == "Saving results..."
+
+    async def test_caller_joining_a_background_refresh_reports_its_steps(self, fake_redis):
+        """Test a caller that joins a stale-while-revalidate refresh follows that run, not an older one."""
+        service = make_user_service()
+        user_data_fetched = asyncio.Event()
+
+        async def get_user_data(username, force_refresh=False):
+            await user_data_fetched.wait()
+            return {"github_username": username}
+
+        service._get_user_data = get_user_data
+        # A previous run left its steps and end marker on the stream
+        progress_key = service._progress_key("github_profile:octocat")
+        await append_to_stream(progress_key, {"stage": "Saving results...", "progress": 95}, ttl=60)
+        await append_to_stream(progress_key, {"done": True}, ttl=60)
+        stale = {"analyzed_at": (datetime.now(timezone.utc) - timedelta(seconds=GitHubUserService.PROFILE_ANALYSIS_SOFT_TTL + 60)).isoformat()}
+        stages = []
+
+        async def progress(stage, percent):
+            stages.append(stage)
+
+        assert service.revalidate_profile_if_stale(stale, "github_profile:octocat", "octocat")
+        await asyncio.sleep(0.02)
+        joiner = asyncio.create_task(service.analyze_github_profile("octocat", force_refresh=True, progress=progress))
+        await asyncio.sleep(0.02)
+        user_data_fetched.set()
+        result = await joiner
+
+        assert service._fetch_graphql_bundle.await_count == 1
+        assert result["user_data"] == {"github_username": "octocat"}
+        assert stages[0] == "Fetching user data..."
+        assert stages[-1] == "Saving results..."
+        assert len(stages) == 7
+
+    async def test_keepalive_wait_fits_the_redis_timeout(self):
+        """Test the SSE wait is the one read_stream actually uses, under the Redis socket timeout."""
+        assert github_api.TASK_PROGRESS_BLOCK_MS < settings.REDIS_TIMEOUT * 1000
+
+    async def test_stream_replays_progress_and_result(self, fake_redis, monkeypatch):
+        """Test the SSE endpoint reads the task's stream instead of polling its status."""
+
+        async def analyze(username, force_refresh=False, max_repositories=10, progress=None):
+            await progress("Fetching user data...", 10)
+            await progress("Analyzing commits...", 60)
+            return {"user_data": {"github_username": username}}
+
+        monkeypatch.setattr(GitHubUserService, "analyze_github_profile", lambda self, **kwargs: analyze(**kwargs))
+        await github_api._process_github_analysis_background("task-1", "octocat")
+        fake_redis.xread = AsyncMock(wraps=fake_redis.xread)
+        fake_redis.get = AsyncMock(wraps=fake_redis.get)
+
+        events = await read_events("task-1")
+
+        assert [(event["status"], event["progress"]) for event in events] == [("processing", 5), ("processing", 10), ("processing", 60), ("completed", 100)]
+        assert events[1]["stage"] == "Fetching user data..."
+        assert events[-1]["result"] == {"user_data": {"github_username": "octocat"}}
+        assert fake_redis.xread.await_count == 1
+        assert fake_redis.get.await_count == 1
+
+    async def test_unknown_task_is_not_found(self, fake_redis):
+        """Test a task without a progress stream ends the stream immediately."""
+        events = await read_events("missing")
+
+        assert events == [{"status": "not_found", "message": "Task not found or expired"}]
@@ -0,0 +1,124 @@
+"""Tests for date-scoped anonymous generation quotas in Redis."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import app.core.dependencies as dependencies
+import app.core.redis_client as redis_client
+from app.core.dependencies import AnonymousUser, get_anonymous_user_data, increment_anonymous_user_count, release_generation_credit, reserve_generation_credit
+from app.core.redis_client import QUOTA_SCRIPT, QUOTA_TTL_SECONDS, RELEASE_QUOTA_SCRIPT
+
+
+class FakeQuotaScript:
+    """Python mirror of QUOTA_SCRIPT over FakeRedis."""
+
+    def __init__(self, registered_client) -> None:
+        self.registered_client = registered_client
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        limit, ttl = int(args[0]), int(args[1])
+        count = await self.registered_client.incr(keys[0])
+        if count == 1:
+            await self.registered_client.expire(keys[0], ttl)
+        if count > limit:
+            await self.registered_client.decr(keys[0])
+            return [0, count - 1]
+        return [1, count]
+
+
+class FakeReleaseQuotaScript:
+    """Python mirror of RELEASE_QUOTA_SCRIPT over FakeRedis."""
+
+    def __init__(self, registered_client) -> None:
+        self.registered_client = registered_client
+
+    async def __call__(self, keys):
+        if await self.registered_client.exists(keys[0]):
+            return await self.registered_client.decr(keys[0])
+        return 0
+
+
+@pytest.fixture
+def quota_redis(monkeypatch, fake_redis):
+    """Serve anonymous quotas from FakeRedis with the quota scripts mirrored in Python."""
+    scripts = {QUOTA_SCRIPT: FakeQuotaScript(fake_redis), RELEASE_QUOTA_SCRIPT: FakeReleaseQuotaScript(fake_redis)}
+    fake_redis.register_script = lambda source: scripts[source]
+
+    async def get_fake_redis():
+        return fake_redis
+
+    monkeypatch.setattr(dependencies, "get_redis", get_fake_redis)
+    monkeypatch.setattr(redis_client, "_quota_script", None)
+    monkeypatch.setattr(redis_client, "_release_quota_script", None)
+    return fake_redis
+
+
+def make_request(ip: str = "203.0.113.9") -> SimpleNamespace:
+    """Build a request carrying only the client address."""
+    return SimpleNamespace(client=SimpleNamespace(host=ip))
+
+
+class TestAnonymousQuota:
+    """Tests for anonymous quota reads, increments and reservations."""
+
+    async def test_reads_todays_key(self, quota_redis):
+        """Test the count is one GET of the date-scoped key, with no writes."""
+        quota_redis.store[f"anonymous:203.0.113.9:{date.today().isoformat()}"] = "2"
+        quota_redis.store["anonymous:203.0.113.9:2000-01-01"] = "3"
+
+        user = await get_anonymous_user_data(make_request())
+
+        assert user.recommendation_count == 2
+        assert len(quota_redis.store) == 2
+
+    async def test_increment_sets_daily_expiry(self, quota_redis):
+        """Test the first increment of today's key sets its expiry."""
+        await increment_anonymous_user_count(make_request("127.0.0.1"))
+
+        key = f"anonymous:localhost:{date.today().isoformat()}"
+        assert quota_redis.store[key] == 1
+        assert quota_redis.ttls[key] == QUOTA_TTL_SECONDS
+
+    async def test_increment_keeps_first_use_expiry(self, quota_redis):
+        """Test later increments don't push back the expiry set on first use."""
+        key = f"anonymous:203.0.113.9:{date.today().isoformat()}"
+        await increment_anonymous_user_count(make_request())
+        quota_redis.ttls[key] = 60  # A minute before the key expires
+
+        await increment_anonymous_user_count(make_request())
+
+        assert quota_redis.store[key] == 2
+        assert quota_redis.ttls[key] == 60
+
+    async def test_release_after_expiry_leaves_no_key(self, quota_redis):
+        """Test refunding a generation whose quota key expired mid-generation doesn't recreate it at -1."""
+        user = AnonymousUser("203.0.113.9")
+        await reserve_generation_credit(user)
+        quota_redis.store.clear()  # The key expires while the generation runs
+
+        await release_generation_credit(user)
+
+        assert quota_redis.store == {}
+
+    async def test_reservation_is_check_and_increment(self, quota_redis):
+        """Test the daily limit is enforced atomically and a failed generation gives its use back."""
+        user = AnonymousUser("203.0.113.9")
+        key = f"anonymous:203.0.113.9:{date.today().isoformat()}"
+
+        for _ in range(user.daily_limit):
+            await reserve_generation_credit(user)
+        with pytest.raises(HTTPException) as exc_info:
+            await reserve_generation_credit(user)
+
+        assert exc_info.value.status_code == 429
+        assert quota_redis.store[key] == user.daily_limit
+        assert quota_redis.ttls[key] == QUOTA_TTL_SECONDS
+
+        await release_generation_credit(user)
+
+        assert quota_redis.store[key] == user.daily_limit - 1
@@ -0,0 +1,82 @@
+"""Tests for the cache value codec."""
+
+import json
+import zlib
+
+import pytest
+
+from app.core import cache_codec
+from app.core.cache_codec import COMPRESSION_NONE, COMPRESSION_ZLIB, HEADER_BYTES, SERIALIZER_JSON, decode_cache_value, encode_cache_value
+from app.core.config import settings
+from app.core.redis_client import get_cache, set_cache
+
+
+def make_analysis(repositories: int) -> dict:
+    """Build a profile analysis with ``repositories`` repositories."""
+    return {
+        "user_data": {"github_username": "octocat", "followers": 42, "bio": "Builds things"},
+        "repositories": [{"name": f"repo-{i}", "language": "Python", "stars": i, "description": "A small project " * 4} for i in range(repositories)],
+        "skills": {"technical_skills": ["Python", "FastAPI"], "frameworks": []},
+    }
+
+
+class TestCacheCodec:
+    """Tests for encode_cache_value/decode_cache_value."""
+
+    def test_small_values_round_trip_uncompressed(self):
+        """Test values under the threshold carry an uncompressed JSON header."""
+        value = make_analysis(1)
+        encoded = encode_cache_value(value)
+
+        assert encoded[0] == SERIALIZER_JSON << 2 | COMPRESSION_NONE
+        assert decode_cache_value(encoded) == value
+
+    def test_large_values_are_compressed(self, monkeypatch):
+        """Test values over the threshold are compressed and still round-trip."""
+        monkeypatch.setattr(settings, "CACHE_COMPRESSION", "zlib")
+        value = make_analysis(200)
+        encoded = encode_cache_value(value)
+
+        assert encoded[0] == SERIALIZER_JSON << 2 | COMPRESSION_ZLIB
+        assert len(encoded) < len(json.dumps(value)) / 4
+        assert json.loads(zlib.decompress(encoded[1:])) == value
+        assert decode_cache_value(encoded) == value
+
+    @pytest.mark.skipif(not cache_codec.zstd_available, reason="zstandard not installed")
+    def test_auto_prefers_zstd(self):
+        """Test auto compression uses zstd when it is installed."""
+        encoded = encode_cache_value(make_analysis(200))
+
+        assert encoded[0] & 0b11 == cache_codec.COMPRESSION_ZSTD
+
+    def test_legacy_values_decode(self):
+        """Test values written before the header byte existed are still readable."""
+        assert decode_cache_value(json.dumps({"login": "octocat"}).encode()) == {"login": "octocat"}
+        assert decode_cache_value(b"plain text") == "plain text"
+        assert decode_cache_value(json.dumps([1, 2]).encode()) == [1, 2]
+
+    def test_strings_are_stored_raw(self):
+        """Test string values stay plain UTF-8 and never look like a header."""
+        assert encode_cache_value("café") == "café".encode("utf-8")
+        assert not any(ord(first) in HEADER_BYTES for first in '{["0-tfn ')
+
+
+class TestCacheCodecWithRedis:
+    """Tests for the codec through set_cache/get_cache."""
+
+    async def test_set_and_get_compressed_value(self, fake_redis):
+        """Test large values are stored compressed and read back intact."""
+        value = make_analysis(200)
+
+        assert await set_cache("github_profile:octocat", value)
+        stored = fake_redis.store["github_profile:octocat"]
+
+        assert isinstance(stored, bytes)
+        assert stored[0] & 0b11 != COMPRESSION_NONE
+        assert await get_cache("github_profile:octocat") == value
+
+    async def test_reads_legacy_json_value(self, fake_redis):
+        """Test entries written by the JSON-text format are still served."""
+        fake_redis.store["github_profile:octocat"] = json.dumps({"login": "octocat"})
+
+        assert await get_cache("github_profile:octocat") == {"login": "octocat"}
@@ -0,0 +1,110 @@
+"""Tests for the single-pass commit analysis pipeline."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services.github.github_commit_service import CommitAnalysisPipeline, CommitAnalyzer, GitHubCommitService
+
+MESSAGES = [
+    "feat(api): add pagination to the search endpoint",
+    "fix: handle empty payloads in the webhook parser",
+    "refactor(db): split the repository layer for performance",
+    "docs: update README",
+    "perf: cache redis lookups\n\nBREAKING CHANGE: cache keys changed",
+    "Merge branch 'main'",
+]
+
+
+def make_commits(count: int, seed: int = 5) -> list:
+    """Build ``count`` commits across a few repositories and dates."""
+    rng = random.Random(seed)
+    return [
+        {
+            "message": rng.choice(MESSAGES),
+            "date": f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00Z",
+            "files_changed": rng.choice([0, 2, 8, 25]),
+            "repository": f"repo-{rng.randint(0, 3)}",
+            "sha": f"{i:040x}",
+        }
+        for i in range(count)
+    ]
+
+
+class TestCommitAnalysisPipeline:
+    """Tests for CommitAnalysisPipeline."""
+
+    def test_batches_match_one_pass(self):
+        """Test feeding commits in batches gives the same analysis as feeding them at once."""
+        service = GitHubCommitService()
+        commits = make_commits(60)
+
+        pipeline = CommitAnalysisPipeline(service)
+        for start in range(0, len(commits), 7):
+            pipeline.add(commits[start : start + 7])
+
+        assert pipeline.finalize() == service._perform_commit_analysis(commits)
+
+    def test_each_message_is_parsed_once(self):
+        """Test conventional parsing runs once per commit although several analyzers read it."""
+        service = GitHubCommitService()
+        service._parse_conventional_commit = MagicMock(wraps=service._parse_conventional_commit)
+        commits = make_commits(40)
+
+        analysis = service._perform_commit_analysis(commits)
+
+        assert service._parse_conventional_commit.call_count == 40
+        assert analysis["total_commits_analyzed"] == 40
+        assert analysis["impact_analysis"]["high_impact_commits"]
+        assert analysis["conventional_commit_analysis"]["stats"]["conventional_commits"] > 0
+
+    def test_no_commits_is_the_empty_analysis(self):
+        """Test an empty pipeline finalizes to the empty analysis."""
+        service = GitHubCommitService()
+
+        assert CommitAnalysisPipeline(service).finalize() == service._empty_commit_analysis()
+
+    def test_incomplete_analyzer_fails_when_created(self):
+        """Test an analyzer without finalize can't be created, rather than failing mid-analysis."""
+
+        class CountingAnalyzer(CommitAnalyzer):
+            def update(self, facts):
+                pass
+
+        with pytest.raises(TypeError):
+            CountingAnalyzer()
+
+    async def test_batches_are_analyzed_while_the_next_is_fetched(self, monkeypatch):
+        """Test a batch is analyzed after the next batch's requests are sent and before they return."""
+        monkeypatch.setattr(settings, "GITHUB_COMMIT_STATS_MODE", "rest")
+        events = []
+
+        async def get_repo_commits(repo_full_name, author, max_items):
+            events.append(f"fetch {repo_full_name}")
+            await asyncio.sleep(0.01)
+            events.append(f"done {repo_full_name}")
+            return [{"sha": f"{len(events):040x}", "commit": {"message": "fix: bug", "author": {"date": "2024-01-01T00:00:00Z"}}}]
+
+        original_add = CommitAnalysisPipeline.add
+
+        def add(pipeline, commits):
+            commits = list(commits)
+            if commits:
+                events.append(f"analyze {len(commits)}")
+            original_add(pipeline, commits)
+
+        monkeypatch.setattr(CommitAnalysisPipeline, "add", add)
+        service = GitHubCommitService()
+        service.github_client = MagicMock(get_repo_commits=get_repo_commits)
+        service._fetch_commit_stats = AsyncMock(return_value={})
+        repositories = [{"name": f"repo-{i}", "full_name": f"octocat/repo-{i}"} for i in range(10)]
+
+        analysis = await service.analyze_contributor_commits("octocat", repositories, max_commits=100)
+
+        assert analysis["total_commits_analyzed"] == 10
+        first_batch_analyzed = events.index("analyze 5")
+        assert events.index("fetch octocat/repo-5") < first_batch_analyzed < events.index("done octocat/repo-5")
+        assert events[-1] == "analyze 5"
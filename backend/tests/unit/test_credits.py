@@ -0,0 +1,138 @@
+"""Tests for atomic credit deduction and credit reservations."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import and_
+
+import app.core.dependencies
+from app.core.dependencies import generation_credit, increment_generation_count
+from app.models.user import User
+
+
+def make_user(credits: int = 3, subscription_tier: str = "free") -> User:
+    """Build a detached user with the fields credit checks read."""
+    return User(id=1, username="octocat", credits=credits, recommendation_count=0, role="free", subscription_tier=subscription_tier, subscription_status="active")
+
+
+def returned_row(credits: int, recommendation_count: int) -> MagicMock:
+    """Result of an UPDATE ... RETURNING credits, recommendation_count that matched a row."""
+    return MagicMock(one_or_none=MagicMock(return_value=SimpleNamespace(credits=credits, recommendation_count=recommendation_count)))
+
+
+def set_values(statement) -> dict:
+    """Map each column an UPDATE sets to the expression it is set to.
+
+    Compared structurally rather than as rendered SQL, which varies between SQLAlchemy versions.
+    """
+    return {column.key: value for column, value in statement._values.items()}
+
+
+def sets(statement, column: str, expression) -> bool:
+    """Whether ``statement`` sets ``column`` to ``expression``."""
+    value = set_values(statement).get(column)
+    return value is not None and value.compare(expression)
+
+
+@pytest.fixture
+def reservation_session(monkeypatch, counting_session):
+    """Serve the short reservation transactions from the counting session."""
+    monkeypatch.setattr(app.core.dependencies, "AsyncSessionLocal", lambda: counting_session)
+    return counting_session
+
+
+class TestAtomicDeduction:
+    """Tests for increment_generation_count."""
+
+    async def test_deducts_with_one_conditional_update(self, counting_session):
+        """Test the credit is spent by a single guarded UPDATE ... RETURNING, not a read-modify-write."""
+        counting_session.results.append(returned_row(credits=2, recommendation_count=1))
+        user = make_user()
+
+        await increment_generation_count(user, SimpleNamespace(), counting_session)
+
+        statement = counting_session.statements[0]
+        assert statement.table.name == "users"
+        assert sets(statement, "credits", User.credits - 1)
+        assert sets(statement, "recommendation_count", User.recommendation_count + 1)
+        assert statement.whereclause.compare(and_(User.id == 1, User.credits > 0))
+        assert [column.key for column in statement._returning] == ["credits", "recommendation_count"]
+        assert (user.credits, user.recommendation_count) == (2, 1)
+        assert counting_session.counts["execute"] == 1
+        assert counting_session.counts["flush"] == 0
+
+    async def test_no_row_updated_is_429(self, counting_session):
+        """Test losing the race for the last credit is a 429 rather than a negative balance."""
+        counting_session.results.append(MagicMock(one_or_none=MagicMock(return_value=None)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await increment_generation_count(make_user(credits=1), SimpleNamespace(), counting_session)
+
+        assert exc_info.value.status_code == 429
+
+    async def test_unlimited_users_only_count(self, counting_session):
+        """Test unlimited subscribers are counted without touching credits."""
+        counting_session.results.append(returned_row(credits=0, recommendation_count=1))
+
+        await increment_generation_count(make_user(credits=0, subscription_tier="unlimited"), SimpleNamespace(), counting_session)
+
+        statement = counting_session.statements[0]
+        assert sets(statement, "recommendation_count", User.recommendation_count + 1)
+        assert "credits" not in set_values(statement)
+
+
+class TestGenerationCredit:
+    """Tests for the reserve/confirm/release credit flow."""
+
+    async def test_success_reserves_then_confirms(self, reservation_session, counting_session):
+        """Test a successful generation commits the reservation and counts the generation in the request."""
+        counting_session.results.extend([returned_row(credits=2, recommendation_count=0), returned_row(credits=2, recommendation_count=1)])
+        user = make_user()
+
+        async with generation_credit(user, SimpleNamespace(), counting_session):
+            assert user.credits == 2
+
+        reserve, confirm = counting_session.statements
+        assert sets(reserve, "credits", User.credits - 1)
+        assert "credits" not in set_values(confirm)
+        # The reservation's own transaction, then the confirmation inside the context
+        assert counting_session.counts["commit"] == 2
+        assert user.recommendation_count == 1
+
+    async def test_failure_refunds_the_credit(self, reservation_session, counting_session):
+        """Test a failed generation refunds the reserved credit and re-raises."""
+        counting_session.results.extend([returned_row(credits=2, recommendation_count=0), returned_row(credits=3, recommendation_count=0)])
+        user = make_user()
+
+        with pytest.raises(RuntimeError):
+            async with generation_credit(user, SimpleNamespace(), counting_session):
+                raise RuntimeError("AI service unavailable")
+
+        assert sets(counting_session.statements[1], "credits", User.credits + 1)
+        assert counting_session.counts["commit"] == 2
+        assert (user.credits, user.recommendation_count) == (3, 0)
+
+    async def test_failed_commit_refunds_the_credit(self, reservation_session, counting_session):
+        """Test a generation whose writes fail to commit refunds the reserved credit."""
+        counting_session.results.extend([returned_row(credits=2, recommendation_count=0), returned_row(credits=2, recommendation_count=1), returned_row(credits=3, recommendation_count=1)])
+        commit = counting_session.commit
+        commits = 0
+
+        async def commit_fails_after_reservation():
+            nonlocal commits
+            commits += 1
+            await commit()
+            if commits == 2:
+                raise RuntimeError("duplicate key value violates unique constraint")
+
+        counting_session.commit = commit_fails_after_reservation
+        user = make_user()
+
+        with pytest.raises(RuntimeError):
+            async with generation_credit(user, SimpleNamespace(), counting_session):
+                pass
+
+        assert sets(counting_session.statements[2], "credits", User.credits + 1)
+        assert user.credits == 3
@@ -0,0 +1,133 @@
+"""Tests for dependency manifest discovery and caching in GitHubUserService."""
+
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.github.github_api_client import GitHubAPIClient
+from app.services.github.github_commit_service import GitHubCommitService
+from app.services.github.github_user_service import GitHubUserService, find_dependency_manifests
+
+BASE_URL = "https://api.github.test"
+
+FILES = {
+    "requirements.txt": "fastapi==0.116.1\nredis>=5.0\n# comment\n",
+    "package.json": json.dumps({"dependencies": {"react": "^18.0.0"}, "devDependencies": {"@types/node": "^20"}}),
+    "README.md": "# Widgets\n",
+    "yarn.lock": "# lockfile\n",
+}
+
+
+def tree_payload(sha: str) -> dict:
+    """Build a root tree listing holding ``FILES`` and a ``src`` directory."""
+    entries = [{"path": path, "type": "blob"} for path in FILES] + [{"path": "src", "type": "tree"}]
+    return {"sha": sha, "tree": entries, "truncated": False}
+
+
+def make_service(tree_sha: str, requests: list) -> GitHubUserService:
+    """Build a user service whose GitHub client serves ``FILES`` and records request paths."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requests.append(path)
+        if path == "/repos/acme/widgets/git/trees/HEAD":
+            return httpx.Response(200, json=tree_payload(tree_sha))
+        filename = path.removeprefix("/repos/acme/widgets/contents/")
+        if filename in FILES:
+            return httpx.Response(200, json={"type": "file", "encoding": "base64", "content": base64.b64encode(FILES[filename].encode()).decode()})
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    service = GitHubUserService(GitHubCommitService())
+    service.github_client = GitHubAPIClient("ghp_test", base_url=BASE_URL, max_concurrent_requests=4, transport=httpx.MockTransport(handler))
+    return service
+
+
+class TestFindDependencyManifests:
+    """Tests for find_dependency_manifests."""
+
+    def test_keeps_parsed_manifests_in_priority_order(self):
+        """Test only files the parser understands are selected, and directories are skipped."""
+        entries = [{"path": "package.json", "type": "blob"}, {"path": "Gemfile", "type": "tree"}, {"path": "poetry.lock", "type": "blob"}, {"path": "requirements.txt", "type": "blob"}]
+
+        assert find_dependency_manifests(entries) == [("requirements.txt", "python"), ("package.json", "javascript")]
+
+
+class TestFetchDependencyData:
+    """Tests for GitHubUserService._fetch_dependency_data."""
+
+    async def test_fetches_only_existing_manifests(self, fake_redis):
+        """Test the tree is listed once and no request is made for a missing manifest."""
+        requests: list = []
+        service = make_service("tree-1", requests)
+
+        dependencies = await service._fetch_dependency_data({"name": "widgets", "full_name": "acme/widgets"})
+        await service.github_client.aclose()
+
+        assert dependencies == ["fastapi", "node", "react", "redis"]
+        assert requests[0] == "/repos/acme/widgets/git/trees/HEAD"
+        assert sorted(requests[1:]) == ["/repos/acme/widgets/contents/package.json", "/repos/acme/widgets/contents/requirements.txt"]
+
+    async def test_unchanged_tree_is_served_from_cache(self, fake_redis):
+        """Test a second call for the same tree sha only lists the tree, and a new sha re-fetches."""
+        requests: list = []
+        service = make_service("tree-2", requests)
+        repo_data = {"name": "widgets", "full_name": "acme/widgets"}
+
+        first = await service._fetch_dependency_data(repo_data)
+        requests.clear()
+        second = await service._fetch_dependency_data(repo_data)
+        cached_requests = list(requests)
+
+        requests.clear()
+        changed = make_service("tree-3", requests)
+        await changed._fetch_dependency_data(repo_data)
+        await service.github_client.aclose()
+        await changed.github_client.aclose()
+
+        assert second == first
+        assert cached_requests == ["/repos/acme/widgets/git/trees/HEAD"]
+        assert len(requests) == 3
+
+    async def test_top_repositories_feed_skill_extraction(self, fake_redis):
+        """Test profile analysis attaches dependencies to its top repositories and extract_skills reads them."""
+        requests: list = []
+        service = make_service("tree-4", requests)
+        repositories = [{"name": "widgets", "full_name": "acme/widgets"}] + [{"name": f"repo-{i}", "full_name": f"acme/repo-{i}"} for i in range(GitHubUserService.DEPENDENCY_REPOSITORY_LIMIT)]
+
+        await service._attach_dependencies(repositories)
+        await service.github_client.aclose()
+        skills = service.profile_analysis_service.extract_skills({}, repositories)
+
+        assert repositories[0]["dependencies"] == ["fastapi", "node", "react", "redis"]
+        assert all("dependencies" not in repo for repo in repositories[1:])
+        assert "/repos/acme/repo-3/git/trees/HEAD" in requests
+        assert "/repos/acme/repo-4/git/trees/HEAD" not in requests
+        assert skills["dependencies_found"] == ["fastapi", "node", "react", "redis"]
+        assert "React" in skills["frameworks"]
+
+
+class TestDependencyScanSetting:
+    """Tests for the GITHUB_DEPENDENCY_SCAN setting."""
+
+    @pytest.mark.parametrize("enabled", [False, True])
+    async def test_profile_analysis_scans_only_when_enabled(self, fake_redis, monkeypatch, enabled):
+        """Test profile analysis fetches dependency manifests only when the setting is on."""
+        monkeypatch.setattr(settings, "GITHUB_DEPENDENCY_SCAN", enabled)
+        service = GitHubUserService(MagicMock())
+        service.github_client = MagicMock()
+        service._fetch_graphql_bundle = AsyncMock(return_value=None)
+        service._get_user_data = AsyncMock(return_value={"github_username": "octocat"})
+        service._get_repositories = AsyncMock(return_value=[{"name": "widgets", "full_name": "acme/widgets"}])
+        service._analyze_languages = AsyncMock(return_value=[])
+        service._fetch_dependency_data = AsyncMock(return_value=["react"])
+        service.commit_service.analyze_contributor_commits = AsyncMock(return_value={})
+        service.commit_service.fetch_user_pull_requests_across_repos = AsyncMock(return_value={})
+
+        analysis = await service.analyze_github_profile("octocat", force_refresh=True)
+
+        assert service._fetch_dependency_data.await_count == int(enabled)
+        assert ("React" in analysis["skills"]["frameworks"]) is enabled
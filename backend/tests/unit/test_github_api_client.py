@@ -0,0 +1,183 @@
+"""Tests for the async GitHub API client."""
+
+import asyncio
+import base64
+import json
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import GitHubAPIError
+from app.services.github.github_api_client import GitHubAPIClient, normalize_timestamp
+from app.services.github.github_commit_service import GitHubCommitService
+
+BASE_URL = "https://api.github.test"
+
+
+def make_client(handler) -> GitHubAPIClient:
+    """Build a client whose requests are served by ``handler``."""
+    return GitHubAPIClient("ghp_test", base_url=BASE_URL, max_concurrent_requests=4, transport=httpx.MockTransport(handler))
+
+
+class TestGitHubAPIClient:
+    """Tests for GitHubAPIClient."""
+
+    async def test_sends_auth_and_version_headers(self):
+        """Test every request carries the token and API version."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.update(request.headers)
+            return httpx.Response(200, json={"login": "octocat"})
+
+        client = make_client(handler)
+        user = await client.get_user("octocat")
+        await client.aclose()
+
+        assert user["login"] == "octocat"
+        assert seen["authorization"] == "Bearer ghp_test"
+        assert seen["x-github-api-version"] == "2022-11-28"
+        assert seen["accept"] == "application/vnd.github+json"
+
+    async def test_paginate_follows_link_header(self):
+        """Test pagination follows rel=next links and honours max_items."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            headers = {}
+            if page < 3:
+                headers["Link"] = f'<{BASE_URL}/users/octocat/starred?per_page=2&page={page + 1}>; rel="next"'
+            return httpx.Response(200, json=[{"id": page * 10 + i} for i in range(2)], headers=headers)
+
+        client = make_client(handler)
+        items = await client.paginate("/users/octocat/starred", max_items=5)
+        await client.aclose()
+
+        assert [item["id"] for item in items] == [10, 11, 20, 21, 30]
+        assert client.request_count == 3
+
+    async def test_error_response_raises_github_api_error(self):
+        """Test non-success responses surface status code and rate-limit details."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(403, json={"message": "API rate limit exceeded"}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000000"})
+
+        client = make_client(handler)
+        with pytest.raises(GitHubAPIError) as exc_info:
+            await client.get_repo("octocat/hello-world")
+        await client.aclose()
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.details["rate_limit_remaining"] == 0
+        assert exc_info.value.details["rate_limit_reset"] == 1700000000
+
+    async def test_get_file_text_decodes_content(self):
+        """Test file contents are base64-decoded."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            content = base64.b64encode(b"fastapi==0.116.1\n").decode()
+            return httpx.Response(200, json={"type": "file", "encoding": "base64", "content": content})
+
+        client = make_client(handler)
+        text = await client.get_file_text("octocat/hello-world", "requirements.txt")
+        await client.aclose()
+
+        assert text == "fastapi==0.116.1\n"
+
+    def test_normalize_timestamp(self):
+        """Test GitHub timestamps match datetime.isoformat() output."""
+        assert normalize_timestamp("2024-01-02T03:04:05Z") == "2024-01-02T03:04:05+00:00"
+        assert normalize_timestamp(None) is None
+
+
+class TestCommitServiceWithAPIClient:
+    """Tests for commit fetching on top of the async client."""
+
+    async def test_contributor_commits_fall_back_to_full_name(self):
+        """Test a 404 on the contributor-owned name falls back to the repository full name."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.startswith("/repos/octocat/"):
+                return httpx.Response(404, json={"message": "Not Found"})
+            if path == "/repos/acme/widgets/commits":
+                assert request.url.params["author"] == "octocat"
+                return httpx.Response(200, json=[{"sha": "abc", "commit": {"message": "feat: add widget", "author": {"date": "2024-01-01T00:00:00Z"}}}])
+            if path == "/repos/acme/widgets/commits/abc":
+                return httpx.Response(200, json={"sha": "abc", "files": [{"filename": "a.py"}, {"filename": "b.py"}]})
+            return httpx.Response(500)
+
+        service = GitHubCommitService()
+        service.github_client = make_client(handler)
+
+        commits = await service._fetch_contributor_commits_async(asyncio.Semaphore(1), "octocat", {"name": "widgets", "full_name": "acme/widgets"}, 10)
+        await service.github_client.aclose()
+
+        assert commits == [
+            {
+                "message": "feat: add widget",
+                "date": "2024-01-01T00:00:00+00:00",
+                "repository": "widgets",
+                "repository_full_name": "acme/widgets",
+                "sha": "abc",
+                "files_changed": 2,
+                "contributor": "octocat",
+            }
+        ]
+
+
+class TestCommitStatsModes:
+    """Tests for GITHUB_COMMIT_STATS_MODE commit collection."""
+
+    @staticmethod
+    def make_service(calls: list) -> GitHubCommitService:
+        """Build a commit service backed by a fake repository with three commits."""
+        messages = ["feat!: redesign the public api for performance and security", "docs: typo", "chore: bump deps"]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path == "/graphql":
+                variables = json.loads(request.content)["variables"]
+                nodes = {f"c{key[3:]}": {"additions": 5, "deletions": 1, "changedFilesIfAvailable": 7} for key in variables if key.startswith("oid")}
+                return httpx.Response(200, json={"data": {"repository": nodes}})
+            if request.url.path == "/repos/octocat/app/commits":
+                return httpx.Response(200, json=[{"sha": f"sha{i}", "commit": {"message": message, "author": {"date": None}}} for i, message in enumerate(messages)])
+            return httpx.Response(200, json={"sha": request.url.path.rsplit("/", 1)[-1], "stats": {"additions": 5, "deletions": 1}, "files": [{}] * 7})
+
+        service = GitHubCommitService()
+        service.github_client = make_client(handler)
+        return service
+
+    @pytest.mark.parametrize(
+        ("mode", "expected_detail_calls", "expected_graphql_calls"),
+        [("rest", 3, 0), ("graphql", 0, 1), ("lazy", 1, 0)],
+    )
+    async def test_api_calls_per_mode(self, monkeypatch, mode, expected_detail_calls, expected_graphql_calls):
+        """Test each mode's request budget for one repository."""
+        monkeypatch.setattr(settings, "GITHUB_COMMIT_STATS_MODE", mode)
+        monkeypatch.setattr(settings, "GITHUB_COMMIT_STATS_LAZY_LIMIT", 1)
+        calls: list = []
+        service = self.make_service(calls)
+
+        analysis = await service.analyze_contributor_commits("octocat", [{"name": "app", "full_name": "octocat/app"}], max_commits=3)
+        await service.github_client.aclose()
+
+        assert analysis["total_commits_analyzed"] == 3
+        assert sum(1 for path in calls if path.startswith("/repos/octocat/app/commits/")) == expected_detail_calls
+        assert calls.count("/graphql") == expected_graphql_calls
+
+    async def test_lazy_mode_enriches_top_ranked_commit(self, monkeypatch):
+        """Test lazy mode fills file counts only for the highest-ranked commit."""
+        monkeypatch.setattr(settings, "GITHUB_COMMIT_STATS_MODE", "lazy")
+        monkeypatch.setattr(settings, "GITHUB_COMMIT_STATS_LAZY_LIMIT", 1)
+        service = self.make_service([])
+        commits = [
+            {"sha": "sha0", "message": "feat!: redesign the public api for performance and security", "repository_full_name": "octocat/app", "files_changed": 0},
+            {"sha": "sha1", "message": "docs: typo", "repository_full_name": "octocat/app", "files_changed": 0},
+        ]
+
+        await service._enrich_high_impact_commits(commits)
+        await service.github_client.aclose()
+
+        assert [commit["files_changed"] for commit in commits] == [7, 0]
@@ -0,0 +1,155 @@
+"""Tests for the GitHub GraphQL batch fetcher."""
+
+import json
+
+import httpx
+
+from app.services.github.github_api_client import GitHubAPIClient
+from app.services.github.github_graphql_service import GitHubGraphQLService
+
+REPO = {
+    "name": "widgets",
+    "nameWithOwner": "octocat/widgets",
+    "description": "Widget toolkit",
+    "primaryLanguage": {"name": "Python"},
+    "stargazerCount": 42,
+    "forkCount": 3,
+    "diskUsage": 512,
+    "createdAt": "2023-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+    "url": "https://github.com/octocat/widgets",
+    "isPrivate": False,
+    "repositoryTopics": {"nodes": [{"topic": {"name": "fastapi"}}]},
+}
+
+USER = {
+    "id": "U_1",
+    "databaseId": 1,
+    "login": "octocat",
+    "name": "The Octocat",
+    "bio": None,
+    "company": "@github",
+    "location": "San Francisco",
+    "email": "",
+    "websiteUrl": "https://github.blog",
+    "avatarUrl": "https://avatars.githubusercontent.com/u/1",
+    "createdAt": "2011-01-25T18:44:36Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+    "followers": {"totalCount": 10},
+    "following": {"totalCount": 2},
+    "gists": {"totalCount": 8},
+    "publicRepositories": {"totalCount": 5},
+    "repositories": {"nodes": [REPO]},
+    "starredRepositories": {"nodes": []},
+    "organizations": {"nodes": []},
+    "pullRequests": {
+        "nodes": [
+            {
+                "number": 7,
+                "title": "Add caching",
+                "body": "Adds a cache",
+                "state": "MERGED",
+                "createdAt": "2024-01-02T00:00:00Z",
+                "mergedAt": "2024-01-03T00:00:00Z",
+                "additions": 10,
+                "deletions": 2,
+                "changedFiles": 3,
+                "comments": {"totalCount": 1},
+                "reviewThreads": {"totalCount": 2},
+                "labels": {"nodes": [{"name": "enhancement"}]},
+                "repository": {"name": "widgets", "nameWithOwner": "octocat/widgets"},
+            },
+            {
+                "number": 99,
+                "title": "Fix typo elsewhere",
+                "body": None,
+                "state": "OPEN",
+                "createdAt": "2024-01-04T00:00:00Z",
+                "mergedAt": None,
+                "additions": 1,
+                "deletions": 1,
+                "changedFiles": 1,
+                "comments": {"totalCount": 0},
+                "reviewThreads": {"totalCount": 0},
+                "labels": {"nodes": []},
+                "repository": {"name": "other", "nameWithOwner": "someone/other"},
+            },
+        ]
+    },
+}
+
+HISTORY = {
+    "r0": {
+        "defaultBranchRef": {
+            "target": {
+                "history": {
+                    "nodes": [
+                        {"oid": "abc", "message": "feat: add cache", "committedDate": "2024-01-02T00:00:00Z", "additions": 10, "deletions": 2, "changedFilesIfAvailable": 3},
+                    ]
+                }
+            }
+        }
+    }
+}
+
+
+class TestGitHubGraphQLService:
+    """Tests for GitHubGraphQLService."""
+
+    async def test_fetch_profile_bundle_maps_rest_shapes_in_two_queries(self):
+        """Test a full profile bundle comes back in two GraphQL requests with REST-compatible shapes."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            if "user(login:" in body["query"]:
+                return httpx.Response(200, json={"data": {"user": USER}})
+            assert body["variables"]["authorId"] == "U_1"
+            return httpx.Response(200, json={"data": HISTORY})
+
+        service = GitHubGraphQLService()
+        service.github_client = GitHubAPIClient("ghp_test", base_url="https://api.github.test", transport=httpx.MockTransport(handler))
+
+        bundle = await service.fetch_profile_bundle("octocat", max_repositories=10)
+        await service.github_client.aclose()
+
+        assert len(requests) == 2
+        assert bundle["user_data"]["github_id"] == 1
+        assert bundle["user_data"]["public_repos"] == 5
+        assert bundle["user_data"]["email"] is None
+        assert bundle["repositories"] == [
+            {
+                "name": "widgets",
+                "full_name": "octocat/widgets",
+                "description": "Widget toolkit",
+                "language": "Python",
+                "stars": 42,
+                "forks": 3,
+                "size": 512,
+                "created_at": "2023-01-01T00:00:00+00:00",
+                "updated_at": "2024-01-01T00:00:00+00:00",
+                "topics": ["fastapi"],
+                "url": "https://github.com/octocat/widgets",
+                "clone_url": "https://github.com/octocat/widgets.git",
+                "is_private": False,
+            }
+        ]
+        assert bundle["commits"][0]["files_changed"] == 3
+        assert bundle["commits"][0]["repository_full_name"] == "octocat/widgets"
+        # Only PRs in the analyzed repositories are kept, and MERGED maps to REST's "closed"
+        assert [pr["number"] for pr in bundle["pull_requests"]] == [7]
+        assert bundle["pull_requests"][0]["state"] == "closed"
+        assert bundle["pull_requests"][0]["merged_at"] == "2024-01-03T00:00:00+00:00"
+
+    async def test_missing_user_returns_none(self):
+        """Test an unknown login yields no bundle so callers fall back to REST."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": {"user": None}, "errors": [{"message": "Could not resolve to a User"}]})
+
+        service = GitHubGraphQLService()
+        service.github_client = GitHubAPIClient("ghp_test", base_url="https://api.github.test", transport=httpx.MockTransport(handler))
+
+        assert await service.fetch_profile_bundle("nobody") is None
+        await service.github_client.aclose()
@@ -0,0 +1,59 @@
+"""Tests for the compiled keyword taxonomy and the commit analyzers built on it."""
+
+import random
+
+from app.core.keyword_taxonomy import KeywordTaxonomy
+from app.services.github.github_commit_service import COMMIT_KEYWORDS, GitHubCommitService
+
+ALL_KEYWORDS = {keyword for categories in COMMIT_KEYWORDS.groups.values() for keywords in categories.values() for keyword in keywords}
+
+
+class TestKeywordTaxonomy:
+    """Tests for KeywordTaxonomy matching."""
+
+    def test_matches_like_substring_search(self):
+        """Test every keyword found by ``in`` is found by the scan, including overlapping ones."""
+        rng = random.Random(7)
+        vocabulary = sorted(ALL_KEYWORDS) + ["the", "of", "widget", "n+", "trade", "-"]
+        messages = [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 8))) for _ in range(500)]
+        messages += ["fix: testing authentication", "add pub/sub via rabbitmq", "tradeoff vs trade-off", "quickfixes", ""]
+
+        for message in messages:
+            assert COMMIT_KEYWORDS.keywords_in(message) == {keyword for keyword in ALL_KEYWORDS if keyword in message}, message
+
+    def test_classify_groups_hits_by_category(self):
+        """Test hits are reported per group and category, and matching ignores case."""
+        taxonomy = KeywordTaxonomy({"areas": {"testing": ["test", "testing"], "docs": ["doc"]}, "other": {"never": ["zzz"]}})
+
+        assert taxonomy.classify("Add Testing docs") == {"areas": {"testing": {"test", "testing"}, "docs": {"doc"}}, "other": {}}
+
+
+class TestCommitAnalyzers:
+    """Tests that the commit analyzers keep their results on the shared taxonomy."""
+
+    def test_tools_are_listed_by_first_mention(self):
+        """Test tools are listed by first mention, in category order within a message."""
+        commits = [{"message": message, "date": None, "files_changed": 0, "repository": "app"} for message in ["move from mysql to postgres", "add redis cache", "postgres tuning"]]
+
+        result = GitHubCommitService()._perform_commit_analysis(commits)["tools_and_features"]
+
+        assert result["tools_by_category"] == {"databases": ["sql", "postgres", "mysql", "redis"]}
+
+    def test_technical_patterns_count_each_keyword(self):
+        """Test technical focus counts every matching keyword in every message."""
+        patterns = GitHubCommitService()._extract_technical_patterns(["Fix race condition in Thread pool", "Add unit test"])
+
+        assert "Bug Fixing: 1 contributions" in patterns
+        assert "Testing: 2 contributions" in patterns
+        assert "Features: 1 contributions" in patterns
+        assert "Concurrency: 2 instances" in patterns
+
+    def test_pr_problem_solving(self):
+        """Test PR discussion is read from title and body, problem types from the title only."""
+        prs = [{"title": "Fix crash in parser", "body": "Considered a rewrite vs a patch"}, {"title": "Docs", "body": "new architecture notes"}]
+
+        result = GitHubCommitService()._analyze_pr_problem_solving(prs)
+
+        assert result["architectural_decisions"] == 1
+        assert result["trade_offs_discussed"] == 1
+        assert result["problem_types"] == ["bug_fix"]
@@ -0,0 +1,98 @@
+"""Tests for the in-process L1 cache in front of Redis."""
+
+import json
+import time
+from collections import Counter, defaultdict
+
+import pytest
+
+import app.core.redis_client as redis_client
+from app.core.local_cache import LocalCache
+from app.core.redis_client import delete_cache, get_cache, get_cache_stats, handle_invalidation_message, set_cache
+
+
+class TestLocalCache:
+    """Tests for LocalCache bounds."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test the entry limit evicts the least recently read entry."""
+        cache = LocalCache(max_entries=2, max_bytes=1000, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_byte_budget_is_enforced(self):
+        """Test value sizes are accounted and oversized values are rejected."""
+        cache = LocalCache(max_entries=10, max_bytes=10, ttl=60)
+        cache.set("a", "x" * 6)
+        cache.set("b", "y" * 6)
+
+        assert cache.get("a") is None
+        assert cache.current_bytes == 6
+        assert cache.set("big", "z" * 11) is False
+        assert cache.current_bytes == 6
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are dropped after the shorter of their TTL and the cache TTL."""
+        cache = LocalCache(max_entries=10, max_bytes=1000, ttl=60)
+        now = time.monotonic()
+        cache.set("short", "1", ttl=5)
+        cache.set("long", "2", ttl=3600)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+        assert cache.get("short") is None
+        assert cache.get("long") == "2"
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+        assert cache.get("long") is None
+        assert cache.current_bytes == 0
+
+
+@pytest.fixture
+def two_tier(fake_redis, monkeypatch):
+    """Enable an L1 cache over the fake Redis with fresh counters."""
+    monkeypatch.setattr(redis_client, "local_cache", LocalCache(max_entries=100, max_bytes=1_000_000, ttl=60))
+    monkeypatch.setattr(redis_client, "_cache_stats", defaultdict(Counter))
+    return fake_redis
+
+
+class TestTwoTierCache:
+    """Tests for get_cache/set_cache/delete_cache with the L1 enabled."""
+
+    async def test_reads_are_served_from_l1(self, two_tier):
+        """Test repeat reads skip Redis and return independent copies."""
+        two_tier.store["github:repo_info:octocat/app"] = json.dumps({"name": "app"})
+
+        first = await get_cache("github:repo_info:octocat/app")
+        del two_tier.store["github:repo_info:octocat/app"]
+        first["name"] = "mutated"
+        second = await get_cache("github:repo_info:octocat/app")
+
+        assert second == {"name": "app"}
+        assert get_cache_stats()["prefixes"]["github:repo_info"] == {"l1_hits": 1, "redis_hits": 1, "misses": 0, "lookups": 2, "hit_rate": 1.0}
+
+    async def test_writes_publish_invalidations(self, two_tier):
+        """Test set_cache and delete_cache notify other workers and keep the local L1 current."""
+        await set_cache("github_profile:octocat", {"version": 1}, ttl=300)
+        assert await get_cache("github_profile:octocat") == {"version": 1}
+
+        await delete_cache("github_profile:octocat")
+
+        assert await get_cache("github_profile:octocat") is None
+        assert [message for _, message in two_tier.published] == [f"{redis_client.INSTANCE_ID}:github_profile:octocat"] * 2
+        assert get_cache_stats()["prefixes"]["github_profile"]["misses"] == 1
+
+    async def test_invalidation_from_another_worker_drops_entry(self, two_tier):
+        """Test a peer's invalidation evicts the L1 entry while our own messages are ignored."""
+        await set_cache("github:user_data:octocat", {"login": "octocat"})
+
+        handle_invalidation_message(f"{redis_client.INSTANCE_ID}:github:user_data:octocat")
+        assert redis_client.local_cache.get("github:user_data:octocat") is not None
+
+        handle_invalidation_message("another-worker:github:user_data:octocat")
+        assert redis_client.local_cache.get("github:user_data:octocat") is None
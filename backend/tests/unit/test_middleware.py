@@ -0,0 +1,111 @@
+"""Tests for the application ASGI middleware."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.exceptions import NotFoundError
+from app.core.middleware import ApplicationMiddleware
+
+
+def make_app() -> FastAPI:
+    """Build an app behind ApplicationMiddleware with ok, failing and streaming endpoints."""
+    app = FastAPI()
+    app.add_middleware(ApplicationMiddleware)
+    release_stream = asyncio.Event()
+    app.state.release_stream = release_stream
+
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+
+    @app.get("/missing")
+    async def missing():
+        raise NotFoundError("Repository", "octocat/app")
+
+    @app.get("/invalid")
+    async def invalid():
+        raise ValueError("bad input")
+
+    @app.get("/events")
+    async def events():
+        async def generate():
+            yield "data: first\n\n"
+            await release_stream.wait()
+            yield "data: second\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    return app
+
+
+def client_for(app: FastAPI) -> AsyncClient:
+    """Build a client that sends requests to ``app`` in-process."""
+    return AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test")
+
+
+class TestApplicationMiddleware:
+    """Tests for ApplicationMiddleware."""
+
+    async def test_adds_request_id_and_security_headers(self):
+        """Test every response carries a request ID and the security headers."""
+        async with client_for(make_app()) as client:
+            response = await client.get("/ok")
+
+        assert response.status_code == 200
+        assert len(response.headers["X-Request-ID"]) == 36
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+
+    @pytest.mark.parametrize(("path", "status_code", "error"), [("/missing", 404, "NOT_FOUND"), ("/invalid", 400, "VALIDATION_ERROR")])
+    async def test_maps_errors_to_json_responses(self, path, status_code, error):
+        """Test exceptions are mapped to error responses that keep the request ID and headers."""
+        async with client_for(make_app()) as client:
+            response = await client.get(path)
+
+        assert response.status_code == status_code
+        assert response.json()["error"] == error
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+    async def test_streams_events_without_buffering(self):
+        """Test SSE chunks are sent on before the stream finishes."""
+        app = make_app()
+        sent: list = []
+        first_chunk = asyncio.Event()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/events",
+            "raw_path": b"/events",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 1234),
+            "server": ("test", 80),
+        }
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body"):
+                first_chunk.set()
+
+        request = asyncio.create_task(app(scope, receive, send))
+        await asyncio.wait_for(first_chunk.wait(), timeout=1)
+        assert not request.done()
+
+        app.state.release_stream.set()
+        await asyncio.wait_for(request, timeout=1)
+
+        headers = dict(sent[0]["headers"])
+        assert b"x-request-id" in headers
+        assert [message["body"] for message in sent[1:] if message.get("body")] == [b"data: first\n\n", b"data: second\n\n"]
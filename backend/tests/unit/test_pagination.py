@@ -0,0 +1,50 @@
+"""Tests for keyset pagination of recommendation history."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.core.dependencies import PaginationParams
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.recommendation.recommendation_service import RecommendationService
+
+
+class TestCursorTokens:
+    """Tests for encode_cursor/decode_cursor."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the position it was built from."""
+        created_at = datetime(2026, 1, 5, 10, 30, 15, 123456, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(datetime(2026, 1, 5), 1)[:-3], "WyJ4Il0"])
+    def test_invalid_cursor_is_rejected(self, cursor):
+        """Test malformed cursors are a 400, not a server error."""
+        with pytest.raises(HTTPException) as exc_info:
+            PaginationParams(page_size=10, cursor=cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestKeysetQuery:
+    """Tests for cursor queries in RecommendationService.get_recommendations."""
+
+    async def test_cursor_seeks_instead_of_offset(self, mock_database_session):
+        """Test a cursor filters on (created_at, id) with a stable order and no OFFSET."""
+        mock_database_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        cursor = (datetime(2026, 1, 5, tzinfo=timezone.utc), 42)
+
+        await RecommendationService().get_recommendations(mock_database_session, user_id=1, limit=11, offset=20, cursor=cursor)
+
+        statement = mock_database_session.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "(recommendations.created_at, recommendations.id) < (" in sql
+        assert "ORDER BY recommendations.created_at DESC, recommendations.id DESC" in sql
+        assert "OFFSET" not in sql
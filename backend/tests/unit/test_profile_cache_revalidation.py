@@ -0,0 +1,68 @@
+"""Tests for stale-while-revalidate profile analysis caching."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+from app.services.github.github_commit_service import GitHubCommitService
+from app.services.github.github_user_service import GitHubUserService
+
+CACHE_KEY = "github_profile:octocat"
+
+
+def cached_analysis(age_seconds: float) -> dict:
+    """Build a cached analysis that was produced ``age_seconds`` ago."""
+    analyzed_at = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return {"user_data": {"github_username": "octocat"}, "analyzed_at": analyzed_at.isoformat(), "version": "cached"}
+
+
+def make_service(monkeypatch, fake_redis) -> tuple[GitHubUserService, list]:
+    """Build a user service whose pipeline records runs and caches a fresh analysis."""
+    service = GitHubUserService(GitHubCommitService())
+    runs: list = []
+
+    async def run_profile_analysis(username, force_refresh, max_repositories, cache_key, progress=None):
+        runs.append(force_refresh)
+        await asyncio.sleep(0.02)
+        analysis = {"user_data": {"github_username": username}, "analyzed_at": datetime.now(timezone.utc).isoformat(), "version": "refreshed"}
+        fake_redis.store[cache_key] = json.dumps(analysis)
+        return analysis
+
+    monkeypatch.setattr(service, "_run_profile_analysis", run_profile_analysis)
+    return service, runs
+
+
+class TestProfileStaleWhileRevalidate:
+    """Tests for soft/hard TTL handling in analyze_github_profile."""
+
+    async def test_fresh_analysis_is_served_without_refresh(self, fake_redis, monkeypatch):
+        """Test analyses younger than the soft TTL are returned as-is."""
+        service, runs = make_service(monkeypatch, fake_redis)
+        fake_redis.store[CACHE_KEY] = json.dumps(cached_analysis(60))
+
+        result = await service.analyze_github_profile("octocat")
+        await asyncio.sleep(0.05)
+
+        assert result["version"] == "cached"
+        assert runs == []
+
+    async def test_stale_analysis_is_served_while_one_refresh_runs(self, fake_redis, monkeypatch):
+        """Test stale hits return immediately and trigger a single deduplicated refresh."""
+        service, runs = make_service(monkeypatch, fake_redis)
+        fake_redis.store[CACHE_KEY] = json.dumps(cached_analysis(GitHubUserService.PROFILE_ANALYSIS_SOFT_TTL + 60))
+
+        results = await asyncio.gather(*(service.analyze_github_profile("octocat") for _ in range(3)))
+
+        assert [result["version"] for result in results] == ["cached"] * 3
+        await asyncio.sleep(0.05)
+        assert runs == [True]
+        assert json.loads(fake_redis.store[CACHE_KEY])["version"] == "refreshed"
+
+    async def test_missing_analysis_blocks_on_fresh_run(self, fake_redis, monkeypatch):
+        """Test a miss past the hard TTL waits for the pipeline."""
+        service, runs = make_service(monkeypatch, fake_redis)
+
+        result = await service.analyze_github_profile("octocat")
+
+        assert result["version"] == "refreshed"
+        assert runs == [False]
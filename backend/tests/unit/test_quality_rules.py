@@ -0,0 +1,59 @@
+"""Tests for the compiled recommendation quality rules and the validators built on them."""
+
+import random
+
+from app.services.ai.ai_recommendation_service import AIRecommendationService
+from app.services.ai.human_story_generator import HumanStoryGenerator
+from app.services.ai.quality_rules import QUALITY_PHRASES, TextProfile, profile_text
+
+ALL_PHRASES = [phrase for categories in QUALITY_PHRASES.values() for phrases in categories.values() for phrase in phrases]
+
+
+class TestTextProfile:
+    """Tests for TextProfile."""
+
+    def test_found_matches_substring_search(self):
+        """Test each category reports exactly the phrases ``in`` finds, in rule order and casing."""
+        rng = random.Random(3)
+        vocabulary = ALL_PHRASES + ["the", "Alex", ".", "\n\n", "I", "go"]
+        texts = [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 60))) for _ in range(300)] + ["I REMEMBER the KPIs and the SHA"]
+
+        for text in texts:
+            profile = TextProfile(text)
+            for group, categories in QUALITY_PHRASES.items():
+                for category, phrases in categories.items():
+                    assert profile.found(group, category) == [phrase for phrase in phrases if phrase.lower() in text.lower()], (group, category, text)
+
+    def test_profile_is_shared_per_text(self):
+        """Test validators of the same option text reuse one scan."""
+        text = "I remember when Alex shipped the Python rewrite.\n\nWe were impressed."
+
+        assert profile_text(text) is profile_text(text)
+        assert profile_text(text).words == text.lower().split()
+        assert profile_text(text).paragraphs == text.split("\n\n")
+
+
+class TestQualityValidators:
+    """Tests that the validators keep their results on the shared rules."""
+
+    def test_generic_content_reports_phrases_in_rule_order(self):
+        """Test detected buzzwords and platitudes are listed in rule order."""
+        text = "Alex is a team player, passionate and dedicated. I highly recommend them; a pleasure to work with."
+
+        result = object.__new__(AIRecommendationService)._detect_generic_content(text)
+
+        assert result["buzzwords_detected"] == ["passionate", "dedicated", "team player"]
+        assert result["linkedin_platitudes_detected"] == ["pleasure to work with", "highly recommend"]
+        assert "No specific technology mentioned" in result["specificity_issues"]
+
+    def test_story_validators_keep_original_casing(self):
+        """Test naturalness and human voice issues quote phrases as written in the rules."""
+        stories = HumanStoryGenerator()
+        text = "Their KPIs looked great. Every SHA was signed."
+
+        naturalness = stories.validate_naturalness(text)
+        human_voice = stories.validate_human_voice(text)
+
+        assert "Contains technical jargon: 'SHA'" in naturalness["issues"]
+        assert "Contains measurement_language: KPIs" in human_voice["issues"]
+        assert human_voice["personal_language_count"] == 0
@@ -0,0 +1,105 @@
+"""Tests for the single round-trip Redis rate limiter."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+import app.core.redis_client as redis_client
+from app.core.config import settings
+from app.core.middleware import ApplicationMiddleware
+from app.core.redis_client import check_rate_limit
+
+
+class FakeRateLimitScript:
+    """Python mirror of RATE_LIMIT_SCRIPT over an in-memory sorted set."""
+
+    def __init__(self, registered_client: "FakeScriptRedis") -> None:
+        self.registered_client = registered_client
+
+    async def __call__(self, keys, args):
+        self.registered_client.calls += 1
+        now, window, limit, member = int(args[0]), int(args[1]), int(args[2]), args[3]
+        entries = self.registered_client.sets.setdefault(keys[0], {})
+        for stale in [m for m, score in entries.items() if score <= now - window]:
+            del entries[stale]
+        allowed = 0
+        if len(entries) < limit:
+            entries[member] = now
+            allowed = 1
+        reset = min(entries.values()) + window if entries else now + window
+        return [allowed, max(limit - len(entries), 0), reset]
+
+
+class FakeScriptRedis:
+    """Redis stand-in that only supports register_script and counts script calls."""
+
+    def __init__(self) -> None:
+        self.sets: dict = {}
+        self.calls = 0
+
+    def register_script(self, script):
+        return FakeRateLimitScript(self)
+
+
+@pytest.fixture
+def script_redis(monkeypatch):
+    """Serve check_rate_limit from a FakeScriptRedis."""
+    fake = FakeScriptRedis()
+
+    async def get_fake_redis():
+        return fake
+
+    monkeypatch.setattr(redis_client, "get_redis", get_fake_redis)
+    monkeypatch.setattr(redis_client, "_rate_limit_script", None)
+    return fake
+
+
+class TestCheckRateLimit:
+    """Tests for check_rate_limit."""
+
+    async def test_burst_in_one_instant_is_counted_per_request(self, script_redis, monkeypatch):
+        """Test requests with the same timestamp each take a slot."""
+        monkeypatch.setattr(redis_client.time, "time", lambda: 1_700_000_000.0)
+
+        results = [await check_rate_limit("203.0.113.9", 3) for _ in range(5)]
+
+        assert [allowed for allowed, _, _ in results] == [True, True, True, False, False]
+        assert [remaining for _, remaining, _ in results] == [2, 1, 0, 0, 0]
+        assert results[-1][2] == 1_700_000_060
+        assert script_redis.calls == 5
+        assert len(script_redis.sets["rate_limit:203.0.113.9"]) == 3
+
+    async def test_fails_open_without_redis(self, monkeypatch):
+        """Test requests are allowed when Redis is unavailable."""
+
+        async def no_redis():
+            return None
+
+        monkeypatch.setattr(redis_client, "get_redis", no_redis)
+
+        allowed, remaining, _ = await check_rate_limit("203.0.113.9", 10)
+
+        assert allowed is True
+        assert remaining == 10
+
+
+class TestRateLimitingMiddleware:
+    """Tests for rate limiting in ApplicationMiddleware."""
+
+    async def test_one_redis_call_per_request_and_headers(self, script_redis, monkeypatch):
+        """Test each request costs one script call and carries the limiter's headers."""
+        monkeypatch.setattr(settings, "ENABLE_RATE_LIMITING", True)
+        app = FastAPI()
+        app.add_middleware(ApplicationMiddleware, requests_per_minute=2)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            responses = [await client.get("/ping") for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 429]
+        assert [response.headers["X-RateLimit-Remaining"] for response in responses] == ["1", "0", "0"]
+        assert int(responses[2].headers["Retry-After"]) >= 1
+        assert script_redis.calls == 3
@@ -0,0 +1,102 @@
+"""Tests for the number and shape of queries RecommendationService issues."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import undefer_group
+
+from app.models.github_profile import GitHubProfile
+from app.models.recommendation import Recommendation
+from app.services.recommendation.recommendation_service import RecommendationService
+
+
+def make_recommendation(recommendation_id: int) -> Recommendation:
+    """Build a detached recommendation with the fields responses read."""
+    now = datetime.now(timezone.utc)
+    return Recommendation(
+        id=recommendation_id,
+        github_profile_id=recommendation_id,
+        title=f"Recommendation {recommendation_id}",
+        content="Great engineer.",
+        recommendation_type="professional",
+        tone="professional",
+        length="medium",
+        word_count=2,
+        ai_model="gemini-2.5-flash-lite",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def compiled_sql(mock_database_session) -> str:
+    """Return the SQL of the only statement executed on the session."""
+    statement = mock_database_session.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestRecommendationQueries:
+    """Tests that recommendation reads fetch usernames in the same query."""
+
+    async def test_listing_runs_one_query(self, mock_database_session):
+        """Test listing 50 recommendations is one query that selects the username and defers heavy columns."""
+        rows = [(make_recommendation(i), f"user{i}") for i in range(1, 51)]
+        mock_database_session.execute.return_value = MagicMock(all=MagicMock(return_value=rows))
+
+        responses = await RecommendationService().get_recommendations(mock_database_session, limit=50)
+
+        assert mock_database_session.execute.await_count == 1
+        assert [response.github_username for response in responses] == [f"user{i}" for i in range(1, 51)]
+        sql = compiled_sql(mock_database_session)
+        assert "github_profiles.github_username" in sql
+        assert "generated_options" not in sql
+        assert "generation_prompt" not in sql
+
+    async def test_get_by_id_runs_one_query(self, mock_database_session):
+        """Test fetching one recommendation joins the profile instead of querying it separately."""
+        mock_database_session.execute.return_value = MagicMock(one_or_none=MagicMock(return_value=(make_recommendation(7), "octocat")))
+
+        response = await RecommendationService().get_recommendation_by_id(mock_database_session, 7)
+
+        assert mock_database_session.execute.await_count == 1
+        assert response.github_username == "octocat"
+        assert "JOIN github_profiles" in compiled_sql(mock_database_session)
+
+    def test_profile_blobs_are_deferred(self):
+        """Test profile lookups skip the analysis blobs unless the group is undeferred."""
+        lookup = str(select(GitHubProfile).compile(dialect=postgresql.dialect()))
+        full = str(select(GitHubProfile).options(undefer_group("analysis")).compile(dialect=postgresql.dialect()))
+
+        assert "github_profiles.github_username" in lookup
+        assert "repositories_data" not in lookup
+        assert "skills_analysis" not in lookup
+        assert "github_profiles.repositories_data" in full
+
+
+class TestGitHubProfileUpsert:
+    """Tests for RecommendationService._get_or_create_github_profile."""
+
+    async def test_upserts_in_one_statement_without_committing(self, mock_database_session):
+        """Test the profile is written with one INSERT ... ON CONFLICT DO UPDATE ... RETURNING."""
+        profile = GitHubProfile(id=3, github_username="octocat", github_id=583231)
+        mock_database_session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=profile))
+        github_data = {
+            "user_data": {"github_username": "octocat", "github_id": 583231, "followers": 10},
+            "repositories": [{"name": "hello-world"}],
+            "languages": [],
+            "skills": {},
+            "analyzed_at": "2026-01-05T10:00:00+00:00",
+        }
+
+        result = await RecommendationService()._get_or_create_github_profile(mock_database_session, github_data)
+
+        assert result is profile
+        assert mock_database_session.execute.await_count == 1
+        mock_database_session.commit.assert_not_awaited()
+        sql = compiled_sql(mock_database_session)
+        assert "ON CONFLICT (github_username) DO UPDATE SET" in sql
+        assert "repositories_data = excluded.repositories_data" in sql
+        assert "github_username = excluded" not in sql
+        assert "RETURNING" in sql
+        assert "created_at" not in sql.split("DO UPDATE")[1].split("RETURNING")[0]
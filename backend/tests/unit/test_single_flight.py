@@ -0,0 +1,90 @@
+"""Tests for single-flight coalescing of expensive analyses."""
+
+import asyncio
+
+from app.core.redis_client import single_flight
+from app.services.github.github_commit_service import GitHubCommitService
+from app.services.github.github_user_service import GitHubUserService
+
+
+class TestSingleFlight:
+    """Tests for single_flight."""
+
+    async def test_concurrent_callers_share_one_computation(self, fake_redis):
+        """Test callers in one process await the same in-flight computation."""
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"login": "octocat"}
+
+        async def read_result():
+            return None
+
+        results = await asyncio.gather(*(single_flight("github_profile:octocat", compute, read_result) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [{"login": "octocat"}] * 5
+        assert fake_redis.store == {}
+
+    async def test_waits_for_lock_held_by_another_worker(self, fake_redis):
+        """Test a caller that loses the lock takes the other worker's cached result."""
+        cache: dict = {}
+        fake_redis.store["single_flight:github_profile:octocat"] = "other-worker"
+
+        async def other_worker_finishes():
+            await asyncio.sleep(0.05)
+            cache["github_profile:octocat"] = {"login": "octocat", "source": "other-worker"}
+            del fake_redis.store["single_flight:github_profile:octocat"]
+
+        async def compute():
+            raise AssertionError("should not recompute while another worker holds the lock")
+
+        async def read_result():
+            return cache.get("github_profile:octocat")
+
+        _, result = await asyncio.gather(other_worker_finishes(), single_flight("github_profile:octocat", compute, read_result))
+
+        assert result == {"login": "octocat", "source": "other-worker"}
+
+    async def test_computes_locally_when_other_worker_left_no_result(self, fake_redis):
+        """Test a failed leader does not leave waiting callers without a result."""
+        fake_redis.store["single_flight:repository:octocat/app"] = "other-worker"
+
+        async def other_worker_fails():
+            await asyncio.sleep(0.02)
+            del fake_redis.store["single_flight:repository:octocat/app"]
+
+        async def compute():
+            return {"repository_info": {"name": "app"}}
+
+        async def read_result():
+            return None
+
+        _, result = await asyncio.gather(other_worker_fails(), single_flight("repository:octocat/app", compute, read_result))
+
+        assert result == {"repository_info": {"name": "app"}}
+
+
+class TestProfileAnalysisSingleFlight:
+    """Tests for single-flight around GitHubUserService.analyze_github_profile."""
+
+    async def test_concurrent_profile_requests_run_one_analysis(self, fake_redis, monkeypatch):
+        """Test concurrent cache misses for one profile run the pipeline once."""
+        service = GitHubUserService(GitHubCommitService())
+        runs = 0
+
+        async def run_profile_analysis(username, force_refresh, max_repositories, cache_key, progress=None):
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.05)
+            return {"user_data": {"github_username": username}}
+
+        monkeypatch.setattr(service, "_run_profile_analysis", run_profile_analysis)
+
+        results = await asyncio.gather(*(service.analyze_github_profile("octocat") for _ in range(3)))
+
+        assert runs == 1
+        assert all(result == {"user_data": {"github_username": "octocat"}} for result in results)
@@ -0,0 +1,92 @@
+"""Tests for the shared skill detector and the skill extraction built on it."""
+
+import json
+
+from app.schemas.github import LanguageStats
+from app.services.analysis.profile_analysis_service import ProfileAnalysisService
+from app.services.analysis.skill_detector import get_skill_detector
+from app.services.github.github_commit_service import GitHubCommitService
+from app.services.github.github_repository_service import GitHubRepositoryService
+
+
+class TestSkillDetector:
+    """Tests for SkillDetector lookups."""
+
+    def test_taxonomy_is_loaded_once(self):
+        """Test the data file is compiled into one shared detector."""
+        assert get_skill_detector() is get_skill_detector()
+        assert "Django" in get_skill_detector().skills("frameworks")
+
+    def test_dependencies_match_by_name_or_leading_segment(self):
+        """Test package names resolve exactly or by their first segment, never by containment."""
+        detector = get_skill_detector()
+
+        assert detector.match_dependency("Django-Filter")["frameworks"] == {"Django"}
+        assert detector.match_dependency("pytest-cov")["tools"] == {"PyTest"}
+        assert detector.match_dependency("gin-gonic/gin")["frameworks"] == {"Gin"}
+        assert detector.match_dependency("core") == {"frameworks": set(), "tools": set(), "domains": set()}
+        assert detector.match_dependency("requests") == {"frameworks": set(), "tools": set(), "domains": set()}
+
+    def test_package_aliases_and_scoped_packages(self):
+        """Test package-only aliases and scoped packages resolve without widening free-text matching."""
+        detector = get_skill_detector()
+
+        assert detector.match_dependency("next")["frameworks"] == {"Next.js", "React"}
+        assert detector.match_dependency("ioredis")["tools"] == {"Redis"}
+        assert detector.match_dependency("@vue/cli")["frameworks"] == {"Vue"}
+        assert detector.match_dependency("@tanstack/react-query")["frameworks"] == {"React"}
+        assert detector.match_dependency("@testing-library/react") == {"frameworks": {"React"}, "tools": {"Jest"}, "domains": set()}
+        assert detector.match_dependency("@angular/core")["frameworks"] == {"Angular"}
+        assert detector.match_dependency("@acme/utils") == {"frameworks": set(), "tools": set(), "domains": set()}
+        assert detector.match_text("Always learning what comes next")["frameworks"] == set()
+
+    def test_text_and_paths_match_substrings(self):
+        """Test free text matches patterns anywhere; paths also match file patterns."""
+        detector = get_skill_detector()
+
+        text = detector.match_text("Realtime dashboards with React and Postgres, deployed on Kubernetes")
+        path = detector.match_path("blog/models.py")
+
+        assert text["frameworks"] == {"React"}
+        assert text["tools"] == {"PostgreSQL", "Kubernetes"}
+        assert path["frameworks"] == {"Django"}
+        assert detector.match_text("blog/models.py")["frameworks"] == set()
+
+
+class TestSkillExtraction:
+    """Tests for the services that extract skills with the shared detector."""
+
+    def test_profile_skills(self):
+        """Test descriptions, dependencies and bio all feed the profile skills."""
+        repositories = [
+            {
+                "name": "shop",
+                "language": "Python",
+                "description": "Storefront on AWS",
+                "dependency_files": [{"filename": "package.json", "content": json.dumps({"dependencies": {"react-dom": "18", "core-js": "3", "@vue/cli": "5"}})}],
+            }
+        ]
+
+        skills = ProfileAnalysisService().extract_skills({"bio": "DevOps lead"}, repositories)
+
+        assert skills["frameworks"] == ["React", "Vue"]
+        assert skills["tools"] == ["AWS"]
+        assert "DevOps" in skills["domains"]
+        assert skills["dependencies_found"] == ["@vue/cli", "core-js", "react-dom"]
+
+    async def test_repository_skills(self):
+        """Test repository skills come from commit messages, file names and the description."""
+        service = GitHubRepositoryService(GitHubCommitService())
+        commits = [
+            {"message": "Add Docker compose for local dev", "files": [{"filename": "blog/views.py"}]},
+            {"message": "fix: django admin", "files": [{"filename": "Dockerfile"}]},
+        ]
+
+        skills = await service._extract_repository_skills(
+            {"name": "blog", "description": "A REST api for blogging"}, [LanguageStats(language="Python", percentage=100.0, lines_of_code=0, repository_count=1)], commits
+        )
+
+        assert skills["frameworks"] == ["Django"]
+        assert skills["tools"] == ["Docker"]
+        assert skills["domains"] == ["API Development"]
+        assert skills["technical_skills"] == ["Python"]
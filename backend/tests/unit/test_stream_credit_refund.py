@@ -0,0 +1,220 @@
+"""Tests for credit refunds on streamed generations."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.api.v1.recommendations as recommendations_api
+import app.core.dependencies as dependencies
+import app.services.ai.ai_recommendation_service as ai_recommendation_module
+from app.core.dependencies import AnonymousUser
+from app.schemas.recommendation import DynamicRefinementRequest
+
+
+@pytest.fixture
+def refunds(monkeypatch) -> list:
+    """Hold credits without touching Redis or the database and record every refund."""
+    released: list = []
+
+    async def release_generation_credit(user):
+        released.append(user)
+
+    monkeypatch.setattr(recommendations_api, "check_recommendation_limit_only", AsyncMock())
+    monkeypatch.setattr(recommendations_api, "reserve_generation_credit", AsyncMock())
+    monkeypatch.setattr(dependencies, "release_generation_credit", release_generation_credit)
+    return released
+
+
+@pytest.fixture
+def stream_sessions(monkeypatch) -> list:
+    """Give each stream a mock session of its own and record them."""
+    sessions: list = []
+
+    def session_factory():
+        session = MagicMock(commit=AsyncMock(), rollback=AsyncMock(), close=AsyncMock())
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(recommendations_api, "AsyncSessionLocal", session_factory)
+    return sessions
+
+
+async def options_stream(user, recommendation_service, db):
+    """Call the options stream endpoint directly, as FastAPI would after resolving dependencies."""
+    return await recommendations_api.generate_recommendation_options_stream(
+        github_username="octocat",
+        recommendation_type="professional",
+        tone="professional",
+        length="medium",
+        custom_prompt=None,
+        target_role=None,
+        include_specific_skills=None,
+        exclude_keywords=None,
+        analysis_context_type="profile",
+        repository_url=None,
+        force_refresh=False,
+        req=None,
+        db=db,
+        recommendation_service=recommendation_service,
+        current_user=user,
+    )
+
+
+async def serve(response, receive, send_delay: float = 0.0) -> list:
+    """Run ``response`` as an ASGI app and return the messages it sent.
+
+    ``send_delay`` models a slow client connection, so a disconnect can arrive while the
+    response headers are still being sent.
+    """
+    sent: list = []
+
+    async def send(message):
+        await asyncio.sleep(send_delay)
+        sent.append(message)
+
+    await response({"type": "http", "asgi": {"version": "3.0", "spec_version": "2.0"}}, receive, send)
+    return sent
+
+
+async def disconnect():
+    """ASGI receive for a client that is already gone."""
+    return {"type": "http.disconnect"}
+
+
+async def stay_connected():
+    """ASGI receive for a client that never disconnects."""
+    await asyncio.Event().wait()
+
+
+async def disconnect_later():
+    """ASGI receive for a client that drops while the stream is running."""
+    await asyncio.sleep(0.05)
+    return {"type": "http.disconnect"}
+
+
+async def serve_until_complete(response) -> list:
+    """Run ``response`` for a client that drops as soon as it has read the ``complete`` event.
+
+    The disconnect lands while the event is still being sent, before the stream resumes.
+    """
+    sent: list = []
+    completed = asyncio.Event()
+
+    async def send(message):
+        sent.append(message)
+        if b'"status":"complete"' in message.get("body", b""):
+            completed.set()
+            await asyncio.sleep(0.05)
+
+    async def receive():
+        await completed.wait()
+        return {"type": "http.disconnect"}
+
+    await response({"type": "http", "asgi": {"version": "3.0", "spec_version": "2.0"}}, receive, send)
+    return sent
+
+
+class CompletingAIService:
+    """An AI service whose stream completes and then keeps the connection open."""
+
+    def __init__(self, prompt_service):
+        self.prompt_service = prompt_service
+
+    async def generate_recommendation_stream(self, **kwargs):
+        yield {"stage": "Complete", "progress": 100, "status": "complete"}
+        await asyncio.Event().wait()
+
+
+async def never_returns(**kwargs):
+    """A GitHub analysis that is still running when the client drops."""
+    await asyncio.Event().wait()
+
+
+class TestStreamCreditRefund:
+    """Tests that a credit held for a streamed generation is refunded exactly once."""
+
+    async def test_disconnect_before_first_chunk_refunds_options_credit(self, refunds, mock_database_session):
+        """Test dropping the options stream before it is iterated still refunds the credit."""
+        user = AnonymousUser("203.0.113.9")
+        service = MagicMock(create_recommendation_options=AsyncMock())
+
+        response = await options_stream(user, service, mock_database_session)
+        sent = await serve(response, disconnect, send_delay=0.05)
+
+        assert not any(message.get("body") for message in sent)
+        service.create_recommendation_options.assert_not_awaited()
+        assert refunds == [user]
+
+    async def test_disconnect_before_first_chunk_refunds_regeneration_credit(self, refunds, mock_database_session):
+        """Test dropping the regeneration stream before it is iterated still refunds the credit."""
+        user = AnonymousUser("203.0.113.9")
+        request = DynamicRefinementRequest(original_content="Great engineer.", refinement_instructions="Shorter", github_username="octocat")
+
+        response = await recommendations_api.regenerate_recommendation_stream(request, None, mock_database_session, MagicMock(), user)
+        await serve(response, disconnect, send_delay=0.05)
+
+        assert refunds == [user]
+
+    async def test_failed_stream_refunds_once(self, refunds, stream_sessions, mock_database_session):
+        """Test a stream that fails refunds in its finally and the background task does not refund again."""
+        user = AnonymousUser("203.0.113.9")
+        service = MagicMock(create_recommendation_options=AsyncMock(side_effect=RuntimeError("GitHub unavailable")))
+
+        response = await options_stream(user, service, mock_database_session)
+        sent = await serve(response, stay_connected)
+
+        assert b"GitHub unavailable" in b"".join(message.get("body", b"") for message in sent)
+        assert refunds == [user]
+
+    async def test_disconnect_after_complete_keeps_credit(self, refunds, stream_sessions, mock_database_session, monkeypatch):
+        """Test a client that drops right after the complete event keeps its confirmed credit spent."""
+        user = AnonymousUser("203.0.113.9")
+        service = MagicMock(create_recommendation_options=AsyncMock(return_value={"github_data": {}}))
+        confirm = AsyncMock()
+        monkeypatch.setattr(recommendations_api, "confirm_generation_credit", confirm)
+        monkeypatch.setattr(ai_recommendation_module, "AIRecommendationService", CompletingAIService)
+
+        response = await options_stream(user, service, mock_database_session)
+        sent = await serve_until_complete(response)
+
+        [session] = stream_sessions
+        assert b'"status":"complete"' in b"".join(message.get("body", b"") for message in sent)
+        confirm.assert_awaited_once_with(user, None, session)
+        session.commit.assert_awaited_once()
+        assert refunds == []
+
+
+class TestStreamSession:
+    """Tests that a streamed generation's own session is always rolled back and closed."""
+
+    async def test_failed_stream_rolls_back_and_closes_session(self, refunds, stream_sessions, mock_database_session):
+        """Test an error after the profile upsert leaves no transaction open on the stream's session."""
+        user = AnonymousUser("203.0.113.9")
+        service = MagicMock(create_recommendation_options=AsyncMock(side_effect=RuntimeError("Gemini unavailable")))
+
+        response = await options_stream(user, service, mock_database_session)
+        await serve(response, stay_connected)
+
+        [session] = stream_sessions
+        assert service.create_recommendation_options.await_args.kwargs["db"] is session
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
+        mock_database_session.commit.assert_not_awaited()
+
+    async def test_disconnect_mid_stream_rolls_back_and_closes_session(self, refunds, stream_sessions, mock_database_session):
+        """Test a client dropping during generation rolls back and closes the stream's session."""
+        user = AnonymousUser("203.0.113.9")
+        request = DynamicRefinementRequest(original_content="Great engineer.", refinement_instructions="Shorter", github_username="octocat")
+        service = MagicMock(_get_or_create_github_profile_data=AsyncMock(side_effect=never_returns))
+
+        response = await recommendations_api.regenerate_recommendation_stream(request, None, mock_database_session, service, user)
+        sent = await serve(response, disconnect_later)
+
+        [session] = stream_sessions
+        assert b"Loading GitHub data" in b"".join(message.get("body", b"") for message in sent)
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
+        assert refunds == [user]
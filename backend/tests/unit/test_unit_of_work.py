@@ -0,0 +1,67 @@
+"""Tests that recommendation creation is one unit of work committed by the request."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.dependencies import increment_generation_count
+from app.models.github_profile import GitHubProfile
+from app.models.user import User
+from app.services.recommendation.recommendation_service import RecommendationService
+
+
+def make_github_data() -> dict:
+    """Build the GitHub data _fetch_github_data returns for a profile analysis."""
+    return {
+        "user_data": {"github_username": "octocat", "github_id": 583231},
+        "repositories": [],
+        "languages": [],
+        "skills": {},
+        "analyzed_at": "2026-01-05T10:00:00+00:00",
+    }
+
+
+class TestUnitOfWork:
+    """Tests for flush-only writes in recommendation creation."""
+
+    async def test_create_from_option_flushes_without_committing(self, counting_session):
+        """Test creating a recommendation is one upsert and one flush, with no commit or refresh."""
+        service = RecommendationService()
+        service._fetch_github_data = AsyncMock(return_value=make_github_data())
+        profile = GitHubProfile(id=3, github_username="octocat", github_id=583231)
+        counting_session.results.append(MagicMock(scalar_one=MagicMock(return_value=profile)))
+        option = {"id": 1, "name": "Technical", "focus": "technical", "content": "Great engineer.", "word_count": 2}
+
+        response = await service.create_recommendation_from_option(counting_session, "octocat", option, [option], user_id=1)
+
+        assert response.id == 1
+        assert response.github_username == "octocat"
+        assert counting_session.counts == {"execute": 1, "flush": 1, "commit": 0, "refresh": 0, "rollback": 0}
+
+    async def test_profile_upsert_runs_after_generation(self, counting_session):
+        """Test the profile row is only written once generation has finished, so its lock is held briefly."""
+        service = RecommendationService()
+        service._fetch_github_data = AsyncMock(return_value=make_github_data())
+        profile = GitHubProfile(id=3, github_username="octocat", github_id=583231)
+        counting_session.results.append(MagicMock(scalar_one=MagicMock(return_value=profile)))
+        executes_during_generation = []
+
+        async def generate_options(**kwargs):
+            executes_during_generation.append(counting_session.counts["execute"])
+            return SimpleNamespace(options=[])
+
+        service.recommendation_engine_service = MagicMock(generate_recommendation_options=generate_options)
+
+        await service.create_recommendation_options(counting_session, "octocat")
+
+        assert executes_during_generation == [0]
+        assert counting_session.counts["execute"] == 1
+
+    async def test_credit_deduction_is_not_committed(self, counting_session):
+        """Test deducting a credit leaves the commit to the request."""
+        counting_session.results.append(MagicMock(one_or_none=MagicMock(return_value=SimpleNamespace(credits=2, recommendation_count=1))))
+        user = User(id=1, username="octocat", credits=3, recommendation_count=0, role="free", subscription_tier="free", subscription_status="active")
+
+        await increment_generation_count(user, SimpleNamespace(), counting_session)
+
+        assert counting_session.counts["execute"] == 1
+        assert counting_session.counts["commit"] == 0
@@ -5,13 +5,19 @@ interface RecommendationGeneratingStateProps {
   contributor: ContributorInfo;
   currentStage: string;
   progress: number; // Progress from 0 to 100
+  streamingDrafts?: Record<number, string>; // Option text received so far, by option id
 }
 
 export default function RecommendationGeneratingState({
   contributor,
   currentStage,
   progress,
+  streamingDrafts = {},
 }: RecommendationGeneratingStateProps) {
+  const drafts = Object.entries(streamingDrafts).sort(
+    ([a], [b]) => Number(a) - Number(b)
+  );
+
   return (
     <div className='text-center py-12'>
       <Loader2 className='w-12 h-12 animate-spin text-blue-600 mx-auto mb-4' />
@@ -38,6 +44,23 @@ export default function RecommendationGeneratingState({
       <p className='text-sm text-gray-500'>
         {progress < 100 ? 'This may take up to 60 seconds...' : 'Almost done!'}
       </p>
+      {drafts.length > 0 && (
+        <div className='mt-6 space-y-4 text-left'>
+          {drafts.map(([optionId, text]) => (
+            <div
+              key={optionId}
+              className='border border-gray-200 rounded-lg p-4 bg-gray-50'
+            >
+              <p className='text-xs font-medium text-gray-500 mb-2'>
+                Option {optionId}
+              </p>
+              <p className='text-sm text-gray-700 whitespace-pre-wrap'>
+                {text}
+              </p>
+            </div>
+          ))}
+        </div>
+      )}
     </div>
   );
 }
@@ -6,6 +6,8 @@ interface ProgressUpdate {
   progress: number;
   status?: string;
   error?: string;
+  option_id?: number;
+  delta?: string;
 }
 import ErrorBoundary from './ui/error-boundary';
 import { parseGitHubInput, validateGitHubInput } from '@/lib/utils';
@@ -239,6 +241,7 @@ export default function RecommendationModal({
       return;
     }
 
+    dispatch({ type: 'CLEAR_STREAMING_DRAFTS' });
     dispatch({ type: 'SET_STEP', payload: 'generating' });
 
     const customPrompt = `
@@ -278,6 +281,17 @@ Key Achievements: ${state.formData.notableAchievements}
         // Update progress in state
         dispatch({ type: 'SET_CURRENT_STAGE', payload: progress.stage });
         dispatch({ type: 'SET_PROGRESS', payload: progress.progress });
+        // Show option text as it is generated instead of only at 100%
+        if (
+          progress.status === 'streaming' &&
+          progress.option_id !== undefined &&
+          progress.delta
+        ) {
+          dispatch({
+            type: 'APPEND_STREAMING_DELTA',
+            payload: { optionId: progress.option_id, delta: progress.delta },
+          });
+        }
       },
       (data: unknown) => {
         // Increment count only if not logged in and generation was successful
@@ -477,6 +491,7 @@ Key Achievements: ${state.formData.notableAchievements}
                 contributor={contributor}
                 currentStage={state.currentStage}
                 progress={state.progress}
+                streamingDrafts={state.streamingDrafts}
               />
             ) : state.step === 'options' && state.options.length > 0 ? (
               <RecommendationOptionsList
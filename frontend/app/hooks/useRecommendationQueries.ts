@@ -5,12 +5,14 @@ import { apiClient } from '../services/api';
 import type { RecommendationRequest, HttpError } from '../types/index';
 
 // Type for progress data
-type ProgressData = {
+export type ProgressData = {
   stage: string;
   progress: number;
   status: string;
   result?: unknown;
   error?: string;
+  option_id?: number;
+  delta?: string;
 };
 
 // Custom hook for SSE connections
@@ -298,13 +300,7 @@ export const useGenerateRecommendationOptionsStream = () => {
   const generate = useCallback(
     (
       request: RecommendationRequest,
-      onProgress: (progress: {
-        stage: string;
-        progress: number;
-        status: string;
-        result?: unknown;
-        error?: string;
-      }) => void,
+      onProgress: (progress: ProgressData) => void,
       onComplete: (result: unknown) => void,
       onError: (error: string) => void
     ) => {
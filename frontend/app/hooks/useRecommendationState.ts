@@ -43,6 +43,8 @@ export interface RecommendationState {
   // New state for real-time progress
   currentStage: string;
   progress: number;
+  // Option text streamed so far, by option id, shown while options generate
+  streamingDrafts: Record<number, string>;
   // New state for dynamic refinement parameters
   dynamicTone: RecommendationFormData['tone'];
   dynamicLength: RecommendationFormData['length'];
@@ -67,6 +69,11 @@ export type RecommendationAction =
   | { type: 'SET_SHOW_LIMIT_EXCEEDED'; payload: boolean }
   | { type: 'SET_CURRENT_STAGE'; payload: string } // New action
   | { type: 'SET_PROGRESS'; payload: number } // New action
+  | {
+      type: 'APPEND_STREAMING_DELTA';
+      payload: { optionId: number; delta: string };
+    }
+  | { type: 'CLEAR_STREAMING_DRAFTS' }
   | {
       // New action to update all dynamic refinement params
       type: 'UPDATE_DYNAMIC_REFINEMENT_PARAMS';
@@ -109,6 +116,7 @@ const initialState: RecommendationState = {
   showLimitExceededMessage: false,
   currentStage: 'Initializing...', // Default initial stage
   progress: 0, // Default initial progress
+  streamingDrafts: {},
   dynamicTone: 'professional',
   dynamicLength: 'medium',
   dynamicIncludeKeywords: [],
@@ -166,6 +174,18 @@ function recommendationReducer(
       return { ...state, currentStage: action.payload };
     case 'SET_PROGRESS': // New case
       return { ...state, progress: action.payload };
+    case 'APPEND_STREAMING_DELTA':
+      return {
+        ...state,
+        streamingDrafts: {
+          ...state.streamingDrafts,
+          [action.payload.optionId]:
+            (state.streamingDrafts[action.payload.optionId] || '') +
+            action.payload.delta,
+        },
+      };
+    case 'CLEAR_STREAMING_DRAFTS':
+      return { ...state, streamingDrafts: {} };
     case 'UPDATE_DYNAMIC_REFINEMENT_PARAMS': // New case
       return {
         ...state,
@@ -204,6 +204,7 @@ export interface RecommendationListResponse {
   total: number;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
 }
 
 export interface ApiError {